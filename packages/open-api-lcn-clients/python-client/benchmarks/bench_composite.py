@@ -0,0 +1,86 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+"""Deserialization time of `storage_resolve` responses, whose
+`StorageResolve200Response` type is a five level anyOf chain.
+
+    python benchmarks/bench_composite.py --rounds 500
+"""
+
+import argparse
+import json
+import time
+
+from openapi_client.api_client import ApiClient
+
+RESPONSE_TYPE = 'StorageResolve200Response'
+
+PROOF = {
+    'type': 'Ed25519Signature2020',
+    'created': '2024-01-01T00:00:00Z',
+    'proofPurpose': 'assertionMethod',
+    'verificationMethod': 'did:web:issuer#key-1',
+    'proofValue': 'z3FXQjecWufY46yg5abdVZsXqLhxhueuSoZgNSARiKBk',
+}
+CREDENTIAL = {
+    '@context': ['https://www.w3.org/2018/credentials/v1'],
+    'type': ['VerifiableCredential'],
+    'issuer': 'did:web:issuer',
+    'issuanceDate': '2024-01-01T00:00:00Z',
+    'credentialSubject': {'id': 'did:web:subject', 'achievement': {'name': 'Boost'}},
+    'proof': PROOF,
+}
+PAYLOADS = {
+    'credential': CREDENTIAL,
+    'presentation': {
+        '@context': ['https://www.w3.org/2018/credentials/v1'],
+        'type': ['VerifiablePresentation'],
+        'holder': 'did:web:holder',
+        'verifiableCredential': CREDENTIAL,
+        'proof': PROOF,
+    },
+    'jwe': {
+        'protected': 'eyJlbmMiOiJYQzIwUCJ9',
+        'iv': 'i3Bkx-5l0hgvNHLZ',
+        'ciphertext': 'B2nXn3r3YxWOBDyuLPHTs08',
+        'tag': 'YyqSKgumtbrPUSy7Q7jJhg',
+        'recipients': [{
+            'header': {
+                'kid': 'did:key:z6Mk#z6LS',
+                'alg': 'ECDH-ES+A256KW',
+                'epk': {'kty': 'OKP', 'crv': 'X25519', 'x': 'ZrI8wZ7CqIeFK3E4wvxHqS4nBYVJDZH5lgwP8oQv2Wk'},
+                'iv': 'Pt1ki9GQ_wQ9u-Jl',
+                'tag': 'DeOtdG58NbrTHufuVXYmtg',
+            },
+            'encrypted_key': 'Dn1-rhV_wC6Dxx8LD4Ir8MHpW_Xs9gh8oNyJq-b6T9Q',
+        }],
+    },
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rounds', type=int, default=500, help='deserializations per payload')
+    args = parser.parse_args()
+
+    api_client = ApiClient()
+    for name, payload in PAYLOADS.items():
+        text = json.dumps(payload)
+        api_client.deserialize(text, RESPONSE_TYPE, 'application/json')
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            api_client.deserialize(text, RESPONSE_TYPE, 'application/json')
+        elapsed = (time.perf_counter() - start) / args.rounds
+        print('%-15s %10.1f us/response' % (name, elapsed * 1e6))
+
+
+if __name__ == '__main__':
+    main()
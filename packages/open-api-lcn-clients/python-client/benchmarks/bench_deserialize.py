@@ -0,0 +1,100 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+"""Records/sec of `ApiClient.response_deserialize` on synthetic pages of
+`BoostGetPaginatedBoostRecipients200ResponseRecordsInner`, with and without
+`Configuration.fast_deserialization`.
+
+    python benchmarks/bench_deserialize.py --records 1000 --pages 20
+"""
+
+import argparse
+import json
+import time
+
+import urllib3
+
+from openapi_client.api_client import ApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.rest import RESTResponse
+
+RESPONSE_TYPE = 'BoostGetPaginatedBoostRecipients200Response'
+
+
+def recipients_page(records: int) -> bytes:
+    return json.dumps({
+        'cursor': 'cursor-%d' % records,
+        'hasMore': True,
+        'records': [
+            {
+                'to': {
+                    'profileId': 'profile-%d' % i,
+                    'displayName': 'Profile %d' % i,
+                    'shortBio': 'Learner',
+                    'bio': 'A learner on the network.',
+                    'did': 'did:web:network.learncard.com:users:profile-%d' % i,
+                    'isPrivate': False,
+                    'image': 'https://example.com/%d.png' % i,
+                    'isServiceProfile': False,
+                    'display': {'backgroundColor': '#ffffff', 'fadeBackgroundImage': False},
+                    'highlightedCredentials': [],
+                    'role': 'student',
+                },
+                'from': 'issuer',
+                'received': '2024-01-01T00:00:00.000Z',
+                'uri': 'lc:network:credential:%d' % i,
+            }
+            for i in range(records)
+        ],
+    }).encode()
+
+
+def response(body: bytes) -> RESTResponse:
+    resp = RESTResponse(urllib3.HTTPResponse(
+        body=body,
+        status=200,
+        headers={'content-type': 'application/json; charset=utf-8'},
+        preload_content=True,
+    ))
+    resp.read()
+    return resp
+
+
+def run(fast: bool, body: bytes, records: int, pages: int) -> float:
+    configuration = Configuration()
+    configuration.fast_deserialization = fast
+    api_client = ApiClient(configuration)
+    response_types_map = {'200': RESPONSE_TYPE}
+    response_data = response(body)
+    # warm up validator compilation and imports
+    api_client.response_deserialize(response_data, response_types_map)
+    start = time.perf_counter()
+    for _ in range(pages):
+        api_client.response_deserialize(response_data, response_types_map)
+    return records * pages / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--records', type=int, default=1000, help='records per page')
+    parser.add_argument('--pages', type=int, default=20, help='pages deserialized per mode')
+    args = parser.parse_args()
+
+    body = recipients_page(args.records)
+    regular = run(False, body, args.records, args.pages)
+    fast = run(True, body, args.records, args.pages)
+    print('%-10s %12.0f records/sec' % ('regular', regular))
+    print('%-10s %12.0f records/sec' % ('fast', fast))
+    print('%-10s %12.1fx' % ('speedup', fast / regular))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+"""Request body encoding of large `BoostCreateBoostRequest` credentials.
+
+Compares what `ApiClient.param_serialize` and `RESTClientObject.request` do by
+default (`sanitize_for_serialization` then `json.dumps`) with
+`openapi_client.encoding.encode` in compatible and compact mode, and checks
+that the compatible output is byte-for-byte the same:
+
+    python benchmarks/bench_encode.py --alignments 500 --field-bytes 256
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict
+
+from openapi_client.api_client import ApiClient
+from openapi_client.encoding import encode
+from openapi_client.models.boost_create_boost_request import BoostCreateBoostRequest
+
+
+def boost_request(alignments: int, field_bytes: int) -> BoostCreateBoostRequest:
+    text = 'x' * field_bytes
+    return BoostCreateBoostRequest.from_dict({
+        'name': 'Badge',
+        'type': 'achievement',
+        'category': 'Achievement',
+        'meta': {'description': text},
+        'credential': {
+            '@context': [
+                'https://www.w3.org/2018/credentials/v1',
+                'https://purl.imsglobal.org/spec/ob/v3p0/context-3.0.3.json',
+            ],
+            'type': ['VerifiableCredential', 'OpenBadgeCredential'],
+            'issuer': {'id': 'did:web:network.learncard.com:users:issuer', 'name': 'Issuer'},
+            'name': 'Badge',
+            'credentialSubject': {
+                'id': 'did:web:network.learncard.com:users:profile-1',
+                'type': ['AchievementSubject'],
+                'achievement': {
+                    'id': 'urn:uuid:achievement-1',
+                    'type': ['Achievement'],
+                    'name': 'Achievement',
+                    'description': text,
+                    'criteria': {'narrative': text},
+                    'alignment': [
+                        {
+                            'type': ['Alignment'],
+                            'targetName': 'Competency %d' % i,
+                            'targetUrl': 'https://example.com/competencies/%d' % i,
+                            'targetDescription': text,
+                            'targetFramework': 'Framework',
+                        }
+                        for i in range(alignments)
+                    ],
+                },
+            },
+            'evidence': [
+                {'id': 'urn:uuid:evidence-%d' % i, 'type': ['Evidence'], 'narrative': text}
+                for i in range(alignments // 10)
+            ],
+        },
+        'skills': [
+            {'frameworkId': 'framework-1', 'id': 'skill-%d' % i} for i in range(alignments // 10 or 1)
+        ],
+    })
+
+
+def timed(encoder: Callable[[], Any], rounds: int) -> float:
+    encoder()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        encoder()
+    return (time.perf_counter() - start) / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--alignments', type=int, default=500, help='alignment entries per credential')
+    parser.add_argument('--field-bytes', type=int, default=256, help='length of free-text fields')
+    parser.add_argument('--rounds', type=int, default=50, help='encodings per mode')
+    args = parser.parse_args()
+
+    request = boost_request(args.alignments, args.field_bytes)
+    api_client = ApiClient()
+    encoders: Dict[str, Callable[[], bytes]] = {
+        'sanitize + json.dumps': lambda: json.dumps(api_client.sanitize_for_serialization(request)).encode(),
+        'encode (compatible)': lambda: encode(request, compact=False),
+        'encode (compact)': lambda: encode(request),
+    }
+    regular = encoders['sanitize + json.dumps']()
+    assert encoders['encode (compatible)']() == regular, 'compatible output differs'
+
+    baseline = None
+    for name, encoder in encoders.items():
+        seconds = timed(encoder, args.rounds)
+        size = len(encoder())
+        baseline = baseline or seconds
+        print('%-24s %9.2f ms %10d bytes %8.1f MB/s  %4.1fx' % (
+            name, seconds * 1e3, size, size / seconds / 1e6, baseline / seconds,
+        ))
+
+
+if __name__ == '__main__':
+    main()
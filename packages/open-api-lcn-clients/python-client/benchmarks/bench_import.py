@@ -0,0 +1,119 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+"""Import time and memory of the API classes.
+
+Imports every API class in a fresh interpreter and reports the time taken
+and the growth in RSS, for this tree and, with `--baseline REV`, for the
+`openapi_client` package of a git revision (e.g. the one before the
+operations were built from `openapi_client.operations` descriptors):
+
+    python benchmarks/bench_import.py --runs 5 --baseline HEAD~1
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+from typing import Tuple
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCRIPT = """
+import time
+def rss_kb():
+    with open('/proc/self/status') as status:
+        for line in status:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1])
+import openapi_client.api_client
+before, start = rss_kb(), time.perf_counter()
+import openapi_client.api as api
+classes = [getattr(api, name) for name in api._LAZY_IMPORTS]
+%s
+print(time.perf_counter() - start, rss_kb() - before)
+"""
+
+# instantiating the classes and calling one validated method each
+# builds what is built lazily
+FIRST_CALLS = """
+from openapi_client.api_client import ApiClient
+from openapi_client.prepared import iter_operations, prepare_request
+client = ApiClient()
+for cls in classes:
+    operation = next(iter_operations(cls))
+    try:
+        prepare_request(cls(client), operation)
+    except Exception:
+        pass
+"""
+
+
+def measure(path: str, first_calls: bool, runs: int) -> Tuple[float, float]:
+    """Median seconds and MiB of importing the API classes from `path`."""
+    seconds, kilobytes = [], []
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [path, env.get('PYTHONPATH')]))
+    script = SCRIPT % (FIRST_CALLS if first_calls else '')
+    for _ in range(runs):
+        # run from the root directory, as `-c` puts the working directory on sys.path
+        output = subprocess.run(
+            [sys.executable, '-c', script], env=env, cwd=os.sep, capture_output=True, text=True, check=True,
+        ).stdout.split()
+        seconds.append(float(output[0]))
+        kilobytes.append(int(output[1]))
+    return statistics.median(seconds), statistics.median(kilobytes) / 1024
+
+
+def checkout(revision: str, directory: str) -> str:
+    """Extracts `openapi_client` at `revision` into `directory`."""
+    archive = os.path.join(directory, 'package.tar')
+    top, prefix = subprocess.run(
+        ['git', 'rev-parse', '--show-toplevel', '--show-prefix'],
+        cwd=PACKAGE_DIR, capture_output=True, text=True, check=True,
+    ).stdout.split('\n')[:2]
+    subprocess.run(
+        ['git', 'archive', '-o', archive, '%s:%sopenapi_client' % (revision, prefix)],
+        cwd=top, check=True,
+    )
+    target = os.path.join(directory, 'openapi_client')
+    with tarfile.open(archive) as tar:
+        tar.extractall(target)
+    return directory
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5, help='interpreters started per measurement')
+    parser.add_argument('--baseline', help='git revision to compare against')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        trees = [('this tree', PACKAGE_DIR)]
+        if args.baseline:
+            trees.append((args.baseline, checkout(args.baseline, directory)))
+        # compile once, so neither side pays for writing .pyc files
+        for _, path in trees:
+            measure(path, True, 1)
+        print('%-12s %-22s %10s %10s' % ('', '', 'time', 'RSS'))
+        for name, path in trees:
+            for first_calls in (False, True):
+                seconds, mebibytes = measure(path, first_calls, args.runs)
+                print('%-12s %-22s %7.0f ms %6.1f MiB' % (
+                    name, 'import + first calls' if first_calls else 'import', seconds * 1e3, mebibytes,
+                ))
+
+
+if __name__ == '__main__':
+    main()
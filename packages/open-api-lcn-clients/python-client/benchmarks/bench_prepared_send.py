@@ -0,0 +1,85 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+"""CPU per `boost_send` of one large template to many recipients.
+
+Compares `SendApi.boost_send` with a fresh `BoostSendRequest` per recipient
+against `SendApi.prepare_boost_send(...).send(recipient)`, both against the
+stub LCN server, and the request building alone (everything up to the HTTP
+write) for both. CPU time is the process's, so the send figures include
+the stub server's share:
+
+    python benchmarks/bench_prepared_send.py --sends 2000 --field-bytes 256
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Callable
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_encode import boost_request  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+from openapi_client.api.send_api import SendApi  # noqa: E402
+from openapi_client.api_client import ApiClient  # noqa: E402
+from openapi_client.configuration import Configuration  # noqa: E402
+from openapi_client.models.boost_send_request import BoostSendRequest  # noqa: E402
+from openapi_client.prepared import prepare_request  # noqa: E402
+
+
+def cpu_per_call(call: Callable[[int], object], sends: int) -> float:
+    call(0)
+    start = time.process_time()
+    for i in range(sends):
+        call(i)
+    return (time.process_time() - start) / sends
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sends', type=int, default=2000, help='recipients per mode')
+    parser.add_argument('--alignments', type=int, default=50, help='alignment entries in the template credential')
+    parser.add_argument('--field-bytes', type=int, default=256, help='length of free-text template fields')
+    args = parser.parse_args()
+
+    boost = boost_request(args.alignments, args.field_bytes)
+    fields = {
+        'type': 'boost',
+        'template': boost.to_dict(),
+        'options': {'suppressDelivery': True},
+        'templateData': {'course': 'Course', 'cohort': '2024'},
+    }
+
+    def request(i: int) -> BoostSendRequest:
+        return BoostSendRequest.from_dict(dict(fields, recipient='profile-%d' % i))
+
+    with StubServer() as server:
+        configuration = Configuration(host=server.host, access_token='token')
+        configuration.fast_serialization = True
+        api = SendApi(ApiClient(configuration))
+        template = api.prepare_boost_send(request(0))
+        modes = {
+            'build only: boost_send': lambda i: prepare_request(api, 'boost_send', request(i)),
+            'build only: template': lambda i: template._params('profile-%d' % i),
+            'send: boost_send': lambda i: api.boost_send(request(i)),
+            'send: template': lambda i: template.send('profile-%d' % i),
+        }
+        print('body: %d bytes' % len(template.body('profile-0')))
+        for name, call in modes.items():
+            seconds = cpu_per_call(call, args.sends)
+            print('%-26s %9.1f us CPU per send' % (name, seconds * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+"""Cost of resolving `_response_types_map` type strings in `ApiClient`.
+
+Resolves every response type declared by the API modules with a cold and a
+warm deserializer cache, then deserializes list and dict responses where the
+per-element resolution used to dominate.
+
+    python benchmarks/bench_response_types.py --rounds 200
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import time
+
+from openapi_client.api_client import ApiClient
+
+API_DIR = os.path.join(os.path.dirname(__file__), os.pardir, 'openapi_client', 'api')
+
+
+def response_types():
+    types = set()
+    for path in glob.glob(os.path.join(API_DIR, '*_api.py')):
+        with open(path) as f:
+            types.update(re.findall(r"'[0-9X]{3}': \"([^\"]+)\"", f.read()))
+    return sorted(types)
+
+
+def bench_resolution(types, rounds: int) -> None:
+    api_client = ApiClient()
+    resolve = api_client._ApiClient__deserializer
+    start = time.perf_counter()
+    for _ in range(rounds):
+        api_client._deserializers.clear()
+        for klass in types:
+            resolve(klass)
+    cold = (time.perf_counter() - start) / (rounds * len(types))
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for klass in types:
+            resolve(klass)
+    warm = (time.perf_counter() - start) / (rounds * len(types))
+    print('%d response types' % len(types))
+    print('%-40s %10.2f us/type' % ('resolve (cold)', cold * 1e6))
+    print('%-40s %10.2f us/type' % ('resolve (cached)', warm * 1e6))
+
+
+def bench_collections(rounds: int) -> None:
+    api_client = ApiClient()
+    cases = [
+        ('List[str]', ['did:web:profile-%d' % i for i in range(1000)]),
+        ('Dict[str, object]', {'key-%d' % i: i for i in range(1000)}),
+        ('List[BoostGetBoosts200ResponseInner]', [
+            {'uri': 'lc:network:boost:%d' % i, 'name': 'Boost %d' % i} for i in range(1000)
+        ]),
+    ]
+    for klass, payload in cases:
+        text = json.dumps(payload)
+        api_client.deserialize(text, klass, 'application/json')
+        start = time.perf_counter()
+        for _ in range(rounds):
+            api_client.deserialize(text, klass, 'application/json')
+        elapsed = (time.perf_counter() - start) / (rounds * len(payload))
+        print('%-40s %10.2f us/element' % (klass, elapsed * 1e6))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rounds', type=int, default=200, help='repetitions per measurement')
+    args = parser.parse_args()
+
+    bench_resolution(response_types(), args.rounds)
+    bench_collections(max(1, args.rounds // 10))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+"""Peak memory and time of streamed versus whole-body list deserialization.
+
+Deserializes a `List[BoostGetBoostRecipients200ResponseInner]` body replayed
+from memory, once with `ApiClient.response_deserialize` and once with
+`ApiClient.stream_deserialize`, discarding each element as it is produced.
+
+    python benchmarks/bench_streaming.py --records 20000
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+
+from openapi_client import rest
+from openapi_client.api_client import ApiClient
+from openapi_client.cache import replay_response
+
+RESPONSE_TYPES = {'200': 'List[BoostGetBoostRecipients200ResponseInner]'}
+
+
+def payload(records: int) -> bytes:
+    return json.dumps([
+        {
+            'to': {
+                'profileId': 'profile-%d' % i,
+                'displayName': 'Profile %d' % i,
+                'shortBio': 'Short bio',
+                'bio': 'A longer bio for profile %d' % i,
+                'did': 'did:web:profile-%d' % i,
+            },
+            'from': 'did:web:issuer',
+            'received': '2024-01-01T00:00:00Z',
+            'uri': 'lc:network:credential:%d' % i,
+        }
+        for i in range(records)
+    ]).encode()
+
+
+def response(body: bytes) -> rest.RESTResponse:
+    return rest.RESTResponse(replay_response(200, 'OK', {'Content-Type': 'application/json'}, body))
+
+
+def measure(label: str, run) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = run()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print('%-12s %8d records %10.1f ms %10.1f KiB peak' % (label, count, elapsed * 1e3, peak / 1024))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--records', type=int, default=20000, help='list elements in the response')
+    parser.add_argument('--chunk-size', type=int, default=64 * 1024, help='bytes read at a time when streaming')
+    args = parser.parse_args()
+
+    api_client = ApiClient()
+    body = payload(args.records)
+    # warm up the deserializer cache and pydantic validators
+    list(api_client.stream_deserialize(response(payload(1)), RESPONSE_TYPES))
+    print('%d byte body' % len(body))
+
+    def whole():
+        data = response(body)
+        data.read()
+        return len(api_client.response_deserialize(data, RESPONSE_TYPES).data)
+
+    def streamed():
+        return sum(1 for _ in api_client.stream_deserialize(response(body), RESPONSE_TYPES, args.chunk_size))
+
+    measure('whole body', whole)
+    measure('streamed', streamed)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,234 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+"""Requests/sec and latency of the sync client against the stub LCN server.
+
+Every scenario calls one generated operation against `stub_server.StubServer`
+from a pool of threads, for each thread count. Per (scenario, threads) the
+results hold requests/sec, p50/p99 latency, the tracemalloc peak of a single
+request (measured separately on one thread) and the process's peak RSS so
+far. They are printed as a table and written as JSON; with `--compare`, the
+run fails when a result regresses beyond `--tolerance` of the baseline:
+
+    python benchmarks/bench_throughput.py --threads 1,4,16 --output base.json
+    python benchmarks/bench_throughput.py --threads 1,4,16 --compare base.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stub_server import StubServer  # noqa: E402
+
+from openapi_client.api.boosts_api import BoostsApi  # noqa: E402
+from openapi_client.api.send_api import SendApi  # noqa: E402
+from openapi_client.api.skills_api import SkillsApi  # noqa: E402
+from openapi_client.api.storage_api import StorageApi  # noqa: E402
+from openapi_client.api.universal_inbox_api import UniversalInboxApi  # noqa: E402
+from openapi_client.api_client import ApiClient  # noqa: E402
+from openapi_client.configuration import Configuration  # noqa: E402
+from openapi_client.models.boost_get_paginated_boost_recipients_request import (  # noqa: E402
+    BoostGetPaginatedBoostRecipientsRequest,
+)
+from openapi_client.models.boost_get_paginated_boosts_request import BoostGetPaginatedBoostsRequest  # noqa: E402
+from openapi_client.models.boost_send_request import BoostSendRequest  # noqa: E402
+from openapi_client.models.inbox_issue_request import InboxIssueRequest  # noqa: E402
+
+BOOST_URI = 'lc:network:network.learncard.com/trpc:boost:0'
+
+
+def scenarios(api_client: ApiClient, records: int) -> Dict[str, Callable[[], Any]]:
+    """One zero-argument call per benchmarked operation."""
+    boosts = BoostsApi(api_client)
+    send = SendApi(api_client)
+    inbox = UniversalInboxApi(api_client)
+    storage = StorageApi(api_client)
+    skills = SkillsApi(api_client)
+    boosts_page = BoostGetPaginatedBoostsRequest(limit=records)
+    recipients_page = BoostGetPaginatedBoostRecipientsRequest(limit=records, uri=BOOST_URI)
+    send_request = BoostSendRequest(type='boost', recipient='profile-1', templateUri=BOOST_URI)
+    issue_request = InboxIssueRequest.from_dict({'recipient': {'type': 'email', 'value': 'learner@example.com'}})
+    return {
+        'boost_get_boost': lambda: boosts.boost_get_boost(BOOST_URI),
+        'boost_get_paginated_boosts': lambda: boosts.boost_get_paginated_boosts(boosts_page),
+        'boost_get_paginated_boost_recipients': (
+            lambda: boosts.boost_get_paginated_boost_recipients(recipients_page)
+        ),
+        'boost_send': lambda: send.boost_send(send_request),
+        'inbox_issue': lambda: inbox.inbox_issue(issue_request),
+        'storage_resolve': lambda: storage.storage_resolve(BOOST_URI),
+        'skills_get_full_skill_tree': lambda: skills.skills_get_full_skill_tree('framework-1'),
+    }
+
+
+def peak_rss_kib() -> Optional[int]:
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return rss // 1024 if sys.platform == 'darwin' else rss
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def measure_throughput(call: Callable[[], Any], threads: int, requests: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    lock = threading.Lock()
+    per_thread = max(1, requests // threads)
+
+    def worker() -> None:
+        local = []
+        for _ in range(per_thread):
+            start = time.perf_counter()
+            call()
+            local.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(local)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        for future in [executor.submit(worker) for _ in range(threads)]:
+            future.result()
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'rps': len(latencies) / elapsed,
+        'p50_ms': percentile(latencies, 0.50) * 1e3,
+        'p99_ms': percentile(latencies, 0.99) * 1e3,
+    }
+
+
+def measure_allocations(call: Callable[[], Any], samples: int = 20) -> int:
+    """Largest tracemalloc peak of a single call, in bytes."""
+    peak = 0
+    tracemalloc.start()
+    try:
+        for _ in range(samples):
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            call()
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    results = []
+    with StubServer(records=args.records, field_bytes=args.field_bytes) as server:
+        configuration = Configuration(host=server.host)
+        configuration.connection_pool_maxsize = max(args.threads)
+        api_client = ApiClient(configuration)
+        calls = scenarios(api_client, args.records)
+        for name, call in calls.items():
+            if args.scenarios and name not in args.scenarios:
+                continue
+            # warm up connections, imports and validator compilation
+            for _ in range(args.warmup):
+                call()
+            allocated = measure_allocations(call)
+            for threads in args.threads:
+                result = measure_throughput(call, threads, args.requests)
+                result.update(
+                    scenario=name,
+                    threads=threads,
+                    peak_alloc_kib=round(allocated / 1024, 1),
+                    peak_rss_kib=peak_rss_kib(),
+                )
+                results.append(result)
+                print('%-38s %3d threads %9.0f req/s  p50 %7.2f ms  p99 %7.2f ms  %8.1f KiB/request' % (
+                    name, threads, result['rps'], result['p50_ms'], result['p99_ms'], result['peak_alloc_kib'],
+                ))
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'records': args.records,
+            'field_bytes': args.field_bytes,
+            'requests': args.requests,
+            'route_bytes': {'%s %s' % key: len(body) for key, body in server.bodies.items()},
+        },
+        'results': results,
+    }
+
+
+def regressions(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Describes every result worse than its baseline beyond `tolerance`."""
+    previous = {(r['scenario'], r['threads']): r for r in baseline['results']}
+    found = []
+    for result in report['results']:
+        base = previous.get((result['scenario'], result['threads']))
+        if base is None:
+            continue
+        label = '%s/%d threads' % (result['scenario'], result['threads'])
+        if result['rps'] < base['rps'] * (1 - tolerance):
+            found.append('%s: %.0f req/s, baseline %.0f' % (label, result['rps'], base['rps']))
+        if result['p99_ms'] > base['p99_ms'] * (1 + tolerance):
+            found.append('%s: p99 %.2f ms, baseline %.2f' % (label, result['p99_ms'], base['p99_ms']))
+        if result['peak_alloc_kib'] > base['peak_alloc_kib'] * (1 + tolerance):
+            found.append('%s: %.1f KiB/request, baseline %.1f' % (
+                label, result['peak_alloc_kib'], base['peak_alloc_kib'],
+            ))
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--threads', default='1,4,16', help='comma separated thread counts')
+    parser.add_argument('--requests', type=int, default=1000, help='requests per scenario and thread count')
+    parser.add_argument('--warmup', type=int, default=20, help='unmeasured requests per scenario')
+    parser.add_argument('--records', type=int, default=50, help='items per list response')
+    parser.add_argument('--field-bytes', type=int, default=64, help='length of free-text payload fields')
+    parser.add_argument('--scenarios', nargs='*', help='operations to run; all by default')
+    parser.add_argument('--output', help='write the JSON report to this file')
+    parser.add_argument('--compare', help='baseline JSON report to check for regressions')
+    parser.add_argument('--tolerance', type=float, default=0.15, help='allowed relative regression')
+    args = parser.parse_args()
+    args.threads = [int(t) for t in args.threads.split(',')]
+
+    report = run(args)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    if args.compare:
+        with open(args.compare) as f:
+            found = regressions(report, json.load(f), args.tolerance)
+        for line in found:
+            print('REGRESSION', line, file=sys.stderr)
+        if found:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+"""Per-call cost of `@validate_call` argument validation.
+
+Times `boost_get_boost` and `boost_send` with
+`Configuration.client_side_validation` on and off, once building the request
+only (`prepare_request`, no I/O) and once sending it to the stub LCN server:
+
+    python benchmarks/bench_validate_call.py --calls 5000
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Callable
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stub_server import StubServer  # noqa: E402
+
+from openapi_client.api.boosts_api import BoostsApi  # noqa: E402
+from openapi_client.api.send_api import SendApi  # noqa: E402
+from openapi_client.api_client import ApiClient  # noqa: E402
+from openapi_client.configuration import Configuration  # noqa: E402
+from openapi_client.models.boost_send_request import BoostSendRequest  # noqa: E402
+from openapi_client.prepared import prepare_request  # noqa: E402
+
+BOOST_URI = 'lc:network:network.learncard.com/trpc:boost:0'
+
+
+def per_call(call: Callable[[], object], calls: int) -> float:
+    for _ in range(min(calls, 100)):
+        call()
+    start = time.perf_counter()
+    for _ in range(calls):
+        call()
+    return (time.perf_counter() - start) / calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--calls', type=int, default=5000, help='calls per measurement')
+    args = parser.parse_args()
+
+    send_request = BoostSendRequest(type='boost', recipient='profile-1', templateUri=BOOST_URI)
+    with StubServer() as server:
+        timings = {}
+        for validate in (True, False):
+            configuration = Configuration(host=server.host, access_token='token')
+            configuration.client_side_validation = validate
+            api_client = ApiClient(configuration)
+            boosts = BoostsApi(api_client)
+            send = SendApi(api_client)
+            calls = {
+                'build boost_get_boost': lambda: prepare_request(boosts, 'boost_get_boost', BOOST_URI),
+                'build boost_send': lambda: prepare_request(send, 'boost_send', send_request),
+                'send boost_get_boost': lambda: boosts.boost_get_boost(BOOST_URI),
+                'send boost_send': lambda: send.boost_send(send_request),
+            }
+            for name, call in calls.items():
+                timings[name, validate] = per_call(call, args.calls)
+
+    print('%-24s %14s %14s %12s' % ('', 'validated', 'unchecked', 'saved'))
+    for name in calls:
+        checked, unchecked = timings[name, True], timings[name, False]
+        print('%-24s %11.1f us %11.1f us %9.1f us' % (
+            name, checked * 1e6, unchecked * 1e6, (checked - unchecked) * 1e6,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,229 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+"""In-process stand-in for the LCN API, serving synthetic payloads.
+
+Responses are rendered once when the server starts, so serving them costs
+little more than writing the bytes and the client dominates the profile:
+
+    with StubServer(records=100, field_bytes=256) as server:
+        configuration = Configuration(host=server.host)
+
+Routes not listed in `StubServer.ROUTES` answer 404.
+"""
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def _text(prefix: str, size: int) -> str:
+    return (prefix + ' ' + 'x' * size)[:max(size, len(prefix))]
+
+
+def credential(i: int, field_bytes: int) -> Dict[str, Any]:
+    """An Open Badges style verifiable credential."""
+    return {
+        '@context': [
+            'https://www.w3.org/2018/credentials/v1',
+            'https://purl.imsglobal.org/spec/ob/v3p0/context-3.0.3.json',
+        ],
+        'id': 'urn:uuid:credential-%d' % i,
+        'type': ['VerifiableCredential', 'OpenBadgeCredential'],
+        'issuer': 'did:web:network.learncard.com:users:issuer',
+        'issuanceDate': '2024-01-01T00:00:00.000Z',
+        'name': 'Badge %d' % i,
+        'credentialSubject': {
+            'id': 'did:web:network.learncard.com:users:profile-%d' % i,
+            'type': ['AchievementSubject'],
+            'achievement': {
+                'id': 'urn:uuid:achievement-%d' % i,
+                'type': ['Achievement'],
+                'name': 'Achievement %d' % i,
+                'description': _text('Achievement description', field_bytes),
+                'criteria': {'narrative': _text('Criteria', field_bytes)},
+            },
+        },
+    }
+
+
+def boost(i: int, field_bytes: int) -> Dict[str, Any]:
+    return {
+        'uri': 'lc:network:network.learncard.com/trpc:boost:%d' % i,
+        'name': 'Boost %d' % i,
+        'type': 'achievement',
+        'category': 'Achievement',
+        'status': 'LIVE',
+        'autoConnectRecipients': False,
+        'meta': {'description': _text('Boost', field_bytes)},
+        'allowAnyoneToCreateChildren': False,
+    }
+
+
+def profile(i: int, field_bytes: int) -> Dict[str, Any]:
+    return {
+        'profileId': 'profile-%d' % i,
+        'displayName': 'Profile %d' % i,
+        'shortBio': 'Learner',
+        'bio': _text('A learner on the network.', field_bytes),
+        'did': 'did:web:network.learncard.com:users:profile-%d' % i,
+        'isPrivate': False,
+        'image': 'https://example.com/%d.png' % i,
+        'isServiceProfile': False,
+        'display': {'backgroundColor': '#ffffff', 'fadeBackgroundImage': False},
+        'highlightedCredentials': [],
+        'role': 'student',
+    }
+
+
+def skill(i: int, field_bytes: int, depth: int = 0) -> Dict[str, Any]:
+    children = [skill(i * 10 + c, field_bytes, depth + 1) for c in range(2)] if depth < 1 else []
+    return {
+        'id': 'skill-%d' % i,
+        'statement': 'Skill %d' % i,
+        'description': _text('Skill description', field_bytes),
+        'code': 'S%d' % i,
+        'type': 'skill',
+        'status': 'active',
+        'frameworkId': 'framework-1',
+        'children': children,
+        'hasChildren': bool(children),
+    }
+
+
+def render_routes(records: int, field_bytes: int) -> Dict[Tuple[str, str], bytes]:
+    """Renders the response bodies, keyed by (method, route)."""
+    def page(items: List[Any]) -> Dict[str, Any]:
+        return {'cursor': 'cursor-%d' % records, 'hasMore': True, 'records': items}
+
+    payloads = {
+        ('GET', '/boost'): dict(boost(0, field_bytes), boost=credential(0, field_bytes)),
+        ('POST', '/boost/paginated'): page([boost(i, field_bytes) for i in range(records)]),
+        ('POST', '/boost/recipients/paginated'): page([
+            {
+                'to': profile(i, field_bytes),
+                'from': 'did:web:network.learncard.com:users:issuer',
+                'received': '2024-01-01T00:00:00.000Z',
+                'uri': 'lc:network:network.learncard.com/trpc:credential:%d' % i,
+            }
+            for i in range(records)
+        ]),
+        ('POST', '/send'): {
+            'type': 'boost',
+            'credentialUri': 'lc:network:network.learncard.com/trpc:credential:1',
+            'uri': 'lc:network:network.learncard.com/trpc:boost:1',
+            'activityId': 'activity-1',
+        },
+        ('POST', '/inbox/issue'): {
+            'issuanceId': 'issuance-1',
+            'status': 'PENDING',
+            'recipient': {'type': 'email', 'value': 'learner@example.com'},
+        },
+        ('GET', '/storage/resolve'): credential(1, field_bytes),
+        ('GET', '/skills/frameworks/{id}/tree/full'): {
+            'skills': [skill(i, field_bytes) for i in range(records)],
+        },
+        ('GET', '/profile'): profile(0, field_bytes),
+    }
+    return {key: json.dumps(value).encode() for key, value in payloads.items()}
+
+
+def _route_pattern(route: str) -> 're.Pattern[str]':
+    return re.compile('^' + re.sub(r'\\{\w+\\}', '[^/]+', re.escape(route)) + '$')
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+    # send headers and body in one segment instead of waiting on delayed ACKs
+    disable_nagle_algorithm = True
+    wbufsize = -1
+
+    def _serve(self) -> None:
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        body = self.server.lookup(self.command, self.path.partition('?')[0])
+        status = 200 if body is not None else 404
+        if body is None:
+            body = b'{"message": "not found"}'
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _serve
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer:
+    """Serves the LCN routes used by the benchmarks on a local port.
+
+    :param records: items per list response (pages, skill trees).
+    :param field_bytes: length of the free-text fields of each item, which
+        scales every payload.
+    :param port: port to listen on; 0 picks a free one.
+    """
+
+    ROUTES = (
+        'GET /boost',
+        'POST /boost/paginated',
+        'POST /boost/recipients/paginated',
+        'POST /send',
+        'POST /inbox/issue',
+        'GET /storage/resolve',
+        'GET /skills/frameworks/{id}/tree/full',
+        'GET /profile',
+    )
+
+    def __init__(self, records: int = 50, field_bytes: int = 64, port: int = 0) -> None:
+        self.records = records
+        self.field_bytes = field_bytes
+        self.bodies = render_routes(records, field_bytes)
+        self._routes: List[Tuple[str, 're.Pattern[str]', bytes]] = [
+            (method, _route_pattern(route), body) for (method, route), body in self.bodies.items()
+        ]
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.lookup = self.lookup
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def host(self) -> str:
+        """Base URL to use as `Configuration.host`."""
+        return 'http://127.0.0.1:%d' % self._httpd.server_port
+
+    def lookup(self, method: str, path: str) -> Optional[bytes]:
+        """Returns the body served for a request, None for a 404."""
+        for route_method, pattern, body in self._routes:
+            if route_method == method and pattern.match(path):
+                return body
+        return None
+
+    def start(self) -> 'StubServer':
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> 'StubServer':
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
@@ -8,9 +8,6 @@
     API for interacting with LearnCloud Network
 
     The version of the OpenAPI document: 1.0.0
-    Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-    Do not edit the class manually.
 """  # noqa: E501
 
 
@@ -582,571 +579,1161 @@ __all__ = [
     "WorkflowsParticipateInExchangeRequest",
 ]
 
-# import apis into sdk package
-from openapi_client.api.activity_api import ActivityApi as ActivityApi
-from openapi_client.api.app_store_api import AppStoreApi as AppStoreApi
-from openapi_client.api.app_store_admin_api import AppStoreAdminApi as AppStoreAdminApi
-from openapi_client.api.auth_grants_api import AuthGrantsApi as AuthGrantsApi
-from openapi_client.api.boosts_api import BoostsApi as BoostsApi
-from openapi_client.api.claim_hooks_api import ClaimHooksApi as ClaimHooksApi
-from openapi_client.api.contact_methods_api import ContactMethodsApi as ContactMethodsApi
-from openapi_client.api.contracts_api import ContractsApi as ContractsApi
-from openapi_client.api.credentials_api import CredentialsApi as CredentialsApi
-from openapi_client.api.did_metadata_api import DIDMetadataApi as DIDMetadataApi
-from openapi_client.api.integrations_api import IntegrationsApi as IntegrationsApi
-from openapi_client.api.presentations_api import PresentationsApi as PresentationsApi
-from openapi_client.api.profile_managers_api import ProfileManagersApi as ProfileManagersApi
-from openapi_client.api.profiles_api import ProfilesApi as ProfilesApi
-from openapi_client.api.send_api import SendApi as SendApi
-from openapi_client.api.skills_api import SkillsApi as SkillsApi
-from openapi_client.api.storage_api import StorageApi as StorageApi
-from openapi_client.api.universal_inbox_api import UniversalInboxApi as UniversalInboxApi
-from openapi_client.api.utilities_api import UtilitiesApi as UtilitiesApi
-from openapi_client.api.vcapi_api import VCAPIApi as VCAPIApi
-from openapi_client.api.workflows_api import WorkflowsApi as WorkflowsApi
+import importlib
+
+if __import__("typing").TYPE_CHECKING:
+    # import apis into sdk package
+    from openapi_client.api.activity_api import ActivityApi as ActivityApi
+    from openapi_client.api.app_store_api import AppStoreApi as AppStoreApi
+    from openapi_client.api.app_store_admin_api import AppStoreAdminApi as AppStoreAdminApi
+    from openapi_client.api.auth_grants_api import AuthGrantsApi as AuthGrantsApi
+    from openapi_client.api.boosts_api import BoostsApi as BoostsApi
+    from openapi_client.api.claim_hooks_api import ClaimHooksApi as ClaimHooksApi
+    from openapi_client.api.contact_methods_api import ContactMethodsApi as ContactMethodsApi
+    from openapi_client.api.contracts_api import ContractsApi as ContractsApi
+    from openapi_client.api.credentials_api import CredentialsApi as CredentialsApi
+    from openapi_client.api.did_metadata_api import DIDMetadataApi as DIDMetadataApi
+    from openapi_client.api.integrations_api import IntegrationsApi as IntegrationsApi
+    from openapi_client.api.presentations_api import PresentationsApi as PresentationsApi
+    from openapi_client.api.profile_managers_api import ProfileManagersApi as ProfileManagersApi
+    from openapi_client.api.profiles_api import ProfilesApi as ProfilesApi
+    from openapi_client.api.send_api import SendApi as SendApi
+    from openapi_client.api.skills_api import SkillsApi as SkillsApi
+    from openapi_client.api.storage_api import StorageApi as StorageApi
+    from openapi_client.api.universal_inbox_api import UniversalInboxApi as UniversalInboxApi
+    from openapi_client.api.utilities_api import UtilitiesApi as UtilitiesApi
+    from openapi_client.api.vcapi_api import VCAPIApi as VCAPIApi
+    from openapi_client.api.workflows_api import WorkflowsApi as WorkflowsApi
+
+    # import ApiClient
+    from openapi_client.api_response import ApiResponse as ApiResponse
+    from openapi_client.api_client import ApiClient as ApiClient
+    from openapi_client.configuration import Configuration as Configuration
+    from openapi_client.exceptions import OpenApiException as OpenApiException
+    from openapi_client.exceptions import ApiTypeError as ApiTypeError
+    from openapi_client.exceptions import ApiValueError as ApiValueError
+    from openapi_client.exceptions import ApiKeyError as ApiKeyError
+    from openapi_client.exceptions import ApiAttributeError as ApiAttributeError
+    from openapi_client.exceptions import ApiException as ApiException
+
+    # import models into sdk package
+    from openapi_client.models.activity_get_activity200_response import ActivityGetActivity200Response as ActivityGetActivity200Response
+    from openapi_client.models.activity_get_activity200_response_boost import ActivityGetActivity200ResponseBoost as ActivityGetActivity200ResponseBoost
+    from openapi_client.models.activity_get_activity200_response_recipient_profile import ActivityGetActivity200ResponseRecipientProfile as ActivityGetActivity200ResponseRecipientProfile
+    from openapi_client.models.activity_get_activity_chain200_response_inner import ActivityGetActivityChain200ResponseInner as ActivityGetActivityChain200ResponseInner
+    from openapi_client.models.activity_get_activity_stats200_response import ActivityGetActivityStats200Response as ActivityGetActivityStats200Response
+    from openapi_client.models.activity_get_my_activities200_response import ActivityGetMyActivities200Response as ActivityGetMyActivities200Response
+    from openapi_client.models.activity_get_my_activities200_response_records_inner import ActivityGetMyActivities200ResponseRecordsInner as ActivityGetMyActivities200ResponseRecordsInner
+    from openapi_client.models.activity_get_my_activities200_response_records_inner_boost import ActivityGetMyActivities200ResponseRecordsInnerBoost as ActivityGetMyActivities200ResponseRecordsInnerBoost
+    from openapi_client.models.activity_get_my_activities200_response_records_inner_recipient_profile import ActivityGetMyActivities200ResponseRecordsInnerRecipientProfile as ActivityGetMyActivities200ResponseRecordsInnerRecipientProfile
+    from openapi_client.models.app_store_add_boost_to_listing_request import AppStoreAddBoostToListingRequest as AppStoreAddBoostToListingRequest
+    from openapi_client.models.app_store_admin_get_all_listings_request import AppStoreAdminGetAllListingsRequest as AppStoreAdminGetAllListingsRequest
+    from openapi_client.models.app_store_admin_update_listing_status_request import AppStoreAdminUpdateListingStatusRequest as AppStoreAdminUpdateListingStatusRequest
+    from openapi_client.models.app_store_admin_update_promotion_level_request import AppStoreAdminUpdatePromotionLevelRequest as AppStoreAdminUpdatePromotionLevelRequest
+    from openapi_client.models.app_store_app_event_request import AppStoreAppEventRequest as AppStoreAppEventRequest
+    from openapi_client.models.app_store_browse_listed_apps_request import AppStoreBrowseListedAppsRequest as AppStoreBrowseListedAppsRequest
+    from openapi_client.models.app_store_create_listing_request import AppStoreCreateListingRequest as AppStoreCreateListingRequest
+    from openapi_client.models.app_store_create_listing_request_listing import AppStoreCreateListingRequestListing as AppStoreCreateListingRequestListing
+    from openapi_client.models.app_store_get_boosts_for_listing200_response_inner import AppStoreGetBoostsForListing200ResponseInner as AppStoreGetBoostsForListing200ResponseInner
+    from openapi_client.models.app_store_get_installed_apps200_response import AppStoreGetInstalledApps200Response as AppStoreGetInstalledApps200Response
+    from openapi_client.models.app_store_get_installed_apps200_response_records_inner import AppStoreGetInstalledApps200ResponseRecordsInner as AppStoreGetInstalledApps200ResponseRecordsInner
+    from openapi_client.models.app_store_get_listing200_response import AppStoreGetListing200Response as AppStoreGetListing200Response
+    from openapi_client.models.app_store_get_listings_for_integration200_response import AppStoreGetListingsForIntegration200Response as AppStoreGetListingsForIntegration200Response
+    from openapi_client.models.app_store_get_listings_for_integration200_response_records_inner import AppStoreGetListingsForIntegration200ResponseRecordsInner as AppStoreGetListingsForIntegration200ResponseRecordsInner
+    from openapi_client.models.app_store_get_listings_for_integration_request import AppStoreGetListingsForIntegrationRequest as AppStoreGetListingsForIntegrationRequest
+    from openapi_client.models.app_store_remove_boost_from_listing_request import AppStoreRemoveBoostFromListingRequest as AppStoreRemoveBoostFromListingRequest
+    from openapi_client.models.app_store_update_listing_request import AppStoreUpdateListingRequest as AppStoreUpdateListingRequest
+    from openapi_client.models.app_store_update_listing_request_updates import AppStoreUpdateListingRequestUpdates as AppStoreUpdateListingRequestUpdates
+    from openapi_client.models.auth_grants_add_auth_grant_request import AuthGrantsAddAuthGrantRequest as AuthGrantsAddAuthGrantRequest
+    from openapi_client.models.auth_grants_get_auth_grant200_response import AuthGrantsGetAuthGrant200Response as AuthGrantsGetAuthGrant200Response
+    from openapi_client.models.auth_grants_get_auth_grants200_response_inner import AuthGrantsGetAuthGrants200ResponseInner as AuthGrantsGetAuthGrants200ResponseInner
+    from openapi_client.models.auth_grants_get_auth_grants_request import AuthGrantsGetAuthGrantsRequest as AuthGrantsGetAuthGrantsRequest
+    from openapi_client.models.auth_grants_get_auth_grants_request_query import AuthGrantsGetAuthGrantsRequestQuery as AuthGrantsGetAuthGrantsRequestQuery
+    from openapi_client.models.auth_grants_update_auth_grant_request import AuthGrantsUpdateAuthGrantRequest as AuthGrantsUpdateAuthGrantRequest
+    from openapi_client.models.auth_grants_update_auth_grant_request_updates import AuthGrantsUpdateAuthGrantRequestUpdates as AuthGrantsUpdateAuthGrantRequestUpdates
+    from openapi_client.models.boost_add_boost_admin_request import BoostAddBoostAdminRequest as BoostAddBoostAdminRequest
+    from openapi_client.models.boost_align_boost_skills_request import BoostAlignBoostSkillsRequest as BoostAlignBoostSkillsRequest
+    from openapi_client.models.boost_align_boost_skills_request_skills_inner import BoostAlignBoostSkillsRequestSkillsInner as BoostAlignBoostSkillsRequestSkillsInner
+    from openapi_client.models.boost_attach_framework_to_boost_request import BoostAttachFrameworkToBoostRequest as BoostAttachFrameworkToBoostRequest
+    from openapi_client.models.boost_claim_boost_with_link_request import BoostClaimBoostWithLinkRequest as BoostClaimBoostWithLinkRequest
+    from openapi_client.models.boost_count_boost_children_request import BoostCountBoostChildrenRequest as BoostCountBoostChildrenRequest
+    from openapi_client.models.boost_count_boost_parents_request import BoostCountBoostParentsRequest as BoostCountBoostParentsRequest
+    from openapi_client.models.boost_count_boost_siblings_request import BoostCountBoostSiblingsRequest as BoostCountBoostSiblingsRequest
+    from openapi_client.models.boost_count_familial_boosts_request import BoostCountFamilialBoostsRequest as BoostCountFamilialBoostsRequest
+    from openapi_client.models.boost_create_boost_request import BoostCreateBoostRequest as BoostCreateBoostRequest
+    from openapi_client.models.boost_create_boost_request_claim_permissions import BoostCreateBoostRequestClaimPermissions as BoostCreateBoostRequestClaimPermissions
+    from openapi_client.models.boost_create_boost_request_credential import BoostCreateBoostRequestCredential as BoostCreateBoostRequestCredential
+    from openapi_client.models.boost_create_boost_request_credential_any_of import BoostCreateBoostRequestCredentialAnyOf as BoostCreateBoostRequestCredentialAnyOf
+    from openapi_client.models.boost_create_child_boost_request import BoostCreateChildBoostRequest as BoostCreateChildBoostRequest
+    from openapi_client.models.boost_create_child_boost_request_boost import BoostCreateChildBoostRequestBoost as BoostCreateChildBoostRequestBoost
+    from openapi_client.models.boost_detach_framework_from_boost_request import BoostDetachFrameworkFromBoostRequest as BoostDetachFrameworkFromBoostRequest
+    from openapi_client.models.boost_generate_claim_link200_response import BoostGenerateClaimLink200Response as BoostGenerateClaimLink200Response
+    from openapi_client.models.boost_generate_claim_link_request import BoostGenerateClaimLinkRequest as BoostGenerateClaimLinkRequest
+    from openapi_client.models.boost_generate_claim_link_request_claim_link_sa import BoostGenerateClaimLinkRequestClaimLinkSA as BoostGenerateClaimLinkRequestClaimLinkSA
+    from openapi_client.models.boost_generate_claim_link_request_options import BoostGenerateClaimLinkRequestOptions as BoostGenerateClaimLinkRequestOptions
+    from openapi_client.models.boost_get_boost200_response import BoostGetBoost200Response as BoostGetBoost200Response
+    from openapi_client.models.boost_get_boost200_response_boost import BoostGetBoost200ResponseBoost as BoostGetBoost200ResponseBoost
+    from openapi_client.models.boost_get_boost200_response_boost_issuer import BoostGetBoost200ResponseBoostIssuer as BoostGetBoost200ResponseBoostIssuer
+    from openapi_client.models.boost_get_boost200_response_boost_issuer_any_of import BoostGetBoost200ResponseBoostIssuerAnyOf as BoostGetBoost200ResponseBoostIssuerAnyOf
+    from openapi_client.models.boost_get_boost200_response_boost_issuer_any_of_address import BoostGetBoost200ResponseBoostIssuerAnyOfAddress as BoostGetBoost200ResponseBoostIssuerAnyOfAddress
+    from openapi_client.models.boost_get_boost200_response_boost_issuer_any_of_address_geo import BoostGetBoost200ResponseBoostIssuerAnyOfAddressGeo as BoostGetBoost200ResponseBoostIssuerAnyOfAddressGeo
+    from openapi_client.models.boost_get_boost200_response_boost_issuer_any_of_image import BoostGetBoost200ResponseBoostIssuerAnyOfImage as BoostGetBoost200ResponseBoostIssuerAnyOfImage
+    from openapi_client.models.boost_get_boost200_response_boost_issuer_any_of_image_any_of import BoostGetBoost200ResponseBoostIssuerAnyOfImageAnyOf as BoostGetBoost200ResponseBoostIssuerAnyOfImageAnyOf
+    from openapi_client.models.boost_get_boost200_response_boost_issuer_any_of_other_identifier_inner import BoostGetBoost200ResponseBoostIssuerAnyOfOtherIdentifierInner as BoostGetBoost200ResponseBoostIssuerAnyOfOtherIdentifierInner
+    from openapi_client.models.boost_get_boost200_response_claim_permissions import BoostGetBoost200ResponseClaimPermissions as BoostGetBoost200ResponseClaimPermissions
+    from openapi_client.models.boost_get_boost200_response_default_permissions import BoostGetBoost200ResponseDefaultPermissions as BoostGetBoost200ResponseDefaultPermissions
+    from openapi_client.models.boost_get_boost_admins200_response import BoostGetBoostAdmins200Response as BoostGetBoostAdmins200Response
+    from openapi_client.models.boost_get_boost_admins_request import BoostGetBoostAdminsRequest as BoostGetBoostAdminsRequest
+    from openapi_client.models.boost_get_boost_alignments200_response_inner import BoostGetBoostAlignments200ResponseInner as BoostGetBoostAlignments200ResponseInner
+    from openapi_client.models.boost_get_boost_children_request import BoostGetBoostChildrenRequest as BoostGetBoostChildrenRequest
+    from openapi_client.models.boost_get_boost_frameworks200_response import BoostGetBoostFrameworks200Response as BoostGetBoostFrameworks200Response
+    from openapi_client.models.boost_get_boost_frameworks200_response_records_inner import BoostGetBoostFrameworks200ResponseRecordsInner as BoostGetBoostFrameworks200ResponseRecordsInner
+    from openapi_client.models.boost_get_boost_frameworks_request import BoostGetBoostFrameworksRequest as BoostGetBoostFrameworksRequest
+    from openapi_client.models.boost_get_boost_frameworks_request_query import BoostGetBoostFrameworksRequestQuery as BoostGetBoostFrameworksRequestQuery
+    from openapi_client.models.boost_get_boost_frameworks_request_query_any_of import BoostGetBoostFrameworksRequestQueryAnyOf as BoostGetBoostFrameworksRequestQueryAnyOf
+    from openapi_client.models.boost_get_boost_frameworks_request_query_any_of_or_inner import BoostGetBoostFrameworksRequestQueryAnyOfOrInner as BoostGetBoostFrameworksRequestQueryAnyOfOrInner
+    from openapi_client.models.boost_get_boost_parents_request import BoostGetBoostParentsRequest as BoostGetBoostParentsRequest
+    from openapi_client.models.boost_get_boost_recipients200_response_inner import BoostGetBoostRecipients200ResponseInner as BoostGetBoostRecipients200ResponseInner
+    from openapi_client.models.boost_get_boost_recipients200_response_inner_to import BoostGetBoostRecipients200ResponseInnerTo as BoostGetBoostRecipients200ResponseInnerTo
+    from openapi_client.models.boost_get_boost_recipients200_response_inner_to_display import BoostGetBoostRecipients200ResponseInnerToDisplay as BoostGetBoostRecipients200ResponseInnerToDisplay
+    from openapi_client.models.boost_get_boost_recipients_with_children_count_request import BoostGetBoostRecipientsWithChildrenCountRequest as BoostGetBoostRecipientsWithChildrenCountRequest
+    from openapi_client.models.boost_get_boost_recipients_with_children_count_request_number_of_generations import BoostGetBoostRecipientsWithChildrenCountRequestNumberOfGenerations as BoostGetBoostRecipientsWithChildrenCountRequestNumberOfGenerations
+    from openapi_client.models.boost_get_boost_siblings_request import BoostGetBoostSiblingsRequest as BoostGetBoostSiblingsRequest
+    from openapi_client.models.boost_get_boosts200_response_inner import BoostGetBoosts200ResponseInner as BoostGetBoosts200ResponseInner
+    from openapi_client.models.boost_get_boosts_request import BoostGetBoostsRequest as BoostGetBoostsRequest
+    from openapi_client.models.boost_get_boosts_request_query import BoostGetBoostsRequestQuery as BoostGetBoostsRequestQuery
+    from openapi_client.models.boost_get_boosts_request_query_any_of import BoostGetBoostsRequestQueryAnyOf as BoostGetBoostsRequestQueryAnyOf
+    from openapi_client.models.boost_get_boosts_request_query_any_of_or_inner import BoostGetBoostsRequestQueryAnyOfOrInner as BoostGetBoostsRequestQueryAnyOfOrInner
+    from openapi_client.models.boost_get_boosts_request_query_any_of_or_inner_status import BoostGetBoostsRequestQueryAnyOfOrInnerStatus as BoostGetBoostsRequestQueryAnyOfOrInnerStatus
+    from openapi_client.models.boost_get_boosts_request_query_any_of_or_inner_status_any_of import BoostGetBoostsRequestQueryAnyOfOrInnerStatusAnyOf as BoostGetBoostsRequestQueryAnyOfOrInnerStatusAnyOf
+    from openapi_client.models.boost_get_children_profile_managers200_response import BoostGetChildrenProfileManagers200Response as BoostGetChildrenProfileManagers200Response
+    from openapi_client.models.boost_get_children_profile_managers200_response_records_inner import BoostGetChildrenProfileManagers200ResponseRecordsInner as BoostGetChildrenProfileManagers200ResponseRecordsInner
+    from openapi_client.models.boost_get_children_profile_managers_request import BoostGetChildrenProfileManagersRequest as BoostGetChildrenProfileManagersRequest
+    from openapi_client.models.boost_get_children_profile_managers_request_query import BoostGetChildrenProfileManagersRequestQuery as BoostGetChildrenProfileManagersRequestQuery
+    from openapi_client.models.boost_get_connected_boost_recipients_request import BoostGetConnectedBoostRecipientsRequest as BoostGetConnectedBoostRecipientsRequest
+    from openapi_client.models.boost_get_familial_boosts_request import BoostGetFamilialBoostsRequest as BoostGetFamilialBoostsRequest
+    from openapi_client.models.boost_get_paginated_boost_recipients200_response import BoostGetPaginatedBoostRecipients200Response as BoostGetPaginatedBoostRecipients200Response
+    from openapi_client.models.boost_get_paginated_boost_recipients200_response_records_inner import BoostGetPaginatedBoostRecipients200ResponseRecordsInner as BoostGetPaginatedBoostRecipients200ResponseRecordsInner
+    from openapi_client.models.boost_get_paginated_boost_recipients200_response_records_inner_to import BoostGetPaginatedBoostRecipients200ResponseRecordsInnerTo as BoostGetPaginatedBoostRecipients200ResponseRecordsInnerTo
+    from openapi_client.models.boost_get_paginated_boost_recipients200_response_records_inner_to_display import BoostGetPaginatedBoostRecipients200ResponseRecordsInnerToDisplay as BoostGetPaginatedBoostRecipients200ResponseRecordsInnerToDisplay
+    from openapi_client.models.boost_get_paginated_boost_recipients_request import BoostGetPaginatedBoostRecipientsRequest as BoostGetPaginatedBoostRecipientsRequest
+    from openapi_client.models.boost_get_paginated_boost_recipients_request_query import BoostGetPaginatedBoostRecipientsRequestQuery as BoostGetPaginatedBoostRecipientsRequestQuery
+    from openapi_client.models.boost_get_paginated_boost_recipients_with_children200_response import BoostGetPaginatedBoostRecipientsWithChildren200Response as BoostGetPaginatedBoostRecipientsWithChildren200Response
+    from openapi_client.models.boost_get_paginated_boost_recipients_with_children200_response_records_inner import BoostGetPaginatedBoostRecipientsWithChildren200ResponseRecordsInner as BoostGetPaginatedBoostRecipientsWithChildren200ResponseRecordsInner
+    from openapi_client.models.boost_get_paginated_boost_recipients_with_children_request import BoostGetPaginatedBoostRecipientsWithChildrenRequest as BoostGetPaginatedBoostRecipientsWithChildrenRequest
+    from openapi_client.models.boost_get_paginated_boost_recipients_with_children_request_number_of_generations import BoostGetPaginatedBoostRecipientsWithChildrenRequestNumberOfGenerations as BoostGetPaginatedBoostRecipientsWithChildrenRequestNumberOfGenerations
+    from openapi_client.models.boost_get_paginated_boosts200_response import BoostGetPaginatedBoosts200Response as BoostGetPaginatedBoosts200Response
+    from openapi_client.models.boost_get_paginated_boosts200_response_records_inner import BoostGetPaginatedBoosts200ResponseRecordsInner as BoostGetPaginatedBoosts200ResponseRecordsInner
+    from openapi_client.models.boost_get_paginated_boosts_request import BoostGetPaginatedBoostsRequest as BoostGetPaginatedBoostsRequest
+    from openapi_client.models.boost_get_skills_available_for_boost200_response_inner import BoostGetSkillsAvailableForBoost200ResponseInner as BoostGetSkillsAvailableForBoost200ResponseInner
+    from openapi_client.models.boost_get_skills_available_for_boost200_response_inner_framework import BoostGetSkillsAvailableForBoost200ResponseInnerFramework as BoostGetSkillsAvailableForBoost200ResponseInnerFramework
+    from openapi_client.models.boost_get_skills_available_for_boost200_response_inner_skills_inner import BoostGetSkillsAvailableForBoost200ResponseInnerSkillsInner as BoostGetSkillsAvailableForBoost200ResponseInnerSkillsInner
+    from openapi_client.models.boost_make_boost_parent_request import BoostMakeBoostParentRequest as BoostMakeBoostParentRequest
+    from openapi_client.models.boost_remove_boost_admin_request import BoostRemoveBoostAdminRequest as BoostRemoveBoostAdminRequest
+    from openapi_client.models.boost_remove_boost_parent_request import BoostRemoveBoostParentRequest as BoostRemoveBoostParentRequest
+    from openapi_client.models.boost_search_skills_available_for_boost200_response import BoostSearchSkillsAvailableForBoost200Response as BoostSearchSkillsAvailableForBoost200Response
+    from openapi_client.models.boost_search_skills_available_for_boost200_response_records_inner import BoostSearchSkillsAvailableForBoost200ResponseRecordsInner as BoostSearchSkillsAvailableForBoost200ResponseRecordsInner
+    from openapi_client.models.boost_search_skills_available_for_boost_request import BoostSearchSkillsAvailableForBoostRequest as BoostSearchSkillsAvailableForBoostRequest
+    from openapi_client.models.boost_search_skills_available_for_boost_request_query import BoostSearchSkillsAvailableForBoostRequestQuery as BoostSearchSkillsAvailableForBoostRequestQuery
+    from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of import BoostSearchSkillsAvailableForBoostRequestQueryAnyOf as BoostSearchSkillsAvailableForBoostRequestQueryAnyOf
+    from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of1 import BoostSearchSkillsAvailableForBoostRequestQueryAnyOf1 as BoostSearchSkillsAvailableForBoostRequestQueryAnyOf1
+    from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInner as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInner
+    from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerId as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerId
+    from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf
+    from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of1 import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1 as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1
+    from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of1_or_inner import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1OrInner as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1OrInner
+    from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of1_or_inner_any_of import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1OrInnerAnyOf as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1OrInnerAnyOf
+    from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of1_or_inner_any_of1 import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1OrInnerAnyOf1 as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1OrInnerAnyOf1
+    from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of1_or_inner_any_of1_regex import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1OrInnerAnyOf1Regex as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1OrInnerAnyOf1Regex
+    from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of1_or_inner_any_of_any_of import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1OrInnerAnyOfAnyOf as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1OrInnerAnyOfAnyOf
+    from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of_any_of import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOfAnyOf as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOfAnyOf
+    from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of_any_of1 import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOfAnyOf1 as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOfAnyOf1
+    from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of_any_of1_regex import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOfAnyOf1Regex as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOfAnyOf1Regex
+    from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of_any_of_any_of import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOfAnyOfAnyOf as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOfAnyOfAnyOf
+    from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_statement import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerStatement as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerStatement
+    from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_status import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerStatus as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerStatus
+    from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_status_any_of import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerStatusAnyOf as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerStatusAnyOf
+    from openapi_client.models.boost_send200_response import BoostSend200Response as BoostSend200Response
+    from openapi_client.models.boost_send200_response_inbox import BoostSend200ResponseInbox as BoostSend200ResponseInbox
+    from openapi_client.models.boost_send_boost_request import BoostSendBoostRequest as BoostSendBoostRequest
+    from openapi_client.models.boost_send_boost_request_credential import BoostSendBoostRequestCredential as BoostSendBoostRequestCredential
+    from openapi_client.models.boost_send_boost_request_credential_any_of import BoostSendBoostRequestCredentialAnyOf as BoostSendBoostRequestCredentialAnyOf
+    from openapi_client.models.boost_send_boost_request_credential_any_of1 import BoostSendBoostRequestCredentialAnyOf1 as BoostSendBoostRequestCredentialAnyOf1
+    from openapi_client.models.boost_send_boost_request_credential_any_of1_recipients_inner import BoostSendBoostRequestCredentialAnyOf1RecipientsInner as BoostSendBoostRequestCredentialAnyOf1RecipientsInner
+    from openapi_client.models.boost_send_boost_request_credential_any_of1_recipients_inner_header import BoostSendBoostRequestCredentialAnyOf1RecipientsInnerHeader as BoostSendBoostRequestCredentialAnyOf1RecipientsInnerHeader
+    from openapi_client.models.boost_send_boost_request_credential_any_of1_recipients_inner_header_epk import BoostSendBoostRequestCredentialAnyOf1RecipientsInnerHeaderEpk as BoostSendBoostRequestCredentialAnyOf1RecipientsInnerHeaderEpk
+    from openapi_client.models.boost_send_boost_request_credential_any_of_context_inner import BoostSendBoostRequestCredentialAnyOfContextInner as BoostSendBoostRequestCredentialAnyOfContextInner
+    from openapi_client.models.boost_send_boost_request_credential_any_of_credential_schema import BoostSendBoostRequestCredentialAnyOfCredentialSchema as BoostSendBoostRequestCredentialAnyOfCredentialSchema
+    from openapi_client.models.boost_send_boost_request_credential_any_of_credential_schema_any_of import BoostSendBoostRequestCredentialAnyOfCredentialSchemaAnyOf as BoostSendBoostRequestCredentialAnyOfCredentialSchemaAnyOf
+    from openapi_client.models.boost_send_boost_request_credential_any_of_credential_schema_any_of1_inner import BoostSendBoostRequestCredentialAnyOfCredentialSchemaAnyOf1Inner as BoostSendBoostRequestCredentialAnyOfCredentialSchemaAnyOf1Inner
+    from openapi_client.models.boost_send_boost_request_credential_any_of_credential_status import BoostSendBoostRequestCredentialAnyOfCredentialStatus as BoostSendBoostRequestCredentialAnyOfCredentialStatus
+    from openapi_client.models.boost_send_boost_request_credential_any_of_credential_subject import BoostSendBoostRequestCredentialAnyOfCredentialSubject as BoostSendBoostRequestCredentialAnyOfCredentialSubject
+    from openapi_client.models.boost_send_boost_request_credential_any_of_credential_subject_any_of import BoostSendBoostRequestCredentialAnyOfCredentialSubjectAnyOf as BoostSendBoostRequestCredentialAnyOfCredentialSubjectAnyOf
+    from openapi_client.models.boost_send_boost_request_credential_any_of_credential_subject_any_of1_inner import BoostSendBoostRequestCredentialAnyOfCredentialSubjectAnyOf1Inner as BoostSendBoostRequestCredentialAnyOfCredentialSubjectAnyOf1Inner
+    from openapi_client.models.boost_send_boost_request_credential_any_of_evidence import BoostSendBoostRequestCredentialAnyOfEvidence as BoostSendBoostRequestCredentialAnyOfEvidence
+    from openapi_client.models.boost_send_boost_request_credential_any_of_evidence_any_of import BoostSendBoostRequestCredentialAnyOfEvidenceAnyOf as BoostSendBoostRequestCredentialAnyOfEvidenceAnyOf
+    from openapi_client.models.boost_send_boost_request_credential_any_of_evidence_any_of1_inner import BoostSendBoostRequestCredentialAnyOfEvidenceAnyOf1Inner as BoostSendBoostRequestCredentialAnyOfEvidenceAnyOf1Inner
+    from openapi_client.models.boost_send_boost_request_credential_any_of_issuer import BoostSendBoostRequestCredentialAnyOfIssuer as BoostSendBoostRequestCredentialAnyOfIssuer
+    from openapi_client.models.boost_send_boost_request_credential_any_of_issuer_any_of import BoostSendBoostRequestCredentialAnyOfIssuerAnyOf as BoostSendBoostRequestCredentialAnyOfIssuerAnyOf
+    from openapi_client.models.boost_send_boost_request_credential_any_of_issuer_any_of_address import BoostSendBoostRequestCredentialAnyOfIssuerAnyOfAddress as BoostSendBoostRequestCredentialAnyOfIssuerAnyOfAddress
+    from openapi_client.models.boost_send_boost_request_credential_any_of_issuer_any_of_address_geo import BoostSendBoostRequestCredentialAnyOfIssuerAnyOfAddressGeo as BoostSendBoostRequestCredentialAnyOfIssuerAnyOfAddressGeo
+    from openapi_client.models.boost_send_boost_request_credential_any_of_issuer_any_of_address_type import BoostSendBoostRequestCredentialAnyOfIssuerAnyOfAddressType as BoostSendBoostRequestCredentialAnyOfIssuerAnyOfAddressType
+    from openapi_client.models.boost_send_boost_request_credential_any_of_issuer_any_of_image import BoostSendBoostRequestCredentialAnyOfIssuerAnyOfImage as BoostSendBoostRequestCredentialAnyOfIssuerAnyOfImage
+    from openapi_client.models.boost_send_boost_request_credential_any_of_issuer_any_of_image_any_of import BoostSendBoostRequestCredentialAnyOfIssuerAnyOfImageAnyOf as BoostSendBoostRequestCredentialAnyOfIssuerAnyOfImageAnyOf
+    from openapi_client.models.boost_send_boost_request_credential_any_of_issuer_any_of_other_identifier_inner import BoostSendBoostRequestCredentialAnyOfIssuerAnyOfOtherIdentifierInner as BoostSendBoostRequestCredentialAnyOfIssuerAnyOfOtherIdentifierInner
+    from openapi_client.models.boost_send_boost_request_credential_any_of_issuer_any_of_other_identifier_inner_identifier_type import BoostSendBoostRequestCredentialAnyOfIssuerAnyOfOtherIdentifierInnerIdentifierType as BoostSendBoostRequestCredentialAnyOfIssuerAnyOfOtherIdentifierInnerIdentifierType
+    from openapi_client.models.boost_send_boost_request_credential_any_of_issuer_any_of_type import BoostSendBoostRequestCredentialAnyOfIssuerAnyOfType as BoostSendBoostRequestCredentialAnyOfIssuerAnyOfType
+    from openapi_client.models.boost_send_boost_request_credential_any_of_proof import BoostSendBoostRequestCredentialAnyOfProof as BoostSendBoostRequestCredentialAnyOfProof
+    from openapi_client.models.boost_send_boost_request_credential_any_of_proof_any_of import BoostSendBoostRequestCredentialAnyOfProofAnyOf as BoostSendBoostRequestCredentialAnyOfProofAnyOf
+    from openapi_client.models.boost_send_boost_request_credential_any_of_proof_any_of1_inner import BoostSendBoostRequestCredentialAnyOfProofAnyOf1Inner as BoostSendBoostRequestCredentialAnyOfProofAnyOf1Inner
+    from openapi_client.models.boost_send_boost_request_credential_any_of_refresh_service import BoostSendBoostRequestCredentialAnyOfRefreshService as BoostSendBoostRequestCredentialAnyOfRefreshService
+    from openapi_client.models.boost_send_boost_request_credential_any_of_refresh_service_any_of import BoostSendBoostRequestCredentialAnyOfRefreshServiceAnyOf as BoostSendBoostRequestCredentialAnyOfRefreshServiceAnyOf
+    from openapi_client.models.boost_send_boost_request_credential_any_of_refresh_service_any_of1_inner import BoostSendBoostRequestCredentialAnyOfRefreshServiceAnyOf1Inner as BoostSendBoostRequestCredentialAnyOfRefreshServiceAnyOf1Inner
+    from openapi_client.models.boost_send_boost_request_credential_any_of_terms_of_use import BoostSendBoostRequestCredentialAnyOfTermsOfUse as BoostSendBoostRequestCredentialAnyOfTermsOfUse
+    from openapi_client.models.boost_send_boost_request_options import BoostSendBoostRequestOptions as BoostSendBoostRequestOptions
+    from openapi_client.models.boost_send_boost_via_signing_authority_request import BoostSendBoostViaSigningAuthorityRequest as BoostSendBoostViaSigningAuthorityRequest
+    from openapi_client.models.boost_send_boost_via_signing_authority_request_signing_authority import BoostSendBoostViaSigningAuthorityRequestSigningAuthority as BoostSendBoostViaSigningAuthorityRequestSigningAuthority
+    from openapi_client.models.boost_send_request import BoostSendRequest as BoostSendRequest
+    from openapi_client.models.boost_send_request_options import BoostSendRequestOptions as BoostSendRequestOptions
+    from openapi_client.models.boost_send_request_options_branding import BoostSendRequestOptionsBranding as BoostSendRequestOptionsBranding
+    from openapi_client.models.boost_send_request_template import BoostSendRequestTemplate as BoostSendRequestTemplate
+    from openapi_client.models.boost_send_request_template_claim_permissions import BoostSendRequestTemplateClaimPermissions as BoostSendRequestTemplateClaimPermissions
+    from openapi_client.models.boost_send_request_template_credential import BoostSendRequestTemplateCredential as BoostSendRequestTemplateCredential
+    from openapi_client.models.boost_send_request_template_credential_any_of import BoostSendRequestTemplateCredentialAnyOf as BoostSendRequestTemplateCredentialAnyOf
+    from openapi_client.models.boost_send_request_template_credential_any_of1 import BoostSendRequestTemplateCredentialAnyOf1 as BoostSendRequestTemplateCredentialAnyOf1
+    from openapi_client.models.boost_send_request_template_credential_any_of_context_inner import BoostSendRequestTemplateCredentialAnyOfContextInner as BoostSendRequestTemplateCredentialAnyOfContextInner
+    from openapi_client.models.boost_send_request_template_credential_any_of_credential_subject import BoostSendRequestTemplateCredentialAnyOfCredentialSubject as BoostSendRequestTemplateCredentialAnyOfCredentialSubject
+    from openapi_client.models.boost_send_request_template_credential_any_of_evidence import BoostSendRequestTemplateCredentialAnyOfEvidence as BoostSendRequestTemplateCredentialAnyOfEvidence
+    from openapi_client.models.boost_send_request_template_credential_any_of_issuer import BoostSendRequestTemplateCredentialAnyOfIssuer as BoostSendRequestTemplateCredentialAnyOfIssuer
+    from openapi_client.models.boost_send_request_template_credential_any_of_issuer_any_of import BoostSendRequestTemplateCredentialAnyOfIssuerAnyOf as BoostSendRequestTemplateCredentialAnyOfIssuerAnyOf
+    from openapi_client.models.boost_send_request_template_credential_any_of_issuer_any_of_address import BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfAddress as BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfAddress
+    from openapi_client.models.boost_send_request_template_credential_any_of_issuer_any_of_address_geo import BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfAddressGeo as BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfAddressGeo
+    from openapi_client.models.boost_send_request_template_credential_any_of_issuer_any_of_image import BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfImage as BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfImage
+    from openapi_client.models.boost_send_request_template_credential_any_of_issuer_any_of_image_any_of import BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfImageAnyOf as BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfImageAnyOf
+    from openapi_client.models.boost_send_request_template_credential_any_of_issuer_any_of_other_identifier_inner import BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfOtherIdentifierInner as BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfOtherIdentifierInner
+    from openapi_client.models.boost_send_request_template_credential_any_of_issuer_any_of_other_identifier_inner_identifier_type import BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfOtherIdentifierInnerIdentifierType as BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfOtherIdentifierInnerIdentifierType
+    from openapi_client.models.boost_send_request_template_credential_any_of_issuer_any_of_type import BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfType as BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfType
+    from openapi_client.models.boost_send_request_template_credential_any_of_proof import BoostSendRequestTemplateCredentialAnyOfProof as BoostSendRequestTemplateCredentialAnyOfProof
+    from openapi_client.models.boost_send_request_template_default_permissions import BoostSendRequestTemplateDefaultPermissions as BoostSendRequestTemplateDefaultPermissions
+    from openapi_client.models.boost_send_request_template_skills_inner import BoostSendRequestTemplateSkillsInner as BoostSendRequestTemplateSkillsInner
+    from openapi_client.models.boost_update_boost_permissions_request import BoostUpdateBoostPermissionsRequest as BoostUpdateBoostPermissionsRequest
+    from openapi_client.models.boost_update_boost_permissions_request_updates import BoostUpdateBoostPermissionsRequestUpdates as BoostUpdateBoostPermissionsRequestUpdates
+    from openapi_client.models.boost_update_boost_request import BoostUpdateBoostRequest as BoostUpdateBoostRequest
+    from openapi_client.models.boost_update_boost_request_updates import BoostUpdateBoostRequestUpdates as BoostUpdateBoostRequestUpdates
+    from openapi_client.models.boost_update_other_boost_permissions_request import BoostUpdateOtherBoostPermissionsRequest as BoostUpdateOtherBoostPermissionsRequest
+    from openapi_client.models.boost_update_other_boost_permissions_request_updates import BoostUpdateOtherBoostPermissionsRequestUpdates as BoostUpdateOtherBoostPermissionsRequestUpdates
+    from openapi_client.models.claim_hook_create_claim_hook_request import ClaimHookCreateClaimHookRequest as ClaimHookCreateClaimHookRequest
+    from openapi_client.models.claim_hook_create_claim_hook_request_hook import ClaimHookCreateClaimHookRequestHook as ClaimHookCreateClaimHookRequestHook
+    from openapi_client.models.claim_hook_create_claim_hook_request_hook_one_of import ClaimHookCreateClaimHookRequestHookOneOf as ClaimHookCreateClaimHookRequestHookOneOf
+    from openapi_client.models.claim_hook_create_claim_hook_request_hook_one_of1 import ClaimHookCreateClaimHookRequestHookOneOf1 as ClaimHookCreateClaimHookRequestHookOneOf1
+    from openapi_client.models.claim_hook_create_claim_hook_request_hook_one_of1_data import ClaimHookCreateClaimHookRequestHookOneOf1Data as ClaimHookCreateClaimHookRequestHookOneOf1Data
+    from openapi_client.models.claim_hook_create_claim_hook_request_hook_one_of2 import ClaimHookCreateClaimHookRequestHookOneOf2 as ClaimHookCreateClaimHookRequestHookOneOf2
+    from openapi_client.models.claim_hook_create_claim_hook_request_hook_one_of2_data import ClaimHookCreateClaimHookRequestHookOneOf2Data as ClaimHookCreateClaimHookRequestHookOneOf2Data
+    from openapi_client.models.claim_hook_create_claim_hook_request_hook_one_of_data import ClaimHookCreateClaimHookRequestHookOneOfData as ClaimHookCreateClaimHookRequestHookOneOfData
+    from openapi_client.models.claim_hook_delete_claim_hook_request import ClaimHookDeleteClaimHookRequest as ClaimHookDeleteClaimHookRequest
+    from openapi_client.models.claim_hook_get_claim_hooks_for_boost200_response import ClaimHookGetClaimHooksForBoost200Response as ClaimHookGetClaimHooksForBoost200Response
+    from openapi_client.models.claim_hook_get_claim_hooks_for_boost200_response_records_inner import ClaimHookGetClaimHooksForBoost200ResponseRecordsInner as ClaimHookGetClaimHooksForBoost200ResponseRecordsInner
+    from openapi_client.models.claim_hook_get_claim_hooks_for_boost200_response_records_inner_all_of_one_of import ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOf as ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOf
+    from openapi_client.models.claim_hook_get_claim_hooks_for_boost200_response_records_inner_all_of_one_of1 import ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOf1 as ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOf1
+    from openapi_client.models.claim_hook_get_claim_hooks_for_boost200_response_records_inner_all_of_one_of1_data import ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOf1Data as ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOf1Data
+    from openapi_client.models.claim_hook_get_claim_hooks_for_boost200_response_records_inner_all_of_one_of2 import ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOf2 as ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOf2
+    from openapi_client.models.claim_hook_get_claim_hooks_for_boost200_response_records_inner_all_of_one_of2_data import ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOf2Data as ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOf2Data
+    from openapi_client.models.claim_hook_get_claim_hooks_for_boost200_response_records_inner_all_of_one_of_data import ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOfData as ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOfData
+    from openapi_client.models.claim_hook_get_claim_hooks_for_boost200_response_records_inner_all_of_one_of_data_permissions import ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOfDataPermissions as ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOfDataPermissions
+    from openapi_client.models.claim_hook_get_claim_hooks_for_boost_request import ClaimHookGetClaimHooksForBoostRequest as ClaimHookGetClaimHooksForBoostRequest
+    from openapi_client.models.claim_hook_get_claim_hooks_for_boost_request_query import ClaimHookGetClaimHooksForBoostRequestQuery as ClaimHookGetClaimHooksForBoostRequestQuery
+    from openapi_client.models.claim_hook_get_claim_hooks_for_boost_request_query_data import ClaimHookGetClaimHooksForBoostRequestQueryData as ClaimHookGetClaimHooksForBoostRequestQueryData
+    from openapi_client.models.claim_hook_get_claim_hooks_for_boost_request_query_data_permissions import ClaimHookGetClaimHooksForBoostRequestQueryDataPermissions as ClaimHookGetClaimHooksForBoostRequestQueryDataPermissions
+    from openapi_client.models.contact_methods_add_contact_method200_response import ContactMethodsAddContactMethod200Response as ContactMethodsAddContactMethod200Response
+    from openapi_client.models.contact_methods_add_contact_method_request import ContactMethodsAddContactMethodRequest as ContactMethodsAddContactMethodRequest
+    from openapi_client.models.contact_methods_create_contact_method_session200_response import ContactMethodsCreateContactMethodSession200Response as ContactMethodsCreateContactMethodSession200Response
+    from openapi_client.models.contact_methods_create_contact_method_session_request import ContactMethodsCreateContactMethodSessionRequest as ContactMethodsCreateContactMethodSessionRequest
+    from openapi_client.models.contact_methods_create_contact_method_session_request_contact_method import ContactMethodsCreateContactMethodSessionRequestContactMethod as ContactMethodsCreateContactMethodSessionRequestContactMethod
+    from openapi_client.models.contact_methods_get_my_contact_methods200_response_inner import ContactMethodsGetMyContactMethods200ResponseInner as ContactMethodsGetMyContactMethods200ResponseInner
+    from openapi_client.models.contact_methods_get_my_contact_methods200_response_inner_one_of import ContactMethodsGetMyContactMethods200ResponseInnerOneOf as ContactMethodsGetMyContactMethods200ResponseInnerOneOf
+    from openapi_client.models.contact_methods_get_my_contact_methods200_response_inner_one_of1 import ContactMethodsGetMyContactMethods200ResponseInnerOneOf1 as ContactMethodsGetMyContactMethods200ResponseInnerOneOf1
+    from openapi_client.models.contact_methods_remove_contact_method_request import ContactMethodsRemoveContactMethodRequest as ContactMethodsRemoveContactMethodRequest
+    from openapi_client.models.contact_methods_send_challenge200_response import ContactMethodsSendChallenge200Response as ContactMethodsSendChallenge200Response
+    from openapi_client.models.contact_methods_send_challenge_request import ContactMethodsSendChallengeRequest as ContactMethodsSendChallengeRequest
+    from openapi_client.models.contact_methods_send_challenge_request_configuration import ContactMethodsSendChallengeRequestConfiguration as ContactMethodsSendChallengeRequestConfiguration
+    from openapi_client.models.contact_methods_set_primary_contact_method_request import ContactMethodsSetPrimaryContactMethodRequest as ContactMethodsSetPrimaryContactMethodRequest
+    from openapi_client.models.contact_methods_verify_contact_method_request import ContactMethodsVerifyContactMethodRequest as ContactMethodsVerifyContactMethodRequest
+    from openapi_client.models.contact_methods_verify_with_credential200_response import ContactMethodsVerifyWithCredential200Response as ContactMethodsVerifyWithCredential200Response
+    from openapi_client.models.contact_methods_verify_with_credential200_response_contact_method import ContactMethodsVerifyWithCredential200ResponseContactMethod as ContactMethodsVerifyWithCredential200ResponseContactMethod
+    from openapi_client.models.contact_methods_verify_with_credential200_response_contact_method_one_of import ContactMethodsVerifyWithCredential200ResponseContactMethodOneOf as ContactMethodsVerifyWithCredential200ResponseContactMethodOneOf
+    from openapi_client.models.contact_methods_verify_with_credential200_response_contact_method_one_of1 import ContactMethodsVerifyWithCredential200ResponseContactMethodOneOf1 as ContactMethodsVerifyWithCredential200ResponseContactMethodOneOf1
+    from openapi_client.models.contact_methods_verify_with_credential_request import ContactMethodsVerifyWithCredentialRequest as ContactMethodsVerifyWithCredentialRequest
+    from openapi_client.models.contracts_add_auto_boosts_to_contract_request import ContractsAddAutoBoostsToContractRequest as ContractsAddAutoBoostsToContractRequest
+    from openapi_client.models.contracts_add_auto_boosts_to_contract_request_autoboosts_inner import ContractsAddAutoBoostsToContractRequestAutoboostsInner as ContractsAddAutoBoostsToContractRequestAutoboostsInner
+    from openapi_client.models.contracts_cancel_contract_request_request import ContractsCancelContractRequestRequest as ContractsCancelContractRequestRequest
+    from openapi_client.models.contracts_consent_to_contract200_response import ContractsConsentToContract200Response as ContractsConsentToContract200Response
+    from openapi_client.models.contracts_consent_to_contract_request import ContractsConsentToContractRequest as ContractsConsentToContractRequest
+    from openapi_client.models.contracts_consent_to_contract_request_terms import ContractsConsentToContractRequestTerms as ContractsConsentToContractRequestTerms
+    from openapi_client.models.contracts_consent_to_contract_request_terms_read import ContractsConsentToContractRequestTermsRead as ContractsConsentToContractRequestTermsRead
+    from openapi_client.models.contracts_consent_to_contract_request_terms_read_credentials import ContractsConsentToContractRequestTermsReadCredentials as ContractsConsentToContractRequestTermsReadCredentials
+    from openapi_client.models.contracts_consent_to_contract_request_terms_read_credentials_categories_value import ContractsConsentToContractRequestTermsReadCredentialsCategoriesValue as ContractsConsentToContractRequestTermsReadCredentialsCategoriesValue
+    from openapi_client.models.contracts_consent_to_contract_request_terms_write import ContractsConsentToContractRequestTermsWrite as ContractsConsentToContractRequestTermsWrite
+    from openapi_client.models.contracts_consent_to_contract_request_terms_write_credentials import ContractsConsentToContractRequestTermsWriteCredentials as ContractsConsentToContractRequestTermsWriteCredentials
+    from openapi_client.models.contracts_create_consent_flow_contract_request import ContractsCreateConsentFlowContractRequest as ContractsCreateConsentFlowContractRequest
+    from openapi_client.models.contracts_create_consent_flow_contract_request_autoboosts_inner import ContractsCreateConsentFlowContractRequestAutoboostsInner as ContractsCreateConsentFlowContractRequestAutoboostsInner
+    from openapi_client.models.contracts_create_consent_flow_contract_request_autoboosts_inner_signing_authority import ContractsCreateConsentFlowContractRequestAutoboostsInnerSigningAuthority as ContractsCreateConsentFlowContractRequestAutoboostsInnerSigningAuthority
+    from openapi_client.models.contracts_create_consent_flow_contract_request_contract import ContractsCreateConsentFlowContractRequestContract as ContractsCreateConsentFlowContractRequestContract
+    from openapi_client.models.contracts_create_consent_flow_contract_request_contract_read import ContractsCreateConsentFlowContractRequestContractRead as ContractsCreateConsentFlowContractRequestContractRead
+    from openapi_client.models.contracts_create_consent_flow_contract_request_contract_read_credentials import ContractsCreateConsentFlowContractRequestContractReadCredentials as ContractsCreateConsentFlowContractRequestContractReadCredentials
+    from openapi_client.models.contracts_create_consent_flow_contract_request_contract_read_credentials_categories_value import ContractsCreateConsentFlowContractRequestContractReadCredentialsCategoriesValue as ContractsCreateConsentFlowContractRequestContractReadCredentialsCategoriesValue
+    from openapi_client.models.contracts_create_consent_flow_contract_request_contract_write import ContractsCreateConsentFlowContractRequestContractWrite as ContractsCreateConsentFlowContractRequestContractWrite
+    from openapi_client.models.contracts_forward_contract_request_to_profile_request import ContractsForwardContractRequestToProfileRequest as ContractsForwardContractRequestToProfileRequest
+    from openapi_client.models.contracts_get_all_contract_requests_for_profile200_response_inner import ContractsGetAllContractRequestsForProfile200ResponseInner as ContractsGetAllContractRequestsForProfile200ResponseInner
+    from openapi_client.models.contracts_get_all_contract_requests_for_profile200_response_inner_contract import ContractsGetAllContractRequestsForProfile200ResponseInnerContract as ContractsGetAllContractRequestsForProfile200ResponseInnerContract
+    from openapi_client.models.contracts_get_all_credentials_for_terms_request import ContractsGetAllCredentialsForTermsRequest as ContractsGetAllCredentialsForTermsRequest
+    from openapi_client.models.contracts_get_consent_flow_contract200_response import ContractsGetConsentFlowContract200Response as ContractsGetConsentFlowContract200Response
+    from openapi_client.models.contracts_get_consent_flow_contract200_response_contract import ContractsGetConsentFlowContract200ResponseContract as ContractsGetConsentFlowContract200ResponseContract
+    from openapi_client.models.contracts_get_consent_flow_contract200_response_contract_read import ContractsGetConsentFlowContract200ResponseContractRead as ContractsGetConsentFlowContract200ResponseContractRead
+    from openapi_client.models.contracts_get_consent_flow_contracts200_response import ContractsGetConsentFlowContracts200Response as ContractsGetConsentFlowContracts200Response
+    from openapi_client.models.contracts_get_consent_flow_contracts200_response_records_inner import ContractsGetConsentFlowContracts200ResponseRecordsInner as ContractsGetConsentFlowContracts200ResponseRecordsInner
+    from openapi_client.models.contracts_get_consent_flow_contracts_request import ContractsGetConsentFlowContractsRequest as ContractsGetConsentFlowContractsRequest
+    from openapi_client.models.contracts_get_consent_flow_contracts_request_query import ContractsGetConsentFlowContractsRequestQuery as ContractsGetConsentFlowContractsRequestQuery
+    from openapi_client.models.contracts_get_consent_flow_contracts_request_query_read import ContractsGetConsentFlowContractsRequestQueryRead as ContractsGetConsentFlowContractsRequestQueryRead
+    from openapi_client.models.contracts_get_consent_flow_contracts_request_query_read_credentials import ContractsGetConsentFlowContractsRequestQueryReadCredentials as ContractsGetConsentFlowContractsRequestQueryReadCredentials
+    from openapi_client.models.contracts_get_consent_flow_contracts_request_query_read_credentials_categories_value import ContractsGetConsentFlowContractsRequestQueryReadCredentialsCategoriesValue as ContractsGetConsentFlowContractsRequestQueryReadCredentialsCategoriesValue
+    from openapi_client.models.contracts_get_consent_flow_contracts_request_query_write import ContractsGetConsentFlowContractsRequestQueryWrite as ContractsGetConsentFlowContractsRequestQueryWrite
+    from openapi_client.models.contracts_get_consented_contracts200_response import ContractsGetConsentedContracts200Response as ContractsGetConsentedContracts200Response
+    from openapi_client.models.contracts_get_consented_contracts200_response_records_inner import ContractsGetConsentedContracts200ResponseRecordsInner as ContractsGetConsentedContracts200ResponseRecordsInner
+    from openapi_client.models.contracts_get_consented_contracts200_response_records_inner_terms import ContractsGetConsentedContracts200ResponseRecordsInnerTerms as ContractsGetConsentedContracts200ResponseRecordsInnerTerms
+    from openapi_client.models.contracts_get_consented_contracts200_response_records_inner_terms_read import ContractsGetConsentedContracts200ResponseRecordsInnerTermsRead as ContractsGetConsentedContracts200ResponseRecordsInnerTermsRead
+    from openapi_client.models.contracts_get_consented_contracts200_response_records_inner_terms_read_credentials import ContractsGetConsentedContracts200ResponseRecordsInnerTermsReadCredentials as ContractsGetConsentedContracts200ResponseRecordsInnerTermsReadCredentials
+    from openapi_client.models.contracts_get_consented_contracts200_response_records_inner_terms_read_credentials_categories_value import ContractsGetConsentedContracts200ResponseRecordsInnerTermsReadCredentialsCategoriesValue as ContractsGetConsentedContracts200ResponseRecordsInnerTermsReadCredentialsCategoriesValue
+    from openapi_client.models.contracts_get_consented_contracts_request import ContractsGetConsentedContractsRequest as ContractsGetConsentedContractsRequest
+    from openapi_client.models.contracts_get_consented_contracts_request_query import ContractsGetConsentedContractsRequestQuery as ContractsGetConsentedContractsRequestQuery
+    from openapi_client.models.contracts_get_consented_contracts_request_query_read import ContractsGetConsentedContractsRequestQueryRead as ContractsGetConsentedContractsRequestQueryRead
+    from openapi_client.models.contracts_get_consented_contracts_request_query_read_credentials import ContractsGetConsentedContractsRequestQueryReadCredentials as ContractsGetConsentedContractsRequestQueryReadCredentials
+    from openapi_client.models.contracts_get_consented_contracts_request_query_read_credentials_categories_value import ContractsGetConsentedContractsRequestQueryReadCredentialsCategoriesValue as ContractsGetConsentedContractsRequestQueryReadCredentialsCategoriesValue
+    from openapi_client.models.contracts_get_consented_contracts_request_query_write import ContractsGetConsentedContractsRequestQueryWrite as ContractsGetConsentedContractsRequestQueryWrite
+    from openapi_client.models.contracts_get_consented_data200_response import ContractsGetConsentedData200Response as ContractsGetConsentedData200Response
+    from openapi_client.models.contracts_get_consented_data200_response_records_inner import ContractsGetConsentedData200ResponseRecordsInner as ContractsGetConsentedData200ResponseRecordsInner
+    from openapi_client.models.contracts_get_consented_data_for_contract200_response import ContractsGetConsentedDataForContract200Response as ContractsGetConsentedDataForContract200Response
+    from openapi_client.models.contracts_get_consented_data_for_contract200_response_records_inner import ContractsGetConsentedDataForContract200ResponseRecordsInner as ContractsGetConsentedDataForContract200ResponseRecordsInner
+    from openapi_client.models.contracts_get_consented_data_for_contract200_response_records_inner_credentials import ContractsGetConsentedDataForContract200ResponseRecordsInnerCredentials as ContractsGetConsentedDataForContract200ResponseRecordsInnerCredentials
+    from openapi_client.models.contracts_get_consented_data_for_contract_request import ContractsGetConsentedDataForContractRequest as ContractsGetConsentedDataForContractRequest
+    from openapi_client.models.contracts_get_consented_data_for_contract_request_query import ContractsGetConsentedDataForContractRequestQuery as ContractsGetConsentedDataForContractRequestQuery
+    from openapi_client.models.contracts_get_consented_data_for_contract_request_query_credentials import ContractsGetConsentedDataForContractRequestQueryCredentials as ContractsGetConsentedDataForContractRequestQueryCredentials
+    from openapi_client.models.contracts_get_consented_data_for_did200_response import ContractsGetConsentedDataForDid200Response as ContractsGetConsentedDataForDid200Response
+    from openapi_client.models.contracts_get_consented_data_for_did200_response_records_inner import ContractsGetConsentedDataForDid200ResponseRecordsInner as ContractsGetConsentedDataForDid200ResponseRecordsInner
+    from openapi_client.models.contracts_get_consented_data_for_did200_response_records_inner_credentials_inner import ContractsGetConsentedDataForDid200ResponseRecordsInnerCredentialsInner as ContractsGetConsentedDataForDid200ResponseRecordsInnerCredentialsInner
+    from openapi_client.models.contracts_get_consented_data_for_did_request import ContractsGetConsentedDataForDidRequest as ContractsGetConsentedDataForDidRequest
+    from openapi_client.models.contracts_get_consented_data_for_did_request_query import ContractsGetConsentedDataForDidRequestQuery as ContractsGetConsentedDataForDidRequestQuery
+    from openapi_client.models.contracts_get_consented_data_request import ContractsGetConsentedDataRequest as ContractsGetConsentedDataRequest
+    from openapi_client.models.contracts_get_contract_sent_requests200_response_inner import ContractsGetContractSentRequests200ResponseInner as ContractsGetContractSentRequests200ResponseInner
+    from openapi_client.models.contracts_get_credentials_for_contract200_response import ContractsGetCredentialsForContract200Response as ContractsGetCredentialsForContract200Response
+    from openapi_client.models.contracts_get_credentials_for_contract200_response_records_inner import ContractsGetCredentialsForContract200ResponseRecordsInner as ContractsGetCredentialsForContract200ResponseRecordsInner
+    from openapi_client.models.contracts_get_credentials_for_contract_request import ContractsGetCredentialsForContractRequest as ContractsGetCredentialsForContractRequest
+    from openapi_client.models.contracts_get_request_status_for_profile200_response import ContractsGetRequestStatusForProfile200Response as ContractsGetRequestStatusForProfile200Response
+    from openapi_client.models.contracts_get_terms_transaction_history200_response import ContractsGetTermsTransactionHistory200Response as ContractsGetTermsTransactionHistory200Response
+    from openapi_client.models.contracts_get_terms_transaction_history200_response_records_inner import ContractsGetTermsTransactionHistory200ResponseRecordsInner as ContractsGetTermsTransactionHistory200ResponseRecordsInner
+    from openapi_client.models.contracts_get_terms_transaction_history200_response_records_inner_terms import ContractsGetTermsTransactionHistory200ResponseRecordsInnerTerms as ContractsGetTermsTransactionHistory200ResponseRecordsInnerTerms
+    from openapi_client.models.contracts_get_terms_transaction_history200_response_records_inner_terms_write import ContractsGetTermsTransactionHistory200ResponseRecordsInnerTermsWrite as ContractsGetTermsTransactionHistory200ResponseRecordsInnerTermsWrite
+    from openapi_client.models.contracts_get_terms_transaction_history200_response_records_inner_terms_write_credentials import ContractsGetTermsTransactionHistory200ResponseRecordsInnerTermsWriteCredentials as ContractsGetTermsTransactionHistory200ResponseRecordsInnerTermsWriteCredentials
+    from openapi_client.models.contracts_get_terms_transaction_history_request import ContractsGetTermsTransactionHistoryRequest as ContractsGetTermsTransactionHistoryRequest
+    from openapi_client.models.contracts_get_terms_transaction_history_request_query import ContractsGetTermsTransactionHistoryRequestQuery as ContractsGetTermsTransactionHistoryRequestQuery
+    from openapi_client.models.contracts_get_terms_transaction_history_request_query_action import ContractsGetTermsTransactionHistoryRequestQueryAction as ContractsGetTermsTransactionHistoryRequestQueryAction
+    from openapi_client.models.contracts_get_terms_transaction_history_request_query_date import ContractsGetTermsTransactionHistoryRequestQueryDate as ContractsGetTermsTransactionHistoryRequestQueryDate
+    from openapi_client.models.contracts_get_terms_transaction_history_request_query_date_any_of import ContractsGetTermsTransactionHistoryRequestQueryDateAnyOf as ContractsGetTermsTransactionHistoryRequestQueryDateAnyOf
+    from openapi_client.models.contracts_get_terms_transaction_history_request_query_date_any_of1 import ContractsGetTermsTransactionHistoryRequestQueryDateAnyOf1 as ContractsGetTermsTransactionHistoryRequestQueryDateAnyOf1
+    from openapi_client.models.contracts_get_terms_transaction_history_request_query_date_any_of_any_of import ContractsGetTermsTransactionHistoryRequestQueryDateAnyOfAnyOf as ContractsGetTermsTransactionHistoryRequestQueryDateAnyOfAnyOf
+    from openapi_client.models.contracts_get_terms_transaction_history_request_query_date_any_of_any_of1 import ContractsGetTermsTransactionHistoryRequestQueryDateAnyOfAnyOf1 as ContractsGetTermsTransactionHistoryRequestQueryDateAnyOfAnyOf1
+    from openapi_client.models.contracts_get_terms_transaction_history_request_query_expires_at import ContractsGetTermsTransactionHistoryRequestQueryExpiresAt as ContractsGetTermsTransactionHistoryRequestQueryExpiresAt
+    from openapi_client.models.contracts_get_terms_transaction_history_request_query_expires_at_any_of import ContractsGetTermsTransactionHistoryRequestQueryExpiresAtAnyOf as ContractsGetTermsTransactionHistoryRequestQueryExpiresAtAnyOf
+    from openapi_client.models.contracts_get_terms_transaction_history_request_query_expires_at_any_of1 import ContractsGetTermsTransactionHistoryRequestQueryExpiresAtAnyOf1 as ContractsGetTermsTransactionHistoryRequestQueryExpiresAtAnyOf1
+    from openapi_client.models.contracts_get_terms_transaction_history_request_query_expires_at_any_of_any_of import ContractsGetTermsTransactionHistoryRequestQueryExpiresAtAnyOfAnyOf as ContractsGetTermsTransactionHistoryRequestQueryExpiresAtAnyOfAnyOf
+    from openapi_client.models.contracts_get_terms_transaction_history_request_query_expires_at_any_of_any_of1 import ContractsGetTermsTransactionHistoryRequestQueryExpiresAtAnyOfAnyOf1 as ContractsGetTermsTransactionHistoryRequestQueryExpiresAtAnyOfAnyOf1
+    from openapi_client.models.contracts_get_terms_transaction_history_request_query_terms import ContractsGetTermsTransactionHistoryRequestQueryTerms as ContractsGetTermsTransactionHistoryRequestQueryTerms
+    from openapi_client.models.contracts_get_terms_transaction_history_request_query_terms_read import ContractsGetTermsTransactionHistoryRequestQueryTermsRead as ContractsGetTermsTransactionHistoryRequestQueryTermsRead
+    from openapi_client.models.contracts_mark_contract_request_as_seen_request import ContractsMarkContractRequestAsSeenRequest as ContractsMarkContractRequestAsSeenRequest
+    from openapi_client.models.contracts_remove_auto_boosts_from_contract_request import ContractsRemoveAutoBoostsFromContractRequest as ContractsRemoveAutoBoostsFromContractRequest
+    from openapi_client.models.contracts_send_ai_insight_share_request_request import ContractsSendAiInsightShareRequestRequest as ContractsSendAiInsightShareRequestRequest
+    from openapi_client.models.contracts_send_ai_insights_contract_request_request import ContractsSendAiInsightsContractRequestRequest as ContractsSendAiInsightsContractRequestRequest
+    from openapi_client.models.contracts_sync_credentials_to_contract_request import ContractsSyncCredentialsToContractRequest as ContractsSyncCredentialsToContractRequest
+    from openapi_client.models.contracts_update_consented_contract_terms_request import ContractsUpdateConsentedContractTermsRequest as ContractsUpdateConsentedContractTermsRequest
+    from openapi_client.models.contracts_update_consented_contract_terms_request_terms import ContractsUpdateConsentedContractTermsRequestTerms as ContractsUpdateConsentedContractTermsRequestTerms
+    from openapi_client.models.contracts_update_consented_contract_terms_request_terms_read import ContractsUpdateConsentedContractTermsRequestTermsRead as ContractsUpdateConsentedContractTermsRequestTermsRead
+    from openapi_client.models.contracts_update_consented_contract_terms_request_terms_read_credentials import ContractsUpdateConsentedContractTermsRequestTermsReadCredentials as ContractsUpdateConsentedContractTermsRequestTermsReadCredentials
+    from openapi_client.models.contracts_write_credential_to_contract_request import ContractsWriteCredentialToContractRequest as ContractsWriteCredentialToContractRequest
+    from openapi_client.models.contracts_write_credential_to_contract_request_credential import ContractsWriteCredentialToContractRequestCredential as ContractsWriteCredentialToContractRequestCredential
+    from openapi_client.models.contracts_write_credential_to_contract_via_signing_authority_request import ContractsWriteCredentialToContractViaSigningAuthorityRequest as ContractsWriteCredentialToContractViaSigningAuthorityRequest
+    from openapi_client.models.credential_accept_credential_request import CredentialAcceptCredentialRequest as CredentialAcceptCredentialRequest
+    from openapi_client.models.credential_accept_credential_request_options import CredentialAcceptCredentialRequestOptions as CredentialAcceptCredentialRequestOptions
+    from openapi_client.models.credential_received_credentials200_response_inner import CredentialReceivedCredentials200ResponseInner as CredentialReceivedCredentials200ResponseInner
+    from openapi_client.models.credential_send_credential_request import CredentialSendCredentialRequest as CredentialSendCredentialRequest
+    from openapi_client.models.credential_send_credential_request_credential import CredentialSendCredentialRequestCredential as CredentialSendCredentialRequestCredential
+    from openapi_client.models.credential_send_credential_request_credential_any_of import CredentialSendCredentialRequestCredentialAnyOf as CredentialSendCredentialRequestCredentialAnyOf
+    from openapi_client.models.credential_send_credential_request_credential_any_of1 import CredentialSendCredentialRequestCredentialAnyOf1 as CredentialSendCredentialRequestCredentialAnyOf1
+    from openapi_client.models.credential_send_credential_request_credential_any_of1_recipients_inner import CredentialSendCredentialRequestCredentialAnyOf1RecipientsInner as CredentialSendCredentialRequestCredentialAnyOf1RecipientsInner
+    from openapi_client.models.credential_send_credential_request_credential_any_of1_recipients_inner_header import CredentialSendCredentialRequestCredentialAnyOf1RecipientsInnerHeader as CredentialSendCredentialRequestCredentialAnyOf1RecipientsInnerHeader
+    from openapi_client.models.credential_send_credential_request_credential_any_of1_recipients_inner_header_epk import CredentialSendCredentialRequestCredentialAnyOf1RecipientsInnerHeaderEpk as CredentialSendCredentialRequestCredentialAnyOf1RecipientsInnerHeaderEpk
+    from openapi_client.models.did_metadata_add_did_metadata_request import DidMetadataAddDidMetadataRequest as DidMetadataAddDidMetadataRequest
+    from openapi_client.models.did_metadata_add_did_metadata_request_authentication_inner import DidMetadataAddDidMetadataRequestAuthenticationInner as DidMetadataAddDidMetadataRequestAuthenticationInner
+    from openapi_client.models.did_metadata_add_did_metadata_request_authentication_inner_any_of import DidMetadataAddDidMetadataRequestAuthenticationInnerAnyOf as DidMetadataAddDidMetadataRequestAuthenticationInnerAnyOf
+    from openapi_client.models.did_metadata_add_did_metadata_request_authentication_inner_any_of_public_key_jwk import DidMetadataAddDidMetadataRequestAuthenticationInnerAnyOfPublicKeyJwk as DidMetadataAddDidMetadataRequestAuthenticationInnerAnyOfPublicKeyJwk
+    from openapi_client.models.did_metadata_add_did_metadata_request_service_inner import DidMetadataAddDidMetadataRequestServiceInner as DidMetadataAddDidMetadataRequestServiceInner
+    from openapi_client.models.did_metadata_add_did_metadata_request_verification_method_inner import DidMetadataAddDidMetadataRequestVerificationMethodInner as DidMetadataAddDidMetadataRequestVerificationMethodInner
+    from openapi_client.models.did_metadata_add_did_metadata_request_verification_method_inner_any_of import DidMetadataAddDidMetadataRequestVerificationMethodInnerAnyOf as DidMetadataAddDidMetadataRequestVerificationMethodInnerAnyOf
+    from openapi_client.models.did_metadata_add_did_metadata_request_verification_method_inner_any_of_public_key_jwk import DidMetadataAddDidMetadataRequestVerificationMethodInnerAnyOfPublicKeyJwk as DidMetadataAddDidMetadataRequestVerificationMethodInnerAnyOfPublicKeyJwk
+    from openapi_client.models.did_metadata_get_did_metadata200_response import DidMetadataGetDidMetadata200Response as DidMetadataGetDidMetadata200Response
+    from openapi_client.models.did_metadata_get_did_metadata200_response_authentication_inner import DidMetadataGetDidMetadata200ResponseAuthenticationInner as DidMetadataGetDidMetadata200ResponseAuthenticationInner
+    from openapi_client.models.did_metadata_get_did_metadata200_response_authentication_inner_any_of import DidMetadataGetDidMetadata200ResponseAuthenticationInnerAnyOf as DidMetadataGetDidMetadata200ResponseAuthenticationInnerAnyOf
+    from openapi_client.models.did_metadata_get_did_metadata200_response_authentication_inner_any_of_public_key_jwk import DidMetadataGetDidMetadata200ResponseAuthenticationInnerAnyOfPublicKeyJwk as DidMetadataGetDidMetadata200ResponseAuthenticationInnerAnyOfPublicKeyJwk
+    from openapi_client.models.did_metadata_get_did_metadata200_response_service_inner import DidMetadataGetDidMetadata200ResponseServiceInner as DidMetadataGetDidMetadata200ResponseServiceInner
+    from openapi_client.models.did_metadata_get_did_metadata200_response_verification_method_inner import DidMetadataGetDidMetadata200ResponseVerificationMethodInner as DidMetadataGetDidMetadata200ResponseVerificationMethodInner
+    from openapi_client.models.did_metadata_get_did_metadata200_response_verification_method_inner_any_of import DidMetadataGetDidMetadata200ResponseVerificationMethodInnerAnyOf as DidMetadataGetDidMetadata200ResponseVerificationMethodInnerAnyOf
+    from openapi_client.models.did_metadata_get_did_metadata200_response_verification_method_inner_any_of_public_key_jwk import DidMetadataGetDidMetadata200ResponseVerificationMethodInnerAnyOfPublicKeyJwk as DidMetadataGetDidMetadata200ResponseVerificationMethodInnerAnyOfPublicKeyJwk
+    from openapi_client.models.did_metadata_get_my_did_metadata200_response_inner import DidMetadataGetMyDidMetadata200ResponseInner as DidMetadataGetMyDidMetadata200ResponseInner
+    from openapi_client.models.did_metadata_update_did_metadata_request import DidMetadataUpdateDidMetadataRequest as DidMetadataUpdateDidMetadataRequest
+    from openapi_client.models.did_metadata_update_did_metadata_request_updates import DidMetadataUpdateDidMetadataRequestUpdates as DidMetadataUpdateDidMetadataRequestUpdates
+    from openapi_client.models.error_badrequest import ErrorBADREQUEST as ErrorBADREQUEST
+    from openapi_client.models.error_badrequest_issues_inner import ErrorBADREQUESTIssuesInner as ErrorBADREQUESTIssuesInner
+    from openapi_client.models.error_forbidden import ErrorFORBIDDEN as ErrorFORBIDDEN
+    from openapi_client.models.error_internalservererror import ErrorINTERNALSERVERERROR as ErrorINTERNALSERVERERROR
+    from openapi_client.models.error_notfound import ErrorNOTFOUND as ErrorNOTFOUND
+    from openapi_client.models.error_unauthorized import ErrorUNAUTHORIZED as ErrorUNAUTHORIZED
+    from openapi_client.models.inbox_approve_guardian_request_request import InboxApproveGuardianRequestRequest as InboxApproveGuardianRequestRequest
+    from openapi_client.models.inbox_claim200_response import InboxClaim200Response as InboxClaim200Response
+    from openapi_client.models.inbox_claim200_response_inbox_credential import InboxClaim200ResponseInboxCredential as InboxClaim200ResponseInboxCredential
+    from openapi_client.models.inbox_claim200_response_inbox_credential_signing_authority import InboxClaim200ResponseInboxCredentialSigningAuthority as InboxClaim200ResponseInboxCredentialSigningAuthority
+    from openapi_client.models.inbox_claim_request import InboxClaimRequest as InboxClaimRequest
+    from openapi_client.models.inbox_claim_request_configuration import InboxClaimRequestConfiguration as InboxClaimRequestConfiguration
+    from openapi_client.models.inbox_claim_request_credential import InboxClaimRequestCredential as InboxClaimRequestCredential
+    from openapi_client.models.inbox_finalize200_response import InboxFinalize200Response as InboxFinalize200Response
+    from openapi_client.models.inbox_get_my_issued_credentials200_response import InboxGetMyIssuedCredentials200Response as InboxGetMyIssuedCredentials200Response
+    from openapi_client.models.inbox_get_my_issued_credentials200_response_records_inner import InboxGetMyIssuedCredentials200ResponseRecordsInner as InboxGetMyIssuedCredentials200ResponseRecordsInner
+    from openapi_client.models.inbox_get_my_issued_credentials200_response_records_inner_signing_authority import InboxGetMyIssuedCredentials200ResponseRecordsInnerSigningAuthority as InboxGetMyIssuedCredentials200ResponseRecordsInnerSigningAuthority
+    from openapi_client.models.inbox_get_my_issued_credentials_request import InboxGetMyIssuedCredentialsRequest as InboxGetMyIssuedCredentialsRequest
+    from openapi_client.models.inbox_get_my_issued_credentials_request_query import InboxGetMyIssuedCredentialsRequestQuery as InboxGetMyIssuedCredentialsRequestQuery
+    from openapi_client.models.inbox_get_my_issued_credentials_request_recipient import InboxGetMyIssuedCredentialsRequestRecipient as InboxGetMyIssuedCredentialsRequestRecipient
+    from openapi_client.models.inbox_get_my_issued_credentials_request_recipient_one_of import InboxGetMyIssuedCredentialsRequestRecipientOneOf as InboxGetMyIssuedCredentialsRequestRecipientOneOf
+    from openapi_client.models.inbox_issue200_response import InboxIssue200Response as InboxIssue200Response
+    from openapi_client.models.inbox_issue200_response_recipient import InboxIssue200ResponseRecipient as InboxIssue200ResponseRecipient
+    from openapi_client.models.inbox_issue200_response_recipient_one_of import InboxIssue200ResponseRecipientOneOf as InboxIssue200ResponseRecipientOneOf
+    from openapi_client.models.inbox_issue200_response_recipient_one_of1 import InboxIssue200ResponseRecipientOneOf1 as InboxIssue200ResponseRecipientOneOf1
+    from openapi_client.models.inbox_issue_request import InboxIssueRequest as InboxIssueRequest
+    from openapi_client.models.inbox_issue_request_configuration import InboxIssueRequestConfiguration as InboxIssueRequestConfiguration
+    from openapi_client.models.inbox_issue_request_configuration_delivery import InboxIssueRequestConfigurationDelivery as InboxIssueRequestConfigurationDelivery
+    from openapi_client.models.inbox_issue_request_configuration_delivery_template import InboxIssueRequestConfigurationDeliveryTemplate as InboxIssueRequestConfigurationDeliveryTemplate
+    from openapi_client.models.inbox_issue_request_configuration_delivery_template_model import InboxIssueRequestConfigurationDeliveryTemplateModel as InboxIssueRequestConfigurationDeliveryTemplateModel
+    from openapi_client.models.inbox_issue_request_configuration_delivery_template_model_credential import InboxIssueRequestConfigurationDeliveryTemplateModelCredential as InboxIssueRequestConfigurationDeliveryTemplateModelCredential
+    from openapi_client.models.inbox_issue_request_configuration_delivery_template_model_issuer import InboxIssueRequestConfigurationDeliveryTemplateModelIssuer as InboxIssueRequestConfigurationDeliveryTemplateModelIssuer
+    from openapi_client.models.inbox_issue_request_configuration_delivery_template_model_recipient import InboxIssueRequestConfigurationDeliveryTemplateModelRecipient as InboxIssueRequestConfigurationDeliveryTemplateModelRecipient
+    from openapi_client.models.inbox_issue_request_configuration_signing_authority import InboxIssueRequestConfigurationSigningAuthority as InboxIssueRequestConfigurationSigningAuthority
+    from openapi_client.models.inbox_issue_request_credential import InboxIssueRequestCredential as InboxIssueRequestCredential
+    from openapi_client.models.inbox_issue_request_credential_any_of import InboxIssueRequestCredentialAnyOf as InboxIssueRequestCredentialAnyOf
+    from openapi_client.models.inbox_issue_request_recipient import InboxIssueRequestRecipient as InboxIssueRequestRecipient
+    from openapi_client.models.inbox_issue_request_recipient_one_of import InboxIssueRequestRecipientOneOf as InboxIssueRequestRecipientOneOf
+    from openapi_client.models.inbox_issue_request_recipient_one_of1 import InboxIssueRequestRecipientOneOf1 as InboxIssueRequestRecipientOneOf1
+    from openapi_client.models.inbox_send_guardian_approval_email200_response import InboxSendGuardianApprovalEmail200Response as InboxSendGuardianApprovalEmail200Response
+    from openapi_client.models.inbox_send_guardian_approval_email_request import InboxSendGuardianApprovalEmailRequest as InboxSendGuardianApprovalEmailRequest
+    from openapi_client.models.inbox_send_guardian_approval_email_request_template import InboxSendGuardianApprovalEmailRequestTemplate as InboxSendGuardianApprovalEmailRequestTemplate
+    from openapi_client.models.integrations_add_integration_request import IntegrationsAddIntegrationRequest as IntegrationsAddIntegrationRequest
+    from openapi_client.models.integrations_add_integration_request_whitelisted_domains_inner import IntegrationsAddIntegrationRequestWhitelistedDomainsInner as IntegrationsAddIntegrationRequestWhitelistedDomainsInner
+    from openapi_client.models.integrations_associate_integration_with_signing_authority_request import IntegrationsAssociateIntegrationWithSigningAuthorityRequest as IntegrationsAssociateIntegrationWithSigningAuthorityRequest
+    from openapi_client.models.integrations_count_integrations_request import IntegrationsCountIntegrationsRequest as IntegrationsCountIntegrationsRequest
+    from openapi_client.models.integrations_get_integration200_response import IntegrationsGetIntegration200Response as IntegrationsGetIntegration200Response
+    from openapi_client.models.integrations_get_integrations200_response import IntegrationsGetIntegrations200Response as IntegrationsGetIntegrations200Response
+    from openapi_client.models.integrations_get_integrations200_response_records_inner import IntegrationsGetIntegrations200ResponseRecordsInner as IntegrationsGetIntegrations200ResponseRecordsInner
+    from openapi_client.models.integrations_get_integrations_request import IntegrationsGetIntegrationsRequest as IntegrationsGetIntegrationsRequest
+    from openapi_client.models.integrations_get_integrations_request_query import IntegrationsGetIntegrationsRequestQuery as IntegrationsGetIntegrationsRequestQuery
+    from openapi_client.models.integrations_update_integration_request import IntegrationsUpdateIntegrationRequest as IntegrationsUpdateIntegrationRequest
+    from openapi_client.models.integrations_update_integration_request_updates import IntegrationsUpdateIntegrationRequestUpdates as IntegrationsUpdateIntegrationRequestUpdates
+    from openapi_client.models.presentation_accept_presentation_request import PresentationAcceptPresentationRequest as PresentationAcceptPresentationRequest
+    from openapi_client.models.presentation_send_presentation_request import PresentationSendPresentationRequest as PresentationSendPresentationRequest
+    from openapi_client.models.presentation_send_presentation_request_presentation import PresentationSendPresentationRequestPresentation as PresentationSendPresentationRequestPresentation
+    from openapi_client.models.presentation_send_presentation_request_presentation_any_of import PresentationSendPresentationRequestPresentationAnyOf as PresentationSendPresentationRequestPresentationAnyOf
+    from openapi_client.models.presentation_send_presentation_request_presentation_any_of_verifiable_credential import PresentationSendPresentationRequestPresentationAnyOfVerifiableCredential as PresentationSendPresentationRequestPresentationAnyOfVerifiableCredential
+    from openapi_client.models.profile_create_profile_request import ProfileCreateProfileRequest as ProfileCreateProfileRequest
+    from openapi_client.models.profile_create_profile_request_display import ProfileCreateProfileRequestDisplay as ProfileCreateProfileRequestDisplay
+    from openapi_client.models.profile_create_service_profile_request import ProfileCreateServiceProfileRequest as ProfileCreateServiceProfileRequest
+    from openapi_client.models.profile_create_service_profile_request_display import ProfileCreateServiceProfileRequestDisplay as ProfileCreateServiceProfileRequestDisplay
+    from openapi_client.models.profile_generate_invite200_response import ProfileGenerateInvite200Response as ProfileGenerateInvite200Response
+    from openapi_client.models.profile_generate_invite_request import ProfileGenerateInviteRequest as ProfileGenerateInviteRequest
+    from openapi_client.models.profile_get_available_profiles200_response import ProfileGetAvailableProfiles200Response as ProfileGetAvailableProfiles200Response
+    from openapi_client.models.profile_get_available_profiles200_response_records_inner import ProfileGetAvailableProfiles200ResponseRecordsInner as ProfileGetAvailableProfiles200ResponseRecordsInner
+    from openapi_client.models.profile_get_available_profiles200_response_records_inner_manager import ProfileGetAvailableProfiles200ResponseRecordsInnerManager as ProfileGetAvailableProfiles200ResponseRecordsInnerManager
+    from openapi_client.models.profile_get_available_profiles_request import ProfileGetAvailableProfilesRequest as ProfileGetAvailableProfilesRequest
+    from openapi_client.models.profile_list_invites200_response_inner import ProfileListInvites200ResponseInner as ProfileListInvites200ResponseInner
+    from openapi_client.models.profile_manager_create_child_profile_manager_request import ProfileManagerCreateChildProfileManagerRequest as ProfileManagerCreateChildProfileManagerRequest
+    from openapi_client.models.profile_manager_create_child_profile_manager_request_profile import ProfileManagerCreateChildProfileManagerRequestProfile as ProfileManagerCreateChildProfileManagerRequestProfile
+    from openapi_client.models.profile_manager_create_managed_profile_request import ProfileManagerCreateManagedProfileRequest as ProfileManagerCreateManagedProfileRequest
+    from openapi_client.models.profile_manager_create_profile_manager_request import ProfileManagerCreateProfileManagerRequest as ProfileManagerCreateProfileManagerRequest
+    from openapi_client.models.profile_manager_get_managed_profiles_request import ProfileManagerGetManagedProfilesRequest as ProfileManagerGetManagedProfilesRequest
+    from openapi_client.models.profile_register_signing_authority_request import ProfileRegisterSigningAuthorityRequest as ProfileRegisterSigningAuthorityRequest
+    from openapi_client.models.profile_search_profiles200_response_inner import ProfileSearchProfiles200ResponseInner as ProfileSearchProfiles200ResponseInner
+    from openapi_client.models.profile_set_primary_signing_authority_request import ProfileSetPrimarySigningAuthorityRequest as ProfileSetPrimarySigningAuthorityRequest
+    from openapi_client.models.profile_signing_authorities200_response_inner import ProfileSigningAuthorities200ResponseInner as ProfileSigningAuthorities200ResponseInner
+    from openapi_client.models.profile_signing_authorities200_response_inner_relationship import ProfileSigningAuthorities200ResponseInnerRelationship as ProfileSigningAuthorities200ResponseInnerRelationship
+    from openapi_client.models.profile_signing_authorities200_response_inner_signing_authority import ProfileSigningAuthorities200ResponseInnerSigningAuthority as ProfileSigningAuthorities200ResponseInnerSigningAuthority
+    from openapi_client.models.profile_signing_authority200_response import ProfileSigningAuthority200Response as ProfileSigningAuthority200Response
+    from openapi_client.models.profile_signing_authority200_response_relationship import ProfileSigningAuthority200ResponseRelationship as ProfileSigningAuthority200ResponseRelationship
+    from openapi_client.models.profile_signing_authority200_response_signing_authority import ProfileSigningAuthority200ResponseSigningAuthority as ProfileSigningAuthority200ResponseSigningAuthority
+    from openapi_client.models.profile_update_profile_request import ProfileUpdateProfileRequest as ProfileUpdateProfileRequest
+    from openapi_client.models.schema0 import Schema0 as Schema0
+    from openapi_client.models.schema1 import Schema1 as Schema1
+    from openapi_client.models.skill_frameworks_add_framework_admin200_response import SkillFrameworksAddFrameworkAdmin200Response as SkillFrameworksAddFrameworkAdmin200Response
+    from openapi_client.models.skill_frameworks_add_framework_admin_request import SkillFrameworksAddFrameworkAdminRequest as SkillFrameworksAddFrameworkAdminRequest
+    from openapi_client.models.skill_frameworks_count_boosts_that_use_framework200_response import SkillFrameworksCountBoostsThatUseFramework200Response as SkillFrameworksCountBoostsThatUseFramework200Response
+    from openapi_client.models.skill_frameworks_create_managed_batch_request import SkillFrameworksCreateManagedBatchRequest as SkillFrameworksCreateManagedBatchRequest
+    from openapi_client.models.skill_frameworks_create_managed_batch_request_frameworks_inner import SkillFrameworksCreateManagedBatchRequestFrameworksInner as SkillFrameworksCreateManagedBatchRequestFrameworksInner
+    from openapi_client.models.skill_frameworks_create_managed_request import SkillFrameworksCreateManagedRequest as SkillFrameworksCreateManagedRequest
+    from openapi_client.models.skill_frameworks_create_request import SkillFrameworksCreateRequest as SkillFrameworksCreateRequest
+    from openapi_client.models.skill_frameworks_get_boosts_that_use_framework_request import SkillFrameworksGetBoostsThatUseFrameworkRequest as SkillFrameworksGetBoostsThatUseFrameworkRequest
+    from openapi_client.models.skill_frameworks_get_by_id200_response import SkillFrameworksGetById200Response as SkillFrameworksGetById200Response
+    from openapi_client.models.skill_frameworks_get_by_id200_response_skills import SkillFrameworksGetById200ResponseSkills as SkillFrameworksGetById200ResponseSkills
+    from openapi_client.models.skill_frameworks_remove_framework_admin200_response import SkillFrameworksRemoveFrameworkAdmin200Response as SkillFrameworksRemoveFrameworkAdmin200Response
+    from openapi_client.models.skill_frameworks_replace_skills200_response import SkillFrameworksReplaceSkills200Response as SkillFrameworksReplaceSkills200Response
+    from openapi_client.models.skill_frameworks_replace_skills_request import SkillFrameworksReplaceSkillsRequest as SkillFrameworksReplaceSkillsRequest
+    from openapi_client.models.skill_frameworks_update_request import SkillFrameworksUpdateRequest as SkillFrameworksUpdateRequest
+    from openapi_client.models.skills_add_skill_tag200_response_inner import SkillsAddSkillTag200ResponseInner as SkillsAddSkillTag200ResponseInner
+    from openapi_client.models.skills_add_skill_tag_request import SkillsAddSkillTagRequest as SkillsAddSkillTagRequest
+    from openapi_client.models.skills_add_skill_tag_request_tag import SkillsAddSkillTagRequestTag as SkillsAddSkillTagRequestTag
+    from openapi_client.models.skills_count_skills200_response import SkillsCountSkills200Response as SkillsCountSkills200Response
+    from openapi_client.models.skills_create200_response import SkillsCreate200Response as SkillsCreate200Response
+    from openapi_client.models.skills_create_many_request import SkillsCreateManyRequest as SkillsCreateManyRequest
+    from openapi_client.models.skills_create_request import SkillsCreateRequest as SkillsCreateRequest
+    from openapi_client.models.skills_delete200_response import SkillsDelete200Response as SkillsDelete200Response
+    from openapi_client.models.skills_get_framework_skill_tree200_response import SkillsGetFrameworkSkillTree200Response as SkillsGetFrameworkSkillTree200Response
+    from openapi_client.models.skills_get_full_skill_tree200_response import SkillsGetFullSkillTree200Response as SkillsGetFullSkillTree200Response
+    from openapi_client.models.skills_get_skill200_response import SkillsGetSkill200Response as SkillsGetSkill200Response
+    from openapi_client.models.skills_get_skill_path200_response import SkillsGetSkillPath200Response as SkillsGetSkillPath200Response
+    from openapi_client.models.skills_list_skill_tags200_response_inner import SkillsListSkillTags200ResponseInner as SkillsListSkillTags200ResponseInner
+    from openapi_client.models.skills_search_framework_skills_request import SkillsSearchFrameworkSkillsRequest as SkillsSearchFrameworkSkillsRequest
+    from openapi_client.models.skills_search_framework_skills_request_query import SkillsSearchFrameworkSkillsRequestQuery as SkillsSearchFrameworkSkillsRequestQuery
+    from openapi_client.models.skills_search_framework_skills_request_query_any_of import SkillsSearchFrameworkSkillsRequestQueryAnyOf as SkillsSearchFrameworkSkillsRequestQueryAnyOf
+    from openapi_client.models.skills_sync_framework_skills200_response import SkillsSyncFrameworkSkills200Response as SkillsSyncFrameworkSkills200Response
+    from openapi_client.models.skills_update_request import SkillsUpdateRequest as SkillsUpdateRequest
+    from openapi_client.models.storage_resolve200_response import StorageResolve200Response as StorageResolve200Response
+    from openapi_client.models.storage_resolve200_response_any_of import StorageResolve200ResponseAnyOf as StorageResolve200ResponseAnyOf
+    from openapi_client.models.storage_resolve200_response_any_of1 import StorageResolve200ResponseAnyOf1 as StorageResolve200ResponseAnyOf1
+    from openapi_client.models.storage_resolve200_response_any_of1_read import StorageResolve200ResponseAnyOf1Read as StorageResolve200ResponseAnyOf1Read
+    from openapi_client.models.storage_resolve200_response_any_of1_read_credentials import StorageResolve200ResponseAnyOf1ReadCredentials as StorageResolve200ResponseAnyOf1ReadCredentials
+    from openapi_client.models.storage_resolve200_response_any_of1_read_credentials_categories_value import StorageResolve200ResponseAnyOf1ReadCredentialsCategoriesValue as StorageResolve200ResponseAnyOf1ReadCredentialsCategoriesValue
+    from openapi_client.models.storage_resolve200_response_any_of1_write import StorageResolve200ResponseAnyOf1Write as StorageResolve200ResponseAnyOf1Write
+    from openapi_client.models.storage_resolve200_response_any_of1_write_credentials import StorageResolve200ResponseAnyOf1WriteCredentials as StorageResolve200ResponseAnyOf1WriteCredentials
+    from openapi_client.models.storage_resolve200_response_any_of_any_of import StorageResolve200ResponseAnyOfAnyOf as StorageResolve200ResponseAnyOfAnyOf
+    from openapi_client.models.storage_resolve200_response_any_of_any_of1 import StorageResolve200ResponseAnyOfAnyOf1 as StorageResolve200ResponseAnyOfAnyOf1
+    from openapi_client.models.storage_resolve200_response_any_of_any_of1_read import StorageResolve200ResponseAnyOfAnyOf1Read as StorageResolve200ResponseAnyOfAnyOf1Read
+    from openapi_client.models.storage_resolve200_response_any_of_any_of1_read_credentials import StorageResolve200ResponseAnyOfAnyOf1ReadCredentials as StorageResolve200ResponseAnyOfAnyOf1ReadCredentials
+    from openapi_client.models.storage_resolve200_response_any_of_any_of1_read_credentials_categories_value import StorageResolve200ResponseAnyOfAnyOf1ReadCredentialsCategoriesValue as StorageResolve200ResponseAnyOfAnyOf1ReadCredentialsCategoriesValue
+    from openapi_client.models.storage_resolve200_response_any_of_any_of1_read_personal_value import StorageResolve200ResponseAnyOfAnyOf1ReadPersonalValue as StorageResolve200ResponseAnyOfAnyOf1ReadPersonalValue
+    from openapi_client.models.storage_resolve200_response_any_of_any_of1_write import StorageResolve200ResponseAnyOfAnyOf1Write as StorageResolve200ResponseAnyOfAnyOf1Write
+    from openapi_client.models.storage_resolve200_response_any_of_any_of1_write_credentials import StorageResolve200ResponseAnyOfAnyOf1WriteCredentials as StorageResolve200ResponseAnyOfAnyOf1WriteCredentials
+    from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of import StorageResolve200ResponseAnyOfAnyOfAnyOf as StorageResolve200ResponseAnyOfAnyOfAnyOf
+    from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of1 import StorageResolve200ResponseAnyOfAnyOfAnyOf1 as StorageResolve200ResponseAnyOfAnyOfAnyOf1
+    from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of1_recipients_inner import StorageResolve200ResponseAnyOfAnyOfAnyOf1RecipientsInner as StorageResolve200ResponseAnyOfAnyOfAnyOf1RecipientsInner
+    from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of1_recipients_inner_header import StorageResolve200ResponseAnyOfAnyOfAnyOf1RecipientsInnerHeader as StorageResolve200ResponseAnyOfAnyOfAnyOf1RecipientsInnerHeader
+    from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of1_recipients_inner_header_epk import StorageResolve200ResponseAnyOfAnyOfAnyOf1RecipientsInnerHeaderEpk as StorageResolve200ResponseAnyOfAnyOfAnyOf1RecipientsInnerHeaderEpk
+    from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of import StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOf as StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOf
+    from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of1 import StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOf1 as StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOf1
+    from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of1_verifiable_credential import StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOf1VerifiableCredential as StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOf1VerifiableCredential
+    from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of_any_of import StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOf as StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOf
+    from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of_any_of1 import StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOf1 as StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOf1
+    from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of_any_of_issuer import StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuer as StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuer
+    from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of_any_of_issuer_any_of import StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOf as StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOf
+    from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of_any_of_issuer_any_of_address import StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOfAddress as StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOfAddress
+    from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of_any_of_issuer_any_of_address_geo import StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOfAddressGeo as StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOfAddressGeo
+    from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of_any_of_issuer_any_of_image import StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOfImage as StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOfImage
+    from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of_any_of_issuer_any_of_image_any_of import StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOfImageAnyOf as StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOfImageAnyOf
+    from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of_any_of_issuer_any_of_other_identifier_inner import StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOfOtherIdentifierInner as StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOfOtherIdentifierInner
+    from openapi_client.models.storage_store_request import StorageStoreRequest as StorageStoreRequest
+    from openapi_client.models.storage_store_request_item import StorageStoreRequestItem as StorageStoreRequestItem
+    from openapi_client.models.storage_store_request_item_any_of import StorageStoreRequestItemAnyOf as StorageStoreRequestItemAnyOf
+    from openapi_client.models.storage_store_request_item_any_of_any_of import StorageStoreRequestItemAnyOfAnyOf as StorageStoreRequestItemAnyOfAnyOf
+    from openapi_client.models.workflows_participate_in_exchange200_response import WorkflowsParticipateInExchange200Response as WorkflowsParticipateInExchange200Response
+    from openapi_client.models.workflows_participate_in_exchange200_response_verifiable_presentation_request import WorkflowsParticipateInExchange200ResponseVerifiablePresentationRequest as WorkflowsParticipateInExchange200ResponseVerifiablePresentationRequest
+    from openapi_client.models.workflows_participate_in_exchange200_response_verifiable_presentation_request_query_inner import WorkflowsParticipateInExchange200ResponseVerifiablePresentationRequestQueryInner as WorkflowsParticipateInExchange200ResponseVerifiablePresentationRequestQueryInner
+    from openapi_client.models.workflows_participate_in_exchange200_response_verifiable_presentation_request_query_inner_credential_query_inner import WorkflowsParticipateInExchange200ResponseVerifiablePresentationRequestQueryInnerCredentialQueryInner as WorkflowsParticipateInExchange200ResponseVerifiablePresentationRequestQueryInnerCredentialQueryInner
+    from openapi_client.models.workflows_participate_in_exchange_request import WorkflowsParticipateInExchangeRequest as WorkflowsParticipateInExchangeRequest
+
+# exports are imported on first access, so `import openapi_client` does
+# not build every API class and pydantic model up front
+_LAZY_IMPORTS = {
+    "ActivityApi": "openapi_client.api.activity_api",
+    "AppStoreApi": "openapi_client.api.app_store_api",
+    "AppStoreAdminApi": "openapi_client.api.app_store_admin_api",
+    "AuthGrantsApi": "openapi_client.api.auth_grants_api",
+    "BoostsApi": "openapi_client.api.boosts_api",
+    "ClaimHooksApi": "openapi_client.api.claim_hooks_api",
+    "ContactMethodsApi": "openapi_client.api.contact_methods_api",
+    "ContractsApi": "openapi_client.api.contracts_api",
+    "CredentialsApi": "openapi_client.api.credentials_api",
+    "DIDMetadataApi": "openapi_client.api.did_metadata_api",
+    "IntegrationsApi": "openapi_client.api.integrations_api",
+    "PresentationsApi": "openapi_client.api.presentations_api",
+    "ProfileManagersApi": "openapi_client.api.profile_managers_api",
+    "ProfilesApi": "openapi_client.api.profiles_api",
+    "SendApi": "openapi_client.api.send_api",
+    "SkillsApi": "openapi_client.api.skills_api",
+    "StorageApi": "openapi_client.api.storage_api",
+    "UniversalInboxApi": "openapi_client.api.universal_inbox_api",
+    "UtilitiesApi": "openapi_client.api.utilities_api",
+    "VCAPIApi": "openapi_client.api.vcapi_api",
+    "WorkflowsApi": "openapi_client.api.workflows_api",
+    "ApiResponse": "openapi_client.api_response",
+    "ApiClient": "openapi_client.api_client",
+    "Configuration": "openapi_client.configuration",
+    "OpenApiException": "openapi_client.exceptions",
+    "ApiTypeError": "openapi_client.exceptions",
+    "ApiValueError": "openapi_client.exceptions",
+    "ApiKeyError": "openapi_client.exceptions",
+    "ApiAttributeError": "openapi_client.exceptions",
+    "ApiException": "openapi_client.exceptions",
+    "ActivityGetActivity200Response": "openapi_client.models.activity_get_activity200_response",
+    "ActivityGetActivity200ResponseBoost": "openapi_client.models.activity_get_activity200_response_boost",
+    "ActivityGetActivity200ResponseRecipientProfile": "openapi_client.models.activity_get_activity200_response_recipient_profile",
+    "ActivityGetActivityChain200ResponseInner": "openapi_client.models.activity_get_activity_chain200_response_inner",
+    "ActivityGetActivityStats200Response": "openapi_client.models.activity_get_activity_stats200_response",
+    "ActivityGetMyActivities200Response": "openapi_client.models.activity_get_my_activities200_response",
+    "ActivityGetMyActivities200ResponseRecordsInner": "openapi_client.models.activity_get_my_activities200_response_records_inner",
+    "ActivityGetMyActivities200ResponseRecordsInnerBoost": "openapi_client.models.activity_get_my_activities200_response_records_inner_boost",
+    "ActivityGetMyActivities200ResponseRecordsInnerRecipientProfile": "openapi_client.models.activity_get_my_activities200_response_records_inner_recipient_profile",
+    "AppStoreAddBoostToListingRequest": "openapi_client.models.app_store_add_boost_to_listing_request",
+    "AppStoreAdminGetAllListingsRequest": "openapi_client.models.app_store_admin_get_all_listings_request",
+    "AppStoreAdminUpdateListingStatusRequest": "openapi_client.models.app_store_admin_update_listing_status_request",
+    "AppStoreAdminUpdatePromotionLevelRequest": "openapi_client.models.app_store_admin_update_promotion_level_request",
+    "AppStoreAppEventRequest": "openapi_client.models.app_store_app_event_request",
+    "AppStoreBrowseListedAppsRequest": "openapi_client.models.app_store_browse_listed_apps_request",
+    "AppStoreCreateListingRequest": "openapi_client.models.app_store_create_listing_request",
+    "AppStoreCreateListingRequestListing": "openapi_client.models.app_store_create_listing_request_listing",
+    "AppStoreGetBoostsForListing200ResponseInner": "openapi_client.models.app_store_get_boosts_for_listing200_response_inner",
+    "AppStoreGetInstalledApps200Response": "openapi_client.models.app_store_get_installed_apps200_response",
+    "AppStoreGetInstalledApps200ResponseRecordsInner": "openapi_client.models.app_store_get_installed_apps200_response_records_inner",
+    "AppStoreGetListing200Response": "openapi_client.models.app_store_get_listing200_response",
+    "AppStoreGetListingsForIntegration200Response": "openapi_client.models.app_store_get_listings_for_integration200_response",
+    "AppStoreGetListingsForIntegration200ResponseRecordsInner": "openapi_client.models.app_store_get_listings_for_integration200_response_records_inner",
+    "AppStoreGetListingsForIntegrationRequest": "openapi_client.models.app_store_get_listings_for_integration_request",
+    "AppStoreRemoveBoostFromListingRequest": "openapi_client.models.app_store_remove_boost_from_listing_request",
+    "AppStoreUpdateListingRequest": "openapi_client.models.app_store_update_listing_request",
+    "AppStoreUpdateListingRequestUpdates": "openapi_client.models.app_store_update_listing_request_updates",
+    "AuthGrantsAddAuthGrantRequest": "openapi_client.models.auth_grants_add_auth_grant_request",
+    "AuthGrantsGetAuthGrant200Response": "openapi_client.models.auth_grants_get_auth_grant200_response",
+    "AuthGrantsGetAuthGrants200ResponseInner": "openapi_client.models.auth_grants_get_auth_grants200_response_inner",
+    "AuthGrantsGetAuthGrantsRequest": "openapi_client.models.auth_grants_get_auth_grants_request",
+    "AuthGrantsGetAuthGrantsRequestQuery": "openapi_client.models.auth_grants_get_auth_grants_request_query",
+    "AuthGrantsUpdateAuthGrantRequest": "openapi_client.models.auth_grants_update_auth_grant_request",
+    "AuthGrantsUpdateAuthGrantRequestUpdates": "openapi_client.models.auth_grants_update_auth_grant_request_updates",
+    "BoostAddBoostAdminRequest": "openapi_client.models.boost_add_boost_admin_request",
+    "BoostAlignBoostSkillsRequest": "openapi_client.models.boost_align_boost_skills_request",
+    "BoostAlignBoostSkillsRequestSkillsInner": "openapi_client.models.boost_align_boost_skills_request_skills_inner",
+    "BoostAttachFrameworkToBoostRequest": "openapi_client.models.boost_attach_framework_to_boost_request",
+    "BoostClaimBoostWithLinkRequest": "openapi_client.models.boost_claim_boost_with_link_request",
+    "BoostCountBoostChildrenRequest": "openapi_client.models.boost_count_boost_children_request",
+    "BoostCountBoostParentsRequest": "openapi_client.models.boost_count_boost_parents_request",
+    "BoostCountBoostSiblingsRequest": "openapi_client.models.boost_count_boost_siblings_request",
+    "BoostCountFamilialBoostsRequest": "openapi_client.models.boost_count_familial_boosts_request",
+    "BoostCreateBoostRequest": "openapi_client.models.boost_create_boost_request",
+    "BoostCreateBoostRequestClaimPermissions": "openapi_client.models.boost_create_boost_request_claim_permissions",
+    "BoostCreateBoostRequestCredential": "openapi_client.models.boost_create_boost_request_credential",
+    "BoostCreateBoostRequestCredentialAnyOf": "openapi_client.models.boost_create_boost_request_credential_any_of",
+    "BoostCreateChildBoostRequest": "openapi_client.models.boost_create_child_boost_request",
+    "BoostCreateChildBoostRequestBoost": "openapi_client.models.boost_create_child_boost_request_boost",
+    "BoostDetachFrameworkFromBoostRequest": "openapi_client.models.boost_detach_framework_from_boost_request",
+    "BoostGenerateClaimLink200Response": "openapi_client.models.boost_generate_claim_link200_response",
+    "BoostGenerateClaimLinkRequest": "openapi_client.models.boost_generate_claim_link_request",
+    "BoostGenerateClaimLinkRequestClaimLinkSA": "openapi_client.models.boost_generate_claim_link_request_claim_link_sa",
+    "BoostGenerateClaimLinkRequestOptions": "openapi_client.models.boost_generate_claim_link_request_options",
+    "BoostGetBoost200Response": "openapi_client.models.boost_get_boost200_response",
+    "BoostGetBoost200ResponseBoost": "openapi_client.models.boost_get_boost200_response_boost",
+    "BoostGetBoost200ResponseBoostIssuer": "openapi_client.models.boost_get_boost200_response_boost_issuer",
+    "BoostGetBoost200ResponseBoostIssuerAnyOf": "openapi_client.models.boost_get_boost200_response_boost_issuer_any_of",
+    "BoostGetBoost200ResponseBoostIssuerAnyOfAddress": "openapi_client.models.boost_get_boost200_response_boost_issuer_any_of_address",
+    "BoostGetBoost200ResponseBoostIssuerAnyOfAddressGeo": "openapi_client.models.boost_get_boost200_response_boost_issuer_any_of_address_geo",
+    "BoostGetBoost200ResponseBoostIssuerAnyOfImage": "openapi_client.models.boost_get_boost200_response_boost_issuer_any_of_image",
+    "BoostGetBoost200ResponseBoostIssuerAnyOfImageAnyOf": "openapi_client.models.boost_get_boost200_response_boost_issuer_any_of_image_any_of",
+    "BoostGetBoost200ResponseBoostIssuerAnyOfOtherIdentifierInner": "openapi_client.models.boost_get_boost200_response_boost_issuer_any_of_other_identifier_inner",
+    "BoostGetBoost200ResponseClaimPermissions": "openapi_client.models.boost_get_boost200_response_claim_permissions",
+    "BoostGetBoost200ResponseDefaultPermissions": "openapi_client.models.boost_get_boost200_response_default_permissions",
+    "BoostGetBoostAdmins200Response": "openapi_client.models.boost_get_boost_admins200_response",
+    "BoostGetBoostAdminsRequest": "openapi_client.models.boost_get_boost_admins_request",
+    "BoostGetBoostAlignments200ResponseInner": "openapi_client.models.boost_get_boost_alignments200_response_inner",
+    "BoostGetBoostChildrenRequest": "openapi_client.models.boost_get_boost_children_request",
+    "BoostGetBoostFrameworks200Response": "openapi_client.models.boost_get_boost_frameworks200_response",
+    "BoostGetBoostFrameworks200ResponseRecordsInner": "openapi_client.models.boost_get_boost_frameworks200_response_records_inner",
+    "BoostGetBoostFrameworksRequest": "openapi_client.models.boost_get_boost_frameworks_request",
+    "BoostGetBoostFrameworksRequestQuery": "openapi_client.models.boost_get_boost_frameworks_request_query",
+    "BoostGetBoostFrameworksRequestQueryAnyOf": "openapi_client.models.boost_get_boost_frameworks_request_query_any_of",
+    "BoostGetBoostFrameworksRequestQueryAnyOfOrInner": "openapi_client.models.boost_get_boost_frameworks_request_query_any_of_or_inner",
+    "BoostGetBoostParentsRequest": "openapi_client.models.boost_get_boost_parents_request",
+    "BoostGetBoostRecipients200ResponseInner": "openapi_client.models.boost_get_boost_recipients200_response_inner",
+    "BoostGetBoostRecipients200ResponseInnerTo": "openapi_client.models.boost_get_boost_recipients200_response_inner_to",
+    "BoostGetBoostRecipients200ResponseInnerToDisplay": "openapi_client.models.boost_get_boost_recipients200_response_inner_to_display",
+    "BoostGetBoostRecipientsWithChildrenCountRequest": "openapi_client.models.boost_get_boost_recipients_with_children_count_request",
+    "BoostGetBoostRecipientsWithChildrenCountRequestNumberOfGenerations": "openapi_client.models.boost_get_boost_recipients_with_children_count_request_number_of_generations",
+    "BoostGetBoostSiblingsRequest": "openapi_client.models.boost_get_boost_siblings_request",
+    "BoostGetBoosts200ResponseInner": "openapi_client.models.boost_get_boosts200_response_inner",
+    "BoostGetBoostsRequest": "openapi_client.models.boost_get_boosts_request",
+    "BoostGetBoostsRequestQuery": "openapi_client.models.boost_get_boosts_request_query",
+    "BoostGetBoostsRequestQueryAnyOf": "openapi_client.models.boost_get_boosts_request_query_any_of",
+    "BoostGetBoostsRequestQueryAnyOfOrInner": "openapi_client.models.boost_get_boosts_request_query_any_of_or_inner",
+    "BoostGetBoostsRequestQueryAnyOfOrInnerStatus": "openapi_client.models.boost_get_boosts_request_query_any_of_or_inner_status",
+    "BoostGetBoostsRequestQueryAnyOfOrInnerStatusAnyOf": "openapi_client.models.boost_get_boosts_request_query_any_of_or_inner_status_any_of",
+    "BoostGetChildrenProfileManagers200Response": "openapi_client.models.boost_get_children_profile_managers200_response",
+    "BoostGetChildrenProfileManagers200ResponseRecordsInner": "openapi_client.models.boost_get_children_profile_managers200_response_records_inner",
+    "BoostGetChildrenProfileManagersRequest": "openapi_client.models.boost_get_children_profile_managers_request",
+    "BoostGetChildrenProfileManagersRequestQuery": "openapi_client.models.boost_get_children_profile_managers_request_query",
+    "BoostGetConnectedBoostRecipientsRequest": "openapi_client.models.boost_get_connected_boost_recipients_request",
+    "BoostGetFamilialBoostsRequest": "openapi_client.models.boost_get_familial_boosts_request",
+    "BoostGetPaginatedBoostRecipients200Response": "openapi_client.models.boost_get_paginated_boost_recipients200_response",
+    "BoostGetPaginatedBoostRecipients200ResponseRecordsInner": "openapi_client.models.boost_get_paginated_boost_recipients200_response_records_inner",
+    "BoostGetPaginatedBoostRecipients200ResponseRecordsInnerTo": "openapi_client.models.boost_get_paginated_boost_recipients200_response_records_inner_to",
+    "BoostGetPaginatedBoostRecipients200ResponseRecordsInnerToDisplay": "openapi_client.models.boost_get_paginated_boost_recipients200_response_records_inner_to_display",
+    "BoostGetPaginatedBoostRecipientsRequest": "openapi_client.models.boost_get_paginated_boost_recipients_request",
+    "BoostGetPaginatedBoostRecipientsRequestQuery": "openapi_client.models.boost_get_paginated_boost_recipients_request_query",
+    "BoostGetPaginatedBoostRecipientsWithChildren200Response": "openapi_client.models.boost_get_paginated_boost_recipients_with_children200_response",
+    "BoostGetPaginatedBoostRecipientsWithChildren200ResponseRecordsInner": "openapi_client.models.boost_get_paginated_boost_recipients_with_children200_response_records_inner",
+    "BoostGetPaginatedBoostRecipientsWithChildrenRequest": "openapi_client.models.boost_get_paginated_boost_recipients_with_children_request",
+    "BoostGetPaginatedBoostRecipientsWithChildrenRequestNumberOfGenerations": "openapi_client.models.boost_get_paginated_boost_recipients_with_children_request_number_of_generations",
+    "BoostGetPaginatedBoosts200Response": "openapi_client.models.boost_get_paginated_boosts200_response",
+    "BoostGetPaginatedBoosts200ResponseRecordsInner": "openapi_client.models.boost_get_paginated_boosts200_response_records_inner",
+    "BoostGetPaginatedBoostsRequest": "openapi_client.models.boost_get_paginated_boosts_request",
+    "BoostGetSkillsAvailableForBoost200ResponseInner": "openapi_client.models.boost_get_skills_available_for_boost200_response_inner",
+    "BoostGetSkillsAvailableForBoost200ResponseInnerFramework": "openapi_client.models.boost_get_skills_available_for_boost200_response_inner_framework",
+    "BoostGetSkillsAvailableForBoost200ResponseInnerSkillsInner": "openapi_client.models.boost_get_skills_available_for_boost200_response_inner_skills_inner",
+    "BoostMakeBoostParentRequest": "openapi_client.models.boost_make_boost_parent_request",
+    "BoostRemoveBoostAdminRequest": "openapi_client.models.boost_remove_boost_admin_request",
+    "BoostRemoveBoostParentRequest": "openapi_client.models.boost_remove_boost_parent_request",
+    "BoostSearchSkillsAvailableForBoost200Response": "openapi_client.models.boost_search_skills_available_for_boost200_response",
+    "BoostSearchSkillsAvailableForBoost200ResponseRecordsInner": "openapi_client.models.boost_search_skills_available_for_boost200_response_records_inner",
+    "BoostSearchSkillsAvailableForBoostRequest": "openapi_client.models.boost_search_skills_available_for_boost_request",
+    "BoostSearchSkillsAvailableForBoostRequestQuery": "openapi_client.models.boost_search_skills_available_for_boost_request_query",
+    "BoostSearchSkillsAvailableForBoostRequestQueryAnyOf": "openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of",
+    "BoostSearchSkillsAvailableForBoostRequestQueryAnyOf1": "openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of1",
+    "BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInner": "openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner",
+    "BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerId": "openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id",
+    "BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf": "openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of",
+    "BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1": "openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of1",
+    "BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1OrInner": "openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of1_or_inner",
+    "BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1OrInnerAnyOf": "openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of1_or_inner_any_of",
+    "BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1OrInnerAnyOf1": "openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of1_or_inner_any_of1",
+    "BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1OrInnerAnyOf1Regex": "openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of1_or_inner_any_of1_regex",
+    "BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1OrInnerAnyOfAnyOf": "openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of1_or_inner_any_of_any_of",
+    "BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOfAnyOf": "openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of_any_of",
+    "BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOfAnyOf1": "openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of_any_of1",
+    "BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOfAnyOf1Regex": "openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of_any_of1_regex",
+    "BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOfAnyOfAnyOf": "openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of_any_of_any_of",
+    "BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerStatement": "openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_statement",
+    "BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerStatus": "openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_status",
+    "BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerStatusAnyOf": "openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_status_any_of",
+    "BoostSend200Response": "openapi_client.models.boost_send200_response",
+    "BoostSend200ResponseInbox": "openapi_client.models.boost_send200_response_inbox",
+    "BoostSendBoostRequest": "openapi_client.models.boost_send_boost_request",
+    "BoostSendBoostRequestCredential": "openapi_client.models.boost_send_boost_request_credential",
+    "BoostSendBoostRequestCredentialAnyOf": "openapi_client.models.boost_send_boost_request_credential_any_of",
+    "BoostSendBoostRequestCredentialAnyOf1": "openapi_client.models.boost_send_boost_request_credential_any_of1",
+    "BoostSendBoostRequestCredentialAnyOf1RecipientsInner": "openapi_client.models.boost_send_boost_request_credential_any_of1_recipients_inner",
+    "BoostSendBoostRequestCredentialAnyOf1RecipientsInnerHeader": "openapi_client.models.boost_send_boost_request_credential_any_of1_recipients_inner_header",
+    "BoostSendBoostRequestCredentialAnyOf1RecipientsInnerHeaderEpk": "openapi_client.models.boost_send_boost_request_credential_any_of1_recipients_inner_header_epk",
+    "BoostSendBoostRequestCredentialAnyOfContextInner": "openapi_client.models.boost_send_boost_request_credential_any_of_context_inner",
+    "BoostSendBoostRequestCredentialAnyOfCredentialSchema": "openapi_client.models.boost_send_boost_request_credential_any_of_credential_schema",
+    "BoostSendBoostRequestCredentialAnyOfCredentialSchemaAnyOf": "openapi_client.models.boost_send_boost_request_credential_any_of_credential_schema_any_of",
+    "BoostSendBoostRequestCredentialAnyOfCredentialSchemaAnyOf1Inner": "openapi_client.models.boost_send_boost_request_credential_any_of_credential_schema_any_of1_inner",
+    "BoostSendBoostRequestCredentialAnyOfCredentialStatus": "openapi_client.models.boost_send_boost_request_credential_any_of_credential_status",
+    "BoostSendBoostRequestCredentialAnyOfCredentialSubject": "openapi_client.models.boost_send_boost_request_credential_any_of_credential_subject",
+    "BoostSendBoostRequestCredentialAnyOfCredentialSubjectAnyOf": "openapi_client.models.boost_send_boost_request_credential_any_of_credential_subject_any_of",
+    "BoostSendBoostRequestCredentialAnyOfCredentialSubjectAnyOf1Inner": "openapi_client.models.boost_send_boost_request_credential_any_of_credential_subject_any_of1_inner",
+    "BoostSendBoostRequestCredentialAnyOfEvidence": "openapi_client.models.boost_send_boost_request_credential_any_of_evidence",
+    "BoostSendBoostRequestCredentialAnyOfEvidenceAnyOf": "openapi_client.models.boost_send_boost_request_credential_any_of_evidence_any_of",
+    "BoostSendBoostRequestCredentialAnyOfEvidenceAnyOf1Inner": "openapi_client.models.boost_send_boost_request_credential_any_of_evidence_any_of1_inner",
+    "BoostSendBoostRequestCredentialAnyOfIssuer": "openapi_client.models.boost_send_boost_request_credential_any_of_issuer",
+    "BoostSendBoostRequestCredentialAnyOfIssuerAnyOf": "openapi_client.models.boost_send_boost_request_credential_any_of_issuer_any_of",
+    "BoostSendBoostRequestCredentialAnyOfIssuerAnyOfAddress": "openapi_client.models.boost_send_boost_request_credential_any_of_issuer_any_of_address",
+    "BoostSendBoostRequestCredentialAnyOfIssuerAnyOfAddressGeo": "openapi_client.models.boost_send_boost_request_credential_any_of_issuer_any_of_address_geo",
+    "BoostSendBoostRequestCredentialAnyOfIssuerAnyOfAddressType": "openapi_client.models.boost_send_boost_request_credential_any_of_issuer_any_of_address_type",
+    "BoostSendBoostRequestCredentialAnyOfIssuerAnyOfImage": "openapi_client.models.boost_send_boost_request_credential_any_of_issuer_any_of_image",
+    "BoostSendBoostRequestCredentialAnyOfIssuerAnyOfImageAnyOf": "openapi_client.models.boost_send_boost_request_credential_any_of_issuer_any_of_image_any_of",
+    "BoostSendBoostRequestCredentialAnyOfIssuerAnyOfOtherIdentifierInner": "openapi_client.models.boost_send_boost_request_credential_any_of_issuer_any_of_other_identifier_inner",
+    "BoostSendBoostRequestCredentialAnyOfIssuerAnyOfOtherIdentifierInnerIdentifierType": "openapi_client.models.boost_send_boost_request_credential_any_of_issuer_any_of_other_identifier_inner_identifier_type",
+    "BoostSendBoostRequestCredentialAnyOfIssuerAnyOfType": "openapi_client.models.boost_send_boost_request_credential_any_of_issuer_any_of_type",
+    "BoostSendBoostRequestCredentialAnyOfProof": "openapi_client.models.boost_send_boost_request_credential_any_of_proof",
+    "BoostSendBoostRequestCredentialAnyOfProofAnyOf": "openapi_client.models.boost_send_boost_request_credential_any_of_proof_any_of",
+    "BoostSendBoostRequestCredentialAnyOfProofAnyOf1Inner": "openapi_client.models.boost_send_boost_request_credential_any_of_proof_any_of1_inner",
+    "BoostSendBoostRequestCredentialAnyOfRefreshService": "openapi_client.models.boost_send_boost_request_credential_any_of_refresh_service",
+    "BoostSendBoostRequestCredentialAnyOfRefreshServiceAnyOf": "openapi_client.models.boost_send_boost_request_credential_any_of_refresh_service_any_of",
+    "BoostSendBoostRequestCredentialAnyOfRefreshServiceAnyOf1Inner": "openapi_client.models.boost_send_boost_request_credential_any_of_refresh_service_any_of1_inner",
+    "BoostSendBoostRequestCredentialAnyOfTermsOfUse": "openapi_client.models.boost_send_boost_request_credential_any_of_terms_of_use",
+    "BoostSendBoostRequestOptions": "openapi_client.models.boost_send_boost_request_options",
+    "BoostSendBoostViaSigningAuthorityRequest": "openapi_client.models.boost_send_boost_via_signing_authority_request",
+    "BoostSendBoostViaSigningAuthorityRequestSigningAuthority": "openapi_client.models.boost_send_boost_via_signing_authority_request_signing_authority",
+    "BoostSendRequest": "openapi_client.models.boost_send_request",
+    "BoostSendRequestOptions": "openapi_client.models.boost_send_request_options",
+    "BoostSendRequestOptionsBranding": "openapi_client.models.boost_send_request_options_branding",
+    "BoostSendRequestTemplate": "openapi_client.models.boost_send_request_template",
+    "BoostSendRequestTemplateClaimPermissions": "openapi_client.models.boost_send_request_template_claim_permissions",
+    "BoostSendRequestTemplateCredential": "openapi_client.models.boost_send_request_template_credential",
+    "BoostSendRequestTemplateCredentialAnyOf": "openapi_client.models.boost_send_request_template_credential_any_of",
+    "BoostSendRequestTemplateCredentialAnyOf1": "openapi_client.models.boost_send_request_template_credential_any_of1",
+    "BoostSendRequestTemplateCredentialAnyOfContextInner": "openapi_client.models.boost_send_request_template_credential_any_of_context_inner",
+    "BoostSendRequestTemplateCredentialAnyOfCredentialSubject": "openapi_client.models.boost_send_request_template_credential_any_of_credential_subject",
+    "BoostSendRequestTemplateCredentialAnyOfEvidence": "openapi_client.models.boost_send_request_template_credential_any_of_evidence",
+    "BoostSendRequestTemplateCredentialAnyOfIssuer": "openapi_client.models.boost_send_request_template_credential_any_of_issuer",
+    "BoostSendRequestTemplateCredentialAnyOfIssuerAnyOf": "openapi_client.models.boost_send_request_template_credential_any_of_issuer_any_of",
+    "BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfAddress": "openapi_client.models.boost_send_request_template_credential_any_of_issuer_any_of_address",
+    "BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfAddressGeo": "openapi_client.models.boost_send_request_template_credential_any_of_issuer_any_of_address_geo",
+    "BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfImage": "openapi_client.models.boost_send_request_template_credential_any_of_issuer_any_of_image",
+    "BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfImageAnyOf": "openapi_client.models.boost_send_request_template_credential_any_of_issuer_any_of_image_any_of",
+    "BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfOtherIdentifierInner": "openapi_client.models.boost_send_request_template_credential_any_of_issuer_any_of_other_identifier_inner",
+    "BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfOtherIdentifierInnerIdentifierType": "openapi_client.models.boost_send_request_template_credential_any_of_issuer_any_of_other_identifier_inner_identifier_type",
+    "BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfType": "openapi_client.models.boost_send_request_template_credential_any_of_issuer_any_of_type",
+    "BoostSendRequestTemplateCredentialAnyOfProof": "openapi_client.models.boost_send_request_template_credential_any_of_proof",
+    "BoostSendRequestTemplateDefaultPermissions": "openapi_client.models.boost_send_request_template_default_permissions",
+    "BoostSendRequestTemplateSkillsInner": "openapi_client.models.boost_send_request_template_skills_inner",
+    "BoostUpdateBoostPermissionsRequest": "openapi_client.models.boost_update_boost_permissions_request",
+    "BoostUpdateBoostPermissionsRequestUpdates": "openapi_client.models.boost_update_boost_permissions_request_updates",
+    "BoostUpdateBoostRequest": "openapi_client.models.boost_update_boost_request",
+    "BoostUpdateBoostRequestUpdates": "openapi_client.models.boost_update_boost_request_updates",
+    "BoostUpdateOtherBoostPermissionsRequest": "openapi_client.models.boost_update_other_boost_permissions_request",
+    "BoostUpdateOtherBoostPermissionsRequestUpdates": "openapi_client.models.boost_update_other_boost_permissions_request_updates",
+    "ClaimHookCreateClaimHookRequest": "openapi_client.models.claim_hook_create_claim_hook_request",
+    "ClaimHookCreateClaimHookRequestHook": "openapi_client.models.claim_hook_create_claim_hook_request_hook",
+    "ClaimHookCreateClaimHookRequestHookOneOf": "openapi_client.models.claim_hook_create_claim_hook_request_hook_one_of",
+    "ClaimHookCreateClaimHookRequestHookOneOf1": "openapi_client.models.claim_hook_create_claim_hook_request_hook_one_of1",
+    "ClaimHookCreateClaimHookRequestHookOneOf1Data": "openapi_client.models.claim_hook_create_claim_hook_request_hook_one_of1_data",
+    "ClaimHookCreateClaimHookRequestHookOneOf2": "openapi_client.models.claim_hook_create_claim_hook_request_hook_one_of2",
+    "ClaimHookCreateClaimHookRequestHookOneOf2Data": "openapi_client.models.claim_hook_create_claim_hook_request_hook_one_of2_data",
+    "ClaimHookCreateClaimHookRequestHookOneOfData": "openapi_client.models.claim_hook_create_claim_hook_request_hook_one_of_data",
+    "ClaimHookDeleteClaimHookRequest": "openapi_client.models.claim_hook_delete_claim_hook_request",
+    "ClaimHookGetClaimHooksForBoost200Response": "openapi_client.models.claim_hook_get_claim_hooks_for_boost200_response",
+    "ClaimHookGetClaimHooksForBoost200ResponseRecordsInner": "openapi_client.models.claim_hook_get_claim_hooks_for_boost200_response_records_inner",
+    "ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOf": "openapi_client.models.claim_hook_get_claim_hooks_for_boost200_response_records_inner_all_of_one_of",
+    "ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOf1": "openapi_client.models.claim_hook_get_claim_hooks_for_boost200_response_records_inner_all_of_one_of1",
+    "ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOf1Data": "openapi_client.models.claim_hook_get_claim_hooks_for_boost200_response_records_inner_all_of_one_of1_data",
+    "ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOf2": "openapi_client.models.claim_hook_get_claim_hooks_for_boost200_response_records_inner_all_of_one_of2",
+    "ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOf2Data": "openapi_client.models.claim_hook_get_claim_hooks_for_boost200_response_records_inner_all_of_one_of2_data",
+    "ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOfData": "openapi_client.models.claim_hook_get_claim_hooks_for_boost200_response_records_inner_all_of_one_of_data",
+    "ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOfDataPermissions": "openapi_client.models.claim_hook_get_claim_hooks_for_boost200_response_records_inner_all_of_one_of_data_permissions",
+    "ClaimHookGetClaimHooksForBoostRequest": "openapi_client.models.claim_hook_get_claim_hooks_for_boost_request",
+    "ClaimHookGetClaimHooksForBoostRequestQuery": "openapi_client.models.claim_hook_get_claim_hooks_for_boost_request_query",
+    "ClaimHookGetClaimHooksForBoostRequestQueryData": "openapi_client.models.claim_hook_get_claim_hooks_for_boost_request_query_data",
+    "ClaimHookGetClaimHooksForBoostRequestQueryDataPermissions": "openapi_client.models.claim_hook_get_claim_hooks_for_boost_request_query_data_permissions",
+    "ContactMethodsAddContactMethod200Response": "openapi_client.models.contact_methods_add_contact_method200_response",
+    "ContactMethodsAddContactMethodRequest": "openapi_client.models.contact_methods_add_contact_method_request",
+    "ContactMethodsCreateContactMethodSession200Response": "openapi_client.models.contact_methods_create_contact_method_session200_response",
+    "ContactMethodsCreateContactMethodSessionRequest": "openapi_client.models.contact_methods_create_contact_method_session_request",
+    "ContactMethodsCreateContactMethodSessionRequestContactMethod": "openapi_client.models.contact_methods_create_contact_method_session_request_contact_method",
+    "ContactMethodsGetMyContactMethods200ResponseInner": "openapi_client.models.contact_methods_get_my_contact_methods200_response_inner",
+    "ContactMethodsGetMyContactMethods200ResponseInnerOneOf": "openapi_client.models.contact_methods_get_my_contact_methods200_response_inner_one_of",
+    "ContactMethodsGetMyContactMethods200ResponseInnerOneOf1": "openapi_client.models.contact_methods_get_my_contact_methods200_response_inner_one_of1",
+    "ContactMethodsRemoveContactMethodRequest": "openapi_client.models.contact_methods_remove_contact_method_request",
+    "ContactMethodsSendChallenge200Response": "openapi_client.models.contact_methods_send_challenge200_response",
+    "ContactMethodsSendChallengeRequest": "openapi_client.models.contact_methods_send_challenge_request",
+    "ContactMethodsSendChallengeRequestConfiguration": "openapi_client.models.contact_methods_send_challenge_request_configuration",
+    "ContactMethodsSetPrimaryContactMethodRequest": "openapi_client.models.contact_methods_set_primary_contact_method_request",
+    "ContactMethodsVerifyContactMethodRequest": "openapi_client.models.contact_methods_verify_contact_method_request",
+    "ContactMethodsVerifyWithCredential200Response": "openapi_client.models.contact_methods_verify_with_credential200_response",
+    "ContactMethodsVerifyWithCredential200ResponseContactMethod": "openapi_client.models.contact_methods_verify_with_credential200_response_contact_method",
+    "ContactMethodsVerifyWithCredential200ResponseContactMethodOneOf": "openapi_client.models.contact_methods_verify_with_credential200_response_contact_method_one_of",
+    "ContactMethodsVerifyWithCredential200ResponseContactMethodOneOf1": "openapi_client.models.contact_methods_verify_with_credential200_response_contact_method_one_of1",
+    "ContactMethodsVerifyWithCredentialRequest": "openapi_client.models.contact_methods_verify_with_credential_request",
+    "ContractsAddAutoBoostsToContractRequest": "openapi_client.models.contracts_add_auto_boosts_to_contract_request",
+    "ContractsAddAutoBoostsToContractRequestAutoboostsInner": "openapi_client.models.contracts_add_auto_boosts_to_contract_request_autoboosts_inner",
+    "ContractsCancelContractRequestRequest": "openapi_client.models.contracts_cancel_contract_request_request",
+    "ContractsConsentToContract200Response": "openapi_client.models.contracts_consent_to_contract200_response",
+    "ContractsConsentToContractRequest": "openapi_client.models.contracts_consent_to_contract_request",
+    "ContractsConsentToContractRequestTerms": "openapi_client.models.contracts_consent_to_contract_request_terms",
+    "ContractsConsentToContractRequestTermsRead": "openapi_client.models.contracts_consent_to_contract_request_terms_read",
+    "ContractsConsentToContractRequestTermsReadCredentials": "openapi_client.models.contracts_consent_to_contract_request_terms_read_credentials",
+    "ContractsConsentToContractRequestTermsReadCredentialsCategoriesValue": "openapi_client.models.contracts_consent_to_contract_request_terms_read_credentials_categories_value",
+    "ContractsConsentToContractRequestTermsWrite": "openapi_client.models.contracts_consent_to_contract_request_terms_write",
+    "ContractsConsentToContractRequestTermsWriteCredentials": "openapi_client.models.contracts_consent_to_contract_request_terms_write_credentials",
+    "ContractsCreateConsentFlowContractRequest": "openapi_client.models.contracts_create_consent_flow_contract_request",
+    "ContractsCreateConsentFlowContractRequestAutoboostsInner": "openapi_client.models.contracts_create_consent_flow_contract_request_autoboosts_inner",
+    "ContractsCreateConsentFlowContractRequestAutoboostsInnerSigningAuthority": "openapi_client.models.contracts_create_consent_flow_contract_request_autoboosts_inner_signing_authority",
+    "ContractsCreateConsentFlowContractRequestContract": "openapi_client.models.contracts_create_consent_flow_contract_request_contract",
+    "ContractsCreateConsentFlowContractRequestContractRead": "openapi_client.models.contracts_create_consent_flow_contract_request_contract_read",
+    "ContractsCreateConsentFlowContractRequestContractReadCredentials": "openapi_client.models.contracts_create_consent_flow_contract_request_contract_read_credentials",
+    "ContractsCreateConsentFlowContractRequestContractReadCredentialsCategoriesValue": "openapi_client.models.contracts_create_consent_flow_contract_request_contract_read_credentials_categories_value",
+    "ContractsCreateConsentFlowContractRequestContractWrite": "openapi_client.models.contracts_create_consent_flow_contract_request_contract_write",
+    "ContractsForwardContractRequestToProfileRequest": "openapi_client.models.contracts_forward_contract_request_to_profile_request",
+    "ContractsGetAllContractRequestsForProfile200ResponseInner": "openapi_client.models.contracts_get_all_contract_requests_for_profile200_response_inner",
+    "ContractsGetAllContractRequestsForProfile200ResponseInnerContract": "openapi_client.models.contracts_get_all_contract_requests_for_profile200_response_inner_contract",
+    "ContractsGetAllCredentialsForTermsRequest": "openapi_client.models.contracts_get_all_credentials_for_terms_request",
+    "ContractsGetConsentFlowContract200Response": "openapi_client.models.contracts_get_consent_flow_contract200_response",
+    "ContractsGetConsentFlowContract200ResponseContract": "openapi_client.models.contracts_get_consent_flow_contract200_response_contract",
+    "ContractsGetConsentFlowContract200ResponseContractRead": "openapi_client.models.contracts_get_consent_flow_contract200_response_contract_read",
+    "ContractsGetConsentFlowContracts200Response": "openapi_client.models.contracts_get_consent_flow_contracts200_response",
+    "ContractsGetConsentFlowContracts200ResponseRecordsInner": "openapi_client.models.contracts_get_consent_flow_contracts200_response_records_inner",
+    "ContractsGetConsentFlowContractsRequest": "openapi_client.models.contracts_get_consent_flow_contracts_request",
+    "ContractsGetConsentFlowContractsRequestQuery": "openapi_client.models.contracts_get_consent_flow_contracts_request_query",
+    "ContractsGetConsentFlowContractsRequestQueryRead": "openapi_client.models.contracts_get_consent_flow_contracts_request_query_read",
+    "ContractsGetConsentFlowContractsRequestQueryReadCredentials": "openapi_client.models.contracts_get_consent_flow_contracts_request_query_read_credentials",
+    "ContractsGetConsentFlowContractsRequestQueryReadCredentialsCategoriesValue": "openapi_client.models.contracts_get_consent_flow_contracts_request_query_read_credentials_categories_value",
+    "ContractsGetConsentFlowContractsRequestQueryWrite": "openapi_client.models.contracts_get_consent_flow_contracts_request_query_write",
+    "ContractsGetConsentedContracts200Response": "openapi_client.models.contracts_get_consented_contracts200_response",
+    "ContractsGetConsentedContracts200ResponseRecordsInner": "openapi_client.models.contracts_get_consented_contracts200_response_records_inner",
+    "ContractsGetConsentedContracts200ResponseRecordsInnerTerms": "openapi_client.models.contracts_get_consented_contracts200_response_records_inner_terms",
+    "ContractsGetConsentedContracts200ResponseRecordsInnerTermsRead": "openapi_client.models.contracts_get_consented_contracts200_response_records_inner_terms_read",
+    "ContractsGetConsentedContracts200ResponseRecordsInnerTermsReadCredentials": "openapi_client.models.contracts_get_consented_contracts200_response_records_inner_terms_read_credentials",
+    "ContractsGetConsentedContracts200ResponseRecordsInnerTermsReadCredentialsCategoriesValue": "openapi_client.models.contracts_get_consented_contracts200_response_records_inner_terms_read_credentials_categories_value",
+    "ContractsGetConsentedContractsRequest": "openapi_client.models.contracts_get_consented_contracts_request",
+    "ContractsGetConsentedContractsRequestQuery": "openapi_client.models.contracts_get_consented_contracts_request_query",
+    "ContractsGetConsentedContractsRequestQueryRead": "openapi_client.models.contracts_get_consented_contracts_request_query_read",
+    "ContractsGetConsentedContractsRequestQueryReadCredentials": "openapi_client.models.contracts_get_consented_contracts_request_query_read_credentials",
+    "ContractsGetConsentedContractsRequestQueryReadCredentialsCategoriesValue": "openapi_client.models.contracts_get_consented_contracts_request_query_read_credentials_categories_value",
+    "ContractsGetConsentedContractsRequestQueryWrite": "openapi_client.models.contracts_get_consented_contracts_request_query_write",
+    "ContractsGetConsentedData200Response": "openapi_client.models.contracts_get_consented_data200_response",
+    "ContractsGetConsentedData200ResponseRecordsInner": "openapi_client.models.contracts_get_consented_data200_response_records_inner",
+    "ContractsGetConsentedDataForContract200Response": "openapi_client.models.contracts_get_consented_data_for_contract200_response",
+    "ContractsGetConsentedDataForContract200ResponseRecordsInner": "openapi_client.models.contracts_get_consented_data_for_contract200_response_records_inner",
+    "ContractsGetConsentedDataForContract200ResponseRecordsInnerCredentials": "openapi_client.models.contracts_get_consented_data_for_contract200_response_records_inner_credentials",
+    "ContractsGetConsentedDataForContractRequest": "openapi_client.models.contracts_get_consented_data_for_contract_request",
+    "ContractsGetConsentedDataForContractRequestQuery": "openapi_client.models.contracts_get_consented_data_for_contract_request_query",
+    "ContractsGetConsentedDataForContractRequestQueryCredentials": "openapi_client.models.contracts_get_consented_data_for_contract_request_query_credentials",
+    "ContractsGetConsentedDataForDid200Response": "openapi_client.models.contracts_get_consented_data_for_did200_response",
+    "ContractsGetConsentedDataForDid200ResponseRecordsInner": "openapi_client.models.contracts_get_consented_data_for_did200_response_records_inner",
+    "ContractsGetConsentedDataForDid200ResponseRecordsInnerCredentialsInner": "openapi_client.models.contracts_get_consented_data_for_did200_response_records_inner_credentials_inner",
+    "ContractsGetConsentedDataForDidRequest": "openapi_client.models.contracts_get_consented_data_for_did_request",
+    "ContractsGetConsentedDataForDidRequestQuery": "openapi_client.models.contracts_get_consented_data_for_did_request_query",
+    "ContractsGetConsentedDataRequest": "openapi_client.models.contracts_get_consented_data_request",
+    "ContractsGetContractSentRequests200ResponseInner": "openapi_client.models.contracts_get_contract_sent_requests200_response_inner",
+    "ContractsGetCredentialsForContract200Response": "openapi_client.models.contracts_get_credentials_for_contract200_response",
+    "ContractsGetCredentialsForContract200ResponseRecordsInner": "openapi_client.models.contracts_get_credentials_for_contract200_response_records_inner",
+    "ContractsGetCredentialsForContractRequest": "openapi_client.models.contracts_get_credentials_for_contract_request",
+    "ContractsGetRequestStatusForProfile200Response": "openapi_client.models.contracts_get_request_status_for_profile200_response",
+    "ContractsGetTermsTransactionHistory200Response": "openapi_client.models.contracts_get_terms_transaction_history200_response",
+    "ContractsGetTermsTransactionHistory200ResponseRecordsInner": "openapi_client.models.contracts_get_terms_transaction_history200_response_records_inner",
+    "ContractsGetTermsTransactionHistory200ResponseRecordsInnerTerms": "openapi_client.models.contracts_get_terms_transaction_history200_response_records_inner_terms",
+    "ContractsGetTermsTransactionHistory200ResponseRecordsInnerTermsWrite": "openapi_client.models.contracts_get_terms_transaction_history200_response_records_inner_terms_write",
+    "ContractsGetTermsTransactionHistory200ResponseRecordsInnerTermsWriteCredentials": "openapi_client.models.contracts_get_terms_transaction_history200_response_records_inner_terms_write_credentials",
+    "ContractsGetTermsTransactionHistoryRequest": "openapi_client.models.contracts_get_terms_transaction_history_request",
+    "ContractsGetTermsTransactionHistoryRequestQuery": "openapi_client.models.contracts_get_terms_transaction_history_request_query",
+    "ContractsGetTermsTransactionHistoryRequestQueryAction": "openapi_client.models.contracts_get_terms_transaction_history_request_query_action",
+    "ContractsGetTermsTransactionHistoryRequestQueryDate": "openapi_client.models.contracts_get_terms_transaction_history_request_query_date",
+    "ContractsGetTermsTransactionHistoryRequestQueryDateAnyOf": "openapi_client.models.contracts_get_terms_transaction_history_request_query_date_any_of",
+    "ContractsGetTermsTransactionHistoryRequestQueryDateAnyOf1": "openapi_client.models.contracts_get_terms_transaction_history_request_query_date_any_of1",
+    "ContractsGetTermsTransactionHistoryRequestQueryDateAnyOfAnyOf": "openapi_client.models.contracts_get_terms_transaction_history_request_query_date_any_of_any_of",
+    "ContractsGetTermsTransactionHistoryRequestQueryDateAnyOfAnyOf1": "openapi_client.models.contracts_get_terms_transaction_history_request_query_date_any_of_any_of1",
+    "ContractsGetTermsTransactionHistoryRequestQueryExpiresAt": "openapi_client.models.contracts_get_terms_transaction_history_request_query_expires_at",
+    "ContractsGetTermsTransactionHistoryRequestQueryExpiresAtAnyOf": "openapi_client.models.contracts_get_terms_transaction_history_request_query_expires_at_any_of",
+    "ContractsGetTermsTransactionHistoryRequestQueryExpiresAtAnyOf1": "openapi_client.models.contracts_get_terms_transaction_history_request_query_expires_at_any_of1",
+    "ContractsGetTermsTransactionHistoryRequestQueryExpiresAtAnyOfAnyOf": "openapi_client.models.contracts_get_terms_transaction_history_request_query_expires_at_any_of_any_of",
+    "ContractsGetTermsTransactionHistoryRequestQueryExpiresAtAnyOfAnyOf1": "openapi_client.models.contracts_get_terms_transaction_history_request_query_expires_at_any_of_any_of1",
+    "ContractsGetTermsTransactionHistoryRequestQueryTerms": "openapi_client.models.contracts_get_terms_transaction_history_request_query_terms",
+    "ContractsGetTermsTransactionHistoryRequestQueryTermsRead": "openapi_client.models.contracts_get_terms_transaction_history_request_query_terms_read",
+    "ContractsMarkContractRequestAsSeenRequest": "openapi_client.models.contracts_mark_contract_request_as_seen_request",
+    "ContractsRemoveAutoBoostsFromContractRequest": "openapi_client.models.contracts_remove_auto_boosts_from_contract_request",
+    "ContractsSendAiInsightShareRequestRequest": "openapi_client.models.contracts_send_ai_insight_share_request_request",
+    "ContractsSendAiInsightsContractRequestRequest": "openapi_client.models.contracts_send_ai_insights_contract_request_request",
+    "ContractsSyncCredentialsToContractRequest": "openapi_client.models.contracts_sync_credentials_to_contract_request",
+    "ContractsUpdateConsentedContractTermsRequest": "openapi_client.models.contracts_update_consented_contract_terms_request",
+    "ContractsUpdateConsentedContractTermsRequestTerms": "openapi_client.models.contracts_update_consented_contract_terms_request_terms",
+    "ContractsUpdateConsentedContractTermsRequestTermsRead": "openapi_client.models.contracts_update_consented_contract_terms_request_terms_read",
+    "ContractsUpdateConsentedContractTermsRequestTermsReadCredentials": "openapi_client.models.contracts_update_consented_contract_terms_request_terms_read_credentials",
+    "ContractsWriteCredentialToContractRequest": "openapi_client.models.contracts_write_credential_to_contract_request",
+    "ContractsWriteCredentialToContractRequestCredential": "openapi_client.models.contracts_write_credential_to_contract_request_credential",
+    "ContractsWriteCredentialToContractViaSigningAuthorityRequest": "openapi_client.models.contracts_write_credential_to_contract_via_signing_authority_request",
+    "CredentialAcceptCredentialRequest": "openapi_client.models.credential_accept_credential_request",
+    "CredentialAcceptCredentialRequestOptions": "openapi_client.models.credential_accept_credential_request_options",
+    "CredentialReceivedCredentials200ResponseInner": "openapi_client.models.credential_received_credentials200_response_inner",
+    "CredentialSendCredentialRequest": "openapi_client.models.credential_send_credential_request",
+    "CredentialSendCredentialRequestCredential": "openapi_client.models.credential_send_credential_request_credential",
+    "CredentialSendCredentialRequestCredentialAnyOf": "openapi_client.models.credential_send_credential_request_credential_any_of",
+    "CredentialSendCredentialRequestCredentialAnyOf1": "openapi_client.models.credential_send_credential_request_credential_any_of1",
+    "CredentialSendCredentialRequestCredentialAnyOf1RecipientsInner": "openapi_client.models.credential_send_credential_request_credential_any_of1_recipients_inner",
+    "CredentialSendCredentialRequestCredentialAnyOf1RecipientsInnerHeader": "openapi_client.models.credential_send_credential_request_credential_any_of1_recipients_inner_header",
+    "CredentialSendCredentialRequestCredentialAnyOf1RecipientsInnerHeaderEpk": "openapi_client.models.credential_send_credential_request_credential_any_of1_recipients_inner_header_epk",
+    "DidMetadataAddDidMetadataRequest": "openapi_client.models.did_metadata_add_did_metadata_request",
+    "DidMetadataAddDidMetadataRequestAuthenticationInner": "openapi_client.models.did_metadata_add_did_metadata_request_authentication_inner",
+    "DidMetadataAddDidMetadataRequestAuthenticationInnerAnyOf": "openapi_client.models.did_metadata_add_did_metadata_request_authentication_inner_any_of",
+    "DidMetadataAddDidMetadataRequestAuthenticationInnerAnyOfPublicKeyJwk": "openapi_client.models.did_metadata_add_did_metadata_request_authentication_inner_any_of_public_key_jwk",
+    "DidMetadataAddDidMetadataRequestServiceInner": "openapi_client.models.did_metadata_add_did_metadata_request_service_inner",
+    "DidMetadataAddDidMetadataRequestVerificationMethodInner": "openapi_client.models.did_metadata_add_did_metadata_request_verification_method_inner",
+    "DidMetadataAddDidMetadataRequestVerificationMethodInnerAnyOf": "openapi_client.models.did_metadata_add_did_metadata_request_verification_method_inner_any_of",
+    "DidMetadataAddDidMetadataRequestVerificationMethodInnerAnyOfPublicKeyJwk": "openapi_client.models.did_metadata_add_did_metadata_request_verification_method_inner_any_of_public_key_jwk",
+    "DidMetadataGetDidMetadata200Response": "openapi_client.models.did_metadata_get_did_metadata200_response",
+    "DidMetadataGetDidMetadata200ResponseAuthenticationInner": "openapi_client.models.did_metadata_get_did_metadata200_response_authentication_inner",
+    "DidMetadataGetDidMetadata200ResponseAuthenticationInnerAnyOf": "openapi_client.models.did_metadata_get_did_metadata200_response_authentication_inner_any_of",
+    "DidMetadataGetDidMetadata200ResponseAuthenticationInnerAnyOfPublicKeyJwk": "openapi_client.models.did_metadata_get_did_metadata200_response_authentication_inner_any_of_public_key_jwk",
+    "DidMetadataGetDidMetadata200ResponseServiceInner": "openapi_client.models.did_metadata_get_did_metadata200_response_service_inner",
+    "DidMetadataGetDidMetadata200ResponseVerificationMethodInner": "openapi_client.models.did_metadata_get_did_metadata200_response_verification_method_inner",
+    "DidMetadataGetDidMetadata200ResponseVerificationMethodInnerAnyOf": "openapi_client.models.did_metadata_get_did_metadata200_response_verification_method_inner_any_of",
+    "DidMetadataGetDidMetadata200ResponseVerificationMethodInnerAnyOfPublicKeyJwk": "openapi_client.models.did_metadata_get_did_metadata200_response_verification_method_inner_any_of_public_key_jwk",
+    "DidMetadataGetMyDidMetadata200ResponseInner": "openapi_client.models.did_metadata_get_my_did_metadata200_response_inner",
+    "DidMetadataUpdateDidMetadataRequest": "openapi_client.models.did_metadata_update_did_metadata_request",
+    "DidMetadataUpdateDidMetadataRequestUpdates": "openapi_client.models.did_metadata_update_did_metadata_request_updates",
+    "ErrorBADREQUEST": "openapi_client.models.error_badrequest",
+    "ErrorBADREQUESTIssuesInner": "openapi_client.models.error_badrequest_issues_inner",
+    "ErrorFORBIDDEN": "openapi_client.models.error_forbidden",
+    "ErrorINTERNALSERVERERROR": "openapi_client.models.error_internalservererror",
+    "ErrorNOTFOUND": "openapi_client.models.error_notfound",
+    "ErrorUNAUTHORIZED": "openapi_client.models.error_unauthorized",
+    "InboxApproveGuardianRequestRequest": "openapi_client.models.inbox_approve_guardian_request_request",
+    "InboxClaim200Response": "openapi_client.models.inbox_claim200_response",
+    "InboxClaim200ResponseInboxCredential": "openapi_client.models.inbox_claim200_response_inbox_credential",
+    "InboxClaim200ResponseInboxCredentialSigningAuthority": "openapi_client.models.inbox_claim200_response_inbox_credential_signing_authority",
+    "InboxClaimRequest": "openapi_client.models.inbox_claim_request",
+    "InboxClaimRequestConfiguration": "openapi_client.models.inbox_claim_request_configuration",
+    "InboxClaimRequestCredential": "openapi_client.models.inbox_claim_request_credential",
+    "InboxFinalize200Response": "openapi_client.models.inbox_finalize200_response",
+    "InboxGetMyIssuedCredentials200Response": "openapi_client.models.inbox_get_my_issued_credentials200_response",
+    "InboxGetMyIssuedCredentials200ResponseRecordsInner": "openapi_client.models.inbox_get_my_issued_credentials200_response_records_inner",
+    "InboxGetMyIssuedCredentials200ResponseRecordsInnerSigningAuthority": "openapi_client.models.inbox_get_my_issued_credentials200_response_records_inner_signing_authority",
+    "InboxGetMyIssuedCredentialsRequest": "openapi_client.models.inbox_get_my_issued_credentials_request",
+    "InboxGetMyIssuedCredentialsRequestQuery": "openapi_client.models.inbox_get_my_issued_credentials_request_query",
+    "InboxGetMyIssuedCredentialsRequestRecipient": "openapi_client.models.inbox_get_my_issued_credentials_request_recipient",
+    "InboxGetMyIssuedCredentialsRequestRecipientOneOf": "openapi_client.models.inbox_get_my_issued_credentials_request_recipient_one_of",
+    "InboxIssue200Response": "openapi_client.models.inbox_issue200_response",
+    "InboxIssue200ResponseRecipient": "openapi_client.models.inbox_issue200_response_recipient",
+    "InboxIssue200ResponseRecipientOneOf": "openapi_client.models.inbox_issue200_response_recipient_one_of",
+    "InboxIssue200ResponseRecipientOneOf1": "openapi_client.models.inbox_issue200_response_recipient_one_of1",
+    "InboxIssueRequest": "openapi_client.models.inbox_issue_request",
+    "InboxIssueRequestConfiguration": "openapi_client.models.inbox_issue_request_configuration",
+    "InboxIssueRequestConfigurationDelivery": "openapi_client.models.inbox_issue_request_configuration_delivery",
+    "InboxIssueRequestConfigurationDeliveryTemplate": "openapi_client.models.inbox_issue_request_configuration_delivery_template",
+    "InboxIssueRequestConfigurationDeliveryTemplateModel": "openapi_client.models.inbox_issue_request_configuration_delivery_template_model",
+    "InboxIssueRequestConfigurationDeliveryTemplateModelCredential": "openapi_client.models.inbox_issue_request_configuration_delivery_template_model_credential",
+    "InboxIssueRequestConfigurationDeliveryTemplateModelIssuer": "openapi_client.models.inbox_issue_request_configuration_delivery_template_model_issuer",
+    "InboxIssueRequestConfigurationDeliveryTemplateModelRecipient": "openapi_client.models.inbox_issue_request_configuration_delivery_template_model_recipient",
+    "InboxIssueRequestConfigurationSigningAuthority": "openapi_client.models.inbox_issue_request_configuration_signing_authority",
+    "InboxIssueRequestCredential": "openapi_client.models.inbox_issue_request_credential",
+    "InboxIssueRequestCredentialAnyOf": "openapi_client.models.inbox_issue_request_credential_any_of",
+    "InboxIssueRequestRecipient": "openapi_client.models.inbox_issue_request_recipient",
+    "InboxIssueRequestRecipientOneOf": "openapi_client.models.inbox_issue_request_recipient_one_of",
+    "InboxIssueRequestRecipientOneOf1": "openapi_client.models.inbox_issue_request_recipient_one_of1",
+    "InboxSendGuardianApprovalEmail200Response": "openapi_client.models.inbox_send_guardian_approval_email200_response",
+    "InboxSendGuardianApprovalEmailRequest": "openapi_client.models.inbox_send_guardian_approval_email_request",
+    "InboxSendGuardianApprovalEmailRequestTemplate": "openapi_client.models.inbox_send_guardian_approval_email_request_template",
+    "IntegrationsAddIntegrationRequest": "openapi_client.models.integrations_add_integration_request",
+    "IntegrationsAddIntegrationRequestWhitelistedDomainsInner": "openapi_client.models.integrations_add_integration_request_whitelisted_domains_inner",
+    "IntegrationsAssociateIntegrationWithSigningAuthorityRequest": "openapi_client.models.integrations_associate_integration_with_signing_authority_request",
+    "IntegrationsCountIntegrationsRequest": "openapi_client.models.integrations_count_integrations_request",
+    "IntegrationsGetIntegration200Response": "openapi_client.models.integrations_get_integration200_response",
+    "IntegrationsGetIntegrations200Response": "openapi_client.models.integrations_get_integrations200_response",
+    "IntegrationsGetIntegrations200ResponseRecordsInner": "openapi_client.models.integrations_get_integrations200_response_records_inner",
+    "IntegrationsGetIntegrationsRequest": "openapi_client.models.integrations_get_integrations_request",
+    "IntegrationsGetIntegrationsRequestQuery": "openapi_client.models.integrations_get_integrations_request_query",
+    "IntegrationsUpdateIntegrationRequest": "openapi_client.models.integrations_update_integration_request",
+    "IntegrationsUpdateIntegrationRequestUpdates": "openapi_client.models.integrations_update_integration_request_updates",
+    "PresentationAcceptPresentationRequest": "openapi_client.models.presentation_accept_presentation_request",
+    "PresentationSendPresentationRequest": "openapi_client.models.presentation_send_presentation_request",
+    "PresentationSendPresentationRequestPresentation": "openapi_client.models.presentation_send_presentation_request_presentation",
+    "PresentationSendPresentationRequestPresentationAnyOf": "openapi_client.models.presentation_send_presentation_request_presentation_any_of",
+    "PresentationSendPresentationRequestPresentationAnyOfVerifiableCredential": "openapi_client.models.presentation_send_presentation_request_presentation_any_of_verifiable_credential",
+    "ProfileCreateProfileRequest": "openapi_client.models.profile_create_profile_request",
+    "ProfileCreateProfileRequestDisplay": "openapi_client.models.profile_create_profile_request_display",
+    "ProfileCreateServiceProfileRequest": "openapi_client.models.profile_create_service_profile_request",
+    "ProfileCreateServiceProfileRequestDisplay": "openapi_client.models.profile_create_service_profile_request_display",
+    "ProfileGenerateInvite200Response": "openapi_client.models.profile_generate_invite200_response",
+    "ProfileGenerateInviteRequest": "openapi_client.models.profile_generate_invite_request",
+    "ProfileGetAvailableProfiles200Response": "openapi_client.models.profile_get_available_profiles200_response",
+    "ProfileGetAvailableProfiles200ResponseRecordsInner": "openapi_client.models.profile_get_available_profiles200_response_records_inner",
+    "ProfileGetAvailableProfiles200ResponseRecordsInnerManager": "openapi_client.models.profile_get_available_profiles200_response_records_inner_manager",
+    "ProfileGetAvailableProfilesRequest": "openapi_client.models.profile_get_available_profiles_request",
+    "ProfileListInvites200ResponseInner": "openapi_client.models.profile_list_invites200_response_inner",
+    "ProfileManagerCreateChildProfileManagerRequest": "openapi_client.models.profile_manager_create_child_profile_manager_request",
+    "ProfileManagerCreateChildProfileManagerRequestProfile": "openapi_client.models.profile_manager_create_child_profile_manager_request_profile",
+    "ProfileManagerCreateManagedProfileRequest": "openapi_client.models.profile_manager_create_managed_profile_request",
+    "ProfileManagerCreateProfileManagerRequest": "openapi_client.models.profile_manager_create_profile_manager_request",
+    "ProfileManagerGetManagedProfilesRequest": "openapi_client.models.profile_manager_get_managed_profiles_request",
+    "ProfileRegisterSigningAuthorityRequest": "openapi_client.models.profile_register_signing_authority_request",
+    "ProfileSearchProfiles200ResponseInner": "openapi_client.models.profile_search_profiles200_response_inner",
+    "ProfileSetPrimarySigningAuthorityRequest": "openapi_client.models.profile_set_primary_signing_authority_request",
+    "ProfileSigningAuthorities200ResponseInner": "openapi_client.models.profile_signing_authorities200_response_inner",
+    "ProfileSigningAuthorities200ResponseInnerRelationship": "openapi_client.models.profile_signing_authorities200_response_inner_relationship",
+    "ProfileSigningAuthorities200ResponseInnerSigningAuthority": "openapi_client.models.profile_signing_authorities200_response_inner_signing_authority",
+    "ProfileSigningAuthority200Response": "openapi_client.models.profile_signing_authority200_response",
+    "ProfileSigningAuthority200ResponseRelationship": "openapi_client.models.profile_signing_authority200_response_relationship",
+    "ProfileSigningAuthority200ResponseSigningAuthority": "openapi_client.models.profile_signing_authority200_response_signing_authority",
+    "ProfileUpdateProfileRequest": "openapi_client.models.profile_update_profile_request",
+    "Schema0": "openapi_client.models.schema0",
+    "Schema1": "openapi_client.models.schema1",
+    "SkillFrameworksAddFrameworkAdmin200Response": "openapi_client.models.skill_frameworks_add_framework_admin200_response",
+    "SkillFrameworksAddFrameworkAdminRequest": "openapi_client.models.skill_frameworks_add_framework_admin_request",
+    "SkillFrameworksCountBoostsThatUseFramework200Response": "openapi_client.models.skill_frameworks_count_boosts_that_use_framework200_response",
+    "SkillFrameworksCreateManagedBatchRequest": "openapi_client.models.skill_frameworks_create_managed_batch_request",
+    "SkillFrameworksCreateManagedBatchRequestFrameworksInner": "openapi_client.models.skill_frameworks_create_managed_batch_request_frameworks_inner",
+    "SkillFrameworksCreateManagedRequest": "openapi_client.models.skill_frameworks_create_managed_request",
+    "SkillFrameworksCreateRequest": "openapi_client.models.skill_frameworks_create_request",
+    "SkillFrameworksGetBoostsThatUseFrameworkRequest": "openapi_client.models.skill_frameworks_get_boosts_that_use_framework_request",
+    "SkillFrameworksGetById200Response": "openapi_client.models.skill_frameworks_get_by_id200_response",
+    "SkillFrameworksGetById200ResponseSkills": "openapi_client.models.skill_frameworks_get_by_id200_response_skills",
+    "SkillFrameworksRemoveFrameworkAdmin200Response": "openapi_client.models.skill_frameworks_remove_framework_admin200_response",
+    "SkillFrameworksReplaceSkills200Response": "openapi_client.models.skill_frameworks_replace_skills200_response",
+    "SkillFrameworksReplaceSkillsRequest": "openapi_client.models.skill_frameworks_replace_skills_request",
+    "SkillFrameworksUpdateRequest": "openapi_client.models.skill_frameworks_update_request",
+    "SkillsAddSkillTag200ResponseInner": "openapi_client.models.skills_add_skill_tag200_response_inner",
+    "SkillsAddSkillTagRequest": "openapi_client.models.skills_add_skill_tag_request",
+    "SkillsAddSkillTagRequestTag": "openapi_client.models.skills_add_skill_tag_request_tag",
+    "SkillsCountSkills200Response": "openapi_client.models.skills_count_skills200_response",
+    "SkillsCreate200Response": "openapi_client.models.skills_create200_response",
+    "SkillsCreateManyRequest": "openapi_client.models.skills_create_many_request",
+    "SkillsCreateRequest": "openapi_client.models.skills_create_request",
+    "SkillsDelete200Response": "openapi_client.models.skills_delete200_response",
+    "SkillsGetFrameworkSkillTree200Response": "openapi_client.models.skills_get_framework_skill_tree200_response",
+    "SkillsGetFullSkillTree200Response": "openapi_client.models.skills_get_full_skill_tree200_response",
+    "SkillsGetSkill200Response": "openapi_client.models.skills_get_skill200_response",
+    "SkillsGetSkillPath200Response": "openapi_client.models.skills_get_skill_path200_response",
+    "SkillsListSkillTags200ResponseInner": "openapi_client.models.skills_list_skill_tags200_response_inner",
+    "SkillsSearchFrameworkSkillsRequest": "openapi_client.models.skills_search_framework_skills_request",
+    "SkillsSearchFrameworkSkillsRequestQuery": "openapi_client.models.skills_search_framework_skills_request_query",
+    "SkillsSearchFrameworkSkillsRequestQueryAnyOf": "openapi_client.models.skills_search_framework_skills_request_query_any_of",
+    "SkillsSyncFrameworkSkills200Response": "openapi_client.models.skills_sync_framework_skills200_response",
+    "SkillsUpdateRequest": "openapi_client.models.skills_update_request",
+    "StorageResolve200Response": "openapi_client.models.storage_resolve200_response",
+    "StorageResolve200ResponseAnyOf": "openapi_client.models.storage_resolve200_response_any_of",
+    "StorageResolve200ResponseAnyOf1": "openapi_client.models.storage_resolve200_response_any_of1",
+    "StorageResolve200ResponseAnyOf1Read": "openapi_client.models.storage_resolve200_response_any_of1_read",
+    "StorageResolve200ResponseAnyOf1ReadCredentials": "openapi_client.models.storage_resolve200_response_any_of1_read_credentials",
+    "StorageResolve200ResponseAnyOf1ReadCredentialsCategoriesValue": "openapi_client.models.storage_resolve200_response_any_of1_read_credentials_categories_value",
+    "StorageResolve200ResponseAnyOf1Write": "openapi_client.models.storage_resolve200_response_any_of1_write",
+    "StorageResolve200ResponseAnyOf1WriteCredentials": "openapi_client.models.storage_resolve200_response_any_of1_write_credentials",
+    "StorageResolve200ResponseAnyOfAnyOf": "openapi_client.models.storage_resolve200_response_any_of_any_of",
+    "StorageResolve200ResponseAnyOfAnyOf1": "openapi_client.models.storage_resolve200_response_any_of_any_of1",
+    "StorageResolve200ResponseAnyOfAnyOf1Read": "openapi_client.models.storage_resolve200_response_any_of_any_of1_read",
+    "StorageResolve200ResponseAnyOfAnyOf1ReadCredentials": "openapi_client.models.storage_resolve200_response_any_of_any_of1_read_credentials",
+    "StorageResolve200ResponseAnyOfAnyOf1ReadCredentialsCategoriesValue": "openapi_client.models.storage_resolve200_response_any_of_any_of1_read_credentials_categories_value",
+    "StorageResolve200ResponseAnyOfAnyOf1ReadPersonalValue": "openapi_client.models.storage_resolve200_response_any_of_any_of1_read_personal_value",
+    "StorageResolve200ResponseAnyOfAnyOf1Write": "openapi_client.models.storage_resolve200_response_any_of_any_of1_write",
+    "StorageResolve200ResponseAnyOfAnyOf1WriteCredentials": "openapi_client.models.storage_resolve200_response_any_of_any_of1_write_credentials",
+    "StorageResolve200ResponseAnyOfAnyOfAnyOf": "openapi_client.models.storage_resolve200_response_any_of_any_of_any_of",
+    "StorageResolve200ResponseAnyOfAnyOfAnyOf1": "openapi_client.models.storage_resolve200_response_any_of_any_of_any_of1",
+    "StorageResolve200ResponseAnyOfAnyOfAnyOf1RecipientsInner": "openapi_client.models.storage_resolve200_response_any_of_any_of_any_of1_recipients_inner",
+    "StorageResolve200ResponseAnyOfAnyOfAnyOf1RecipientsInnerHeader": "openapi_client.models.storage_resolve200_response_any_of_any_of_any_of1_recipients_inner_header",
+    "StorageResolve200ResponseAnyOfAnyOfAnyOf1RecipientsInnerHeaderEpk": "openapi_client.models.storage_resolve200_response_any_of_any_of_any_of1_recipients_inner_header_epk",
+    "StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOf": "openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of",
+    "StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOf1": "openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of1",
+    "StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOf1VerifiableCredential": "openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of1_verifiable_credential",
+    "StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOf": "openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of_any_of",
+    "StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOf1": "openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of_any_of1",
+    "StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuer": "openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of_any_of_issuer",
+    "StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOf": "openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of_any_of_issuer_any_of",
+    "StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOfAddress": "openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of_any_of_issuer_any_of_address",
+    "StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOfAddressGeo": "openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of_any_of_issuer_any_of_address_geo",
+    "StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOfImage": "openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of_any_of_issuer_any_of_image",
+    "StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOfImageAnyOf": "openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of_any_of_issuer_any_of_image_any_of",
+    "StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOfOtherIdentifierInner": "openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of_any_of_issuer_any_of_other_identifier_inner",
+    "StorageStoreRequest": "openapi_client.models.storage_store_request",
+    "StorageStoreRequestItem": "openapi_client.models.storage_store_request_item",
+    "StorageStoreRequestItemAnyOf": "openapi_client.models.storage_store_request_item_any_of",
+    "StorageStoreRequestItemAnyOfAnyOf": "openapi_client.models.storage_store_request_item_any_of_any_of",
+    "WorkflowsParticipateInExchange200Response": "openapi_client.models.workflows_participate_in_exchange200_response",
+    "WorkflowsParticipateInExchange200ResponseVerifiablePresentationRequest": "openapi_client.models.workflows_participate_in_exchange200_response_verifiable_presentation_request",
+    "WorkflowsParticipateInExchange200ResponseVerifiablePresentationRequestQueryInner": "openapi_client.models.workflows_participate_in_exchange200_response_verifiable_presentation_request_query_inner",
+    "WorkflowsParticipateInExchange200ResponseVerifiablePresentationRequestQueryInnerCredentialQueryInner": "openapi_client.models.workflows_participate_in_exchange200_response_verifiable_presentation_request_query_inner_credential_query_inner",
+    "WorkflowsParticipateInExchangeRequest": "openapi_client.models.workflows_participate_in_exchange_request",
+}
+
 
-# import ApiClient
-from openapi_client.api_response import ApiResponse as ApiResponse
-from openapi_client.api_client import ApiClient as ApiClient
-from openapi_client.configuration import Configuration as Configuration
-from openapi_client.exceptions import OpenApiException as OpenApiException
-from openapi_client.exceptions import ApiTypeError as ApiTypeError
-from openapi_client.exceptions import ApiValueError as ApiValueError
-from openapi_client.exceptions import ApiKeyError as ApiKeyError
-from openapi_client.exceptions import ApiAttributeError as ApiAttributeError
-from openapi_client.exceptions import ApiException as ApiException
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        # submodules such as `openapi_client.models` stay reachable as attributes
+        if name.startswith("__"):
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        try:
+            return importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
 
-# import models into sdk package
-from openapi_client.models.activity_get_activity200_response import ActivityGetActivity200Response as ActivityGetActivity200Response
-from openapi_client.models.activity_get_activity200_response_boost import ActivityGetActivity200ResponseBoost as ActivityGetActivity200ResponseBoost
-from openapi_client.models.activity_get_activity200_response_recipient_profile import ActivityGetActivity200ResponseRecipientProfile as ActivityGetActivity200ResponseRecipientProfile
-from openapi_client.models.activity_get_activity_chain200_response_inner import ActivityGetActivityChain200ResponseInner as ActivityGetActivityChain200ResponseInner
-from openapi_client.models.activity_get_activity_stats200_response import ActivityGetActivityStats200Response as ActivityGetActivityStats200Response
-from openapi_client.models.activity_get_my_activities200_response import ActivityGetMyActivities200Response as ActivityGetMyActivities200Response
-from openapi_client.models.activity_get_my_activities200_response_records_inner import ActivityGetMyActivities200ResponseRecordsInner as ActivityGetMyActivities200ResponseRecordsInner
-from openapi_client.models.activity_get_my_activities200_response_records_inner_boost import ActivityGetMyActivities200ResponseRecordsInnerBoost as ActivityGetMyActivities200ResponseRecordsInnerBoost
-from openapi_client.models.activity_get_my_activities200_response_records_inner_recipient_profile import ActivityGetMyActivities200ResponseRecordsInnerRecipientProfile as ActivityGetMyActivities200ResponseRecordsInnerRecipientProfile
-from openapi_client.models.app_store_add_boost_to_listing_request import AppStoreAddBoostToListingRequest as AppStoreAddBoostToListingRequest
-from openapi_client.models.app_store_admin_get_all_listings_request import AppStoreAdminGetAllListingsRequest as AppStoreAdminGetAllListingsRequest
-from openapi_client.models.app_store_admin_update_listing_status_request import AppStoreAdminUpdateListingStatusRequest as AppStoreAdminUpdateListingStatusRequest
-from openapi_client.models.app_store_admin_update_promotion_level_request import AppStoreAdminUpdatePromotionLevelRequest as AppStoreAdminUpdatePromotionLevelRequest
-from openapi_client.models.app_store_app_event_request import AppStoreAppEventRequest as AppStoreAppEventRequest
-from openapi_client.models.app_store_browse_listed_apps_request import AppStoreBrowseListedAppsRequest as AppStoreBrowseListedAppsRequest
-from openapi_client.models.app_store_create_listing_request import AppStoreCreateListingRequest as AppStoreCreateListingRequest
-from openapi_client.models.app_store_create_listing_request_listing import AppStoreCreateListingRequestListing as AppStoreCreateListingRequestListing
-from openapi_client.models.app_store_get_boosts_for_listing200_response_inner import AppStoreGetBoostsForListing200ResponseInner as AppStoreGetBoostsForListing200ResponseInner
-from openapi_client.models.app_store_get_installed_apps200_response import AppStoreGetInstalledApps200Response as AppStoreGetInstalledApps200Response
-from openapi_client.models.app_store_get_installed_apps200_response_records_inner import AppStoreGetInstalledApps200ResponseRecordsInner as AppStoreGetInstalledApps200ResponseRecordsInner
-from openapi_client.models.app_store_get_listing200_response import AppStoreGetListing200Response as AppStoreGetListing200Response
-from openapi_client.models.app_store_get_listings_for_integration200_response import AppStoreGetListingsForIntegration200Response as AppStoreGetListingsForIntegration200Response
-from openapi_client.models.app_store_get_listings_for_integration200_response_records_inner import AppStoreGetListingsForIntegration200ResponseRecordsInner as AppStoreGetListingsForIntegration200ResponseRecordsInner
-from openapi_client.models.app_store_get_listings_for_integration_request import AppStoreGetListingsForIntegrationRequest as AppStoreGetListingsForIntegrationRequest
-from openapi_client.models.app_store_remove_boost_from_listing_request import AppStoreRemoveBoostFromListingRequest as AppStoreRemoveBoostFromListingRequest
-from openapi_client.models.app_store_update_listing_request import AppStoreUpdateListingRequest as AppStoreUpdateListingRequest
-from openapi_client.models.app_store_update_listing_request_updates import AppStoreUpdateListingRequestUpdates as AppStoreUpdateListingRequestUpdates
-from openapi_client.models.auth_grants_add_auth_grant_request import AuthGrantsAddAuthGrantRequest as AuthGrantsAddAuthGrantRequest
-from openapi_client.models.auth_grants_get_auth_grant200_response import AuthGrantsGetAuthGrant200Response as AuthGrantsGetAuthGrant200Response
-from openapi_client.models.auth_grants_get_auth_grants200_response_inner import AuthGrantsGetAuthGrants200ResponseInner as AuthGrantsGetAuthGrants200ResponseInner
-from openapi_client.models.auth_grants_get_auth_grants_request import AuthGrantsGetAuthGrantsRequest as AuthGrantsGetAuthGrantsRequest
-from openapi_client.models.auth_grants_get_auth_grants_request_query import AuthGrantsGetAuthGrantsRequestQuery as AuthGrantsGetAuthGrantsRequestQuery
-from openapi_client.models.auth_grants_update_auth_grant_request import AuthGrantsUpdateAuthGrantRequest as AuthGrantsUpdateAuthGrantRequest
-from openapi_client.models.auth_grants_update_auth_grant_request_updates import AuthGrantsUpdateAuthGrantRequestUpdates as AuthGrantsUpdateAuthGrantRequestUpdates
-from openapi_client.models.boost_add_boost_admin_request import BoostAddBoostAdminRequest as BoostAddBoostAdminRequest
-from openapi_client.models.boost_align_boost_skills_request import BoostAlignBoostSkillsRequest as BoostAlignBoostSkillsRequest
-from openapi_client.models.boost_align_boost_skills_request_skills_inner import BoostAlignBoostSkillsRequestSkillsInner as BoostAlignBoostSkillsRequestSkillsInner
-from openapi_client.models.boost_attach_framework_to_boost_request import BoostAttachFrameworkToBoostRequest as BoostAttachFrameworkToBoostRequest
-from openapi_client.models.boost_claim_boost_with_link_request import BoostClaimBoostWithLinkRequest as BoostClaimBoostWithLinkRequest
-from openapi_client.models.boost_count_boost_children_request import BoostCountBoostChildrenRequest as BoostCountBoostChildrenRequest
-from openapi_client.models.boost_count_boost_parents_request import BoostCountBoostParentsRequest as BoostCountBoostParentsRequest
-from openapi_client.models.boost_count_boost_siblings_request import BoostCountBoostSiblingsRequest as BoostCountBoostSiblingsRequest
-from openapi_client.models.boost_count_familial_boosts_request import BoostCountFamilialBoostsRequest as BoostCountFamilialBoostsRequest
-from openapi_client.models.boost_create_boost_request import BoostCreateBoostRequest as BoostCreateBoostRequest
-from openapi_client.models.boost_create_boost_request_claim_permissions import BoostCreateBoostRequestClaimPermissions as BoostCreateBoostRequestClaimPermissions
-from openapi_client.models.boost_create_boost_request_credential import BoostCreateBoostRequestCredential as BoostCreateBoostRequestCredential
-from openapi_client.models.boost_create_boost_request_credential_any_of import BoostCreateBoostRequestCredentialAnyOf as BoostCreateBoostRequestCredentialAnyOf
-from openapi_client.models.boost_create_child_boost_request import BoostCreateChildBoostRequest as BoostCreateChildBoostRequest
-from openapi_client.models.boost_create_child_boost_request_boost import BoostCreateChildBoostRequestBoost as BoostCreateChildBoostRequestBoost
-from openapi_client.models.boost_detach_framework_from_boost_request import BoostDetachFrameworkFromBoostRequest as BoostDetachFrameworkFromBoostRequest
-from openapi_client.models.boost_generate_claim_link200_response import BoostGenerateClaimLink200Response as BoostGenerateClaimLink200Response
-from openapi_client.models.boost_generate_claim_link_request import BoostGenerateClaimLinkRequest as BoostGenerateClaimLinkRequest
-from openapi_client.models.boost_generate_claim_link_request_claim_link_sa import BoostGenerateClaimLinkRequestClaimLinkSA as BoostGenerateClaimLinkRequestClaimLinkSA
-from openapi_client.models.boost_generate_claim_link_request_options import BoostGenerateClaimLinkRequestOptions as BoostGenerateClaimLinkRequestOptions
-from openapi_client.models.boost_get_boost200_response import BoostGetBoost200Response as BoostGetBoost200Response
-from openapi_client.models.boost_get_boost200_response_boost import BoostGetBoost200ResponseBoost as BoostGetBoost200ResponseBoost
-from openapi_client.models.boost_get_boost200_response_boost_issuer import BoostGetBoost200ResponseBoostIssuer as BoostGetBoost200ResponseBoostIssuer
-from openapi_client.models.boost_get_boost200_response_boost_issuer_any_of import BoostGetBoost200ResponseBoostIssuerAnyOf as BoostGetBoost200ResponseBoostIssuerAnyOf
-from openapi_client.models.boost_get_boost200_response_boost_issuer_any_of_address import BoostGetBoost200ResponseBoostIssuerAnyOfAddress as BoostGetBoost200ResponseBoostIssuerAnyOfAddress
-from openapi_client.models.boost_get_boost200_response_boost_issuer_any_of_address_geo import BoostGetBoost200ResponseBoostIssuerAnyOfAddressGeo as BoostGetBoost200ResponseBoostIssuerAnyOfAddressGeo
-from openapi_client.models.boost_get_boost200_response_boost_issuer_any_of_image import BoostGetBoost200ResponseBoostIssuerAnyOfImage as BoostGetBoost200ResponseBoostIssuerAnyOfImage
-from openapi_client.models.boost_get_boost200_response_boost_issuer_any_of_image_any_of import BoostGetBoost200ResponseBoostIssuerAnyOfImageAnyOf as BoostGetBoost200ResponseBoostIssuerAnyOfImageAnyOf
-from openapi_client.models.boost_get_boost200_response_boost_issuer_any_of_other_identifier_inner import BoostGetBoost200ResponseBoostIssuerAnyOfOtherIdentifierInner as BoostGetBoost200ResponseBoostIssuerAnyOfOtherIdentifierInner
-from openapi_client.models.boost_get_boost200_response_claim_permissions import BoostGetBoost200ResponseClaimPermissions as BoostGetBoost200ResponseClaimPermissions
-from openapi_client.models.boost_get_boost200_response_default_permissions import BoostGetBoost200ResponseDefaultPermissions as BoostGetBoost200ResponseDefaultPermissions
-from openapi_client.models.boost_get_boost_admins200_response import BoostGetBoostAdmins200Response as BoostGetBoostAdmins200Response
-from openapi_client.models.boost_get_boost_admins_request import BoostGetBoostAdminsRequest as BoostGetBoostAdminsRequest
-from openapi_client.models.boost_get_boost_alignments200_response_inner import BoostGetBoostAlignments200ResponseInner as BoostGetBoostAlignments200ResponseInner
-from openapi_client.models.boost_get_boost_children_request import BoostGetBoostChildrenRequest as BoostGetBoostChildrenRequest
-from openapi_client.models.boost_get_boost_frameworks200_response import BoostGetBoostFrameworks200Response as BoostGetBoostFrameworks200Response
-from openapi_client.models.boost_get_boost_frameworks200_response_records_inner import BoostGetBoostFrameworks200ResponseRecordsInner as BoostGetBoostFrameworks200ResponseRecordsInner
-from openapi_client.models.boost_get_boost_frameworks_request import BoostGetBoostFrameworksRequest as BoostGetBoostFrameworksRequest
-from openapi_client.models.boost_get_boost_frameworks_request_query import BoostGetBoostFrameworksRequestQuery as BoostGetBoostFrameworksRequestQuery
-from openapi_client.models.boost_get_boost_frameworks_request_query_any_of import BoostGetBoostFrameworksRequestQueryAnyOf as BoostGetBoostFrameworksRequestQueryAnyOf
-from openapi_client.models.boost_get_boost_frameworks_request_query_any_of_or_inner import BoostGetBoostFrameworksRequestQueryAnyOfOrInner as BoostGetBoostFrameworksRequestQueryAnyOfOrInner
-from openapi_client.models.boost_get_boost_parents_request import BoostGetBoostParentsRequest as BoostGetBoostParentsRequest
-from openapi_client.models.boost_get_boost_recipients200_response_inner import BoostGetBoostRecipients200ResponseInner as BoostGetBoostRecipients200ResponseInner
-from openapi_client.models.boost_get_boost_recipients200_response_inner_to import BoostGetBoostRecipients200ResponseInnerTo as BoostGetBoostRecipients200ResponseInnerTo
-from openapi_client.models.boost_get_boost_recipients200_response_inner_to_display import BoostGetBoostRecipients200ResponseInnerToDisplay as BoostGetBoostRecipients200ResponseInnerToDisplay
-from openapi_client.models.boost_get_boost_recipients_with_children_count_request import BoostGetBoostRecipientsWithChildrenCountRequest as BoostGetBoostRecipientsWithChildrenCountRequest
-from openapi_client.models.boost_get_boost_recipients_with_children_count_request_number_of_generations import BoostGetBoostRecipientsWithChildrenCountRequestNumberOfGenerations as BoostGetBoostRecipientsWithChildrenCountRequestNumberOfGenerations
-from openapi_client.models.boost_get_boost_siblings_request import BoostGetBoostSiblingsRequest as BoostGetBoostSiblingsRequest
-from openapi_client.models.boost_get_boosts200_response_inner import BoostGetBoosts200ResponseInner as BoostGetBoosts200ResponseInner
-from openapi_client.models.boost_get_boosts_request import BoostGetBoostsRequest as BoostGetBoostsRequest
-from openapi_client.models.boost_get_boosts_request_query import BoostGetBoostsRequestQuery as BoostGetBoostsRequestQuery
-from openapi_client.models.boost_get_boosts_request_query_any_of import BoostGetBoostsRequestQueryAnyOf as BoostGetBoostsRequestQueryAnyOf
-from openapi_client.models.boost_get_boosts_request_query_any_of_or_inner import BoostGetBoostsRequestQueryAnyOfOrInner as BoostGetBoostsRequestQueryAnyOfOrInner
-from openapi_client.models.boost_get_boosts_request_query_any_of_or_inner_status import BoostGetBoostsRequestQueryAnyOfOrInnerStatus as BoostGetBoostsRequestQueryAnyOfOrInnerStatus
-from openapi_client.models.boost_get_boosts_request_query_any_of_or_inner_status_any_of import BoostGetBoostsRequestQueryAnyOfOrInnerStatusAnyOf as BoostGetBoostsRequestQueryAnyOfOrInnerStatusAnyOf
-from openapi_client.models.boost_get_children_profile_managers200_response import BoostGetChildrenProfileManagers200Response as BoostGetChildrenProfileManagers200Response
-from openapi_client.models.boost_get_children_profile_managers200_response_records_inner import BoostGetChildrenProfileManagers200ResponseRecordsInner as BoostGetChildrenProfileManagers200ResponseRecordsInner
-from openapi_client.models.boost_get_children_profile_managers_request import BoostGetChildrenProfileManagersRequest as BoostGetChildrenProfileManagersRequest
-from openapi_client.models.boost_get_children_profile_managers_request_query import BoostGetChildrenProfileManagersRequestQuery as BoostGetChildrenProfileManagersRequestQuery
-from openapi_client.models.boost_get_connected_boost_recipients_request import BoostGetConnectedBoostRecipientsRequest as BoostGetConnectedBoostRecipientsRequest
-from openapi_client.models.boost_get_familial_boosts_request import BoostGetFamilialBoostsRequest as BoostGetFamilialBoostsRequest
-from openapi_client.models.boost_get_paginated_boost_recipients200_response import BoostGetPaginatedBoostRecipients200Response as BoostGetPaginatedBoostRecipients200Response
-from openapi_client.models.boost_get_paginated_boost_recipients200_response_records_inner import BoostGetPaginatedBoostRecipients200ResponseRecordsInner as BoostGetPaginatedBoostRecipients200ResponseRecordsInner
-from openapi_client.models.boost_get_paginated_boost_recipients200_response_records_inner_to import BoostGetPaginatedBoostRecipients200ResponseRecordsInnerTo as BoostGetPaginatedBoostRecipients200ResponseRecordsInnerTo
-from openapi_client.models.boost_get_paginated_boost_recipients200_response_records_inner_to_display import BoostGetPaginatedBoostRecipients200ResponseRecordsInnerToDisplay as BoostGetPaginatedBoostRecipients200ResponseRecordsInnerToDisplay
-from openapi_client.models.boost_get_paginated_boost_recipients_request import BoostGetPaginatedBoostRecipientsRequest as BoostGetPaginatedBoostRecipientsRequest
-from openapi_client.models.boost_get_paginated_boost_recipients_request_query import BoostGetPaginatedBoostRecipientsRequestQuery as BoostGetPaginatedBoostRecipientsRequestQuery
-from openapi_client.models.boost_get_paginated_boost_recipients_with_children200_response import BoostGetPaginatedBoostRecipientsWithChildren200Response as BoostGetPaginatedBoostRecipientsWithChildren200Response
-from openapi_client.models.boost_get_paginated_boost_recipients_with_children200_response_records_inner import BoostGetPaginatedBoostRecipientsWithChildren200ResponseRecordsInner as BoostGetPaginatedBoostRecipientsWithChildren200ResponseRecordsInner
-from openapi_client.models.boost_get_paginated_boost_recipients_with_children_request import BoostGetPaginatedBoostRecipientsWithChildrenRequest as BoostGetPaginatedBoostRecipientsWithChildrenRequest
-from openapi_client.models.boost_get_paginated_boost_recipients_with_children_request_number_of_generations import BoostGetPaginatedBoostRecipientsWithChildrenRequestNumberOfGenerations as BoostGetPaginatedBoostRecipientsWithChildrenRequestNumberOfGenerations
-from openapi_client.models.boost_get_paginated_boosts200_response import BoostGetPaginatedBoosts200Response as BoostGetPaginatedBoosts200Response
-from openapi_client.models.boost_get_paginated_boosts200_response_records_inner import BoostGetPaginatedBoosts200ResponseRecordsInner as BoostGetPaginatedBoosts200ResponseRecordsInner
-from openapi_client.models.boost_get_paginated_boosts_request import BoostGetPaginatedBoostsRequest as BoostGetPaginatedBoostsRequest
-from openapi_client.models.boost_get_skills_available_for_boost200_response_inner import BoostGetSkillsAvailableForBoost200ResponseInner as BoostGetSkillsAvailableForBoost200ResponseInner
-from openapi_client.models.boost_get_skills_available_for_boost200_response_inner_framework import BoostGetSkillsAvailableForBoost200ResponseInnerFramework as BoostGetSkillsAvailableForBoost200ResponseInnerFramework
-from openapi_client.models.boost_get_skills_available_for_boost200_response_inner_skills_inner import BoostGetSkillsAvailableForBoost200ResponseInnerSkillsInner as BoostGetSkillsAvailableForBoost200ResponseInnerSkillsInner
-from openapi_client.models.boost_make_boost_parent_request import BoostMakeBoostParentRequest as BoostMakeBoostParentRequest
-from openapi_client.models.boost_remove_boost_admin_request import BoostRemoveBoostAdminRequest as BoostRemoveBoostAdminRequest
-from openapi_client.models.boost_remove_boost_parent_request import BoostRemoveBoostParentRequest as BoostRemoveBoostParentRequest
-from openapi_client.models.boost_search_skills_available_for_boost200_response import BoostSearchSkillsAvailableForBoost200Response as BoostSearchSkillsAvailableForBoost200Response
-from openapi_client.models.boost_search_skills_available_for_boost200_response_records_inner import BoostSearchSkillsAvailableForBoost200ResponseRecordsInner as BoostSearchSkillsAvailableForBoost200ResponseRecordsInner
-from openapi_client.models.boost_search_skills_available_for_boost_request import BoostSearchSkillsAvailableForBoostRequest as BoostSearchSkillsAvailableForBoostRequest
-from openapi_client.models.boost_search_skills_available_for_boost_request_query import BoostSearchSkillsAvailableForBoostRequestQuery as BoostSearchSkillsAvailableForBoostRequestQuery
-from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of import BoostSearchSkillsAvailableForBoostRequestQueryAnyOf as BoostSearchSkillsAvailableForBoostRequestQueryAnyOf
-from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of1 import BoostSearchSkillsAvailableForBoostRequestQueryAnyOf1 as BoostSearchSkillsAvailableForBoostRequestQueryAnyOf1
-from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInner as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInner
-from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerId as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerId
-from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf
-from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of1 import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1 as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1
-from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of1_or_inner import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1OrInner as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1OrInner
-from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of1_or_inner_any_of import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1OrInnerAnyOf as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1OrInnerAnyOf
-from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of1_or_inner_any_of1 import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1OrInnerAnyOf1 as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1OrInnerAnyOf1
-from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of1_or_inner_any_of1_regex import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1OrInnerAnyOf1Regex as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1OrInnerAnyOf1Regex
-from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of1_or_inner_any_of_any_of import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1OrInnerAnyOfAnyOf as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOf1OrInnerAnyOfAnyOf
-from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of_any_of import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOfAnyOf as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOfAnyOf
-from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of_any_of1 import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOfAnyOf1 as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOfAnyOf1
-from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of_any_of1_regex import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOfAnyOf1Regex as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOfAnyOf1Regex
-from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_id_any_of_any_of_any_of import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOfAnyOfAnyOf as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerIdAnyOfAnyOfAnyOf
-from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_statement import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerStatement as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerStatement
-from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_status import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerStatus as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerStatus
-from openapi_client.models.boost_search_skills_available_for_boost_request_query_any_of_or_inner_status_any_of import BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerStatusAnyOf as BoostSearchSkillsAvailableForBoostRequestQueryAnyOfOrInnerStatusAnyOf
-from openapi_client.models.boost_send200_response import BoostSend200Response as BoostSend200Response
-from openapi_client.models.boost_send200_response_inbox import BoostSend200ResponseInbox as BoostSend200ResponseInbox
-from openapi_client.models.boost_send_boost_request import BoostSendBoostRequest as BoostSendBoostRequest
-from openapi_client.models.boost_send_boost_request_credential import BoostSendBoostRequestCredential as BoostSendBoostRequestCredential
-from openapi_client.models.boost_send_boost_request_credential_any_of import BoostSendBoostRequestCredentialAnyOf as BoostSendBoostRequestCredentialAnyOf
-from openapi_client.models.boost_send_boost_request_credential_any_of1 import BoostSendBoostRequestCredentialAnyOf1 as BoostSendBoostRequestCredentialAnyOf1
-from openapi_client.models.boost_send_boost_request_credential_any_of1_recipients_inner import BoostSendBoostRequestCredentialAnyOf1RecipientsInner as BoostSendBoostRequestCredentialAnyOf1RecipientsInner
-from openapi_client.models.boost_send_boost_request_credential_any_of1_recipients_inner_header import BoostSendBoostRequestCredentialAnyOf1RecipientsInnerHeader as BoostSendBoostRequestCredentialAnyOf1RecipientsInnerHeader
-from openapi_client.models.boost_send_boost_request_credential_any_of1_recipients_inner_header_epk import BoostSendBoostRequestCredentialAnyOf1RecipientsInnerHeaderEpk as BoostSendBoostRequestCredentialAnyOf1RecipientsInnerHeaderEpk
-from openapi_client.models.boost_send_boost_request_credential_any_of_context_inner import BoostSendBoostRequestCredentialAnyOfContextInner as BoostSendBoostRequestCredentialAnyOfContextInner
-from openapi_client.models.boost_send_boost_request_credential_any_of_credential_schema import BoostSendBoostRequestCredentialAnyOfCredentialSchema as BoostSendBoostRequestCredentialAnyOfCredentialSchema
-from openapi_client.models.boost_send_boost_request_credential_any_of_credential_schema_any_of import BoostSendBoostRequestCredentialAnyOfCredentialSchemaAnyOf as BoostSendBoostRequestCredentialAnyOfCredentialSchemaAnyOf
-from openapi_client.models.boost_send_boost_request_credential_any_of_credential_schema_any_of1_inner import BoostSendBoostRequestCredentialAnyOfCredentialSchemaAnyOf1Inner as BoostSendBoostRequestCredentialAnyOfCredentialSchemaAnyOf1Inner
-from openapi_client.models.boost_send_boost_request_credential_any_of_credential_status import BoostSendBoostRequestCredentialAnyOfCredentialStatus as BoostSendBoostRequestCredentialAnyOfCredentialStatus
-from openapi_client.models.boost_send_boost_request_credential_any_of_credential_subject import BoostSendBoostRequestCredentialAnyOfCredentialSubject as BoostSendBoostRequestCredentialAnyOfCredentialSubject
-from openapi_client.models.boost_send_boost_request_credential_any_of_credential_subject_any_of import BoostSendBoostRequestCredentialAnyOfCredentialSubjectAnyOf as BoostSendBoostRequestCredentialAnyOfCredentialSubjectAnyOf
-from openapi_client.models.boost_send_boost_request_credential_any_of_credential_subject_any_of1_inner import BoostSendBoostRequestCredentialAnyOfCredentialSubjectAnyOf1Inner as BoostSendBoostRequestCredentialAnyOfCredentialSubjectAnyOf1Inner
-from openapi_client.models.boost_send_boost_request_credential_any_of_evidence import BoostSendBoostRequestCredentialAnyOfEvidence as BoostSendBoostRequestCredentialAnyOfEvidence
-from openapi_client.models.boost_send_boost_request_credential_any_of_evidence_any_of import BoostSendBoostRequestCredentialAnyOfEvidenceAnyOf as BoostSendBoostRequestCredentialAnyOfEvidenceAnyOf
-from openapi_client.models.boost_send_boost_request_credential_any_of_evidence_any_of1_inner import BoostSendBoostRequestCredentialAnyOfEvidenceAnyOf1Inner as BoostSendBoostRequestCredentialAnyOfEvidenceAnyOf1Inner
-from openapi_client.models.boost_send_boost_request_credential_any_of_issuer import BoostSendBoostRequestCredentialAnyOfIssuer as BoostSendBoostRequestCredentialAnyOfIssuer
-from openapi_client.models.boost_send_boost_request_credential_any_of_issuer_any_of import BoostSendBoostRequestCredentialAnyOfIssuerAnyOf as BoostSendBoostRequestCredentialAnyOfIssuerAnyOf
-from openapi_client.models.boost_send_boost_request_credential_any_of_issuer_any_of_address import BoostSendBoostRequestCredentialAnyOfIssuerAnyOfAddress as BoostSendBoostRequestCredentialAnyOfIssuerAnyOfAddress
-from openapi_client.models.boost_send_boost_request_credential_any_of_issuer_any_of_address_geo import BoostSendBoostRequestCredentialAnyOfIssuerAnyOfAddressGeo as BoostSendBoostRequestCredentialAnyOfIssuerAnyOfAddressGeo
-from openapi_client.models.boost_send_boost_request_credential_any_of_issuer_any_of_address_type import BoostSendBoostRequestCredentialAnyOfIssuerAnyOfAddressType as BoostSendBoostRequestCredentialAnyOfIssuerAnyOfAddressType
-from openapi_client.models.boost_send_boost_request_credential_any_of_issuer_any_of_image import BoostSendBoostRequestCredentialAnyOfIssuerAnyOfImage as BoostSendBoostRequestCredentialAnyOfIssuerAnyOfImage
-from openapi_client.models.boost_send_boost_request_credential_any_of_issuer_any_of_image_any_of import BoostSendBoostRequestCredentialAnyOfIssuerAnyOfImageAnyOf as BoostSendBoostRequestCredentialAnyOfIssuerAnyOfImageAnyOf
-from openapi_client.models.boost_send_boost_request_credential_any_of_issuer_any_of_other_identifier_inner import BoostSendBoostRequestCredentialAnyOfIssuerAnyOfOtherIdentifierInner as BoostSendBoostRequestCredentialAnyOfIssuerAnyOfOtherIdentifierInner
-from openapi_client.models.boost_send_boost_request_credential_any_of_issuer_any_of_other_identifier_inner_identifier_type import BoostSendBoostRequestCredentialAnyOfIssuerAnyOfOtherIdentifierInnerIdentifierType as BoostSendBoostRequestCredentialAnyOfIssuerAnyOfOtherIdentifierInnerIdentifierType
-from openapi_client.models.boost_send_boost_request_credential_any_of_issuer_any_of_type import BoostSendBoostRequestCredentialAnyOfIssuerAnyOfType as BoostSendBoostRequestCredentialAnyOfIssuerAnyOfType
-from openapi_client.models.boost_send_boost_request_credential_any_of_proof import BoostSendBoostRequestCredentialAnyOfProof as BoostSendBoostRequestCredentialAnyOfProof
-from openapi_client.models.boost_send_boost_request_credential_any_of_proof_any_of import BoostSendBoostRequestCredentialAnyOfProofAnyOf as BoostSendBoostRequestCredentialAnyOfProofAnyOf
-from openapi_client.models.boost_send_boost_request_credential_any_of_proof_any_of1_inner import BoostSendBoostRequestCredentialAnyOfProofAnyOf1Inner as BoostSendBoostRequestCredentialAnyOfProofAnyOf1Inner
-from openapi_client.models.boost_send_boost_request_credential_any_of_refresh_service import BoostSendBoostRequestCredentialAnyOfRefreshService as BoostSendBoostRequestCredentialAnyOfRefreshService
-from openapi_client.models.boost_send_boost_request_credential_any_of_refresh_service_any_of import BoostSendBoostRequestCredentialAnyOfRefreshServiceAnyOf as BoostSendBoostRequestCredentialAnyOfRefreshServiceAnyOf
-from openapi_client.models.boost_send_boost_request_credential_any_of_refresh_service_any_of1_inner import BoostSendBoostRequestCredentialAnyOfRefreshServiceAnyOf1Inner as BoostSendBoostRequestCredentialAnyOfRefreshServiceAnyOf1Inner
-from openapi_client.models.boost_send_boost_request_credential_any_of_terms_of_use import BoostSendBoostRequestCredentialAnyOfTermsOfUse as BoostSendBoostRequestCredentialAnyOfTermsOfUse
-from openapi_client.models.boost_send_boost_request_options import BoostSendBoostRequestOptions as BoostSendBoostRequestOptions
-from openapi_client.models.boost_send_boost_via_signing_authority_request import BoostSendBoostViaSigningAuthorityRequest as BoostSendBoostViaSigningAuthorityRequest
-from openapi_client.models.boost_send_boost_via_signing_authority_request_signing_authority import BoostSendBoostViaSigningAuthorityRequestSigningAuthority as BoostSendBoostViaSigningAuthorityRequestSigningAuthority
-from openapi_client.models.boost_send_request import BoostSendRequest as BoostSendRequest
-from openapi_client.models.boost_send_request_options import BoostSendRequestOptions as BoostSendRequestOptions
-from openapi_client.models.boost_send_request_options_branding import BoostSendRequestOptionsBranding as BoostSendRequestOptionsBranding
-from openapi_client.models.boost_send_request_template import BoostSendRequestTemplate as BoostSendRequestTemplate
-from openapi_client.models.boost_send_request_template_claim_permissions import BoostSendRequestTemplateClaimPermissions as BoostSendRequestTemplateClaimPermissions
-from openapi_client.models.boost_send_request_template_credential import BoostSendRequestTemplateCredential as BoostSendRequestTemplateCredential
-from openapi_client.models.boost_send_request_template_credential_any_of import BoostSendRequestTemplateCredentialAnyOf as BoostSendRequestTemplateCredentialAnyOf
-from openapi_client.models.boost_send_request_template_credential_any_of1 import BoostSendRequestTemplateCredentialAnyOf1 as BoostSendRequestTemplateCredentialAnyOf1
-from openapi_client.models.boost_send_request_template_credential_any_of_context_inner import BoostSendRequestTemplateCredentialAnyOfContextInner as BoostSendRequestTemplateCredentialAnyOfContextInner
-from openapi_client.models.boost_send_request_template_credential_any_of_credential_subject import BoostSendRequestTemplateCredentialAnyOfCredentialSubject as BoostSendRequestTemplateCredentialAnyOfCredentialSubject
-from openapi_client.models.boost_send_request_template_credential_any_of_evidence import BoostSendRequestTemplateCredentialAnyOfEvidence as BoostSendRequestTemplateCredentialAnyOfEvidence
-from openapi_client.models.boost_send_request_template_credential_any_of_issuer import BoostSendRequestTemplateCredentialAnyOfIssuer as BoostSendRequestTemplateCredentialAnyOfIssuer
-from openapi_client.models.boost_send_request_template_credential_any_of_issuer_any_of import BoostSendRequestTemplateCredentialAnyOfIssuerAnyOf as BoostSendRequestTemplateCredentialAnyOfIssuerAnyOf
-from openapi_client.models.boost_send_request_template_credential_any_of_issuer_any_of_address import BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfAddress as BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfAddress
-from openapi_client.models.boost_send_request_template_credential_any_of_issuer_any_of_address_geo import BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfAddressGeo as BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfAddressGeo
-from openapi_client.models.boost_send_request_template_credential_any_of_issuer_any_of_image import BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfImage as BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfImage
-from openapi_client.models.boost_send_request_template_credential_any_of_issuer_any_of_image_any_of import BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfImageAnyOf as BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfImageAnyOf
-from openapi_client.models.boost_send_request_template_credential_any_of_issuer_any_of_other_identifier_inner import BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfOtherIdentifierInner as BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfOtherIdentifierInner
-from openapi_client.models.boost_send_request_template_credential_any_of_issuer_any_of_other_identifier_inner_identifier_type import BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfOtherIdentifierInnerIdentifierType as BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfOtherIdentifierInnerIdentifierType
-from openapi_client.models.boost_send_request_template_credential_any_of_issuer_any_of_type import BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfType as BoostSendRequestTemplateCredentialAnyOfIssuerAnyOfType
-from openapi_client.models.boost_send_request_template_credential_any_of_proof import BoostSendRequestTemplateCredentialAnyOfProof as BoostSendRequestTemplateCredentialAnyOfProof
-from openapi_client.models.boost_send_request_template_default_permissions import BoostSendRequestTemplateDefaultPermissions as BoostSendRequestTemplateDefaultPermissions
-from openapi_client.models.boost_send_request_template_skills_inner import BoostSendRequestTemplateSkillsInner as BoostSendRequestTemplateSkillsInner
-from openapi_client.models.boost_update_boost_permissions_request import BoostUpdateBoostPermissionsRequest as BoostUpdateBoostPermissionsRequest
-from openapi_client.models.boost_update_boost_permissions_request_updates import BoostUpdateBoostPermissionsRequestUpdates as BoostUpdateBoostPermissionsRequestUpdates
-from openapi_client.models.boost_update_boost_request import BoostUpdateBoostRequest as BoostUpdateBoostRequest
-from openapi_client.models.boost_update_boost_request_updates import BoostUpdateBoostRequestUpdates as BoostUpdateBoostRequestUpdates
-from openapi_client.models.boost_update_other_boost_permissions_request import BoostUpdateOtherBoostPermissionsRequest as BoostUpdateOtherBoostPermissionsRequest
-from openapi_client.models.boost_update_other_boost_permissions_request_updates import BoostUpdateOtherBoostPermissionsRequestUpdates as BoostUpdateOtherBoostPermissionsRequestUpdates
-from openapi_client.models.claim_hook_create_claim_hook_request import ClaimHookCreateClaimHookRequest as ClaimHookCreateClaimHookRequest
-from openapi_client.models.claim_hook_create_claim_hook_request_hook import ClaimHookCreateClaimHookRequestHook as ClaimHookCreateClaimHookRequestHook
-from openapi_client.models.claim_hook_create_claim_hook_request_hook_one_of import ClaimHookCreateClaimHookRequestHookOneOf as ClaimHookCreateClaimHookRequestHookOneOf
-from openapi_client.models.claim_hook_create_claim_hook_request_hook_one_of1 import ClaimHookCreateClaimHookRequestHookOneOf1 as ClaimHookCreateClaimHookRequestHookOneOf1
-from openapi_client.models.claim_hook_create_claim_hook_request_hook_one_of1_data import ClaimHookCreateClaimHookRequestHookOneOf1Data as ClaimHookCreateClaimHookRequestHookOneOf1Data
-from openapi_client.models.claim_hook_create_claim_hook_request_hook_one_of2 import ClaimHookCreateClaimHookRequestHookOneOf2 as ClaimHookCreateClaimHookRequestHookOneOf2
-from openapi_client.models.claim_hook_create_claim_hook_request_hook_one_of2_data import ClaimHookCreateClaimHookRequestHookOneOf2Data as ClaimHookCreateClaimHookRequestHookOneOf2Data
-from openapi_client.models.claim_hook_create_claim_hook_request_hook_one_of_data import ClaimHookCreateClaimHookRequestHookOneOfData as ClaimHookCreateClaimHookRequestHookOneOfData
-from openapi_client.models.claim_hook_delete_claim_hook_request import ClaimHookDeleteClaimHookRequest as ClaimHookDeleteClaimHookRequest
-from openapi_client.models.claim_hook_get_claim_hooks_for_boost200_response import ClaimHookGetClaimHooksForBoost200Response as ClaimHookGetClaimHooksForBoost200Response
-from openapi_client.models.claim_hook_get_claim_hooks_for_boost200_response_records_inner import ClaimHookGetClaimHooksForBoost200ResponseRecordsInner as ClaimHookGetClaimHooksForBoost200ResponseRecordsInner
-from openapi_client.models.claim_hook_get_claim_hooks_for_boost200_response_records_inner_all_of_one_of import ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOf as ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOf
-from openapi_client.models.claim_hook_get_claim_hooks_for_boost200_response_records_inner_all_of_one_of1 import ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOf1 as ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOf1
-from openapi_client.models.claim_hook_get_claim_hooks_for_boost200_response_records_inner_all_of_one_of1_data import ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOf1Data as ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOf1Data
-from openapi_client.models.claim_hook_get_claim_hooks_for_boost200_response_records_inner_all_of_one_of2 import ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOf2 as ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOf2
-from openapi_client.models.claim_hook_get_claim_hooks_for_boost200_response_records_inner_all_of_one_of2_data import ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOf2Data as ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOf2Data
-from openapi_client.models.claim_hook_get_claim_hooks_for_boost200_response_records_inner_all_of_one_of_data import ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOfData as ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOfData
-from openapi_client.models.claim_hook_get_claim_hooks_for_boost200_response_records_inner_all_of_one_of_data_permissions import ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOfDataPermissions as ClaimHookGetClaimHooksForBoost200ResponseRecordsInnerAllOfOneOfDataPermissions
-from openapi_client.models.claim_hook_get_claim_hooks_for_boost_request import ClaimHookGetClaimHooksForBoostRequest as ClaimHookGetClaimHooksForBoostRequest
-from openapi_client.models.claim_hook_get_claim_hooks_for_boost_request_query import ClaimHookGetClaimHooksForBoostRequestQuery as ClaimHookGetClaimHooksForBoostRequestQuery
-from openapi_client.models.claim_hook_get_claim_hooks_for_boost_request_query_data import ClaimHookGetClaimHooksForBoostRequestQueryData as ClaimHookGetClaimHooksForBoostRequestQueryData
-from openapi_client.models.claim_hook_get_claim_hooks_for_boost_request_query_data_permissions import ClaimHookGetClaimHooksForBoostRequestQueryDataPermissions as ClaimHookGetClaimHooksForBoostRequestQueryDataPermissions
-from openapi_client.models.contact_methods_add_contact_method200_response import ContactMethodsAddContactMethod200Response as ContactMethodsAddContactMethod200Response
-from openapi_client.models.contact_methods_add_contact_method_request import ContactMethodsAddContactMethodRequest as ContactMethodsAddContactMethodRequest
-from openapi_client.models.contact_methods_create_contact_method_session200_response import ContactMethodsCreateContactMethodSession200Response as ContactMethodsCreateContactMethodSession200Response
-from openapi_client.models.contact_methods_create_contact_method_session_request import ContactMethodsCreateContactMethodSessionRequest as ContactMethodsCreateContactMethodSessionRequest
-from openapi_client.models.contact_methods_create_contact_method_session_request_contact_method import ContactMethodsCreateContactMethodSessionRequestContactMethod as ContactMethodsCreateContactMethodSessionRequestContactMethod
-from openapi_client.models.contact_methods_get_my_contact_methods200_response_inner import ContactMethodsGetMyContactMethods200ResponseInner as ContactMethodsGetMyContactMethods200ResponseInner
-from openapi_client.models.contact_methods_get_my_contact_methods200_response_inner_one_of import ContactMethodsGetMyContactMethods200ResponseInnerOneOf as ContactMethodsGetMyContactMethods200ResponseInnerOneOf
-from openapi_client.models.contact_methods_get_my_contact_methods200_response_inner_one_of1 import ContactMethodsGetMyContactMethods200ResponseInnerOneOf1 as ContactMethodsGetMyContactMethods200ResponseInnerOneOf1
-from openapi_client.models.contact_methods_remove_contact_method_request import ContactMethodsRemoveContactMethodRequest as ContactMethodsRemoveContactMethodRequest
-from openapi_client.models.contact_methods_send_challenge200_response import ContactMethodsSendChallenge200Response as ContactMethodsSendChallenge200Response
-from openapi_client.models.contact_methods_send_challenge_request import ContactMethodsSendChallengeRequest as ContactMethodsSendChallengeRequest
-from openapi_client.models.contact_methods_send_challenge_request_configuration import ContactMethodsSendChallengeRequestConfiguration as ContactMethodsSendChallengeRequestConfiguration
-from openapi_client.models.contact_methods_set_primary_contact_method_request import ContactMethodsSetPrimaryContactMethodRequest as ContactMethodsSetPrimaryContactMethodRequest
-from openapi_client.models.contact_methods_verify_contact_method_request import ContactMethodsVerifyContactMethodRequest as ContactMethodsVerifyContactMethodRequest
-from openapi_client.models.contact_methods_verify_with_credential200_response import ContactMethodsVerifyWithCredential200Response as ContactMethodsVerifyWithCredential200Response
-from openapi_client.models.contact_methods_verify_with_credential200_response_contact_method import ContactMethodsVerifyWithCredential200ResponseContactMethod as ContactMethodsVerifyWithCredential200ResponseContactMethod
-from openapi_client.models.contact_methods_verify_with_credential200_response_contact_method_one_of import ContactMethodsVerifyWithCredential200ResponseContactMethodOneOf as ContactMethodsVerifyWithCredential200ResponseContactMethodOneOf
-from openapi_client.models.contact_methods_verify_with_credential200_response_contact_method_one_of1 import ContactMethodsVerifyWithCredential200ResponseContactMethodOneOf1 as ContactMethodsVerifyWithCredential200ResponseContactMethodOneOf1
-from openapi_client.models.contact_methods_verify_with_credential_request import ContactMethodsVerifyWithCredentialRequest as ContactMethodsVerifyWithCredentialRequest
-from openapi_client.models.contracts_add_auto_boosts_to_contract_request import ContractsAddAutoBoostsToContractRequest as ContractsAddAutoBoostsToContractRequest
-from openapi_client.models.contracts_add_auto_boosts_to_contract_request_autoboosts_inner import ContractsAddAutoBoostsToContractRequestAutoboostsInner as ContractsAddAutoBoostsToContractRequestAutoboostsInner
-from openapi_client.models.contracts_cancel_contract_request_request import ContractsCancelContractRequestRequest as ContractsCancelContractRequestRequest
-from openapi_client.models.contracts_consent_to_contract200_response import ContractsConsentToContract200Response as ContractsConsentToContract200Response
-from openapi_client.models.contracts_consent_to_contract_request import ContractsConsentToContractRequest as ContractsConsentToContractRequest
-from openapi_client.models.contracts_consent_to_contract_request_terms import ContractsConsentToContractRequestTerms as ContractsConsentToContractRequestTerms
-from openapi_client.models.contracts_consent_to_contract_request_terms_read import ContractsConsentToContractRequestTermsRead as ContractsConsentToContractRequestTermsRead
-from openapi_client.models.contracts_consent_to_contract_request_terms_read_credentials import ContractsConsentToContractRequestTermsReadCredentials as ContractsConsentToContractRequestTermsReadCredentials
-from openapi_client.models.contracts_consent_to_contract_request_terms_read_credentials_categories_value import ContractsConsentToContractRequestTermsReadCredentialsCategoriesValue as ContractsConsentToContractRequestTermsReadCredentialsCategoriesValue
-from openapi_client.models.contracts_consent_to_contract_request_terms_write import ContractsConsentToContractRequestTermsWrite as ContractsConsentToContractRequestTermsWrite
-from openapi_client.models.contracts_consent_to_contract_request_terms_write_credentials import ContractsConsentToContractRequestTermsWriteCredentials as ContractsConsentToContractRequestTermsWriteCredentials
-from openapi_client.models.contracts_create_consent_flow_contract_request import ContractsCreateConsentFlowContractRequest as ContractsCreateConsentFlowContractRequest
-from openapi_client.models.contracts_create_consent_flow_contract_request_autoboosts_inner import ContractsCreateConsentFlowContractRequestAutoboostsInner as ContractsCreateConsentFlowContractRequestAutoboostsInner
-from openapi_client.models.contracts_create_consent_flow_contract_request_autoboosts_inner_signing_authority import ContractsCreateConsentFlowContractRequestAutoboostsInnerSigningAuthority as ContractsCreateConsentFlowContractRequestAutoboostsInnerSigningAuthority
-from openapi_client.models.contracts_create_consent_flow_contract_request_contract import ContractsCreateConsentFlowContractRequestContract as ContractsCreateConsentFlowContractRequestContract
-from openapi_client.models.contracts_create_consent_flow_contract_request_contract_read import ContractsCreateConsentFlowContractRequestContractRead as ContractsCreateConsentFlowContractRequestContractRead
-from openapi_client.models.contracts_create_consent_flow_contract_request_contract_read_credentials import ContractsCreateConsentFlowContractRequestContractReadCredentials as ContractsCreateConsentFlowContractRequestContractReadCredentials
-from openapi_client.models.contracts_create_consent_flow_contract_request_contract_read_credentials_categories_value import ContractsCreateConsentFlowContractRequestContractReadCredentialsCategoriesValue as ContractsCreateConsentFlowContractRequestContractReadCredentialsCategoriesValue
-from openapi_client.models.contracts_create_consent_flow_contract_request_contract_write import ContractsCreateConsentFlowContractRequestContractWrite as ContractsCreateConsentFlowContractRequestContractWrite
-from openapi_client.models.contracts_forward_contract_request_to_profile_request import ContractsForwardContractRequestToProfileRequest as ContractsForwardContractRequestToProfileRequest
-from openapi_client.models.contracts_get_all_contract_requests_for_profile200_response_inner import ContractsGetAllContractRequestsForProfile200ResponseInner as ContractsGetAllContractRequestsForProfile200ResponseInner
-from openapi_client.models.contracts_get_all_contract_requests_for_profile200_response_inner_contract import ContractsGetAllContractRequestsForProfile200ResponseInnerContract as ContractsGetAllContractRequestsForProfile200ResponseInnerContract
-from openapi_client.models.contracts_get_all_credentials_for_terms_request import ContractsGetAllCredentialsForTermsRequest as ContractsGetAllCredentialsForTermsRequest
-from openapi_client.models.contracts_get_consent_flow_contract200_response import ContractsGetConsentFlowContract200Response as ContractsGetConsentFlowContract200Response
-from openapi_client.models.contracts_get_consent_flow_contract200_response_contract import ContractsGetConsentFlowContract200ResponseContract as ContractsGetConsentFlowContract200ResponseContract
-from openapi_client.models.contracts_get_consent_flow_contract200_response_contract_read import ContractsGetConsentFlowContract200ResponseContractRead as ContractsGetConsentFlowContract200ResponseContractRead
-from openapi_client.models.contracts_get_consent_flow_contracts200_response import ContractsGetConsentFlowContracts200Response as ContractsGetConsentFlowContracts200Response
-from openapi_client.models.contracts_get_consent_flow_contracts200_response_records_inner import ContractsGetConsentFlowContracts200ResponseRecordsInner as ContractsGetConsentFlowContracts200ResponseRecordsInner
-from openapi_client.models.contracts_get_consent_flow_contracts_request import ContractsGetConsentFlowContractsRequest as ContractsGetConsentFlowContractsRequest
-from openapi_client.models.contracts_get_consent_flow_contracts_request_query import ContractsGetConsentFlowContractsRequestQuery as ContractsGetConsentFlowContractsRequestQuery
-from openapi_client.models.contracts_get_consent_flow_contracts_request_query_read import ContractsGetConsentFlowContractsRequestQueryRead as ContractsGetConsentFlowContractsRequestQueryRead
-from openapi_client.models.contracts_get_consent_flow_contracts_request_query_read_credentials import ContractsGetConsentFlowContractsRequestQueryReadCredentials as ContractsGetConsentFlowContractsRequestQueryReadCredentials
-from openapi_client.models.contracts_get_consent_flow_contracts_request_query_read_credentials_categories_value import ContractsGetConsentFlowContractsRequestQueryReadCredentialsCategoriesValue as ContractsGetConsentFlowContractsRequestQueryReadCredentialsCategoriesValue
-from openapi_client.models.contracts_get_consent_flow_contracts_request_query_write import ContractsGetConsentFlowContractsRequestQueryWrite as ContractsGetConsentFlowContractsRequestQueryWrite
-from openapi_client.models.contracts_get_consented_contracts200_response import ContractsGetConsentedContracts200Response as ContractsGetConsentedContracts200Response
-from openapi_client.models.contracts_get_consented_contracts200_response_records_inner import ContractsGetConsentedContracts200ResponseRecordsInner as ContractsGetConsentedContracts200ResponseRecordsInner
-from openapi_client.models.contracts_get_consented_contracts200_response_records_inner_terms import ContractsGetConsentedContracts200ResponseRecordsInnerTerms as ContractsGetConsentedContracts200ResponseRecordsInnerTerms
-from openapi_client.models.contracts_get_consented_contracts200_response_records_inner_terms_read import ContractsGetConsentedContracts200ResponseRecordsInnerTermsRead as ContractsGetConsentedContracts200ResponseRecordsInnerTermsRead
-from openapi_client.models.contracts_get_consented_contracts200_response_records_inner_terms_read_credentials import ContractsGetConsentedContracts200ResponseRecordsInnerTermsReadCredentials as ContractsGetConsentedContracts200ResponseRecordsInnerTermsReadCredentials
-from openapi_client.models.contracts_get_consented_contracts200_response_records_inner_terms_read_credentials_categories_value import ContractsGetConsentedContracts200ResponseRecordsInnerTermsReadCredentialsCategoriesValue as ContractsGetConsentedContracts200ResponseRecordsInnerTermsReadCredentialsCategoriesValue
-from openapi_client.models.contracts_get_consented_contracts_request import ContractsGetConsentedContractsRequest as ContractsGetConsentedContractsRequest
-from openapi_client.models.contracts_get_consented_contracts_request_query import ContractsGetConsentedContractsRequestQuery as ContractsGetConsentedContractsRequestQuery
-from openapi_client.models.contracts_get_consented_contracts_request_query_read import ContractsGetConsentedContractsRequestQueryRead as ContractsGetConsentedContractsRequestQueryRead
-from openapi_client.models.contracts_get_consented_contracts_request_query_read_credentials import ContractsGetConsentedContractsRequestQueryReadCredentials as ContractsGetConsentedContractsRequestQueryReadCredentials
-from openapi_client.models.contracts_get_consented_contracts_request_query_read_credentials_categories_value import ContractsGetConsentedContractsRequestQueryReadCredentialsCategoriesValue as ContractsGetConsentedContractsRequestQueryReadCredentialsCategoriesValue
-from openapi_client.models.contracts_get_consented_contracts_request_query_write import ContractsGetConsentedContractsRequestQueryWrite as ContractsGetConsentedContractsRequestQueryWrite
-from openapi_client.models.contracts_get_consented_data200_response import ContractsGetConsentedData200Response as ContractsGetConsentedData200Response
-from openapi_client.models.contracts_get_consented_data200_response_records_inner import ContractsGetConsentedData200ResponseRecordsInner as ContractsGetConsentedData200ResponseRecordsInner
-from openapi_client.models.contracts_get_consented_data_for_contract200_response import ContractsGetConsentedDataForContract200Response as ContractsGetConsentedDataForContract200Response
-from openapi_client.models.contracts_get_consented_data_for_contract200_response_records_inner import ContractsGetConsentedDataForContract200ResponseRecordsInner as ContractsGetConsentedDataForContract200ResponseRecordsInner
-from openapi_client.models.contracts_get_consented_data_for_contract200_response_records_inner_credentials import ContractsGetConsentedDataForContract200ResponseRecordsInnerCredentials as ContractsGetConsentedDataForContract200ResponseRecordsInnerCredentials
-from openapi_client.models.contracts_get_consented_data_for_contract_request import ContractsGetConsentedDataForContractRequest as ContractsGetConsentedDataForContractRequest
-from openapi_client.models.contracts_get_consented_data_for_contract_request_query import ContractsGetConsentedDataForContractRequestQuery as ContractsGetConsentedDataForContractRequestQuery
-from openapi_client.models.contracts_get_consented_data_for_contract_request_query_credentials import ContractsGetConsentedDataForContractRequestQueryCredentials as ContractsGetConsentedDataForContractRequestQueryCredentials
-from openapi_client.models.contracts_get_consented_data_for_did200_response import ContractsGetConsentedDataForDid200Response as ContractsGetConsentedDataForDid200Response
-from openapi_client.models.contracts_get_consented_data_for_did200_response_records_inner import ContractsGetConsentedDataForDid200ResponseRecordsInner as ContractsGetConsentedDataForDid200ResponseRecordsInner
-from openapi_client.models.contracts_get_consented_data_for_did200_response_records_inner_credentials_inner import ContractsGetConsentedDataForDid200ResponseRecordsInnerCredentialsInner as ContractsGetConsentedDataForDid200ResponseRecordsInnerCredentialsInner
-from openapi_client.models.contracts_get_consented_data_for_did_request import ContractsGetConsentedDataForDidRequest as ContractsGetConsentedDataForDidRequest
-from openapi_client.models.contracts_get_consented_data_for_did_request_query import ContractsGetConsentedDataForDidRequestQuery as ContractsGetConsentedDataForDidRequestQuery
-from openapi_client.models.contracts_get_consented_data_request import ContractsGetConsentedDataRequest as ContractsGetConsentedDataRequest
-from openapi_client.models.contracts_get_contract_sent_requests200_response_inner import ContractsGetContractSentRequests200ResponseInner as ContractsGetContractSentRequests200ResponseInner
-from openapi_client.models.contracts_get_credentials_for_contract200_response import ContractsGetCredentialsForContract200Response as ContractsGetCredentialsForContract200Response
-from openapi_client.models.contracts_get_credentials_for_contract200_response_records_inner import ContractsGetCredentialsForContract200ResponseRecordsInner as ContractsGetCredentialsForContract200ResponseRecordsInner
-from openapi_client.models.contracts_get_credentials_for_contract_request import ContractsGetCredentialsForContractRequest as ContractsGetCredentialsForContractRequest
-from openapi_client.models.contracts_get_request_status_for_profile200_response import ContractsGetRequestStatusForProfile200Response as ContractsGetRequestStatusForProfile200Response
-from openapi_client.models.contracts_get_terms_transaction_history200_response import ContractsGetTermsTransactionHistory200Response as ContractsGetTermsTransactionHistory200Response
-from openapi_client.models.contracts_get_terms_transaction_history200_response_records_inner import ContractsGetTermsTransactionHistory200ResponseRecordsInner as ContractsGetTermsTransactionHistory200ResponseRecordsInner
-from openapi_client.models.contracts_get_terms_transaction_history200_response_records_inner_terms import ContractsGetTermsTransactionHistory200ResponseRecordsInnerTerms as ContractsGetTermsTransactionHistory200ResponseRecordsInnerTerms
-from openapi_client.models.contracts_get_terms_transaction_history200_response_records_inner_terms_write import ContractsGetTermsTransactionHistory200ResponseRecordsInnerTermsWrite as ContractsGetTermsTransactionHistory200ResponseRecordsInnerTermsWrite
-from openapi_client.models.contracts_get_terms_transaction_history200_response_records_inner_terms_write_credentials import ContractsGetTermsTransactionHistory200ResponseRecordsInnerTermsWriteCredentials as ContractsGetTermsTransactionHistory200ResponseRecordsInnerTermsWriteCredentials
-from openapi_client.models.contracts_get_terms_transaction_history_request import ContractsGetTermsTransactionHistoryRequest as ContractsGetTermsTransactionHistoryRequest
-from openapi_client.models.contracts_get_terms_transaction_history_request_query import ContractsGetTermsTransactionHistoryRequestQuery as ContractsGetTermsTransactionHistoryRequestQuery
-from openapi_client.models.contracts_get_terms_transaction_history_request_query_action import ContractsGetTermsTransactionHistoryRequestQueryAction as ContractsGetTermsTransactionHistoryRequestQueryAction
-from openapi_client.models.contracts_get_terms_transaction_history_request_query_date import ContractsGetTermsTransactionHistoryRequestQueryDate as ContractsGetTermsTransactionHistoryRequestQueryDate
-from openapi_client.models.contracts_get_terms_transaction_history_request_query_date_any_of import ContractsGetTermsTransactionHistoryRequestQueryDateAnyOf as ContractsGetTermsTransactionHistoryRequestQueryDateAnyOf
-from openapi_client.models.contracts_get_terms_transaction_history_request_query_date_any_of1 import ContractsGetTermsTransactionHistoryRequestQueryDateAnyOf1 as ContractsGetTermsTransactionHistoryRequestQueryDateAnyOf1
-from openapi_client.models.contracts_get_terms_transaction_history_request_query_date_any_of_any_of import ContractsGetTermsTransactionHistoryRequestQueryDateAnyOfAnyOf as ContractsGetTermsTransactionHistoryRequestQueryDateAnyOfAnyOf
-from openapi_client.models.contracts_get_terms_transaction_history_request_query_date_any_of_any_of1 import ContractsGetTermsTransactionHistoryRequestQueryDateAnyOfAnyOf1 as ContractsGetTermsTransactionHistoryRequestQueryDateAnyOfAnyOf1
-from openapi_client.models.contracts_get_terms_transaction_history_request_query_expires_at import ContractsGetTermsTransactionHistoryRequestQueryExpiresAt as ContractsGetTermsTransactionHistoryRequestQueryExpiresAt
-from openapi_client.models.contracts_get_terms_transaction_history_request_query_expires_at_any_of import ContractsGetTermsTransactionHistoryRequestQueryExpiresAtAnyOf as ContractsGetTermsTransactionHistoryRequestQueryExpiresAtAnyOf
-from openapi_client.models.contracts_get_terms_transaction_history_request_query_expires_at_any_of1 import ContractsGetTermsTransactionHistoryRequestQueryExpiresAtAnyOf1 as ContractsGetTermsTransactionHistoryRequestQueryExpiresAtAnyOf1
-from openapi_client.models.contracts_get_terms_transaction_history_request_query_expires_at_any_of_any_of import ContractsGetTermsTransactionHistoryRequestQueryExpiresAtAnyOfAnyOf as ContractsGetTermsTransactionHistoryRequestQueryExpiresAtAnyOfAnyOf
-from openapi_client.models.contracts_get_terms_transaction_history_request_query_expires_at_any_of_any_of1 import ContractsGetTermsTransactionHistoryRequestQueryExpiresAtAnyOfAnyOf1 as ContractsGetTermsTransactionHistoryRequestQueryExpiresAtAnyOfAnyOf1
-from openapi_client.models.contracts_get_terms_transaction_history_request_query_terms import ContractsGetTermsTransactionHistoryRequestQueryTerms as ContractsGetTermsTransactionHistoryRequestQueryTerms
-from openapi_client.models.contracts_get_terms_transaction_history_request_query_terms_read import ContractsGetTermsTransactionHistoryRequestQueryTermsRead as ContractsGetTermsTransactionHistoryRequestQueryTermsRead
-from openapi_client.models.contracts_mark_contract_request_as_seen_request import ContractsMarkContractRequestAsSeenRequest as ContractsMarkContractRequestAsSeenRequest
-from openapi_client.models.contracts_remove_auto_boosts_from_contract_request import ContractsRemoveAutoBoostsFromContractRequest as ContractsRemoveAutoBoostsFromContractRequest
-from openapi_client.models.contracts_send_ai_insight_share_request_request import ContractsSendAiInsightShareRequestRequest as ContractsSendAiInsightShareRequestRequest
-from openapi_client.models.contracts_send_ai_insights_contract_request_request import ContractsSendAiInsightsContractRequestRequest as ContractsSendAiInsightsContractRequestRequest
-from openapi_client.models.contracts_sync_credentials_to_contract_request import ContractsSyncCredentialsToContractRequest as ContractsSyncCredentialsToContractRequest
-from openapi_client.models.contracts_update_consented_contract_terms_request import ContractsUpdateConsentedContractTermsRequest as ContractsUpdateConsentedContractTermsRequest
-from openapi_client.models.contracts_update_consented_contract_terms_request_terms import ContractsUpdateConsentedContractTermsRequestTerms as ContractsUpdateConsentedContractTermsRequestTerms
-from openapi_client.models.contracts_update_consented_contract_terms_request_terms_read import ContractsUpdateConsentedContractTermsRequestTermsRead as ContractsUpdateConsentedContractTermsRequestTermsRead
-from openapi_client.models.contracts_update_consented_contract_terms_request_terms_read_credentials import ContractsUpdateConsentedContractTermsRequestTermsReadCredentials as ContractsUpdateConsentedContractTermsRequestTermsReadCredentials
-from openapi_client.models.contracts_write_credential_to_contract_request import ContractsWriteCredentialToContractRequest as ContractsWriteCredentialToContractRequest
-from openapi_client.models.contracts_write_credential_to_contract_request_credential import ContractsWriteCredentialToContractRequestCredential as ContractsWriteCredentialToContractRequestCredential
-from openapi_client.models.contracts_write_credential_to_contract_via_signing_authority_request import ContractsWriteCredentialToContractViaSigningAuthorityRequest as ContractsWriteCredentialToContractViaSigningAuthorityRequest
-from openapi_client.models.credential_accept_credential_request import CredentialAcceptCredentialRequest as CredentialAcceptCredentialRequest
-from openapi_client.models.credential_accept_credential_request_options import CredentialAcceptCredentialRequestOptions as CredentialAcceptCredentialRequestOptions
-from openapi_client.models.credential_received_credentials200_response_inner import CredentialReceivedCredentials200ResponseInner as CredentialReceivedCredentials200ResponseInner
-from openapi_client.models.credential_send_credential_request import CredentialSendCredentialRequest as CredentialSendCredentialRequest
-from openapi_client.models.credential_send_credential_request_credential import CredentialSendCredentialRequestCredential as CredentialSendCredentialRequestCredential
-from openapi_client.models.credential_send_credential_request_credential_any_of import CredentialSendCredentialRequestCredentialAnyOf as CredentialSendCredentialRequestCredentialAnyOf
-from openapi_client.models.credential_send_credential_request_credential_any_of1 import CredentialSendCredentialRequestCredentialAnyOf1 as CredentialSendCredentialRequestCredentialAnyOf1
-from openapi_client.models.credential_send_credential_request_credential_any_of1_recipients_inner import CredentialSendCredentialRequestCredentialAnyOf1RecipientsInner as CredentialSendCredentialRequestCredentialAnyOf1RecipientsInner
-from openapi_client.models.credential_send_credential_request_credential_any_of1_recipients_inner_header import CredentialSendCredentialRequestCredentialAnyOf1RecipientsInnerHeader as CredentialSendCredentialRequestCredentialAnyOf1RecipientsInnerHeader
-from openapi_client.models.credential_send_credential_request_credential_any_of1_recipients_inner_header_epk import CredentialSendCredentialRequestCredentialAnyOf1RecipientsInnerHeaderEpk as CredentialSendCredentialRequestCredentialAnyOf1RecipientsInnerHeaderEpk
-from openapi_client.models.did_metadata_add_did_metadata_request import DidMetadataAddDidMetadataRequest as DidMetadataAddDidMetadataRequest
-from openapi_client.models.did_metadata_add_did_metadata_request_authentication_inner import DidMetadataAddDidMetadataRequestAuthenticationInner as DidMetadataAddDidMetadataRequestAuthenticationInner
-from openapi_client.models.did_metadata_add_did_metadata_request_authentication_inner_any_of import DidMetadataAddDidMetadataRequestAuthenticationInnerAnyOf as DidMetadataAddDidMetadataRequestAuthenticationInnerAnyOf
-from openapi_client.models.did_metadata_add_did_metadata_request_authentication_inner_any_of_public_key_jwk import DidMetadataAddDidMetadataRequestAuthenticationInnerAnyOfPublicKeyJwk as DidMetadataAddDidMetadataRequestAuthenticationInnerAnyOfPublicKeyJwk
-from openapi_client.models.did_metadata_add_did_metadata_request_service_inner import DidMetadataAddDidMetadataRequestServiceInner as DidMetadataAddDidMetadataRequestServiceInner
-from openapi_client.models.did_metadata_add_did_metadata_request_verification_method_inner import DidMetadataAddDidMetadataRequestVerificationMethodInner as DidMetadataAddDidMetadataRequestVerificationMethodInner
-from openapi_client.models.did_metadata_add_did_metadata_request_verification_method_inner_any_of import DidMetadataAddDidMetadataRequestVerificationMethodInnerAnyOf as DidMetadataAddDidMetadataRequestVerificationMethodInnerAnyOf
-from openapi_client.models.did_metadata_add_did_metadata_request_verification_method_inner_any_of_public_key_jwk import DidMetadataAddDidMetadataRequestVerificationMethodInnerAnyOfPublicKeyJwk as DidMetadataAddDidMetadataRequestVerificationMethodInnerAnyOfPublicKeyJwk
-from openapi_client.models.did_metadata_get_did_metadata200_response import DidMetadataGetDidMetadata200Response as DidMetadataGetDidMetadata200Response
-from openapi_client.models.did_metadata_get_did_metadata200_response_authentication_inner import DidMetadataGetDidMetadata200ResponseAuthenticationInner as DidMetadataGetDidMetadata200ResponseAuthenticationInner
-from openapi_client.models.did_metadata_get_did_metadata200_response_authentication_inner_any_of import DidMetadataGetDidMetadata200ResponseAuthenticationInnerAnyOf as DidMetadataGetDidMetadata200ResponseAuthenticationInnerAnyOf
-from openapi_client.models.did_metadata_get_did_metadata200_response_authentication_inner_any_of_public_key_jwk import DidMetadataGetDidMetadata200ResponseAuthenticationInnerAnyOfPublicKeyJwk as DidMetadataGetDidMetadata200ResponseAuthenticationInnerAnyOfPublicKeyJwk
-from openapi_client.models.did_metadata_get_did_metadata200_response_service_inner import DidMetadataGetDidMetadata200ResponseServiceInner as DidMetadataGetDidMetadata200ResponseServiceInner
-from openapi_client.models.did_metadata_get_did_metadata200_response_verification_method_inner import DidMetadataGetDidMetadata200ResponseVerificationMethodInner as DidMetadataGetDidMetadata200ResponseVerificationMethodInner
-from openapi_client.models.did_metadata_get_did_metadata200_response_verification_method_inner_any_of import DidMetadataGetDidMetadata200ResponseVerificationMethodInnerAnyOf as DidMetadataGetDidMetadata200ResponseVerificationMethodInnerAnyOf
-from openapi_client.models.did_metadata_get_did_metadata200_response_verification_method_inner_any_of_public_key_jwk import DidMetadataGetDidMetadata200ResponseVerificationMethodInnerAnyOfPublicKeyJwk as DidMetadataGetDidMetadata200ResponseVerificationMethodInnerAnyOfPublicKeyJwk
-from openapi_client.models.did_metadata_get_my_did_metadata200_response_inner import DidMetadataGetMyDidMetadata200ResponseInner as DidMetadataGetMyDidMetadata200ResponseInner
-from openapi_client.models.did_metadata_update_did_metadata_request import DidMetadataUpdateDidMetadataRequest as DidMetadataUpdateDidMetadataRequest
-from openapi_client.models.did_metadata_update_did_metadata_request_updates import DidMetadataUpdateDidMetadataRequestUpdates as DidMetadataUpdateDidMetadataRequestUpdates
-from openapi_client.models.error_badrequest import ErrorBADREQUEST as ErrorBADREQUEST
-from openapi_client.models.error_badrequest_issues_inner import ErrorBADREQUESTIssuesInner as ErrorBADREQUESTIssuesInner
-from openapi_client.models.error_forbidden import ErrorFORBIDDEN as ErrorFORBIDDEN
-from openapi_client.models.error_internalservererror import ErrorINTERNALSERVERERROR as ErrorINTERNALSERVERERROR
-from openapi_client.models.error_notfound import ErrorNOTFOUND as ErrorNOTFOUND
-from openapi_client.models.error_unauthorized import ErrorUNAUTHORIZED as ErrorUNAUTHORIZED
-from openapi_client.models.inbox_approve_guardian_request_request import InboxApproveGuardianRequestRequest as InboxApproveGuardianRequestRequest
-from openapi_client.models.inbox_claim200_response import InboxClaim200Response as InboxClaim200Response
-from openapi_client.models.inbox_claim200_response_inbox_credential import InboxClaim200ResponseInboxCredential as InboxClaim200ResponseInboxCredential
-from openapi_client.models.inbox_claim200_response_inbox_credential_signing_authority import InboxClaim200ResponseInboxCredentialSigningAuthority as InboxClaim200ResponseInboxCredentialSigningAuthority
-from openapi_client.models.inbox_claim_request import InboxClaimRequest as InboxClaimRequest
-from openapi_client.models.inbox_claim_request_configuration import InboxClaimRequestConfiguration as InboxClaimRequestConfiguration
-from openapi_client.models.inbox_claim_request_credential import InboxClaimRequestCredential as InboxClaimRequestCredential
-from openapi_client.models.inbox_finalize200_response import InboxFinalize200Response as InboxFinalize200Response
-from openapi_client.models.inbox_get_my_issued_credentials200_response import InboxGetMyIssuedCredentials200Response as InboxGetMyIssuedCredentials200Response
-from openapi_client.models.inbox_get_my_issued_credentials200_response_records_inner import InboxGetMyIssuedCredentials200ResponseRecordsInner as InboxGetMyIssuedCredentials200ResponseRecordsInner
-from openapi_client.models.inbox_get_my_issued_credentials200_response_records_inner_signing_authority import InboxGetMyIssuedCredentials200ResponseRecordsInnerSigningAuthority as InboxGetMyIssuedCredentials200ResponseRecordsInnerSigningAuthority
-from openapi_client.models.inbox_get_my_issued_credentials_request import InboxGetMyIssuedCredentialsRequest as InboxGetMyIssuedCredentialsRequest
-from openapi_client.models.inbox_get_my_issued_credentials_request_query import InboxGetMyIssuedCredentialsRequestQuery as InboxGetMyIssuedCredentialsRequestQuery
-from openapi_client.models.inbox_get_my_issued_credentials_request_recipient import InboxGetMyIssuedCredentialsRequestRecipient as InboxGetMyIssuedCredentialsRequestRecipient
-from openapi_client.models.inbox_get_my_issued_credentials_request_recipient_one_of import InboxGetMyIssuedCredentialsRequestRecipientOneOf as InboxGetMyIssuedCredentialsRequestRecipientOneOf
-from openapi_client.models.inbox_issue200_response import InboxIssue200Response as InboxIssue200Response
-from openapi_client.models.inbox_issue200_response_recipient import InboxIssue200ResponseRecipient as InboxIssue200ResponseRecipient
-from openapi_client.models.inbox_issue200_response_recipient_one_of import InboxIssue200ResponseRecipientOneOf as InboxIssue200ResponseRecipientOneOf
-from openapi_client.models.inbox_issue200_response_recipient_one_of1 import InboxIssue200ResponseRecipientOneOf1 as InboxIssue200ResponseRecipientOneOf1
-from openapi_client.models.inbox_issue_request import InboxIssueRequest as InboxIssueRequest
-from openapi_client.models.inbox_issue_request_configuration import InboxIssueRequestConfiguration as InboxIssueRequestConfiguration
-from openapi_client.models.inbox_issue_request_configuration_delivery import InboxIssueRequestConfigurationDelivery as InboxIssueRequestConfigurationDelivery
-from openapi_client.models.inbox_issue_request_configuration_delivery_template import InboxIssueRequestConfigurationDeliveryTemplate as InboxIssueRequestConfigurationDeliveryTemplate
-from openapi_client.models.inbox_issue_request_configuration_delivery_template_model import InboxIssueRequestConfigurationDeliveryTemplateModel as InboxIssueRequestConfigurationDeliveryTemplateModel
-from openapi_client.models.inbox_issue_request_configuration_delivery_template_model_credential import InboxIssueRequestConfigurationDeliveryTemplateModelCredential as InboxIssueRequestConfigurationDeliveryTemplateModelCredential
-from openapi_client.models.inbox_issue_request_configuration_delivery_template_model_issuer import InboxIssueRequestConfigurationDeliveryTemplateModelIssuer as InboxIssueRequestConfigurationDeliveryTemplateModelIssuer
-from openapi_client.models.inbox_issue_request_configuration_delivery_template_model_recipient import InboxIssueRequestConfigurationDeliveryTemplateModelRecipient as InboxIssueRequestConfigurationDeliveryTemplateModelRecipient
-from openapi_client.models.inbox_issue_request_configuration_signing_authority import InboxIssueRequestConfigurationSigningAuthority as InboxIssueRequestConfigurationSigningAuthority
-from openapi_client.models.inbox_issue_request_credential import InboxIssueRequestCredential as InboxIssueRequestCredential
-from openapi_client.models.inbox_issue_request_credential_any_of import InboxIssueRequestCredentialAnyOf as InboxIssueRequestCredentialAnyOf
-from openapi_client.models.inbox_issue_request_recipient import InboxIssueRequestRecipient as InboxIssueRequestRecipient
-from openapi_client.models.inbox_issue_request_recipient_one_of import InboxIssueRequestRecipientOneOf as InboxIssueRequestRecipientOneOf
-from openapi_client.models.inbox_issue_request_recipient_one_of1 import InboxIssueRequestRecipientOneOf1 as InboxIssueRequestRecipientOneOf1
-from openapi_client.models.inbox_send_guardian_approval_email200_response import InboxSendGuardianApprovalEmail200Response as InboxSendGuardianApprovalEmail200Response
-from openapi_client.models.inbox_send_guardian_approval_email_request import InboxSendGuardianApprovalEmailRequest as InboxSendGuardianApprovalEmailRequest
-from openapi_client.models.inbox_send_guardian_approval_email_request_template import InboxSendGuardianApprovalEmailRequestTemplate as InboxSendGuardianApprovalEmailRequestTemplate
-from openapi_client.models.integrations_add_integration_request import IntegrationsAddIntegrationRequest as IntegrationsAddIntegrationRequest
-from openapi_client.models.integrations_add_integration_request_whitelisted_domains_inner import IntegrationsAddIntegrationRequestWhitelistedDomainsInner as IntegrationsAddIntegrationRequestWhitelistedDomainsInner
-from openapi_client.models.integrations_associate_integration_with_signing_authority_request import IntegrationsAssociateIntegrationWithSigningAuthorityRequest as IntegrationsAssociateIntegrationWithSigningAuthorityRequest
-from openapi_client.models.integrations_count_integrations_request import IntegrationsCountIntegrationsRequest as IntegrationsCountIntegrationsRequest
-from openapi_client.models.integrations_get_integration200_response import IntegrationsGetIntegration200Response as IntegrationsGetIntegration200Response
-from openapi_client.models.integrations_get_integrations200_response import IntegrationsGetIntegrations200Response as IntegrationsGetIntegrations200Response
-from openapi_client.models.integrations_get_integrations200_response_records_inner import IntegrationsGetIntegrations200ResponseRecordsInner as IntegrationsGetIntegrations200ResponseRecordsInner
-from openapi_client.models.integrations_get_integrations_request import IntegrationsGetIntegrationsRequest as IntegrationsGetIntegrationsRequest
-from openapi_client.models.integrations_get_integrations_request_query import IntegrationsGetIntegrationsRequestQuery as IntegrationsGetIntegrationsRequestQuery
-from openapi_client.models.integrations_update_integration_request import IntegrationsUpdateIntegrationRequest as IntegrationsUpdateIntegrationRequest
-from openapi_client.models.integrations_update_integration_request_updates import IntegrationsUpdateIntegrationRequestUpdates as IntegrationsUpdateIntegrationRequestUpdates
-from openapi_client.models.presentation_accept_presentation_request import PresentationAcceptPresentationRequest as PresentationAcceptPresentationRequest
-from openapi_client.models.presentation_send_presentation_request import PresentationSendPresentationRequest as PresentationSendPresentationRequest
-from openapi_client.models.presentation_send_presentation_request_presentation import PresentationSendPresentationRequestPresentation as PresentationSendPresentationRequestPresentation
-from openapi_client.models.presentation_send_presentation_request_presentation_any_of import PresentationSendPresentationRequestPresentationAnyOf as PresentationSendPresentationRequestPresentationAnyOf
-from openapi_client.models.presentation_send_presentation_request_presentation_any_of_verifiable_credential import PresentationSendPresentationRequestPresentationAnyOfVerifiableCredential as PresentationSendPresentationRequestPresentationAnyOfVerifiableCredential
-from openapi_client.models.profile_create_profile_request import ProfileCreateProfileRequest as ProfileCreateProfileRequest
-from openapi_client.models.profile_create_profile_request_display import ProfileCreateProfileRequestDisplay as ProfileCreateProfileRequestDisplay
-from openapi_client.models.profile_create_service_profile_request import ProfileCreateServiceProfileRequest as ProfileCreateServiceProfileRequest
-from openapi_client.models.profile_create_service_profile_request_display import ProfileCreateServiceProfileRequestDisplay as ProfileCreateServiceProfileRequestDisplay
-from openapi_client.models.profile_generate_invite200_response import ProfileGenerateInvite200Response as ProfileGenerateInvite200Response
-from openapi_client.models.profile_generate_invite_request import ProfileGenerateInviteRequest as ProfileGenerateInviteRequest
-from openapi_client.models.profile_get_available_profiles200_response import ProfileGetAvailableProfiles200Response as ProfileGetAvailableProfiles200Response
-from openapi_client.models.profile_get_available_profiles200_response_records_inner import ProfileGetAvailableProfiles200ResponseRecordsInner as ProfileGetAvailableProfiles200ResponseRecordsInner
-from openapi_client.models.profile_get_available_profiles200_response_records_inner_manager import ProfileGetAvailableProfiles200ResponseRecordsInnerManager as ProfileGetAvailableProfiles200ResponseRecordsInnerManager
-from openapi_client.models.profile_get_available_profiles_request import ProfileGetAvailableProfilesRequest as ProfileGetAvailableProfilesRequest
-from openapi_client.models.profile_list_invites200_response_inner import ProfileListInvites200ResponseInner as ProfileListInvites200ResponseInner
-from openapi_client.models.profile_manager_create_child_profile_manager_request import ProfileManagerCreateChildProfileManagerRequest as ProfileManagerCreateChildProfileManagerRequest
-from openapi_client.models.profile_manager_create_child_profile_manager_request_profile import ProfileManagerCreateChildProfileManagerRequestProfile as ProfileManagerCreateChildProfileManagerRequestProfile
-from openapi_client.models.profile_manager_create_managed_profile_request import ProfileManagerCreateManagedProfileRequest as ProfileManagerCreateManagedProfileRequest
-from openapi_client.models.profile_manager_create_profile_manager_request import ProfileManagerCreateProfileManagerRequest as ProfileManagerCreateProfileManagerRequest
-from openapi_client.models.profile_manager_get_managed_profiles_request import ProfileManagerGetManagedProfilesRequest as ProfileManagerGetManagedProfilesRequest
-from openapi_client.models.profile_register_signing_authority_request import ProfileRegisterSigningAuthorityRequest as ProfileRegisterSigningAuthorityRequest
-from openapi_client.models.profile_search_profiles200_response_inner import ProfileSearchProfiles200ResponseInner as ProfileSearchProfiles200ResponseInner
-from openapi_client.models.profile_set_primary_signing_authority_request import ProfileSetPrimarySigningAuthorityRequest as ProfileSetPrimarySigningAuthorityRequest
-from openapi_client.models.profile_signing_authorities200_response_inner import ProfileSigningAuthorities200ResponseInner as ProfileSigningAuthorities200ResponseInner
-from openapi_client.models.profile_signing_authorities200_response_inner_relationship import ProfileSigningAuthorities200ResponseInnerRelationship as ProfileSigningAuthorities200ResponseInnerRelationship
-from openapi_client.models.profile_signing_authorities200_response_inner_signing_authority import ProfileSigningAuthorities200ResponseInnerSigningAuthority as ProfileSigningAuthorities200ResponseInnerSigningAuthority
-from openapi_client.models.profile_signing_authority200_response import ProfileSigningAuthority200Response as ProfileSigningAuthority200Response
-from openapi_client.models.profile_signing_authority200_response_relationship import ProfileSigningAuthority200ResponseRelationship as ProfileSigningAuthority200ResponseRelationship
-from openapi_client.models.profile_signing_authority200_response_signing_authority import ProfileSigningAuthority200ResponseSigningAuthority as ProfileSigningAuthority200ResponseSigningAuthority
-from openapi_client.models.profile_update_profile_request import ProfileUpdateProfileRequest as ProfileUpdateProfileRequest
-from openapi_client.models.schema0 import Schema0 as Schema0
-from openapi_client.models.schema1 import Schema1 as Schema1
-from openapi_client.models.skill_frameworks_add_framework_admin200_response import SkillFrameworksAddFrameworkAdmin200Response as SkillFrameworksAddFrameworkAdmin200Response
-from openapi_client.models.skill_frameworks_add_framework_admin_request import SkillFrameworksAddFrameworkAdminRequest as SkillFrameworksAddFrameworkAdminRequest
-from openapi_client.models.skill_frameworks_count_boosts_that_use_framework200_response import SkillFrameworksCountBoostsThatUseFramework200Response as SkillFrameworksCountBoostsThatUseFramework200Response
-from openapi_client.models.skill_frameworks_create_managed_batch_request import SkillFrameworksCreateManagedBatchRequest as SkillFrameworksCreateManagedBatchRequest
-from openapi_client.models.skill_frameworks_create_managed_batch_request_frameworks_inner import SkillFrameworksCreateManagedBatchRequestFrameworksInner as SkillFrameworksCreateManagedBatchRequestFrameworksInner
-from openapi_client.models.skill_frameworks_create_managed_request import SkillFrameworksCreateManagedRequest as SkillFrameworksCreateManagedRequest
-from openapi_client.models.skill_frameworks_create_request import SkillFrameworksCreateRequest as SkillFrameworksCreateRequest
-from openapi_client.models.skill_frameworks_get_boosts_that_use_framework_request import SkillFrameworksGetBoostsThatUseFrameworkRequest as SkillFrameworksGetBoostsThatUseFrameworkRequest
-from openapi_client.models.skill_frameworks_get_by_id200_response import SkillFrameworksGetById200Response as SkillFrameworksGetById200Response
-from openapi_client.models.skill_frameworks_get_by_id200_response_skills import SkillFrameworksGetById200ResponseSkills as SkillFrameworksGetById200ResponseSkills
-from openapi_client.models.skill_frameworks_remove_framework_admin200_response import SkillFrameworksRemoveFrameworkAdmin200Response as SkillFrameworksRemoveFrameworkAdmin200Response
-from openapi_client.models.skill_frameworks_replace_skills200_response import SkillFrameworksReplaceSkills200Response as SkillFrameworksReplaceSkills200Response
-from openapi_client.models.skill_frameworks_replace_skills_request import SkillFrameworksReplaceSkillsRequest as SkillFrameworksReplaceSkillsRequest
-from openapi_client.models.skill_frameworks_update_request import SkillFrameworksUpdateRequest as SkillFrameworksUpdateRequest
-from openapi_client.models.skills_add_skill_tag200_response_inner import SkillsAddSkillTag200ResponseInner as SkillsAddSkillTag200ResponseInner
-from openapi_client.models.skills_add_skill_tag_request import SkillsAddSkillTagRequest as SkillsAddSkillTagRequest
-from openapi_client.models.skills_add_skill_tag_request_tag import SkillsAddSkillTagRequestTag as SkillsAddSkillTagRequestTag
-from openapi_client.models.skills_count_skills200_response import SkillsCountSkills200Response as SkillsCountSkills200Response
-from openapi_client.models.skills_create200_response import SkillsCreate200Response as SkillsCreate200Response
-from openapi_client.models.skills_create_many_request import SkillsCreateManyRequest as SkillsCreateManyRequest
-from openapi_client.models.skills_create_request import SkillsCreateRequest as SkillsCreateRequest
-from openapi_client.models.skills_delete200_response import SkillsDelete200Response as SkillsDelete200Response
-from openapi_client.models.skills_get_framework_skill_tree200_response import SkillsGetFrameworkSkillTree200Response as SkillsGetFrameworkSkillTree200Response
-from openapi_client.models.skills_get_full_skill_tree200_response import SkillsGetFullSkillTree200Response as SkillsGetFullSkillTree200Response
-from openapi_client.models.skills_get_skill200_response import SkillsGetSkill200Response as SkillsGetSkill200Response
-from openapi_client.models.skills_get_skill_path200_response import SkillsGetSkillPath200Response as SkillsGetSkillPath200Response
-from openapi_client.models.skills_list_skill_tags200_response_inner import SkillsListSkillTags200ResponseInner as SkillsListSkillTags200ResponseInner
-from openapi_client.models.skills_search_framework_skills_request import SkillsSearchFrameworkSkillsRequest as SkillsSearchFrameworkSkillsRequest
-from openapi_client.models.skills_search_framework_skills_request_query import SkillsSearchFrameworkSkillsRequestQuery as SkillsSearchFrameworkSkillsRequestQuery
-from openapi_client.models.skills_search_framework_skills_request_query_any_of import SkillsSearchFrameworkSkillsRequestQueryAnyOf as SkillsSearchFrameworkSkillsRequestQueryAnyOf
-from openapi_client.models.skills_sync_framework_skills200_response import SkillsSyncFrameworkSkills200Response as SkillsSyncFrameworkSkills200Response
-from openapi_client.models.skills_update_request import SkillsUpdateRequest as SkillsUpdateRequest
-from openapi_client.models.storage_resolve200_response import StorageResolve200Response as StorageResolve200Response
-from openapi_client.models.storage_resolve200_response_any_of import StorageResolve200ResponseAnyOf as StorageResolve200ResponseAnyOf
-from openapi_client.models.storage_resolve200_response_any_of1 import StorageResolve200ResponseAnyOf1 as StorageResolve200ResponseAnyOf1
-from openapi_client.models.storage_resolve200_response_any_of1_read import StorageResolve200ResponseAnyOf1Read as StorageResolve200ResponseAnyOf1Read
-from openapi_client.models.storage_resolve200_response_any_of1_read_credentials import StorageResolve200ResponseAnyOf1ReadCredentials as StorageResolve200ResponseAnyOf1ReadCredentials
-from openapi_client.models.storage_resolve200_response_any_of1_read_credentials_categories_value import StorageResolve200ResponseAnyOf1ReadCredentialsCategoriesValue as StorageResolve200ResponseAnyOf1ReadCredentialsCategoriesValue
-from openapi_client.models.storage_resolve200_response_any_of1_write import StorageResolve200ResponseAnyOf1Write as StorageResolve200ResponseAnyOf1Write
-from openapi_client.models.storage_resolve200_response_any_of1_write_credentials import StorageResolve200ResponseAnyOf1WriteCredentials as StorageResolve200ResponseAnyOf1WriteCredentials
-from openapi_client.models.storage_resolve200_response_any_of_any_of import StorageResolve200ResponseAnyOfAnyOf as StorageResolve200ResponseAnyOfAnyOf
-from openapi_client.models.storage_resolve200_response_any_of_any_of1 import StorageResolve200ResponseAnyOfAnyOf1 as StorageResolve200ResponseAnyOfAnyOf1
-from openapi_client.models.storage_resolve200_response_any_of_any_of1_read import StorageResolve200ResponseAnyOfAnyOf1Read as StorageResolve200ResponseAnyOfAnyOf1Read
-from openapi_client.models.storage_resolve200_response_any_of_any_of1_read_credentials import StorageResolve200ResponseAnyOfAnyOf1ReadCredentials as StorageResolve200ResponseAnyOfAnyOf1ReadCredentials
-from openapi_client.models.storage_resolve200_response_any_of_any_of1_read_credentials_categories_value import StorageResolve200ResponseAnyOfAnyOf1ReadCredentialsCategoriesValue as StorageResolve200ResponseAnyOfAnyOf1ReadCredentialsCategoriesValue
-from openapi_client.models.storage_resolve200_response_any_of_any_of1_read_personal_value import StorageResolve200ResponseAnyOfAnyOf1ReadPersonalValue as StorageResolve200ResponseAnyOfAnyOf1ReadPersonalValue
-from openapi_client.models.storage_resolve200_response_any_of_any_of1_write import StorageResolve200ResponseAnyOfAnyOf1Write as StorageResolve200ResponseAnyOfAnyOf1Write
-from openapi_client.models.storage_resolve200_response_any_of_any_of1_write_credentials import StorageResolve200ResponseAnyOfAnyOf1WriteCredentials as StorageResolve200ResponseAnyOfAnyOf1WriteCredentials
-from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of import StorageResolve200ResponseAnyOfAnyOfAnyOf as StorageResolve200ResponseAnyOfAnyOfAnyOf
-from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of1 import StorageResolve200ResponseAnyOfAnyOfAnyOf1 as StorageResolve200ResponseAnyOfAnyOfAnyOf1
-from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of1_recipients_inner import StorageResolve200ResponseAnyOfAnyOfAnyOf1RecipientsInner as StorageResolve200ResponseAnyOfAnyOfAnyOf1RecipientsInner
-from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of1_recipients_inner_header import StorageResolve200ResponseAnyOfAnyOfAnyOf1RecipientsInnerHeader as StorageResolve200ResponseAnyOfAnyOfAnyOf1RecipientsInnerHeader
-from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of1_recipients_inner_header_epk import StorageResolve200ResponseAnyOfAnyOfAnyOf1RecipientsInnerHeaderEpk as StorageResolve200ResponseAnyOfAnyOfAnyOf1RecipientsInnerHeaderEpk
-from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of import StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOf as StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOf
-from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of1 import StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOf1 as StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOf1
-from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of1_verifiable_credential import StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOf1VerifiableCredential as StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOf1VerifiableCredential
-from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of_any_of import StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOf as StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOf
-from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of_any_of1 import StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOf1 as StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOf1
-from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of_any_of_issuer import StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuer as StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuer
-from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of_any_of_issuer_any_of import StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOf as StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOf
-from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of_any_of_issuer_any_of_address import StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOfAddress as StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOfAddress
-from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of_any_of_issuer_any_of_address_geo import StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOfAddressGeo as StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOfAddressGeo
-from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of_any_of_issuer_any_of_image import StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOfImage as StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOfImage
-from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of_any_of_issuer_any_of_image_any_of import StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOfImageAnyOf as StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOfImageAnyOf
-from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of_any_of_issuer_any_of_other_identifier_inner import StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOfOtherIdentifierInner as StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOfIssuerAnyOfOtherIdentifierInner
-from openapi_client.models.storage_store_request import StorageStoreRequest as StorageStoreRequest
-from openapi_client.models.storage_store_request_item import StorageStoreRequestItem as StorageStoreRequestItem
-from openapi_client.models.storage_store_request_item_any_of import StorageStoreRequestItemAnyOf as StorageStoreRequestItemAnyOf
-from openapi_client.models.storage_store_request_item_any_of_any_of import StorageStoreRequestItemAnyOfAnyOf as StorageStoreRequestItemAnyOfAnyOf
-from openapi_client.models.workflows_participate_in_exchange200_response import WorkflowsParticipateInExchange200Response as WorkflowsParticipateInExchange200Response
-from openapi_client.models.workflows_participate_in_exchange200_response_verifiable_presentation_request import WorkflowsParticipateInExchange200ResponseVerifiablePresentationRequest as WorkflowsParticipateInExchange200ResponseVerifiablePresentationRequest
-from openapi_client.models.workflows_participate_in_exchange200_response_verifiable_presentation_request_query_inner import WorkflowsParticipateInExchange200ResponseVerifiablePresentationRequestQueryInner as WorkflowsParticipateInExchange200ResponseVerifiablePresentationRequestQueryInner
-from openapi_client.models.workflows_participate_in_exchange200_response_verifiable_presentation_request_query_inner_credential_query_inner import WorkflowsParticipateInExchange200ResponseVerifiablePresentationRequestQueryInnerCredentialQueryInner as WorkflowsParticipateInExchange200ResponseVerifiablePresentationRequestQueryInnerCredentialQueryInner
-from openapi_client.models.workflows_participate_in_exchange_request import WorkflowsParticipateInExchangeRequest as WorkflowsParticipateInExchangeRequest
 
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
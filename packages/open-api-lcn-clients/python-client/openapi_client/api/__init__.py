@@ -1,25 +1,65 @@
 # flake8: noqa
 
-# import apis into api package
-from openapi_client.api.activity_api import ActivityApi
-from openapi_client.api.app_store_api import AppStoreApi
-from openapi_client.api.app_store_admin_api import AppStoreAdminApi
-from openapi_client.api.auth_grants_api import AuthGrantsApi
-from openapi_client.api.boosts_api import BoostsApi
-from openapi_client.api.claim_hooks_api import ClaimHooksApi
-from openapi_client.api.contact_methods_api import ContactMethodsApi
-from openapi_client.api.contracts_api import ContractsApi
-from openapi_client.api.credentials_api import CredentialsApi
-from openapi_client.api.did_metadata_api import DIDMetadataApi
-from openapi_client.api.integrations_api import IntegrationsApi
-from openapi_client.api.presentations_api import PresentationsApi
-from openapi_client.api.profile_managers_api import ProfileManagersApi
-from openapi_client.api.profiles_api import ProfilesApi
-from openapi_client.api.send_api import SendApi
-from openapi_client.api.skills_api import SkillsApi
-from openapi_client.api.storage_api import StorageApi
-from openapi_client.api.universal_inbox_api import UniversalInboxApi
-from openapi_client.api.utilities_api import UtilitiesApi
-from openapi_client.api.vcapi_api import VCAPIApi
-from openapi_client.api.workflows_api import WorkflowsApi
+import importlib
 
+if __import__("typing").TYPE_CHECKING:
+    # import apis into api package
+    from openapi_client.api.activity_api import ActivityApi
+    from openapi_client.api.app_store_api import AppStoreApi
+    from openapi_client.api.app_store_admin_api import AppStoreAdminApi
+    from openapi_client.api.auth_grants_api import AuthGrantsApi
+    from openapi_client.api.boosts_api import BoostsApi
+    from openapi_client.api.claim_hooks_api import ClaimHooksApi
+    from openapi_client.api.contact_methods_api import ContactMethodsApi
+    from openapi_client.api.contracts_api import ContractsApi
+    from openapi_client.api.credentials_api import CredentialsApi
+    from openapi_client.api.did_metadata_api import DIDMetadataApi
+    from openapi_client.api.integrations_api import IntegrationsApi
+    from openapi_client.api.presentations_api import PresentationsApi
+    from openapi_client.api.profile_managers_api import ProfileManagersApi
+    from openapi_client.api.profiles_api import ProfilesApi
+    from openapi_client.api.send_api import SendApi
+    from openapi_client.api.skills_api import SkillsApi
+    from openapi_client.api.storage_api import StorageApi
+    from openapi_client.api.universal_inbox_api import UniversalInboxApi
+    from openapi_client.api.utilities_api import UtilitiesApi
+    from openapi_client.api.vcapi_api import VCAPIApi
+    from openapi_client.api.workflows_api import WorkflowsApi
+
+# apis are imported on first access
+_LAZY_IMPORTS = {
+    "ActivityApi": "openapi_client.api.activity_api",
+    "AppStoreApi": "openapi_client.api.app_store_api",
+    "AppStoreAdminApi": "openapi_client.api.app_store_admin_api",
+    "AuthGrantsApi": "openapi_client.api.auth_grants_api",
+    "BoostsApi": "openapi_client.api.boosts_api",
+    "ClaimHooksApi": "openapi_client.api.claim_hooks_api",
+    "ContactMethodsApi": "openapi_client.api.contact_methods_api",
+    "ContractsApi": "openapi_client.api.contracts_api",
+    "CredentialsApi": "openapi_client.api.credentials_api",
+    "DIDMetadataApi": "openapi_client.api.did_metadata_api",
+    "IntegrationsApi": "openapi_client.api.integrations_api",
+    "PresentationsApi": "openapi_client.api.presentations_api",
+    "ProfileManagersApi": "openapi_client.api.profile_managers_api",
+    "ProfilesApi": "openapi_client.api.profiles_api",
+    "SendApi": "openapi_client.api.send_api",
+    "SkillsApi": "openapi_client.api.skills_api",
+    "StorageApi": "openapi_client.api.storage_api",
+    "UniversalInboxApi": "openapi_client.api.universal_inbox_api",
+    "UtilitiesApi": "openapi_client.api.utilities_api",
+    "VCAPIApi": "openapi_client.api.vcapi_api",
+    "WorkflowsApi": "openapi_client.api.workflows_api",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
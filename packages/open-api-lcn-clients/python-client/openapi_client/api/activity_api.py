@@ -6,1231 +6,153 @@
     API for interacting with LearnCloud Network
 
     The version of the OpenAPI document: 1.0.0
-    Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-    Do not edit the class manually.
 """  # noqa: E501
 
-import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
-from typing import Any, Dict, List, Optional, Tuple, Union
+from pydantic import Field, StrictStr
+from typing import Any, Iterator, List, Optional
 from typing_extensions import Annotated
 
-from pydantic import Field, StrictStr, field_validator
-from typing import List, Optional
-from typing_extensions import Annotated
 from openapi_client.models.activity_get_activity200_response import ActivityGetActivity200Response
 from openapi_client.models.activity_get_activity_chain200_response_inner import ActivityGetActivityChain200ResponseInner
 from openapi_client.models.activity_get_activity_stats200_response import ActivityGetActivityStats200Response
 from openapi_client.models.activity_get_my_activities200_response import ActivityGetMyActivities200Response
+from openapi_client.models.activity_get_my_activities200_response_records_inner import ActivityGetMyActivities200ResponseRecordsInner
 
-from openapi_client.api_client import ApiClient, RequestSerialized
-from openapi_client.api_response import ApiResponse
-from openapi_client.rest import RESTResponseType
+from openapi_client.operations import Endpoint, GeneratedApi, Param
+from openapi_client.pagination import iter_records
+from openapi_client.streaming import DEFAULT_CHUNK_SIZE, stream_records
 
 
-class ActivityApi:
-    """NOTE: This class is auto generated by OpenAPI Generator
-    Ref: https://openapi-generator.tech
+class ActivityApi(GeneratedApi):
+    """Operations of the Activity tag of the LearnCloud Network API.
 
-    Do not edit the class manually.
+    `GeneratedApi` builds the operation methods from `operations`; the rest
+    of the class is written by hand.
     """
 
-    def __init__(self, api_client=None) -> None:
-        if api_client is None:
-            api_client = ApiClient.get_default()
-        self.api_client = api_client
-
-
-    @validate_call
-    def activity_get_activity(
-        self,
-        activity_id: Optional[StrictStr],
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ActivityGetActivity200Response:
-        """Get Credential Activity by ID
-
-        Returns details of a specific credential activity by its activity ID. Only returns activities belonging to the authenticated profile.
-
-        :param activity_id: (required)
-        :type activity_id: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._activity_get_activity_serialize(
-            activity_id=activity_id,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "ActivityGetActivity200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def activity_get_activity_with_http_info(
-        self,
-        activity_id: Optional[StrictStr],
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[ActivityGetActivity200Response]:
-        """Get Credential Activity by ID
-
-        Returns details of a specific credential activity by its activity ID. Only returns activities belonging to the authenticated profile.
-
-        :param activity_id: (required)
-        :type activity_id: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._activity_get_activity_serialize(
-            activity_id=activity_id,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "ActivityGetActivity200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def activity_get_activity_without_preload_content(
-        self,
-        activity_id: Optional[StrictStr],
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Get Credential Activity by ID
-
-        Returns details of a specific credential activity by its activity ID. Only returns activities belonging to the authenticated profile.
-
-        :param activity_id: (required)
-        :type activity_id: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._activity_get_activity_serialize(
-            activity_id=activity_id,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "ActivityGetActivity200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _activity_get_activity_serialize(
-        self,
-        activity_id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if activity_id is not None:
-            _path_params['activityId'] = activity_id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
+    operations = (
+        Endpoint(
+            name='activity_get_activity',
             method='GET',
-            resource_path='/activity/credentials/{activityId}',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def activity_get_activity_chain(
-        self,
-        activity_id: StrictStr,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> List[ActivityGetActivityChain200ResponseInner]:
-        """Get Activity Chain
-
-        Returns all events in a credential activity chain by activityId. Shows the full lifecycle (e.g., CREATED → CLAIMED).
-
-        :param activity_id: (required)
-        :type activity_id: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._activity_get_activity_chain_serialize(
-            activity_id=activity_id,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "List[ActivityGetActivityChain200ResponseInner]",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def activity_get_activity_chain_with_http_info(
-        self,
-        activity_id: StrictStr,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[List[ActivityGetActivityChain200ResponseInner]]:
-        """Get Activity Chain
-
-        Returns all events in a credential activity chain by activityId. Shows the full lifecycle (e.g., CREATED → CLAIMED).
-
-        :param activity_id: (required)
-        :type activity_id: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._activity_get_activity_chain_serialize(
-            activity_id=activity_id,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "List[ActivityGetActivityChain200ResponseInner]",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def activity_get_activity_chain_without_preload_content(
-        self,
-        activity_id: StrictStr,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Get Activity Chain
-
-        Returns all events in a credential activity chain by activityId. Shows the full lifecycle (e.g., CREATED → CLAIMED).
-
-        :param activity_id: (required)
-        :type activity_id: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._activity_get_activity_chain_serialize(
-            activity_id=activity_id,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "List[ActivityGetActivityChain200ResponseInner]",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _activity_get_activity_chain_serialize(
-        self,
-        activity_id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if activity_id is not None:
-            _path_params['activityId'] = activity_id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
+            path='/activity/credentials/{activityId}',
+            summary='Get Credential Activity by ID',
+            description='Returns details of a specific credential activity by its activity ID. Only returns activities belonging to the authenticated profile.',
+            params=(
+                Param('activity_id', Optional[StrictStr], 'path', 'activityId'),
+            ),
+            returns=ActivityGetActivity200Response,
+            response_types_map={
+                '200': "ActivityGetActivity200Response",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '404': "ErrorNOTFOUND",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='activity_get_activity_chain',
             method='GET',
-            resource_path='/activity/credentials/{activityId}/chain',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def activity_get_activity_stats(
-        self,
-        boost_uris: Optional[List[StrictStr]] = None,
-        integration_id: Optional[StrictStr] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ActivityGetActivityStats200Response:
-        """Get Credential Activity Stats
-
-        Returns aggregated statistics for credential activities. Includes counts by status and claim rate.
-
-        :param boost_uris:
-        :type boost_uris: List[str]
-        :param integration_id:
-        :type integration_id: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._activity_get_activity_stats_serialize(
-            boost_uris=boost_uris,
-            integration_id=integration_id,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "ActivityGetActivityStats200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def activity_get_activity_stats_with_http_info(
-        self,
-        boost_uris: Optional[List[StrictStr]] = None,
-        integration_id: Optional[StrictStr] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[ActivityGetActivityStats200Response]:
-        """Get Credential Activity Stats
-
-        Returns aggregated statistics for credential activities. Includes counts by status and claim rate.
-
-        :param boost_uris:
-        :type boost_uris: List[str]
-        :param integration_id:
-        :type integration_id: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._activity_get_activity_stats_serialize(
-            boost_uris=boost_uris,
-            integration_id=integration_id,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "ActivityGetActivityStats200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def activity_get_activity_stats_without_preload_content(
-        self,
-        boost_uris: Optional[List[StrictStr]] = None,
-        integration_id: Optional[StrictStr] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Get Credential Activity Stats
-
-        Returns aggregated statistics for credential activities. Includes counts by status and claim rate.
-
-        :param boost_uris:
-        :type boost_uris: List[str]
-        :param integration_id:
-        :type integration_id: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._activity_get_activity_stats_serialize(
-            boost_uris=boost_uris,
-            integration_id=integration_id,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "ActivityGetActivityStats200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _activity_get_activity_stats_serialize(
-        self,
-        boost_uris,
-        integration_id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-            'boostUris': 'multi',
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if boost_uris is not None:
-            
-            _query_params.append(('boostUris', boost_uris))
-            
-        if integration_id is not None:
-            
-            _query_params.append(('integrationId', integration_id))
-            
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
+            path='/activity/credentials/{activityId}/chain',
+            summary='Get Activity Chain',
+            description='Returns all events in a credential activity chain by activityId. Shows the full lifecycle (e.g., CREATED → CLAIMED).',
+            params=(
+                Param('activity_id', StrictStr, 'path', 'activityId'),
+            ),
+            returns=List[ActivityGetActivityChain200ResponseInner],
+            response_types_map={
+                '200': "List[ActivityGetActivityChain200ResponseInner]",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '404': "ErrorNOTFOUND",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='activity_get_activity_stats',
             method='GET',
-            resource_path='/activity/credentials/stats',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def activity_get_my_activities(
-        self,
-        limit: Optional[Annotated[int, Field(le=100, strict=True, ge=1)]] = None,
-        cursor: Optional[StrictStr] = None,
-        boost_uri: Optional[StrictStr] = None,
-        event_type: Optional[StrictStr] = None,
-        integration_id: Optional[StrictStr] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ActivityGetMyActivities200Response:
-        """Get Credential Activities
-
-        Returns a paginated list of credential activities for the authenticated profile. Use this to track what credentials have been sent, claimed, expired, etc.
-
-        :param limit:
-        :type limit: int
-        :param cursor:
-        :type cursor: str
-        :param boost_uri:
-        :type boost_uri: str
-        :param event_type:
-        :type event_type: str
-        :param integration_id:
-        :type integration_id: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._activity_get_my_activities_serialize(
-            limit=limit,
-            cursor=cursor,
-            boost_uri=boost_uri,
-            event_type=event_type,
-            integration_id=integration_id,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "ActivityGetMyActivities200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def activity_get_my_activities_with_http_info(
-        self,
-        limit: Optional[Annotated[int, Field(le=100, strict=True, ge=1)]] = None,
-        cursor: Optional[StrictStr] = None,
-        boost_uri: Optional[StrictStr] = None,
-        event_type: Optional[StrictStr] = None,
-        integration_id: Optional[StrictStr] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[ActivityGetMyActivities200Response]:
-        """Get Credential Activities
-
-        Returns a paginated list of credential activities for the authenticated profile. Use this to track what credentials have been sent, claimed, expired, etc.
-
-        :param limit:
-        :type limit: int
-        :param cursor:
-        :type cursor: str
-        :param boost_uri:
-        :type boost_uri: str
-        :param event_type:
-        :type event_type: str
-        :param integration_id:
-        :type integration_id: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._activity_get_my_activities_serialize(
-            limit=limit,
-            cursor=cursor,
-            boost_uri=boost_uri,
-            event_type=event_type,
-            integration_id=integration_id,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "ActivityGetMyActivities200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def activity_get_my_activities_without_preload_content(
-        self,
-        limit: Optional[Annotated[int, Field(le=100, strict=True, ge=1)]] = None,
-        cursor: Optional[StrictStr] = None,
-        boost_uri: Optional[StrictStr] = None,
-        event_type: Optional[StrictStr] = None,
-        integration_id: Optional[StrictStr] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Get Credential Activities
-
-        Returns a paginated list of credential activities for the authenticated profile. Use this to track what credentials have been sent, claimed, expired, etc.
-
-        :param limit:
-        :type limit: int
-        :param cursor:
-        :type cursor: str
-        :param boost_uri:
-        :type boost_uri: str
-        :param event_type:
-        :type event_type: str
-        :param integration_id:
-        :type integration_id: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._activity_get_my_activities_serialize(
-            limit=limit,
-            cursor=cursor,
-            boost_uri=boost_uri,
-            event_type=event_type,
-            integration_id=integration_id,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "ActivityGetMyActivities200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _activity_get_my_activities_serialize(
-        self,
-        limit,
-        cursor,
-        boost_uri,
-        event_type,
-        integration_id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if limit is not None:
-            
-            _query_params.append(('limit', limit))
-            
-        if cursor is not None:
-            
-            _query_params.append(('cursor', cursor))
-            
-        if boost_uri is not None:
-            
-            _query_params.append(('boostUri', boost_uri))
-            
-        if event_type is not None:
-            
-            _query_params.append(('eventType', event_type))
-            
-        if integration_id is not None:
-            
-            _query_params.append(('integrationId', integration_id))
-            
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
+            path='/activity/credentials/stats',
+            summary='Get Credential Activity Stats',
+            description='Returns aggregated statistics for credential activities. Includes counts by status and claim rate.',
+            params=(
+                Param('boost_uris', Optional[List[StrictStr]], 'query', 'boostUris', required=False, collection_format='multi'),
+                Param('integration_id', Optional[StrictStr], 'query', 'integrationId', required=False),
+            ),
+            returns=ActivityGetActivityStats200Response,
+            response_types_map={
+                '200': "ActivityGetActivityStats200Response",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '404': "ErrorNOTFOUND",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='activity_get_my_activities',
             method='GET',
-            resource_path='/activity/credentials',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
+            path='/activity/credentials',
+            summary='Get Credential Activities',
+            description='Returns a paginated list of credential activities for the authenticated profile. Use this to track what credentials have been sent, claimed, expired, etc.',
+            params=(
+                Param('limit', Optional[Annotated[int, Field(le=100, strict=True, ge=1)]], 'query', 'limit', required=False),
+                Param('cursor', Optional[StrictStr], 'query', 'cursor', required=False),
+                Param('boost_uri', Optional[StrictStr], 'query', 'boostUri', required=False),
+                Param('event_type', Optional[StrictStr], 'query', 'eventType', required=False),
+                Param('integration_id', Optional[StrictStr], 'query', 'integrationId', required=False),
+            ),
+            returns=ActivityGetMyActivities200Response,
+            response_types_map={
+                '200': "ActivityGetMyActivities200Response",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '404': "ErrorNOTFOUND",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+    )
+
+
+    def iter_activity_get_my_activities(
+        self,
+        *,
+        page_size: Optional[int] = None,
+        max_records: Optional[int] = None,
+        prefetch: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[ActivityGetMyActivities200ResponseRecordsInner]:
+        """Iterates the records of `activity_get_my_activities` across all pages.
+
+        See `openapi_client.pagination.iter_records`; other arguments are
+        passed to `activity_get_my_activities`.
+        """
+        return iter_records(
+            self.activity_get_my_activities,
+            page_size=page_size,
+            max_records=max_records,
+            prefetch=prefetch,
+            **kwargs
+        )
+
+
+    def stream_activity_get_activity_chain(
+        self,
+        activity_id: StrictStr,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **kwargs: Any,
+    ) -> Iterator[ActivityGetActivityChain200ResponseInner]:
+        """Streams the elements of `activity_get_activity_chain` as they are received.
+
+        See `openapi_client.streaming.stream_records`; other arguments are
+        passed to `activity_get_activity_chain`.
+        """
+        return stream_records(
+            self,
+            'activity_get_activity_chain',
+            activity_id,
+            chunk_size=chunk_size,
+            **kwargs
         )
-
-
@@ -6,18 +6,11 @@
     API for interacting with LearnCloud Network
 
     The version of the OpenAPI document: 1.0.0
-    Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-    Do not edit the class manually.
 """  # noqa: E501
 
-import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
-from typing import Any, Dict, List, Optional, Tuple, Union
-from typing_extensions import Annotated
-
 from pydantic import StrictBool, StrictFloat, StrictInt, StrictStr
-from typing import List, Optional, Union
+from typing import Any, Iterator, List, Optional, Union
+
 from openapi_client.models.boost_add_boost_admin_request import BoostAddBoostAdminRequest
 from openapi_client.models.boost_align_boost_skills_request import BoostAlignBoostSkillsRequest
 from openapi_client.models.boost_attach_framework_to_boost_request import BoostAttachFrameworkToBoostRequest
@@ -38,6 +31,7 @@ from openapi_client.models.boost_get_boost_admins_request import BoostGetBoostAd
 from openapi_client.models.boost_get_boost_alignments200_response_inner import BoostGetBoostAlignments200ResponseInner
 from openapi_client.models.boost_get_boost_children_request import BoostGetBoostChildrenRequest
 from openapi_client.models.boost_get_boost_frameworks200_response import BoostGetBoostFrameworks200Response
+from openapi_client.models.boost_get_boost_frameworks200_response_records_inner import BoostGetBoostFrameworks200ResponseRecordsInner
 from openapi_client.models.boost_get_boost_frameworks_request import BoostGetBoostFrameworksRequest
 from openapi_client.models.boost_get_boost_parents_request import BoostGetBoostParentsRequest
 from openapi_client.models.boost_get_boost_recipients200_response_inner import BoostGetBoostRecipients200ResponseInner
@@ -46,20 +40,26 @@ from openapi_client.models.boost_get_boost_siblings_request import BoostGetBoost
 from openapi_client.models.boost_get_boosts200_response_inner import BoostGetBoosts200ResponseInner
 from openapi_client.models.boost_get_boosts_request import BoostGetBoostsRequest
 from openapi_client.models.boost_get_children_profile_managers200_response import BoostGetChildrenProfileManagers200Response
+from openapi_client.models.boost_get_children_profile_managers200_response_records_inner import BoostGetChildrenProfileManagers200ResponseRecordsInner
 from openapi_client.models.boost_get_children_profile_managers_request import BoostGetChildrenProfileManagersRequest
 from openapi_client.models.boost_get_connected_boost_recipients_request import BoostGetConnectedBoostRecipientsRequest
 from openapi_client.models.boost_get_familial_boosts_request import BoostGetFamilialBoostsRequest
 from openapi_client.models.boost_get_paginated_boost_recipients200_response import BoostGetPaginatedBoostRecipients200Response
+from openapi_client.models.boost_get_paginated_boost_recipients200_response_records_inner import BoostGetPaginatedBoostRecipients200ResponseRecordsInner
+from openapi_client.models.boost_get_paginated_boost_recipients200_response_records_inner_to import BoostGetPaginatedBoostRecipients200ResponseRecordsInnerTo
 from openapi_client.models.boost_get_paginated_boost_recipients_request import BoostGetPaginatedBoostRecipientsRequest
 from openapi_client.models.boost_get_paginated_boost_recipients_with_children200_response import BoostGetPaginatedBoostRecipientsWithChildren200Response
+from openapi_client.models.boost_get_paginated_boost_recipients_with_children200_response_records_inner import BoostGetPaginatedBoostRecipientsWithChildren200ResponseRecordsInner
 from openapi_client.models.boost_get_paginated_boost_recipients_with_children_request import BoostGetPaginatedBoostRecipientsWithChildrenRequest
 from openapi_client.models.boost_get_paginated_boosts200_response import BoostGetPaginatedBoosts200Response
+from openapi_client.models.boost_get_paginated_boosts200_response_records_inner import BoostGetPaginatedBoosts200ResponseRecordsInner
 from openapi_client.models.boost_get_paginated_boosts_request import BoostGetPaginatedBoostsRequest
 from openapi_client.models.boost_get_skills_available_for_boost200_response_inner import BoostGetSkillsAvailableForBoost200ResponseInner
 from openapi_client.models.boost_make_boost_parent_request import BoostMakeBoostParentRequest
 from openapi_client.models.boost_remove_boost_admin_request import BoostRemoveBoostAdminRequest
 from openapi_client.models.boost_remove_boost_parent_request import BoostRemoveBoostParentRequest
 from openapi_client.models.boost_search_skills_available_for_boost200_response import BoostSearchSkillsAvailableForBoost200Response
+from openapi_client.models.boost_search_skills_available_for_boost200_response_records_inner import BoostSearchSkillsAvailableForBoost200ResponseRecordsInner
 from openapi_client.models.boost_search_skills_available_for_boost_request import BoostSearchSkillsAvailableForBoostRequest
 from openapi_client.models.boost_send_boost_request import BoostSendBoostRequest
 from openapi_client.models.boost_send_boost_via_signing_authority_request import BoostSendBoostViaSigningAuthorityRequest
@@ -67,12695 +67,1252 @@ from openapi_client.models.boost_update_boost_permissions_request import BoostUp
 from openapi_client.models.boost_update_boost_request import BoostUpdateBoostRequest
 from openapi_client.models.boost_update_other_boost_permissions_request import BoostUpdateOtherBoostPermissionsRequest
 
-from openapi_client.api_client import ApiClient, RequestSerialized
-from openapi_client.api_response import ApiResponse
-from openapi_client.rest import RESTResponseType
+from openapi_client.boost_graph import BoostGraph
+from openapi_client.operations import Endpoint, GeneratedApi, Param
+from openapi_client.pagination import iter_records
+from openapi_client.streaming import DEFAULT_CHUNK_SIZE, stream_records
 
 
-class BoostsApi:
-    """NOTE: This class is auto generated by OpenAPI Generator
-    Ref: https://openapi-generator.tech
+class BoostsApi(GeneratedApi):
+    """Operations of the Boosts tag of the LearnCloud Network API.
 
-    Do not edit the class manually.
+    `GeneratedApi` builds the operation methods from `operations`; the rest
+    of the class is written by hand.
     """
 
-    def __init__(self, api_client=None) -> None:
-        if api_client is None:
-            api_client = ApiClient.get_default()
-        self.api_client = api_client
-
-
-    @validate_call
-    def boost_add_boost_admin(
-        self,
-        boost_add_boost_admin_request: BoostAddBoostAdminRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> bool:
-        """Add a Boost admin
-
-        This route adds a new admin for a boost
-
-        :param boost_add_boost_admin_request: (required)
-        :type boost_add_boost_admin_request: BoostAddBoostAdminRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_add_boost_admin_serialize(
-            boost_add_boost_admin_request=boost_add_boost_admin_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_add_boost_admin_with_http_info(
-        self,
-        boost_add_boost_admin_request: BoostAddBoostAdminRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[bool]:
-        """Add a Boost admin
-
-        This route adds a new admin for a boost
-
-        :param boost_add_boost_admin_request: (required)
-        :type boost_add_boost_admin_request: BoostAddBoostAdminRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_add_boost_admin_serialize(
-            boost_add_boost_admin_request=boost_add_boost_admin_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_add_boost_admin_without_preload_content(
-        self,
-        boost_add_boost_admin_request: BoostAddBoostAdminRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Add a Boost admin
-
-        This route adds a new admin for a boost
-
-        :param boost_add_boost_admin_request: (required)
-        :type boost_add_boost_admin_request: BoostAddBoostAdminRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_add_boost_admin_serialize(
-            boost_add_boost_admin_request=boost_add_boost_admin_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_add_boost_admin_serialize(
-        self,
-        boost_add_boost_admin_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_add_boost_admin_request is not None:
-            _body_params = boost_add_boost_admin_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
+    operations = (
+        Endpoint(
+            name='boost_add_boost_admin',
             method='POST',
-            resource_path='/boost/add-admin',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_align_boost_skills(
-        self,
-        boost_align_boost_skills_request: BoostAlignBoostSkillsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> bool:
-        """Align skills to boost
-
-        Ensures ALIGNED_TO relationships from a boost to Skill nodes. Requires boost admin.
-
-        :param boost_align_boost_skills_request: (required)
-        :type boost_align_boost_skills_request: BoostAlignBoostSkillsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_align_boost_skills_serialize(
-            boost_align_boost_skills_request=boost_align_boost_skills_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_align_boost_skills_with_http_info(
-        self,
-        boost_align_boost_skills_request: BoostAlignBoostSkillsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[bool]:
-        """Align skills to boost
-
-        Ensures ALIGNED_TO relationships from a boost to Skill nodes. Requires boost admin.
-
-        :param boost_align_boost_skills_request: (required)
-        :type boost_align_boost_skills_request: BoostAlignBoostSkillsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_align_boost_skills_serialize(
-            boost_align_boost_skills_request=boost_align_boost_skills_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_align_boost_skills_without_preload_content(
-        self,
-        boost_align_boost_skills_request: BoostAlignBoostSkillsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Align skills to boost
-
-        Ensures ALIGNED_TO relationships from a boost to Skill nodes. Requires boost admin.
-
-        :param boost_align_boost_skills_request: (required)
-        :type boost_align_boost_skills_request: BoostAlignBoostSkillsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_align_boost_skills_serialize(
-            boost_align_boost_skills_request=boost_align_boost_skills_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_align_boost_skills_serialize(
-        self,
-        boost_align_boost_skills_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_align_boost_skills_request is not None:
-            _body_params = boost_align_boost_skills_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
+            path='/boost/add-admin',
+            summary='Add a Boost admin',
+            description='This route adds a new admin for a boost',
+            params=(
+                Param('boost_add_boost_admin_request', BoostAddBoostAdminRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=bool,
+            response_types_map={
+                '200': "bool",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_align_boost_skills',
             method='POST',
-            resource_path='/boost/align-skills',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_attach_framework_to_boost(
+            path='/boost/align-skills',
+            summary='Align skills to boost',
+            description='Ensures ALIGNED_TO relationships from a boost to Skill nodes. Requires boost admin.',
+            params=(
+                Param('boost_align_boost_skills_request', BoostAlignBoostSkillsRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=bool,
+            response_types_map={
+                '200': "bool",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_attach_framework_to_boost',
+            method='POST',
+            path='/boost/attach-framework',
+            summary='Attach framework to boost',
+            description='Ensures a USES_FRAMEWORK relationship from a boost to a SkillFramework. Requires boost admin.',
+            params=(
+                Param('boost_attach_framework_to_boost_request', BoostAttachFrameworkToBoostRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=bool,
+            response_types_map={
+                '200': "bool",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_claim_boost_with_link',
+            method='POST',
+            path='/boost/claim',
+            summary='Claim a boost using a claim link',
+            description='Claims a boost using a claim link, including a challenge',
+            params=(
+                Param('boost_claim_boost_with_link_request', BoostClaimBoostWithLinkRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=str,
+            response_types_map={
+                '200': "str",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_count_boost_children',
+            method='POST',
+            path='/boost/children/count',
+            summary='Count boost children',
+            description='This endpoint counts the children of a particular boost',
+            params=(
+                Param('boost_count_boost_children_request', BoostCountBoostChildrenRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=float,
+            response_types_map={
+                '200': "float",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_count_boost_parents',
+            method='POST',
+            path='/boost/parents/count',
+            summary='Count boost parents',
+            description='This endpoint counts the parents of a particular boost',
+            params=(
+                Param('boost_count_boost_parents_request', BoostCountBoostParentsRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=float,
+            response_types_map={
+                '200': "float",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_count_boost_siblings',
+            method='POST',
+            path='/boost/siblings/count',
+            summary='Count boost siblings',
+            description='This endpoint counts the siblings of a particular boost',
+            params=(
+                Param('boost_count_boost_siblings_request', BoostCountBoostSiblingsRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=float,
+            response_types_map={
+                '200': "float",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_count_boosts',
+            method='POST',
+            path='/boost/count',
+            summary='Count managed boosts',
+            description="This endpoint counts the current user's managed boosts.",
+            params=(
+                Param('boost_get_boosts_request', Optional[BoostGetBoostsRequest], 'body', required=False),
+            ),
+            content_types=('application/json',),
+            returns=float,
+            response_types_map={
+                '200': "float",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_count_familial_boosts',
+            method='POST',
+            path='/boost/family/count',
+            summary='Count familial boosts',
+            description='This endpoint counts the parents, children, and siblings of a particular boost',
+            params=(
+                Param('boost_count_familial_boosts_request', BoostCountFamilialBoostsRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=float,
+            response_types_map={
+                '200': "float",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_create_boost',
+            method='POST',
+            path='/boost/create',
+            summary='Creates a boost',
+            description='This route creates a boost',
+            params=(
+                Param('boost_create_boost_request', BoostCreateBoostRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=str,
+            response_types_map={
+                '200': "str",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_create_child_boost',
+            method='POST',
+            path='/boost/create/child',
+            summary='Creates a boost',
+            description='This route creates a boost',
+            params=(
+                Param('boost_create_child_boost_request', BoostCreateChildBoostRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=str,
+            response_types_map={
+                '200': "str",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_delete_boost',
+            method='DELETE',
+            path='/boost',
+            summary='Delete a boost',
+            description='This route deletes a boost',
+            params=(
+                Param('uri', StrictStr, 'query', 'uri'),
+            ),
+            returns=bool,
+            response_types_map={
+                '200': "bool",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '404': "ErrorNOTFOUND",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_detach_framework_from_boost',
+            method='POST',
+            path='/boost/detach-framework',
+            summary='Detach framework from boost',
+            description='Removes a USES_FRAMEWORK relationship from a boost to a SkillFramework. Requires boost admin.',
+            params=(
+                Param('boost_detach_framework_from_boost_request', BoostDetachFrameworkFromBoostRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=bool,
+            response_types_map={
+                '200': "bool",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_generate_claim_link',
+            method='POST',
+            path='/boost/generate-claim-link',
+            summary='Generate a claim link for a boost',
+            description='This route creates a challenge that an unknown profile can use to claim a boost.',
+            params=(
+                Param('boost_generate_claim_link_request', BoostGenerateClaimLinkRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=BoostGenerateClaimLink200Response,
+            response_types_map={
+                '200': "BoostGenerateClaimLink200Response",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_get_boost',
+            method='GET',
+            path='/boost',
+            summary='Get boost',
+            description='This endpoint gets metadata about a boost',
+            params=(
+                Param('uri', StrictStr, 'query', 'uri'),
+            ),
+            returns=BoostGetBoost200Response,
+            response_types_map={
+                '200': "BoostGetBoost200Response",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '404': "ErrorNOTFOUND",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_get_boost_admins',
+            method='POST',
+            path='/boost/admins',
+            summary='Get boost admins',
+            description='This route returns the admins for a boost',
+            params=(
+                Param('boost_get_boost_admins_request', BoostGetBoostAdminsRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=BoostGetBoostAdmins200Response,
+            response_types_map={
+                '200': "BoostGetBoostAdmins200Response",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_get_boost_alignments',
+            method='GET',
+            path='/boost/alignments',
+            summary='Get OBv3 alignments for a boost',
+            description="Returns OBv3 alignment entries based on the boost's linked framework and aligned skills. Requires issue permission.",
+            params=(
+                Param('uri', StrictStr, 'query', 'uri'),
+            ),
+            returns=List[BoostGetBoostAlignments200ResponseInner],
+            response_types_map={
+                '200': "List[BoostGetBoostAlignments200ResponseInner]",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '404': "ErrorNOTFOUND",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_get_boost_children',
+            method='POST',
+            path='/boost/children',
+            summary='Get boost children',
+            description='This endpoint gets the children of a particular boost',
+            params=(
+                Param('boost_get_boost_children_request', BoostGetBoostChildrenRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=BoostGetPaginatedBoosts200Response,
+            response_types_map={
+                '200': "BoostGetPaginatedBoosts200Response",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_get_boost_frameworks',
+            method='POST',
+            path='/boost/frameworks',
+            summary='List frameworks used by a boost (paginated)',
+            description='Returns frameworks aligned to a boost via USES_FRAMEWORK with pagination and optional query filtering. Requires boost admin.',
+            params=(
+                Param('boost_get_boost_frameworks_request', BoostGetBoostFrameworksRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=BoostGetBoostFrameworks200Response,
+            response_types_map={
+                '200': "BoostGetBoostFrameworks200Response",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_get_boost_parents',
+            method='POST',
+            path='/boost/parents',
+            summary='Get boost parents',
+            description='This endpoint gets the parents of a particular boost',
+            params=(
+                Param('boost_get_boost_parents_request', BoostGetBoostParentsRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=BoostGetPaginatedBoosts200Response,
+            response_types_map={
+                '200': "BoostGetPaginatedBoosts200Response",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_get_boost_permissions',
+            method='GET',
+            path='/boost/permissions',
+            summary='Get boost permissions',
+            description='This endpoint gets permission metadata about a boost',
+            params=(
+                Param('uri', StrictStr, 'query', 'uri'),
+            ),
+            returns=BoostGetBoost200ResponseClaimPermissions,
+            response_types_map={
+                '200': "BoostGetBoost200ResponseClaimPermissions",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '404': "ErrorNOTFOUND",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_get_boost_recipient_count',
+            method='GET',
+            path='/boost/recipients/count',
+            summary='Get boost recipients count',
+            description='This endpoint counts the recipients of a particular boost',
+            params=(
+                Param('uri', StrictStr, 'query', 'uri'),
+                Param('include_unaccepted_boosts', Optional[StrictBool], 'query', 'includeUnacceptedBoosts', required=False),
+            ),
+            returns=float,
+            response_types_map={
+                '200': "float",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '404': "ErrorNOTFOUND",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_get_boost_recipients',
+            method='GET',
+            path='/boost/recipients',
+            summary='Get boost recipients',
+            description='This endpoint gets the recipients of a particular boost. Warning! This route is deprecated and currently has a hard limit of returning only the first 50 boosts. Please use getPaginatedBoostRecipients instead',
+            deprecated=True,
+            params=(
+                Param('uri', StrictStr, 'query', 'uri'),
+                Param('limit', Optional[Union[StrictFloat, StrictInt]], 'query', 'limit', required=False),
+                Param('skip', Optional[Union[StrictFloat, StrictInt]], 'query', 'skip', required=False),
+                Param('include_unaccepted_boosts', Optional[StrictBool], 'query', 'includeUnacceptedBoosts', required=False),
+            ),
+            returns=List[BoostGetBoostRecipients200ResponseInner],
+            response_types_map={
+                '200': "List[BoostGetBoostRecipients200ResponseInner]",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '404': "ErrorNOTFOUND",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_get_boost_recipients_with_children_count',
+            method='POST',
+            path='/boost/recipients-with-children/count',
+            summary='Count boost recipients with children',
+            description='This endpoint counts distinct recipients of a boost and all its children boosts',
+            params=(
+                Param('boost_get_boost_recipients_with_children_count_request', BoostGetBoostRecipientsWithChildrenCountRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=float,
+            response_types_map={
+                '200': "float",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_get_boost_siblings',
+            method='POST',
+            path='/boost/siblings',
+            summary='Get boost siblings',
+            description='This endpoint gets the siblings of a particular boost',
+            params=(
+                Param('boost_get_boost_siblings_request', BoostGetBoostSiblingsRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=BoostGetPaginatedBoosts200Response,
+            response_types_map={
+                '200': "BoostGetPaginatedBoosts200Response",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_get_boosts',
+            method='POST',
+            path='/boost/all',
+            summary='Get boosts',
+            description="This endpoint gets the current user's boosts. Warning! This route is deprecated and currently has a hard limit of returning only the first 50 boosts. Please use getPaginatedBoosts instead",
+            deprecated=True,
+            params=(
+                Param('boost_get_boosts_request', Optional[BoostGetBoostsRequest], 'body', required=False),
+            ),
+            content_types=('application/json',),
+            returns=List[BoostGetBoosts200ResponseInner],
+            response_types_map={
+                '200': "List[BoostGetBoosts200ResponseInner]",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_get_children_profile_managers',
+            method='POST',
+            path='/boost/children-profile-managers',
+            summary='Get Profile Managers that are a child of a boost',
+            description='Get Profile Managers that are a child of a boost',
+            params=(
+                Param('boost_get_children_profile_managers_request', BoostGetChildrenProfileManagersRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=BoostGetChildrenProfileManagers200Response,
+            response_types_map={
+                '200': "BoostGetChildrenProfileManagers200Response",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_get_connected_boost_recipient_count',
+            method='GET',
+            path='/boost/recipients/connected/{uri}/count',
+            summary='Get boost recipients count',
+            description='This endpoint counts the recipients of a particular boost',
+            params=(
+                Param('uri', StrictStr, 'path', 'uri'),
+                Param('include_unaccepted_boosts', Optional[StrictBool], 'query', 'includeUnacceptedBoosts', required=False),
+            ),
+            returns=float,
+            response_types_map={
+                '200': "float",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '404': "ErrorNOTFOUND",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_get_connected_boost_recipients',
+            method='POST',
+            path='/boost/recipients/connected/{uri}',
+            summary='Get connected boost recipients',
+            description='This endpoint gets the recipients of a particular boost',
+            params=(
+                Param('uri', Optional[StrictStr], 'path', 'uri'),
+                Param('boost_get_connected_boost_recipients_request', BoostGetConnectedBoostRecipientsRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=BoostGetPaginatedBoostRecipients200Response,
+            response_types_map={
+                '200': "BoostGetPaginatedBoostRecipients200Response",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_get_familial_boosts',
+            method='POST',
+            path='/boost/family',
+            summary='Get familial boosts',
+            description='This endpoint gets the parents, children, and siblings of a particular boost',
+            params=(
+                Param('boost_get_familial_boosts_request', BoostGetFamilialBoostsRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=BoostGetPaginatedBoosts200Response,
+            response_types_map={
+                '200': "BoostGetPaginatedBoosts200Response",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_get_other_boost_permissions',
+            method='GET',
+            path='/boost/permissions/{profileId}',
+            summary='Get boost permissions for someone else',
+            description='This endpoint gets permission metadata about a boost for someone else',
+            params=(
+                Param('profile_id', StrictStr, 'path', 'profileId'),
+                Param('uri', StrictStr, 'query', 'uri'),
+            ),
+            returns=BoostGetBoost200ResponseClaimPermissions,
+            response_types_map={
+                '200': "BoostGetBoost200ResponseClaimPermissions",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '404': "ErrorNOTFOUND",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_get_paginated_boost_recipients',
+            method='POST',
+            path='/boost/recipients/paginated',
+            summary='Get boost recipients',
+            description='This endpoint gets the recipients of a particular boost',
+            params=(
+                Param('boost_get_paginated_boost_recipients_request', BoostGetPaginatedBoostRecipientsRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=BoostGetPaginatedBoostRecipients200Response,
+            response_types_map={
+                '200': "BoostGetPaginatedBoostRecipients200Response",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_get_paginated_boost_recipients_with_children',
+            method='POST',
+            path='/boost/recipients-with-children/paginated',
+            summary='Get boost recipients with children',
+            description='This endpoint gets the recipients of a boost and all its children boosts',
+            params=(
+                Param('boost_get_paginated_boost_recipients_with_children_request', BoostGetPaginatedBoostRecipientsWithChildrenRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=BoostGetPaginatedBoostRecipientsWithChildren200Response,
+            response_types_map={
+                '200': "BoostGetPaginatedBoostRecipientsWithChildren200Response",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_get_paginated_boosts',
+            method='POST',
+            path='/boost/paginated',
+            summary='Get boosts',
+            description="This endpoint gets the current user's boosts",
+            params=(
+                Param('boost_get_paginated_boosts_request', Optional[BoostGetPaginatedBoostsRequest], 'body', required=False),
+            ),
+            content_types=('application/json',),
+            returns=BoostGetPaginatedBoosts200Response,
+            response_types_map={
+                '200': "BoostGetPaginatedBoosts200Response",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_get_skills_available_for_boost',
+            method='GET',
+            path='/boost/skills/available',
+            summary='List available skills for a boost',
+            description='Returns skills from frameworks attached to the boost or any of its ancestors. Requires boost admin.',
+            params=(
+                Param('uri', StrictStr, 'query', 'uri'),
+            ),
+            returns=List[BoostGetSkillsAvailableForBoost200ResponseInner],
+            response_types_map={
+                '200': "List[BoostGetSkillsAvailableForBoost200ResponseInner]",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '404': "ErrorNOTFOUND",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_make_boost_parent',
+            method='POST',
+            path='/boost/make-parent',
+            summary='Make Boost Parent',
+            description='This endpoint creates a parent/child relationship between two boosts',
+            params=(
+                Param('boost_make_boost_parent_request', BoostMakeBoostParentRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=bool,
+            response_types_map={
+                '200': "bool",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_remove_boost_admin',
+            method='POST',
+            path='/boost/remove-admin',
+            summary='Remove a Boost admin',
+            description='This route removes an  admin from a boost',
+            params=(
+                Param('boost_remove_boost_admin_request', BoostRemoveBoostAdminRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=bool,
+            response_types_map={
+                '200': "bool",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_remove_boost_parent',
+            method='POST',
+            path='/boost/remove-parent',
+            summary='Remove Boost Parent',
+            description='This endpoint removes a parent/child relationship between two boosts',
+            params=(
+                Param('boost_remove_boost_parent_request', BoostRemoveBoostParentRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=bool,
+            response_types_map={
+                '200': "bool",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_search_skills_available_for_boost',
+            method='POST',
+            path='/boost/skills/search',
+            summary='Search available skills for a boost',
+            description='Returns a flattened, paginated list of skills matching the search query. Supports $regex and $in operators. Searches skills from frameworks attached to the boost or any of its ancestors. Requires boost admin.',
+            params=(
+                Param('boost_search_skills_available_for_boost_request', BoostSearchSkillsAvailableForBoostRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=BoostSearchSkillsAvailableForBoost200Response,
+            response_types_map={
+                '200': "BoostSearchSkillsAvailableForBoost200Response",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_send_boost',
+            method='POST',
+            path='/boost/send/{profileId}',
+            summary='Send a Boost',
+            description='This endpoint sends a boost to a profile',
+            params=(
+                Param('profile_id', Optional[StrictStr], 'path', 'profileId'),
+                Param('boost_send_boost_request', BoostSendBoostRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=str,
+            response_types_map={
+                '200': "str",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_send_boost_via_signing_authority',
+            method='POST',
+            path='/boost/send/via-signing-authority/{profileId}',
+            summary='Send a boost to a profile using a signing authority',
+            description='Issues a boost VC to a recipient profile using a specified signing authority and sends it via the network.',
+            params=(
+                Param('profile_id', StrictStr, 'path', 'profileId'),
+                Param('boost_send_boost_via_signing_authority_request', BoostSendBoostViaSigningAuthorityRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=str,
+            response_types_map={
+                '200': "str",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_update_boost',
+            method='POST',
+            path='/boost',
+            summary='Update a boost',
+            description='This route updates a boost',
+            params=(
+                Param('boost_update_boost_request', BoostUpdateBoostRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=bool,
+            response_types_map={
+                '200': "bool",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_update_boost_permissions',
+            method='POST',
+            path='/boost/permissions',
+            summary='Update boost permissions',
+            description='This endpoint updates permission metadata about a boost for the current user',
+            params=(
+                Param('boost_update_boost_permissions_request', BoostUpdateBoostPermissionsRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=bool,
+            response_types_map={
+                '200': "bool",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+        Endpoint(
+            name='boost_update_other_boost_permissions',
+            method='POST',
+            path='/boost/permissions/{profileId}',
+            summary="Update other profile's boost permissions",
+            description='This endpoint updates permission metadata about a boost for another user',
+            params=(
+                Param('profile_id', StrictStr, 'path', 'profileId'),
+                Param('boost_update_other_boost_permissions_request', BoostUpdateOtherBoostPermissionsRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=bool,
+            response_types_map={
+                '200': "bool",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+    )
+
+
+    def iter_boost_get_boost_admins(
         self,
-        boost_attach_framework_to_boost_request: BoostAttachFrameworkToBoostRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> bool:
-        """Attach framework to boost
-
-        Ensures a USES_FRAMEWORK relationship from a boost to a SkillFramework. Requires boost admin.
-
-        :param boost_attach_framework_to_boost_request: (required)
-        :type boost_attach_framework_to_boost_request: BoostAttachFrameworkToBoostRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_attach_framework_to_boost_serialize(
-            boost_attach_framework_to_boost_request=boost_attach_framework_to_boost_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
+        boost_get_boost_admins_request: BoostGetBoostAdminsRequest,
+        *,
+        page_size: Optional[int] = None,
+        max_records: Optional[int] = None,
+        prefetch: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[BoostGetPaginatedBoostRecipients200ResponseRecordsInnerTo]:
+        """Iterates the records of `boost_get_boost_admins` across all pages.
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
+        See `openapi_client.pagination.iter_records`; other arguments are
+        passed to `boost_get_boost_admins`.
+        """
+        return iter_records(
+            self.boost_get_boost_admins,
+            boost_get_boost_admins_request,
+            page_size=page_size,
+            max_records=max_records,
+            prefetch=prefetch,
+            **kwargs
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
 
-    @validate_call
-    def boost_attach_framework_to_boost_with_http_info(
+    def iter_boost_get_boost_children(
         self,
-        boost_attach_framework_to_boost_request: BoostAttachFrameworkToBoostRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[bool]:
-        """Attach framework to boost
-
-        Ensures a USES_FRAMEWORK relationship from a boost to a SkillFramework. Requires boost admin.
-
-        :param boost_attach_framework_to_boost_request: (required)
-        :type boost_attach_framework_to_boost_request: BoostAttachFrameworkToBoostRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_attach_framework_to_boost_serialize(
-            boost_attach_framework_to_boost_request=boost_attach_framework_to_boost_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
+        boost_get_boost_children_request: BoostGetBoostChildrenRequest,
+        *,
+        page_size: Optional[int] = None,
+        max_records: Optional[int] = None,
+        prefetch: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[BoostGetPaginatedBoosts200ResponseRecordsInner]:
+        """Iterates the records of `boost_get_boost_children` across all pages.
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
+        See `openapi_client.pagination.iter_records`; other arguments are
+        passed to `boost_get_boost_children`.
+        """
+        return iter_records(
+            self.boost_get_boost_children,
+            boost_get_boost_children_request,
+            page_size=page_size,
+            max_records=max_records,
+            prefetch=prefetch,
+            **kwargs
         )
 
 
-    @validate_call
-    def boost_attach_framework_to_boost_without_preload_content(
+    def iter_boost_get_boost_frameworks(
         self,
-        boost_attach_framework_to_boost_request: BoostAttachFrameworkToBoostRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Attach framework to boost
-
-        Ensures a USES_FRAMEWORK relationship from a boost to a SkillFramework. Requires boost admin.
-
-        :param boost_attach_framework_to_boost_request: (required)
-        :type boost_attach_framework_to_boost_request: BoostAttachFrameworkToBoostRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_attach_framework_to_boost_serialize(
-            boost_attach_framework_to_boost_request=boost_attach_framework_to_boost_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
+        boost_get_boost_frameworks_request: BoostGetBoostFrameworksRequest,
+        *,
+        page_size: Optional[int] = None,
+        max_records: Optional[int] = None,
+        prefetch: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[BoostGetBoostFrameworks200ResponseRecordsInner]:
+        """Iterates the records of `boost_get_boost_frameworks` across all pages.
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
+        See `openapi_client.pagination.iter_records`; other arguments are
+        passed to `boost_get_boost_frameworks`.
+        """
+        return iter_records(
+            self.boost_get_boost_frameworks,
+            boost_get_boost_frameworks_request,
+            page_size=page_size,
+            max_records=max_records,
+            prefetch=prefetch,
+            **kwargs
         )
-        return response_data.response
 
 
-    def _boost_attach_framework_to_boost_serialize(
+    def iter_boost_get_boost_parents(
         self,
-        boost_attach_framework_to_boost_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_attach_framework_to_boost_request is not None:
-            _body_params = boost_attach_framework_to_boost_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
+        boost_get_boost_parents_request: BoostGetBoostParentsRequest,
+        *,
+        page_size: Optional[int] = None,
+        max_records: Optional[int] = None,
+        prefetch: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[BoostGetPaginatedBoosts200ResponseRecordsInner]:
+        """Iterates the records of `boost_get_boost_parents` across all pages.
 
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/attach-framework',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
+        See `openapi_client.pagination.iter_records`; other arguments are
+        passed to `boost_get_boost_parents`.
+        """
+        return iter_records(
+            self.boost_get_boost_parents,
+            boost_get_boost_parents_request,
+            page_size=page_size,
+            max_records=max_records,
+            prefetch=prefetch,
+            **kwargs
         )
 
 
-
-
-    @validate_call
-    def boost_claim_boost_with_link(
+    def iter_boost_get_boost_siblings(
         self,
-        boost_claim_boost_with_link_request: BoostClaimBoostWithLinkRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> str:
-        """Claim a boost using a claim link
-
-        Claims a boost using a claim link, including a challenge
-
-        :param boost_claim_boost_with_link_request: (required)
-        :type boost_claim_boost_with_link_request: BoostClaimBoostWithLinkRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_claim_boost_with_link_serialize(
-            boost_claim_boost_with_link_request=boost_claim_boost_with_link_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
+        boost_get_boost_siblings_request: BoostGetBoostSiblingsRequest,
+        *,
+        page_size: Optional[int] = None,
+        max_records: Optional[int] = None,
+        prefetch: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[BoostGetPaginatedBoosts200ResponseRecordsInner]:
+        """Iterates the records of `boost_get_boost_siblings` across all pages.
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "str",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
+        See `openapi_client.pagination.iter_records`; other arguments are
+        passed to `boost_get_boost_siblings`.
+        """
+        return iter_records(
+            self.boost_get_boost_siblings,
+            boost_get_boost_siblings_request,
+            page_size=page_size,
+            max_records=max_records,
+            prefetch=prefetch,
+            **kwargs
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
 
-    @validate_call
-    def boost_claim_boost_with_link_with_http_info(
+    def iter_boost_get_children_profile_managers(
         self,
-        boost_claim_boost_with_link_request: BoostClaimBoostWithLinkRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[str]:
-        """Claim a boost using a claim link
-
-        Claims a boost using a claim link, including a challenge
-
-        :param boost_claim_boost_with_link_request: (required)
-        :type boost_claim_boost_with_link_request: BoostClaimBoostWithLinkRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_claim_boost_with_link_serialize(
-            boost_claim_boost_with_link_request=boost_claim_boost_with_link_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
+        boost_get_children_profile_managers_request: BoostGetChildrenProfileManagersRequest,
+        *,
+        page_size: Optional[int] = None,
+        max_records: Optional[int] = None,
+        prefetch: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[BoostGetChildrenProfileManagers200ResponseRecordsInner]:
+        """Iterates the records of `boost_get_children_profile_managers` across all pages.
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "str",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
+        See `openapi_client.pagination.iter_records`; other arguments are
+        passed to `boost_get_children_profile_managers`.
+        """
+        return iter_records(
+            self.boost_get_children_profile_managers,
+            boost_get_children_profile_managers_request,
+            page_size=page_size,
+            max_records=max_records,
+            prefetch=prefetch,
+            **kwargs
         )
 
 
-    @validate_call
-    def boost_claim_boost_with_link_without_preload_content(
+    def iter_boost_get_connected_boost_recipients(
         self,
-        boost_claim_boost_with_link_request: BoostClaimBoostWithLinkRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Claim a boost using a claim link
-
-        Claims a boost using a claim link, including a challenge
-
-        :param boost_claim_boost_with_link_request: (required)
-        :type boost_claim_boost_with_link_request: BoostClaimBoostWithLinkRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_claim_boost_with_link_serialize(
-            boost_claim_boost_with_link_request=boost_claim_boost_with_link_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
+        uri: Optional[StrictStr],
+        boost_get_connected_boost_recipients_request: BoostGetConnectedBoostRecipientsRequest,
+        *,
+        page_size: Optional[int] = None,
+        max_records: Optional[int] = None,
+        prefetch: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[BoostGetPaginatedBoostRecipients200ResponseRecordsInner]:
+        """Iterates the records of `boost_get_connected_boost_recipients` across all pages.
+
+        See `openapi_client.pagination.iter_records`; other arguments are
+        passed to `boost_get_connected_boost_recipients`.
+        """
+        return iter_records(
+            self.boost_get_connected_boost_recipients,
+            uri,
+            boost_get_connected_boost_recipients_request,
+            page_size=page_size,
+            max_records=max_records,
+            prefetch=prefetch,
+            **kwargs
+        )
+
+
+    def iter_boost_get_familial_boosts(
+        self,
+        boost_get_familial_boosts_request: BoostGetFamilialBoostsRequest,
+        *,
+        page_size: Optional[int] = None,
+        max_records: Optional[int] = None,
+        prefetch: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[BoostGetPaginatedBoosts200ResponseRecordsInner]:
+        """Iterates the records of `boost_get_familial_boosts` across all pages.
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "str",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
+        See `openapi_client.pagination.iter_records`; other arguments are
+        passed to `boost_get_familial_boosts`.
+        """
+        return iter_records(
+            self.boost_get_familial_boosts,
+            boost_get_familial_boosts_request,
+            page_size=page_size,
+            max_records=max_records,
+            prefetch=prefetch,
+            **kwargs
         )
-        return response_data.response
 
 
-    def _boost_claim_boost_with_link_serialize(
+    def iter_boost_get_paginated_boost_recipients(
         self,
-        boost_claim_boost_with_link_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_claim_boost_with_link_request is not None:
-            _body_params = boost_claim_boost_with_link_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
+        boost_get_paginated_boost_recipients_request: BoostGetPaginatedBoostRecipientsRequest,
+        *,
+        page_size: Optional[int] = None,
+        max_records: Optional[int] = None,
+        prefetch: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[BoostGetPaginatedBoostRecipients200ResponseRecordsInner]:
+        """Iterates the records of `boost_get_paginated_boost_recipients` across all pages.
 
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/claim',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
+        See `openapi_client.pagination.iter_records`; other arguments are
+        passed to `boost_get_paginated_boost_recipients`.
+        """
+        return iter_records(
+            self.boost_get_paginated_boost_recipients,
+            boost_get_paginated_boost_recipients_request,
+            page_size=page_size,
+            max_records=max_records,
+            prefetch=prefetch,
+            **kwargs
         )
 
 
-
-
-    @validate_call
-    def boost_count_boost_children(
+    def iter_boost_get_paginated_boost_recipients_with_children(
         self,
-        boost_count_boost_children_request: BoostCountBoostChildrenRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> float:
-        """Count boost children
-
-        This endpoint counts the children of a particular boost
-
-        :param boost_count_boost_children_request: (required)
-        :type boost_count_boost_children_request: BoostCountBoostChildrenRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_count_boost_children_serialize(
-            boost_count_boost_children_request=boost_count_boost_children_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
+        boost_get_paginated_boost_recipients_with_children_request: BoostGetPaginatedBoostRecipientsWithChildrenRequest,
+        *,
+        page_size: Optional[int] = None,
+        max_records: Optional[int] = None,
+        prefetch: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[BoostGetPaginatedBoostRecipientsWithChildren200ResponseRecordsInner]:
+        """Iterates the records of `boost_get_paginated_boost_recipients_with_children` across all pages.
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "float",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
+        See `openapi_client.pagination.iter_records`; other arguments are
+        passed to `boost_get_paginated_boost_recipients_with_children`.
+        """
+        return iter_records(
+            self.boost_get_paginated_boost_recipients_with_children,
+            boost_get_paginated_boost_recipients_with_children_request,
+            page_size=page_size,
+            max_records=max_records,
+            prefetch=prefetch,
+            **kwargs
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
 
-    @validate_call
-    def boost_count_boost_children_with_http_info(
+    def iter_boost_get_paginated_boosts(
         self,
-        boost_count_boost_children_request: BoostCountBoostChildrenRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[float]:
-        """Count boost children
-
-        This endpoint counts the children of a particular boost
-
-        :param boost_count_boost_children_request: (required)
-        :type boost_count_boost_children_request: BoostCountBoostChildrenRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_count_boost_children_serialize(
-            boost_count_boost_children_request=boost_count_boost_children_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
+        boost_get_paginated_boosts_request: Optional[BoostGetPaginatedBoostsRequest] = None,
+        *,
+        page_size: Optional[int] = None,
+        max_records: Optional[int] = None,
+        prefetch: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[BoostGetPaginatedBoosts200ResponseRecordsInner]:
+        """Iterates the records of `boost_get_paginated_boosts` across all pages.
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "float",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
+        See `openapi_client.pagination.iter_records`; other arguments are
+        passed to `boost_get_paginated_boosts`.
+        """
+        return iter_records(
+            self.boost_get_paginated_boosts,
+            boost_get_paginated_boosts_request,
+            page_size=page_size,
+            max_records=max_records,
+            prefetch=prefetch,
+            **kwargs
         )
 
 
-    @validate_call
-    def boost_count_boost_children_without_preload_content(
+    def iter_boost_search_skills_available_for_boost(
         self,
-        boost_count_boost_children_request: BoostCountBoostChildrenRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Count boost children
-
-        This endpoint counts the children of a particular boost
-
-        :param boost_count_boost_children_request: (required)
-        :type boost_count_boost_children_request: BoostCountBoostChildrenRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_count_boost_children_serialize(
-            boost_count_boost_children_request=boost_count_boost_children_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
+        boost_search_skills_available_for_boost_request: BoostSearchSkillsAvailableForBoostRequest,
+        *,
+        page_size: Optional[int] = None,
+        max_records: Optional[int] = None,
+        prefetch: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[BoostSearchSkillsAvailableForBoost200ResponseRecordsInner]:
+        """Iterates the records of `boost_search_skills_available_for_boost` across all pages.
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "float",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
+        See `openapi_client.pagination.iter_records`; other arguments are
+        passed to `boost_search_skills_available_for_boost`.
+        """
+        return iter_records(
+            self.boost_search_skills_available_for_boost,
+            boost_search_skills_available_for_boost_request,
+            page_size=page_size,
+            max_records=max_records,
+            prefetch=prefetch,
+            **kwargs
         )
-        return response_data.response
 
 
-    def _boost_count_boost_children_serialize(
+    def stream_boost_get_boost_alignments(
         self,
-        boost_count_boost_children_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_count_boost_children_request is not None:
-            _body_params = boost_count_boost_children_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
+        uri: StrictStr,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **kwargs: Any,
+    ) -> Iterator[BoostGetBoostAlignments200ResponseInner]:
+        """Streams the elements of `boost_get_boost_alignments` as they are received.
 
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/children/count',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
+        See `openapi_client.streaming.stream_records`; other arguments are
+        passed to `boost_get_boost_alignments`.
+        """
+        return stream_records(
+            self,
+            'boost_get_boost_alignments',
+            uri,
+            chunk_size=chunk_size,
+            **kwargs
         )
 
 
-
-
-    @validate_call
-    def boost_count_boost_parents(
+    def stream_boost_get_boost_recipients(
         self,
-        boost_count_boost_parents_request: BoostCountBoostParentsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> float:
-        """Count boost parents
-
-        This endpoint counts the parents of a particular boost
-
-        :param boost_count_boost_parents_request: (required)
-        :type boost_count_boost_parents_request: BoostCountBoostParentsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_count_boost_parents_serialize(
-            boost_count_boost_parents_request=boost_count_boost_parents_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
+        uri: StrictStr,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **kwargs: Any,
+    ) -> Iterator[BoostGetBoostRecipients200ResponseInner]:
+        """Streams the elements of `boost_get_boost_recipients` as they are received.
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "float",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
+        See `openapi_client.streaming.stream_records`; other arguments are
+        passed to `boost_get_boost_recipients`.
+        """
+        return stream_records(
+            self,
+            'boost_get_boost_recipients',
+            uri,
+            chunk_size=chunk_size,
+            **kwargs
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
 
-    @validate_call
-    def boost_count_boost_parents_with_http_info(
+    def stream_boost_get_skills_available_for_boost(
         self,
-        boost_count_boost_parents_request: BoostCountBoostParentsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[float]:
-        """Count boost parents
-
-        This endpoint counts the parents of a particular boost
-
-        :param boost_count_boost_parents_request: (required)
-        :type boost_count_boost_parents_request: BoostCountBoostParentsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_count_boost_parents_serialize(
-            boost_count_boost_parents_request=boost_count_boost_parents_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
+        uri: StrictStr,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **kwargs: Any,
+    ) -> Iterator[BoostGetSkillsAvailableForBoost200ResponseInner]:
+        """Streams the elements of `boost_get_skills_available_for_boost` as they are received.
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "float",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
+        See `openapi_client.streaming.stream_records`; other arguments are
+        passed to `boost_get_skills_available_for_boost`.
+        """
+        return stream_records(
+            self,
+            'boost_get_skills_available_for_boost',
+            uri,
+            chunk_size=chunk_size,
+            **kwargs
         )
 
 
-    @validate_call
-    def boost_count_boost_parents_without_preload_content(
+    def boost_graph(
         self,
-        boost_count_boost_parents_request: BoostCountBoostParentsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Count boost parents
-
-        This endpoint counts the parents of a particular boost
-
-        :param boost_count_boost_parents_request: (required)
-        :type boost_count_boost_parents_request: BoostCountBoostParentsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
+        uri: StrictStr,
+        *,
+        page_size: Optional[int] = None,
+        max_workers: int = 4,
+        max_nodes: Optional[int] = None,
+    ) -> BoostGraph:
+        """Loads the parent/child graph of the boosts related to a boost.
 
-        _param = self._boost_count_boost_parents_serialize(
-            boost_count_boost_parents_request=boost_count_boost_parents_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
+        The edges of every boost reached are fetched with concurrent
+        `boost_get_boost_children` and `boost_get_boost_parents` requests;
+        see `BoostGraph`.
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "float",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
+        :param uri: (required)
+        :type uri: str
+        :param page_size: boosts requested per page.
+        :type page_size: int, optional
+        :param max_workers: concurrent requests.
+        :type max_workers: int
+        :param max_nodes: boosts whose edges are loaded at most.
+        :type max_nodes: int, optional
+        :return: Returns the boost graph.
+        """ # noqa: E501
+        return BoostGraph(
+            self,
+            uri,
+            page_size=page_size,
+            max_workers=max_workers,
+            max_nodes=max_nodes,
         )
-        return response_data.response
-
-
-    def _boost_count_boost_parents_serialize(
-        self,
-        boost_count_boost_parents_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_count_boost_parents_request is not None:
-            _body_params = boost_count_boost_parents_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/parents/count',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_count_boost_siblings(
-        self,
-        boost_count_boost_siblings_request: BoostCountBoostSiblingsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> float:
-        """Count boost siblings
-
-        This endpoint counts the siblings of a particular boost
-
-        :param boost_count_boost_siblings_request: (required)
-        :type boost_count_boost_siblings_request: BoostCountBoostSiblingsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_count_boost_siblings_serialize(
-            boost_count_boost_siblings_request=boost_count_boost_siblings_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "float",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_count_boost_siblings_with_http_info(
-        self,
-        boost_count_boost_siblings_request: BoostCountBoostSiblingsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[float]:
-        """Count boost siblings
-
-        This endpoint counts the siblings of a particular boost
-
-        :param boost_count_boost_siblings_request: (required)
-        :type boost_count_boost_siblings_request: BoostCountBoostSiblingsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_count_boost_siblings_serialize(
-            boost_count_boost_siblings_request=boost_count_boost_siblings_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "float",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_count_boost_siblings_without_preload_content(
-        self,
-        boost_count_boost_siblings_request: BoostCountBoostSiblingsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Count boost siblings
-
-        This endpoint counts the siblings of a particular boost
-
-        :param boost_count_boost_siblings_request: (required)
-        :type boost_count_boost_siblings_request: BoostCountBoostSiblingsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_count_boost_siblings_serialize(
-            boost_count_boost_siblings_request=boost_count_boost_siblings_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "float",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_count_boost_siblings_serialize(
-        self,
-        boost_count_boost_siblings_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_count_boost_siblings_request is not None:
-            _body_params = boost_count_boost_siblings_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/siblings/count',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_count_boosts(
-        self,
-        boost_get_boosts_request: Optional[BoostGetBoostsRequest] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> float:
-        """Count managed boosts
-
-        This endpoint counts the current user's managed boosts.
-
-        :param boost_get_boosts_request:
-        :type boost_get_boosts_request: BoostGetBoostsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_count_boosts_serialize(
-            boost_get_boosts_request=boost_get_boosts_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "float",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_count_boosts_with_http_info(
-        self,
-        boost_get_boosts_request: Optional[BoostGetBoostsRequest] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[float]:
-        """Count managed boosts
-
-        This endpoint counts the current user's managed boosts.
-
-        :param boost_get_boosts_request:
-        :type boost_get_boosts_request: BoostGetBoostsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_count_boosts_serialize(
-            boost_get_boosts_request=boost_get_boosts_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "float",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_count_boosts_without_preload_content(
-        self,
-        boost_get_boosts_request: Optional[BoostGetBoostsRequest] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Count managed boosts
-
-        This endpoint counts the current user's managed boosts.
-
-        :param boost_get_boosts_request:
-        :type boost_get_boosts_request: BoostGetBoostsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_count_boosts_serialize(
-            boost_get_boosts_request=boost_get_boosts_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "float",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_count_boosts_serialize(
-        self,
-        boost_get_boosts_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_get_boosts_request is not None:
-            _body_params = boost_get_boosts_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/count',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_count_familial_boosts(
-        self,
-        boost_count_familial_boosts_request: BoostCountFamilialBoostsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> float:
-        """Count familial boosts
-
-        This endpoint counts the parents, children, and siblings of a particular boost
-
-        :param boost_count_familial_boosts_request: (required)
-        :type boost_count_familial_boosts_request: BoostCountFamilialBoostsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_count_familial_boosts_serialize(
-            boost_count_familial_boosts_request=boost_count_familial_boosts_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "float",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_count_familial_boosts_with_http_info(
-        self,
-        boost_count_familial_boosts_request: BoostCountFamilialBoostsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[float]:
-        """Count familial boosts
-
-        This endpoint counts the parents, children, and siblings of a particular boost
-
-        :param boost_count_familial_boosts_request: (required)
-        :type boost_count_familial_boosts_request: BoostCountFamilialBoostsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_count_familial_boosts_serialize(
-            boost_count_familial_boosts_request=boost_count_familial_boosts_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "float",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_count_familial_boosts_without_preload_content(
-        self,
-        boost_count_familial_boosts_request: BoostCountFamilialBoostsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Count familial boosts
-
-        This endpoint counts the parents, children, and siblings of a particular boost
-
-        :param boost_count_familial_boosts_request: (required)
-        :type boost_count_familial_boosts_request: BoostCountFamilialBoostsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_count_familial_boosts_serialize(
-            boost_count_familial_boosts_request=boost_count_familial_boosts_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "float",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_count_familial_boosts_serialize(
-        self,
-        boost_count_familial_boosts_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_count_familial_boosts_request is not None:
-            _body_params = boost_count_familial_boosts_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/family/count',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_create_boost(
-        self,
-        boost_create_boost_request: BoostCreateBoostRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> str:
-        """Creates a boost
-
-        This route creates a boost
-
-        :param boost_create_boost_request: (required)
-        :type boost_create_boost_request: BoostCreateBoostRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_create_boost_serialize(
-            boost_create_boost_request=boost_create_boost_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "str",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_create_boost_with_http_info(
-        self,
-        boost_create_boost_request: BoostCreateBoostRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[str]:
-        """Creates a boost
-
-        This route creates a boost
-
-        :param boost_create_boost_request: (required)
-        :type boost_create_boost_request: BoostCreateBoostRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_create_boost_serialize(
-            boost_create_boost_request=boost_create_boost_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "str",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_create_boost_without_preload_content(
-        self,
-        boost_create_boost_request: BoostCreateBoostRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Creates a boost
-
-        This route creates a boost
-
-        :param boost_create_boost_request: (required)
-        :type boost_create_boost_request: BoostCreateBoostRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_create_boost_serialize(
-            boost_create_boost_request=boost_create_boost_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "str",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_create_boost_serialize(
-        self,
-        boost_create_boost_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_create_boost_request is not None:
-            _body_params = boost_create_boost_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/create',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_create_child_boost(
-        self,
-        boost_create_child_boost_request: BoostCreateChildBoostRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> str:
-        """Creates a boost
-
-        This route creates a boost
-
-        :param boost_create_child_boost_request: (required)
-        :type boost_create_child_boost_request: BoostCreateChildBoostRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_create_child_boost_serialize(
-            boost_create_child_boost_request=boost_create_child_boost_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "str",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_create_child_boost_with_http_info(
-        self,
-        boost_create_child_boost_request: BoostCreateChildBoostRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[str]:
-        """Creates a boost
-
-        This route creates a boost
-
-        :param boost_create_child_boost_request: (required)
-        :type boost_create_child_boost_request: BoostCreateChildBoostRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_create_child_boost_serialize(
-            boost_create_child_boost_request=boost_create_child_boost_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "str",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_create_child_boost_without_preload_content(
-        self,
-        boost_create_child_boost_request: BoostCreateChildBoostRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Creates a boost
-
-        This route creates a boost
-
-        :param boost_create_child_boost_request: (required)
-        :type boost_create_child_boost_request: BoostCreateChildBoostRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_create_child_boost_serialize(
-            boost_create_child_boost_request=boost_create_child_boost_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "str",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_create_child_boost_serialize(
-        self,
-        boost_create_child_boost_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_create_child_boost_request is not None:
-            _body_params = boost_create_child_boost_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/create/child',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_delete_boost(
-        self,
-        uri: StrictStr,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> bool:
-        """Delete a boost
-
-        This route deletes a boost
-
-        :param uri: (required)
-        :type uri: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_delete_boost_serialize(
-            uri=uri,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_delete_boost_with_http_info(
-        self,
-        uri: StrictStr,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[bool]:
-        """Delete a boost
-
-        This route deletes a boost
-
-        :param uri: (required)
-        :type uri: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_delete_boost_serialize(
-            uri=uri,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_delete_boost_without_preload_content(
-        self,
-        uri: StrictStr,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Delete a boost
-
-        This route deletes a boost
-
-        :param uri: (required)
-        :type uri: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_delete_boost_serialize(
-            uri=uri,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_delete_boost_serialize(
-        self,
-        uri,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if uri is not None:
-            
-            _query_params.append(('uri', uri))
-            
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='DELETE',
-            resource_path='/boost',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_detach_framework_from_boost(
-        self,
-        boost_detach_framework_from_boost_request: BoostDetachFrameworkFromBoostRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> bool:
-        """Detach framework from boost
-
-        Removes a USES_FRAMEWORK relationship from a boost to a SkillFramework. Requires boost admin.
-
-        :param boost_detach_framework_from_boost_request: (required)
-        :type boost_detach_framework_from_boost_request: BoostDetachFrameworkFromBoostRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_detach_framework_from_boost_serialize(
-            boost_detach_framework_from_boost_request=boost_detach_framework_from_boost_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_detach_framework_from_boost_with_http_info(
-        self,
-        boost_detach_framework_from_boost_request: BoostDetachFrameworkFromBoostRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[bool]:
-        """Detach framework from boost
-
-        Removes a USES_FRAMEWORK relationship from a boost to a SkillFramework. Requires boost admin.
-
-        :param boost_detach_framework_from_boost_request: (required)
-        :type boost_detach_framework_from_boost_request: BoostDetachFrameworkFromBoostRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_detach_framework_from_boost_serialize(
-            boost_detach_framework_from_boost_request=boost_detach_framework_from_boost_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_detach_framework_from_boost_without_preload_content(
-        self,
-        boost_detach_framework_from_boost_request: BoostDetachFrameworkFromBoostRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Detach framework from boost
-
-        Removes a USES_FRAMEWORK relationship from a boost to a SkillFramework. Requires boost admin.
-
-        :param boost_detach_framework_from_boost_request: (required)
-        :type boost_detach_framework_from_boost_request: BoostDetachFrameworkFromBoostRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_detach_framework_from_boost_serialize(
-            boost_detach_framework_from_boost_request=boost_detach_framework_from_boost_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_detach_framework_from_boost_serialize(
-        self,
-        boost_detach_framework_from_boost_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_detach_framework_from_boost_request is not None:
-            _body_params = boost_detach_framework_from_boost_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/detach-framework',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_generate_claim_link(
-        self,
-        boost_generate_claim_link_request: BoostGenerateClaimLinkRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> BoostGenerateClaimLink200Response:
-        """Generate a claim link for a boost
-
-        This route creates a challenge that an unknown profile can use to claim a boost.
-
-        :param boost_generate_claim_link_request: (required)
-        :type boost_generate_claim_link_request: BoostGenerateClaimLinkRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_generate_claim_link_serialize(
-            boost_generate_claim_link_request=boost_generate_claim_link_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGenerateClaimLink200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_generate_claim_link_with_http_info(
-        self,
-        boost_generate_claim_link_request: BoostGenerateClaimLinkRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[BoostGenerateClaimLink200Response]:
-        """Generate a claim link for a boost
-
-        This route creates a challenge that an unknown profile can use to claim a boost.
-
-        :param boost_generate_claim_link_request: (required)
-        :type boost_generate_claim_link_request: BoostGenerateClaimLinkRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_generate_claim_link_serialize(
-            boost_generate_claim_link_request=boost_generate_claim_link_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGenerateClaimLink200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_generate_claim_link_without_preload_content(
-        self,
-        boost_generate_claim_link_request: BoostGenerateClaimLinkRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Generate a claim link for a boost
-
-        This route creates a challenge that an unknown profile can use to claim a boost.
-
-        :param boost_generate_claim_link_request: (required)
-        :type boost_generate_claim_link_request: BoostGenerateClaimLinkRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_generate_claim_link_serialize(
-            boost_generate_claim_link_request=boost_generate_claim_link_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGenerateClaimLink200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_generate_claim_link_serialize(
-        self,
-        boost_generate_claim_link_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_generate_claim_link_request is not None:
-            _body_params = boost_generate_claim_link_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/generate-claim-link',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_get_boost(
-        self,
-        uri: StrictStr,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> BoostGetBoost200Response:
-        """Get boost
-
-        This endpoint gets metadata about a boost
-
-        :param uri: (required)
-        :type uri: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_serialize(
-            uri=uri,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetBoost200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_get_boost_with_http_info(
-        self,
-        uri: StrictStr,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[BoostGetBoost200Response]:
-        """Get boost
-
-        This endpoint gets metadata about a boost
-
-        :param uri: (required)
-        :type uri: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_serialize(
-            uri=uri,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetBoost200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_get_boost_without_preload_content(
-        self,
-        uri: StrictStr,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Get boost
-
-        This endpoint gets metadata about a boost
-
-        :param uri: (required)
-        :type uri: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_serialize(
-            uri=uri,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetBoost200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_get_boost_serialize(
-        self,
-        uri,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if uri is not None:
-            
-            _query_params.append(('uri', uri))
-            
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='GET',
-            resource_path='/boost',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_get_boost_admins(
-        self,
-        boost_get_boost_admins_request: BoostGetBoostAdminsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> BoostGetBoostAdmins200Response:
-        """Get boost admins
-
-        This route returns the admins for a boost
-
-        :param boost_get_boost_admins_request: (required)
-        :type boost_get_boost_admins_request: BoostGetBoostAdminsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_admins_serialize(
-            boost_get_boost_admins_request=boost_get_boost_admins_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetBoostAdmins200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_get_boost_admins_with_http_info(
-        self,
-        boost_get_boost_admins_request: BoostGetBoostAdminsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[BoostGetBoostAdmins200Response]:
-        """Get boost admins
-
-        This route returns the admins for a boost
-
-        :param boost_get_boost_admins_request: (required)
-        :type boost_get_boost_admins_request: BoostGetBoostAdminsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_admins_serialize(
-            boost_get_boost_admins_request=boost_get_boost_admins_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetBoostAdmins200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_get_boost_admins_without_preload_content(
-        self,
-        boost_get_boost_admins_request: BoostGetBoostAdminsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Get boost admins
-
-        This route returns the admins for a boost
-
-        :param boost_get_boost_admins_request: (required)
-        :type boost_get_boost_admins_request: BoostGetBoostAdminsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_admins_serialize(
-            boost_get_boost_admins_request=boost_get_boost_admins_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetBoostAdmins200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_get_boost_admins_serialize(
-        self,
-        boost_get_boost_admins_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_get_boost_admins_request is not None:
-            _body_params = boost_get_boost_admins_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/admins',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_get_boost_alignments(
-        self,
-        uri: StrictStr,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> List[BoostGetBoostAlignments200ResponseInner]:
-        """Get OBv3 alignments for a boost
-
-        Returns OBv3 alignment entries based on the boost's linked framework and aligned skills. Requires issue permission.
-
-        :param uri: (required)
-        :type uri: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_alignments_serialize(
-            uri=uri,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "List[BoostGetBoostAlignments200ResponseInner]",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_get_boost_alignments_with_http_info(
-        self,
-        uri: StrictStr,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[List[BoostGetBoostAlignments200ResponseInner]]:
-        """Get OBv3 alignments for a boost
-
-        Returns OBv3 alignment entries based on the boost's linked framework and aligned skills. Requires issue permission.
-
-        :param uri: (required)
-        :type uri: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_alignments_serialize(
-            uri=uri,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "List[BoostGetBoostAlignments200ResponseInner]",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_get_boost_alignments_without_preload_content(
-        self,
-        uri: StrictStr,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Get OBv3 alignments for a boost
-
-        Returns OBv3 alignment entries based on the boost's linked framework and aligned skills. Requires issue permission.
-
-        :param uri: (required)
-        :type uri: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_alignments_serialize(
-            uri=uri,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "List[BoostGetBoostAlignments200ResponseInner]",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_get_boost_alignments_serialize(
-        self,
-        uri,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if uri is not None:
-            
-            _query_params.append(('uri', uri))
-            
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='GET',
-            resource_path='/boost/alignments',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_get_boost_children(
-        self,
-        boost_get_boost_children_request: BoostGetBoostChildrenRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> BoostGetPaginatedBoosts200Response:
-        """Get boost children
-
-        This endpoint gets the children of a particular boost
-
-        :param boost_get_boost_children_request: (required)
-        :type boost_get_boost_children_request: BoostGetBoostChildrenRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_children_serialize(
-            boost_get_boost_children_request=boost_get_boost_children_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetPaginatedBoosts200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_get_boost_children_with_http_info(
-        self,
-        boost_get_boost_children_request: BoostGetBoostChildrenRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[BoostGetPaginatedBoosts200Response]:
-        """Get boost children
-
-        This endpoint gets the children of a particular boost
-
-        :param boost_get_boost_children_request: (required)
-        :type boost_get_boost_children_request: BoostGetBoostChildrenRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_children_serialize(
-            boost_get_boost_children_request=boost_get_boost_children_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetPaginatedBoosts200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_get_boost_children_without_preload_content(
-        self,
-        boost_get_boost_children_request: BoostGetBoostChildrenRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Get boost children
-
-        This endpoint gets the children of a particular boost
-
-        :param boost_get_boost_children_request: (required)
-        :type boost_get_boost_children_request: BoostGetBoostChildrenRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_children_serialize(
-            boost_get_boost_children_request=boost_get_boost_children_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetPaginatedBoosts200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_get_boost_children_serialize(
-        self,
-        boost_get_boost_children_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_get_boost_children_request is not None:
-            _body_params = boost_get_boost_children_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/children',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_get_boost_frameworks(
-        self,
-        boost_get_boost_frameworks_request: BoostGetBoostFrameworksRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> BoostGetBoostFrameworks200Response:
-        """List frameworks used by a boost (paginated)
-
-        Returns frameworks aligned to a boost via USES_FRAMEWORK with pagination and optional query filtering. Requires boost admin.
-
-        :param boost_get_boost_frameworks_request: (required)
-        :type boost_get_boost_frameworks_request: BoostGetBoostFrameworksRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_frameworks_serialize(
-            boost_get_boost_frameworks_request=boost_get_boost_frameworks_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetBoostFrameworks200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_get_boost_frameworks_with_http_info(
-        self,
-        boost_get_boost_frameworks_request: BoostGetBoostFrameworksRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[BoostGetBoostFrameworks200Response]:
-        """List frameworks used by a boost (paginated)
-
-        Returns frameworks aligned to a boost via USES_FRAMEWORK with pagination and optional query filtering. Requires boost admin.
-
-        :param boost_get_boost_frameworks_request: (required)
-        :type boost_get_boost_frameworks_request: BoostGetBoostFrameworksRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_frameworks_serialize(
-            boost_get_boost_frameworks_request=boost_get_boost_frameworks_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetBoostFrameworks200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_get_boost_frameworks_without_preload_content(
-        self,
-        boost_get_boost_frameworks_request: BoostGetBoostFrameworksRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """List frameworks used by a boost (paginated)
-
-        Returns frameworks aligned to a boost via USES_FRAMEWORK with pagination and optional query filtering. Requires boost admin.
-
-        :param boost_get_boost_frameworks_request: (required)
-        :type boost_get_boost_frameworks_request: BoostGetBoostFrameworksRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_frameworks_serialize(
-            boost_get_boost_frameworks_request=boost_get_boost_frameworks_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetBoostFrameworks200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_get_boost_frameworks_serialize(
-        self,
-        boost_get_boost_frameworks_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_get_boost_frameworks_request is not None:
-            _body_params = boost_get_boost_frameworks_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/frameworks',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_get_boost_parents(
-        self,
-        boost_get_boost_parents_request: BoostGetBoostParentsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> BoostGetPaginatedBoosts200Response:
-        """Get boost parents
-
-        This endpoint gets the parents of a particular boost
-
-        :param boost_get_boost_parents_request: (required)
-        :type boost_get_boost_parents_request: BoostGetBoostParentsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_parents_serialize(
-            boost_get_boost_parents_request=boost_get_boost_parents_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetPaginatedBoosts200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_get_boost_parents_with_http_info(
-        self,
-        boost_get_boost_parents_request: BoostGetBoostParentsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[BoostGetPaginatedBoosts200Response]:
-        """Get boost parents
-
-        This endpoint gets the parents of a particular boost
-
-        :param boost_get_boost_parents_request: (required)
-        :type boost_get_boost_parents_request: BoostGetBoostParentsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_parents_serialize(
-            boost_get_boost_parents_request=boost_get_boost_parents_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetPaginatedBoosts200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_get_boost_parents_without_preload_content(
-        self,
-        boost_get_boost_parents_request: BoostGetBoostParentsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Get boost parents
-
-        This endpoint gets the parents of a particular boost
-
-        :param boost_get_boost_parents_request: (required)
-        :type boost_get_boost_parents_request: BoostGetBoostParentsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_parents_serialize(
-            boost_get_boost_parents_request=boost_get_boost_parents_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetPaginatedBoosts200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_get_boost_parents_serialize(
-        self,
-        boost_get_boost_parents_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_get_boost_parents_request is not None:
-            _body_params = boost_get_boost_parents_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/parents',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_get_boost_permissions(
-        self,
-        uri: StrictStr,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> BoostGetBoost200ResponseClaimPermissions:
-        """Get boost permissions
-
-        This endpoint gets permission metadata about a boost
-
-        :param uri: (required)
-        :type uri: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_permissions_serialize(
-            uri=uri,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetBoost200ResponseClaimPermissions",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_get_boost_permissions_with_http_info(
-        self,
-        uri: StrictStr,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[BoostGetBoost200ResponseClaimPermissions]:
-        """Get boost permissions
-
-        This endpoint gets permission metadata about a boost
-
-        :param uri: (required)
-        :type uri: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_permissions_serialize(
-            uri=uri,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetBoost200ResponseClaimPermissions",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_get_boost_permissions_without_preload_content(
-        self,
-        uri: StrictStr,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Get boost permissions
-
-        This endpoint gets permission metadata about a boost
-
-        :param uri: (required)
-        :type uri: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_permissions_serialize(
-            uri=uri,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetBoost200ResponseClaimPermissions",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_get_boost_permissions_serialize(
-        self,
-        uri,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if uri is not None:
-            
-            _query_params.append(('uri', uri))
-            
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='GET',
-            resource_path='/boost/permissions',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_get_boost_recipient_count(
-        self,
-        uri: StrictStr,
-        include_unaccepted_boosts: Optional[StrictBool] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> float:
-        """Get boost recipients count
-
-        This endpoint counts the recipients of a particular boost
-
-        :param uri: (required)
-        :type uri: str
-        :param include_unaccepted_boosts:
-        :type include_unaccepted_boosts: bool
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_recipient_count_serialize(
-            uri=uri,
-            include_unaccepted_boosts=include_unaccepted_boosts,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "float",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_get_boost_recipient_count_with_http_info(
-        self,
-        uri: StrictStr,
-        include_unaccepted_boosts: Optional[StrictBool] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[float]:
-        """Get boost recipients count
-
-        This endpoint counts the recipients of a particular boost
-
-        :param uri: (required)
-        :type uri: str
-        :param include_unaccepted_boosts:
-        :type include_unaccepted_boosts: bool
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_recipient_count_serialize(
-            uri=uri,
-            include_unaccepted_boosts=include_unaccepted_boosts,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "float",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_get_boost_recipient_count_without_preload_content(
-        self,
-        uri: StrictStr,
-        include_unaccepted_boosts: Optional[StrictBool] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Get boost recipients count
-
-        This endpoint counts the recipients of a particular boost
-
-        :param uri: (required)
-        :type uri: str
-        :param include_unaccepted_boosts:
-        :type include_unaccepted_boosts: bool
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_recipient_count_serialize(
-            uri=uri,
-            include_unaccepted_boosts=include_unaccepted_boosts,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "float",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_get_boost_recipient_count_serialize(
-        self,
-        uri,
-        include_unaccepted_boosts,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if uri is not None:
-            
-            _query_params.append(('uri', uri))
-            
-        if include_unaccepted_boosts is not None:
-            
-            _query_params.append(('includeUnacceptedBoosts', include_unaccepted_boosts))
-            
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='GET',
-            resource_path='/boost/recipients/count',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_get_boost_recipients(
-        self,
-        uri: StrictStr,
-        limit: Optional[Union[StrictFloat, StrictInt]] = None,
-        skip: Optional[Union[StrictFloat, StrictInt]] = None,
-        include_unaccepted_boosts: Optional[StrictBool] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> List[BoostGetBoostRecipients200ResponseInner]:
-        """(Deprecated) Get boost recipients
-
-        This endpoint gets the recipients of a particular boost. Warning! This route is deprecated and currently has a hard limit of returning only the first 50 boosts. Please use getPaginatedBoostRecipients instead
-
-        :param uri: (required)
-        :type uri: str
-        :param limit:
-        :type limit: float
-        :param skip:
-        :type skip: float
-        :param include_unaccepted_boosts:
-        :type include_unaccepted_boosts: bool
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-        warnings.warn("GET /boost/recipients is deprecated.", DeprecationWarning)
-
-        _param = self._boost_get_boost_recipients_serialize(
-            uri=uri,
-            limit=limit,
-            skip=skip,
-            include_unaccepted_boosts=include_unaccepted_boosts,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "List[BoostGetBoostRecipients200ResponseInner]",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_get_boost_recipients_with_http_info(
-        self,
-        uri: StrictStr,
-        limit: Optional[Union[StrictFloat, StrictInt]] = None,
-        skip: Optional[Union[StrictFloat, StrictInt]] = None,
-        include_unaccepted_boosts: Optional[StrictBool] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[List[BoostGetBoostRecipients200ResponseInner]]:
-        """(Deprecated) Get boost recipients
-
-        This endpoint gets the recipients of a particular boost. Warning! This route is deprecated and currently has a hard limit of returning only the first 50 boosts. Please use getPaginatedBoostRecipients instead
-
-        :param uri: (required)
-        :type uri: str
-        :param limit:
-        :type limit: float
-        :param skip:
-        :type skip: float
-        :param include_unaccepted_boosts:
-        :type include_unaccepted_boosts: bool
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-        warnings.warn("GET /boost/recipients is deprecated.", DeprecationWarning)
-
-        _param = self._boost_get_boost_recipients_serialize(
-            uri=uri,
-            limit=limit,
-            skip=skip,
-            include_unaccepted_boosts=include_unaccepted_boosts,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "List[BoostGetBoostRecipients200ResponseInner]",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_get_boost_recipients_without_preload_content(
-        self,
-        uri: StrictStr,
-        limit: Optional[Union[StrictFloat, StrictInt]] = None,
-        skip: Optional[Union[StrictFloat, StrictInt]] = None,
-        include_unaccepted_boosts: Optional[StrictBool] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """(Deprecated) Get boost recipients
-
-        This endpoint gets the recipients of a particular boost. Warning! This route is deprecated and currently has a hard limit of returning only the first 50 boosts. Please use getPaginatedBoostRecipients instead
-
-        :param uri: (required)
-        :type uri: str
-        :param limit:
-        :type limit: float
-        :param skip:
-        :type skip: float
-        :param include_unaccepted_boosts:
-        :type include_unaccepted_boosts: bool
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-        warnings.warn("GET /boost/recipients is deprecated.", DeprecationWarning)
-
-        _param = self._boost_get_boost_recipients_serialize(
-            uri=uri,
-            limit=limit,
-            skip=skip,
-            include_unaccepted_boosts=include_unaccepted_boosts,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "List[BoostGetBoostRecipients200ResponseInner]",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_get_boost_recipients_serialize(
-        self,
-        uri,
-        limit,
-        skip,
-        include_unaccepted_boosts,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if uri is not None:
-            
-            _query_params.append(('uri', uri))
-            
-        if limit is not None:
-            
-            _query_params.append(('limit', limit))
-            
-        if skip is not None:
-            
-            _query_params.append(('skip', skip))
-            
-        if include_unaccepted_boosts is not None:
-            
-            _query_params.append(('includeUnacceptedBoosts', include_unaccepted_boosts))
-            
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='GET',
-            resource_path='/boost/recipients',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_get_boost_recipients_with_children_count(
-        self,
-        boost_get_boost_recipients_with_children_count_request: BoostGetBoostRecipientsWithChildrenCountRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> float:
-        """Count boost recipients with children
-
-        This endpoint counts distinct recipients of a boost and all its children boosts
-
-        :param boost_get_boost_recipients_with_children_count_request: (required)
-        :type boost_get_boost_recipients_with_children_count_request: BoostGetBoostRecipientsWithChildrenCountRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_recipients_with_children_count_serialize(
-            boost_get_boost_recipients_with_children_count_request=boost_get_boost_recipients_with_children_count_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "float",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_get_boost_recipients_with_children_count_with_http_info(
-        self,
-        boost_get_boost_recipients_with_children_count_request: BoostGetBoostRecipientsWithChildrenCountRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[float]:
-        """Count boost recipients with children
-
-        This endpoint counts distinct recipients of a boost and all its children boosts
-
-        :param boost_get_boost_recipients_with_children_count_request: (required)
-        :type boost_get_boost_recipients_with_children_count_request: BoostGetBoostRecipientsWithChildrenCountRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_recipients_with_children_count_serialize(
-            boost_get_boost_recipients_with_children_count_request=boost_get_boost_recipients_with_children_count_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "float",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_get_boost_recipients_with_children_count_without_preload_content(
-        self,
-        boost_get_boost_recipients_with_children_count_request: BoostGetBoostRecipientsWithChildrenCountRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Count boost recipients with children
-
-        This endpoint counts distinct recipients of a boost and all its children boosts
-
-        :param boost_get_boost_recipients_with_children_count_request: (required)
-        :type boost_get_boost_recipients_with_children_count_request: BoostGetBoostRecipientsWithChildrenCountRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_recipients_with_children_count_serialize(
-            boost_get_boost_recipients_with_children_count_request=boost_get_boost_recipients_with_children_count_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "float",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_get_boost_recipients_with_children_count_serialize(
-        self,
-        boost_get_boost_recipients_with_children_count_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_get_boost_recipients_with_children_count_request is not None:
-            _body_params = boost_get_boost_recipients_with_children_count_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/recipients-with-children/count',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_get_boost_siblings(
-        self,
-        boost_get_boost_siblings_request: BoostGetBoostSiblingsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> BoostGetPaginatedBoosts200Response:
-        """Get boost siblings
-
-        This endpoint gets the siblings of a particular boost
-
-        :param boost_get_boost_siblings_request: (required)
-        :type boost_get_boost_siblings_request: BoostGetBoostSiblingsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_siblings_serialize(
-            boost_get_boost_siblings_request=boost_get_boost_siblings_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetPaginatedBoosts200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_get_boost_siblings_with_http_info(
-        self,
-        boost_get_boost_siblings_request: BoostGetBoostSiblingsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[BoostGetPaginatedBoosts200Response]:
-        """Get boost siblings
-
-        This endpoint gets the siblings of a particular boost
-
-        :param boost_get_boost_siblings_request: (required)
-        :type boost_get_boost_siblings_request: BoostGetBoostSiblingsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_siblings_serialize(
-            boost_get_boost_siblings_request=boost_get_boost_siblings_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetPaginatedBoosts200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_get_boost_siblings_without_preload_content(
-        self,
-        boost_get_boost_siblings_request: BoostGetBoostSiblingsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Get boost siblings
-
-        This endpoint gets the siblings of a particular boost
-
-        :param boost_get_boost_siblings_request: (required)
-        :type boost_get_boost_siblings_request: BoostGetBoostSiblingsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_boost_siblings_serialize(
-            boost_get_boost_siblings_request=boost_get_boost_siblings_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetPaginatedBoosts200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_get_boost_siblings_serialize(
-        self,
-        boost_get_boost_siblings_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_get_boost_siblings_request is not None:
-            _body_params = boost_get_boost_siblings_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/siblings',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_get_boosts(
-        self,
-        boost_get_boosts_request: Optional[BoostGetBoostsRequest] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> List[BoostGetBoosts200ResponseInner]:
-        """(Deprecated) Get boosts
-
-        This endpoint gets the current user's boosts. Warning! This route is deprecated and currently has a hard limit of returning only the first 50 boosts. Please use getPaginatedBoosts instead
-
-        :param boost_get_boosts_request:
-        :type boost_get_boosts_request: BoostGetBoostsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-        warnings.warn("POST /boost/all is deprecated.", DeprecationWarning)
-
-        _param = self._boost_get_boosts_serialize(
-            boost_get_boosts_request=boost_get_boosts_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "List[BoostGetBoosts200ResponseInner]",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_get_boosts_with_http_info(
-        self,
-        boost_get_boosts_request: Optional[BoostGetBoostsRequest] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[List[BoostGetBoosts200ResponseInner]]:
-        """(Deprecated) Get boosts
-
-        This endpoint gets the current user's boosts. Warning! This route is deprecated and currently has a hard limit of returning only the first 50 boosts. Please use getPaginatedBoosts instead
-
-        :param boost_get_boosts_request:
-        :type boost_get_boosts_request: BoostGetBoostsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-        warnings.warn("POST /boost/all is deprecated.", DeprecationWarning)
-
-        _param = self._boost_get_boosts_serialize(
-            boost_get_boosts_request=boost_get_boosts_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "List[BoostGetBoosts200ResponseInner]",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_get_boosts_without_preload_content(
-        self,
-        boost_get_boosts_request: Optional[BoostGetBoostsRequest] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """(Deprecated) Get boosts
-
-        This endpoint gets the current user's boosts. Warning! This route is deprecated and currently has a hard limit of returning only the first 50 boosts. Please use getPaginatedBoosts instead
-
-        :param boost_get_boosts_request:
-        :type boost_get_boosts_request: BoostGetBoostsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-        warnings.warn("POST /boost/all is deprecated.", DeprecationWarning)
-
-        _param = self._boost_get_boosts_serialize(
-            boost_get_boosts_request=boost_get_boosts_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "List[BoostGetBoosts200ResponseInner]",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_get_boosts_serialize(
-        self,
-        boost_get_boosts_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_get_boosts_request is not None:
-            _body_params = boost_get_boosts_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/all',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_get_children_profile_managers(
-        self,
-        boost_get_children_profile_managers_request: BoostGetChildrenProfileManagersRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> BoostGetChildrenProfileManagers200Response:
-        """Get Profile Managers that are a child of a boost
-
-        Get Profile Managers that are a child of a boost
-
-        :param boost_get_children_profile_managers_request: (required)
-        :type boost_get_children_profile_managers_request: BoostGetChildrenProfileManagersRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_children_profile_managers_serialize(
-            boost_get_children_profile_managers_request=boost_get_children_profile_managers_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetChildrenProfileManagers200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_get_children_profile_managers_with_http_info(
-        self,
-        boost_get_children_profile_managers_request: BoostGetChildrenProfileManagersRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[BoostGetChildrenProfileManagers200Response]:
-        """Get Profile Managers that are a child of a boost
-
-        Get Profile Managers that are a child of a boost
-
-        :param boost_get_children_profile_managers_request: (required)
-        :type boost_get_children_profile_managers_request: BoostGetChildrenProfileManagersRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_children_profile_managers_serialize(
-            boost_get_children_profile_managers_request=boost_get_children_profile_managers_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetChildrenProfileManagers200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_get_children_profile_managers_without_preload_content(
-        self,
-        boost_get_children_profile_managers_request: BoostGetChildrenProfileManagersRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Get Profile Managers that are a child of a boost
-
-        Get Profile Managers that are a child of a boost
-
-        :param boost_get_children_profile_managers_request: (required)
-        :type boost_get_children_profile_managers_request: BoostGetChildrenProfileManagersRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_children_profile_managers_serialize(
-            boost_get_children_profile_managers_request=boost_get_children_profile_managers_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetChildrenProfileManagers200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_get_children_profile_managers_serialize(
-        self,
-        boost_get_children_profile_managers_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_get_children_profile_managers_request is not None:
-            _body_params = boost_get_children_profile_managers_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/children-profile-managers',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_get_connected_boost_recipient_count(
-        self,
-        uri: StrictStr,
-        include_unaccepted_boosts: Optional[StrictBool] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> float:
-        """Get boost recipients count
-
-        This endpoint counts the recipients of a particular boost
-
-        :param uri: (required)
-        :type uri: str
-        :param include_unaccepted_boosts:
-        :type include_unaccepted_boosts: bool
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_connected_boost_recipient_count_serialize(
-            uri=uri,
-            include_unaccepted_boosts=include_unaccepted_boosts,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "float",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_get_connected_boost_recipient_count_with_http_info(
-        self,
-        uri: StrictStr,
-        include_unaccepted_boosts: Optional[StrictBool] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[float]:
-        """Get boost recipients count
-
-        This endpoint counts the recipients of a particular boost
-
-        :param uri: (required)
-        :type uri: str
-        :param include_unaccepted_boosts:
-        :type include_unaccepted_boosts: bool
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_connected_boost_recipient_count_serialize(
-            uri=uri,
-            include_unaccepted_boosts=include_unaccepted_boosts,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "float",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_get_connected_boost_recipient_count_without_preload_content(
-        self,
-        uri: StrictStr,
-        include_unaccepted_boosts: Optional[StrictBool] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Get boost recipients count
-
-        This endpoint counts the recipients of a particular boost
-
-        :param uri: (required)
-        :type uri: str
-        :param include_unaccepted_boosts:
-        :type include_unaccepted_boosts: bool
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_connected_boost_recipient_count_serialize(
-            uri=uri,
-            include_unaccepted_boosts=include_unaccepted_boosts,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "float",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_get_connected_boost_recipient_count_serialize(
-        self,
-        uri,
-        include_unaccepted_boosts,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if uri is not None:
-            _path_params['uri'] = uri
-        # process the query parameters
-        if include_unaccepted_boosts is not None:
-            
-            _query_params.append(('includeUnacceptedBoosts', include_unaccepted_boosts))
-            
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='GET',
-            resource_path='/boost/recipients/connected/{uri}/count',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_get_connected_boost_recipients(
-        self,
-        uri: Optional[StrictStr],
-        boost_get_connected_boost_recipients_request: BoostGetConnectedBoostRecipientsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> BoostGetPaginatedBoostRecipients200Response:
-        """Get connected boost recipients
-
-        This endpoint gets the recipients of a particular boost
-
-        :param uri: (required)
-        :type uri: str
-        :param boost_get_connected_boost_recipients_request: (required)
-        :type boost_get_connected_boost_recipients_request: BoostGetConnectedBoostRecipientsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_connected_boost_recipients_serialize(
-            uri=uri,
-            boost_get_connected_boost_recipients_request=boost_get_connected_boost_recipients_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetPaginatedBoostRecipients200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_get_connected_boost_recipients_with_http_info(
-        self,
-        uri: Optional[StrictStr],
-        boost_get_connected_boost_recipients_request: BoostGetConnectedBoostRecipientsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[BoostGetPaginatedBoostRecipients200Response]:
-        """Get connected boost recipients
-
-        This endpoint gets the recipients of a particular boost
-
-        :param uri: (required)
-        :type uri: str
-        :param boost_get_connected_boost_recipients_request: (required)
-        :type boost_get_connected_boost_recipients_request: BoostGetConnectedBoostRecipientsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_connected_boost_recipients_serialize(
-            uri=uri,
-            boost_get_connected_boost_recipients_request=boost_get_connected_boost_recipients_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetPaginatedBoostRecipients200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_get_connected_boost_recipients_without_preload_content(
-        self,
-        uri: Optional[StrictStr],
-        boost_get_connected_boost_recipients_request: BoostGetConnectedBoostRecipientsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Get connected boost recipients
-
-        This endpoint gets the recipients of a particular boost
-
-        :param uri: (required)
-        :type uri: str
-        :param boost_get_connected_boost_recipients_request: (required)
-        :type boost_get_connected_boost_recipients_request: BoostGetConnectedBoostRecipientsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_connected_boost_recipients_serialize(
-            uri=uri,
-            boost_get_connected_boost_recipients_request=boost_get_connected_boost_recipients_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetPaginatedBoostRecipients200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_get_connected_boost_recipients_serialize(
-        self,
-        uri,
-        boost_get_connected_boost_recipients_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if uri is not None:
-            _path_params['uri'] = uri
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_get_connected_boost_recipients_request is not None:
-            _body_params = boost_get_connected_boost_recipients_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/recipients/connected/{uri}',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_get_familial_boosts(
-        self,
-        boost_get_familial_boosts_request: BoostGetFamilialBoostsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> BoostGetPaginatedBoosts200Response:
-        """Get familial boosts
-
-        This endpoint gets the parents, children, and siblings of a particular boost
-
-        :param boost_get_familial_boosts_request: (required)
-        :type boost_get_familial_boosts_request: BoostGetFamilialBoostsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_familial_boosts_serialize(
-            boost_get_familial_boosts_request=boost_get_familial_boosts_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetPaginatedBoosts200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_get_familial_boosts_with_http_info(
-        self,
-        boost_get_familial_boosts_request: BoostGetFamilialBoostsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[BoostGetPaginatedBoosts200Response]:
-        """Get familial boosts
-
-        This endpoint gets the parents, children, and siblings of a particular boost
-
-        :param boost_get_familial_boosts_request: (required)
-        :type boost_get_familial_boosts_request: BoostGetFamilialBoostsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_familial_boosts_serialize(
-            boost_get_familial_boosts_request=boost_get_familial_boosts_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetPaginatedBoosts200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_get_familial_boosts_without_preload_content(
-        self,
-        boost_get_familial_boosts_request: BoostGetFamilialBoostsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Get familial boosts
-
-        This endpoint gets the parents, children, and siblings of a particular boost
-
-        :param boost_get_familial_boosts_request: (required)
-        :type boost_get_familial_boosts_request: BoostGetFamilialBoostsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_familial_boosts_serialize(
-            boost_get_familial_boosts_request=boost_get_familial_boosts_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetPaginatedBoosts200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_get_familial_boosts_serialize(
-        self,
-        boost_get_familial_boosts_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_get_familial_boosts_request is not None:
-            _body_params = boost_get_familial_boosts_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/family',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_get_other_boost_permissions(
-        self,
-        profile_id: StrictStr,
-        uri: StrictStr,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> BoostGetBoost200ResponseClaimPermissions:
-        """Get boost permissions for someone else
-
-        This endpoint gets permission metadata about a boost for someone else
-
-        :param profile_id: (required)
-        :type profile_id: str
-        :param uri: (required)
-        :type uri: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_other_boost_permissions_serialize(
-            profile_id=profile_id,
-            uri=uri,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetBoost200ResponseClaimPermissions",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_get_other_boost_permissions_with_http_info(
-        self,
-        profile_id: StrictStr,
-        uri: StrictStr,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[BoostGetBoost200ResponseClaimPermissions]:
-        """Get boost permissions for someone else
-
-        This endpoint gets permission metadata about a boost for someone else
-
-        :param profile_id: (required)
-        :type profile_id: str
-        :param uri: (required)
-        :type uri: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_other_boost_permissions_serialize(
-            profile_id=profile_id,
-            uri=uri,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetBoost200ResponseClaimPermissions",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_get_other_boost_permissions_without_preload_content(
-        self,
-        profile_id: StrictStr,
-        uri: StrictStr,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Get boost permissions for someone else
-
-        This endpoint gets permission metadata about a boost for someone else
-
-        :param profile_id: (required)
-        :type profile_id: str
-        :param uri: (required)
-        :type uri: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_other_boost_permissions_serialize(
-            profile_id=profile_id,
-            uri=uri,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetBoost200ResponseClaimPermissions",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_get_other_boost_permissions_serialize(
-        self,
-        profile_id,
-        uri,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if profile_id is not None:
-            _path_params['profileId'] = profile_id
-        # process the query parameters
-        if uri is not None:
-            
-            _query_params.append(('uri', uri))
-            
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='GET',
-            resource_path='/boost/permissions/{profileId}',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_get_paginated_boost_recipients(
-        self,
-        boost_get_paginated_boost_recipients_request: BoostGetPaginatedBoostRecipientsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> BoostGetPaginatedBoostRecipients200Response:
-        """Get boost recipients
-
-        This endpoint gets the recipients of a particular boost
-
-        :param boost_get_paginated_boost_recipients_request: (required)
-        :type boost_get_paginated_boost_recipients_request: BoostGetPaginatedBoostRecipientsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_paginated_boost_recipients_serialize(
-            boost_get_paginated_boost_recipients_request=boost_get_paginated_boost_recipients_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetPaginatedBoostRecipients200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_get_paginated_boost_recipients_with_http_info(
-        self,
-        boost_get_paginated_boost_recipients_request: BoostGetPaginatedBoostRecipientsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[BoostGetPaginatedBoostRecipients200Response]:
-        """Get boost recipients
-
-        This endpoint gets the recipients of a particular boost
-
-        :param boost_get_paginated_boost_recipients_request: (required)
-        :type boost_get_paginated_boost_recipients_request: BoostGetPaginatedBoostRecipientsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_paginated_boost_recipients_serialize(
-            boost_get_paginated_boost_recipients_request=boost_get_paginated_boost_recipients_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetPaginatedBoostRecipients200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_get_paginated_boost_recipients_without_preload_content(
-        self,
-        boost_get_paginated_boost_recipients_request: BoostGetPaginatedBoostRecipientsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Get boost recipients
-
-        This endpoint gets the recipients of a particular boost
-
-        :param boost_get_paginated_boost_recipients_request: (required)
-        :type boost_get_paginated_boost_recipients_request: BoostGetPaginatedBoostRecipientsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_paginated_boost_recipients_serialize(
-            boost_get_paginated_boost_recipients_request=boost_get_paginated_boost_recipients_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetPaginatedBoostRecipients200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_get_paginated_boost_recipients_serialize(
-        self,
-        boost_get_paginated_boost_recipients_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_get_paginated_boost_recipients_request is not None:
-            _body_params = boost_get_paginated_boost_recipients_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/recipients/paginated',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_get_paginated_boost_recipients_with_children(
-        self,
-        boost_get_paginated_boost_recipients_with_children_request: BoostGetPaginatedBoostRecipientsWithChildrenRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> BoostGetPaginatedBoostRecipientsWithChildren200Response:
-        """Get boost recipients with children
-
-        This endpoint gets the recipients of a boost and all its children boosts
-
-        :param boost_get_paginated_boost_recipients_with_children_request: (required)
-        :type boost_get_paginated_boost_recipients_with_children_request: BoostGetPaginatedBoostRecipientsWithChildrenRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_paginated_boost_recipients_with_children_serialize(
-            boost_get_paginated_boost_recipients_with_children_request=boost_get_paginated_boost_recipients_with_children_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetPaginatedBoostRecipientsWithChildren200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_get_paginated_boost_recipients_with_children_with_http_info(
-        self,
-        boost_get_paginated_boost_recipients_with_children_request: BoostGetPaginatedBoostRecipientsWithChildrenRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[BoostGetPaginatedBoostRecipientsWithChildren200Response]:
-        """Get boost recipients with children
-
-        This endpoint gets the recipients of a boost and all its children boosts
-
-        :param boost_get_paginated_boost_recipients_with_children_request: (required)
-        :type boost_get_paginated_boost_recipients_with_children_request: BoostGetPaginatedBoostRecipientsWithChildrenRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_paginated_boost_recipients_with_children_serialize(
-            boost_get_paginated_boost_recipients_with_children_request=boost_get_paginated_boost_recipients_with_children_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetPaginatedBoostRecipientsWithChildren200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_get_paginated_boost_recipients_with_children_without_preload_content(
-        self,
-        boost_get_paginated_boost_recipients_with_children_request: BoostGetPaginatedBoostRecipientsWithChildrenRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Get boost recipients with children
-
-        This endpoint gets the recipients of a boost and all its children boosts
-
-        :param boost_get_paginated_boost_recipients_with_children_request: (required)
-        :type boost_get_paginated_boost_recipients_with_children_request: BoostGetPaginatedBoostRecipientsWithChildrenRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_paginated_boost_recipients_with_children_serialize(
-            boost_get_paginated_boost_recipients_with_children_request=boost_get_paginated_boost_recipients_with_children_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetPaginatedBoostRecipientsWithChildren200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_get_paginated_boost_recipients_with_children_serialize(
-        self,
-        boost_get_paginated_boost_recipients_with_children_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_get_paginated_boost_recipients_with_children_request is not None:
-            _body_params = boost_get_paginated_boost_recipients_with_children_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/recipients-with-children/paginated',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_get_paginated_boosts(
-        self,
-        boost_get_paginated_boosts_request: Optional[BoostGetPaginatedBoostsRequest] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> BoostGetPaginatedBoosts200Response:
-        """Get boosts
-
-        This endpoint gets the current user's boosts
-
-        :param boost_get_paginated_boosts_request:
-        :type boost_get_paginated_boosts_request: BoostGetPaginatedBoostsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_paginated_boosts_serialize(
-            boost_get_paginated_boosts_request=boost_get_paginated_boosts_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetPaginatedBoosts200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_get_paginated_boosts_with_http_info(
-        self,
-        boost_get_paginated_boosts_request: Optional[BoostGetPaginatedBoostsRequest] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[BoostGetPaginatedBoosts200Response]:
-        """Get boosts
-
-        This endpoint gets the current user's boosts
-
-        :param boost_get_paginated_boosts_request:
-        :type boost_get_paginated_boosts_request: BoostGetPaginatedBoostsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_paginated_boosts_serialize(
-            boost_get_paginated_boosts_request=boost_get_paginated_boosts_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetPaginatedBoosts200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_get_paginated_boosts_without_preload_content(
-        self,
-        boost_get_paginated_boosts_request: Optional[BoostGetPaginatedBoostsRequest] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Get boosts
-
-        This endpoint gets the current user's boosts
-
-        :param boost_get_paginated_boosts_request:
-        :type boost_get_paginated_boosts_request: BoostGetPaginatedBoostsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_paginated_boosts_serialize(
-            boost_get_paginated_boosts_request=boost_get_paginated_boosts_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostGetPaginatedBoosts200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_get_paginated_boosts_serialize(
-        self,
-        boost_get_paginated_boosts_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_get_paginated_boosts_request is not None:
-            _body_params = boost_get_paginated_boosts_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/paginated',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_get_skills_available_for_boost(
-        self,
-        uri: StrictStr,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> List[BoostGetSkillsAvailableForBoost200ResponseInner]:
-        """List available skills for a boost
-
-        Returns skills from frameworks attached to the boost or any of its ancestors. Requires boost admin.
-
-        :param uri: (required)
-        :type uri: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_skills_available_for_boost_serialize(
-            uri=uri,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "List[BoostGetSkillsAvailableForBoost200ResponseInner]",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_get_skills_available_for_boost_with_http_info(
-        self,
-        uri: StrictStr,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[List[BoostGetSkillsAvailableForBoost200ResponseInner]]:
-        """List available skills for a boost
-
-        Returns skills from frameworks attached to the boost or any of its ancestors. Requires boost admin.
-
-        :param uri: (required)
-        :type uri: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_skills_available_for_boost_serialize(
-            uri=uri,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "List[BoostGetSkillsAvailableForBoost200ResponseInner]",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_get_skills_available_for_boost_without_preload_content(
-        self,
-        uri: StrictStr,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """List available skills for a boost
-
-        Returns skills from frameworks attached to the boost or any of its ancestors. Requires boost admin.
-
-        :param uri: (required)
-        :type uri: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_get_skills_available_for_boost_serialize(
-            uri=uri,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "List[BoostGetSkillsAvailableForBoost200ResponseInner]",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '404': "ErrorNOTFOUND",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_get_skills_available_for_boost_serialize(
-        self,
-        uri,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if uri is not None:
-            
-            _query_params.append(('uri', uri))
-            
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='GET',
-            resource_path='/boost/skills/available',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_make_boost_parent(
-        self,
-        boost_make_boost_parent_request: BoostMakeBoostParentRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> bool:
-        """Make Boost Parent
-
-        This endpoint creates a parent/child relationship between two boosts
-
-        :param boost_make_boost_parent_request: (required)
-        :type boost_make_boost_parent_request: BoostMakeBoostParentRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_make_boost_parent_serialize(
-            boost_make_boost_parent_request=boost_make_boost_parent_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_make_boost_parent_with_http_info(
-        self,
-        boost_make_boost_parent_request: BoostMakeBoostParentRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[bool]:
-        """Make Boost Parent
-
-        This endpoint creates a parent/child relationship between two boosts
-
-        :param boost_make_boost_parent_request: (required)
-        :type boost_make_boost_parent_request: BoostMakeBoostParentRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_make_boost_parent_serialize(
-            boost_make_boost_parent_request=boost_make_boost_parent_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_make_boost_parent_without_preload_content(
-        self,
-        boost_make_boost_parent_request: BoostMakeBoostParentRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Make Boost Parent
-
-        This endpoint creates a parent/child relationship between two boosts
-
-        :param boost_make_boost_parent_request: (required)
-        :type boost_make_boost_parent_request: BoostMakeBoostParentRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_make_boost_parent_serialize(
-            boost_make_boost_parent_request=boost_make_boost_parent_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_make_boost_parent_serialize(
-        self,
-        boost_make_boost_parent_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_make_boost_parent_request is not None:
-            _body_params = boost_make_boost_parent_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/make-parent',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_remove_boost_admin(
-        self,
-        boost_remove_boost_admin_request: BoostRemoveBoostAdminRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> bool:
-        """Remove a Boost admin
-
-        This route removes an  admin from a boost
-
-        :param boost_remove_boost_admin_request: (required)
-        :type boost_remove_boost_admin_request: BoostRemoveBoostAdminRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_remove_boost_admin_serialize(
-            boost_remove_boost_admin_request=boost_remove_boost_admin_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_remove_boost_admin_with_http_info(
-        self,
-        boost_remove_boost_admin_request: BoostRemoveBoostAdminRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[bool]:
-        """Remove a Boost admin
-
-        This route removes an  admin from a boost
-
-        :param boost_remove_boost_admin_request: (required)
-        :type boost_remove_boost_admin_request: BoostRemoveBoostAdminRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_remove_boost_admin_serialize(
-            boost_remove_boost_admin_request=boost_remove_boost_admin_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_remove_boost_admin_without_preload_content(
-        self,
-        boost_remove_boost_admin_request: BoostRemoveBoostAdminRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Remove a Boost admin
-
-        This route removes an  admin from a boost
-
-        :param boost_remove_boost_admin_request: (required)
-        :type boost_remove_boost_admin_request: BoostRemoveBoostAdminRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_remove_boost_admin_serialize(
-            boost_remove_boost_admin_request=boost_remove_boost_admin_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_remove_boost_admin_serialize(
-        self,
-        boost_remove_boost_admin_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_remove_boost_admin_request is not None:
-            _body_params = boost_remove_boost_admin_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/remove-admin',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_remove_boost_parent(
-        self,
-        boost_remove_boost_parent_request: BoostRemoveBoostParentRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> bool:
-        """Remove Boost Parent
-
-        This endpoint removes a parent/child relationship between two boosts
-
-        :param boost_remove_boost_parent_request: (required)
-        :type boost_remove_boost_parent_request: BoostRemoveBoostParentRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_remove_boost_parent_serialize(
-            boost_remove_boost_parent_request=boost_remove_boost_parent_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_remove_boost_parent_with_http_info(
-        self,
-        boost_remove_boost_parent_request: BoostRemoveBoostParentRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[bool]:
-        """Remove Boost Parent
-
-        This endpoint removes a parent/child relationship between two boosts
-
-        :param boost_remove_boost_parent_request: (required)
-        :type boost_remove_boost_parent_request: BoostRemoveBoostParentRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_remove_boost_parent_serialize(
-            boost_remove_boost_parent_request=boost_remove_boost_parent_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_remove_boost_parent_without_preload_content(
-        self,
-        boost_remove_boost_parent_request: BoostRemoveBoostParentRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Remove Boost Parent
-
-        This endpoint removes a parent/child relationship between two boosts
-
-        :param boost_remove_boost_parent_request: (required)
-        :type boost_remove_boost_parent_request: BoostRemoveBoostParentRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_remove_boost_parent_serialize(
-            boost_remove_boost_parent_request=boost_remove_boost_parent_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_remove_boost_parent_serialize(
-        self,
-        boost_remove_boost_parent_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_remove_boost_parent_request is not None:
-            _body_params = boost_remove_boost_parent_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/remove-parent',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_search_skills_available_for_boost(
-        self,
-        boost_search_skills_available_for_boost_request: BoostSearchSkillsAvailableForBoostRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> BoostSearchSkillsAvailableForBoost200Response:
-        """Search available skills for a boost
-
-        Returns a flattened, paginated list of skills matching the search query. Supports $regex and $in operators. Searches skills from frameworks attached to the boost or any of its ancestors. Requires boost admin.
-
-        :param boost_search_skills_available_for_boost_request: (required)
-        :type boost_search_skills_available_for_boost_request: BoostSearchSkillsAvailableForBoostRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_search_skills_available_for_boost_serialize(
-            boost_search_skills_available_for_boost_request=boost_search_skills_available_for_boost_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostSearchSkillsAvailableForBoost200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_search_skills_available_for_boost_with_http_info(
-        self,
-        boost_search_skills_available_for_boost_request: BoostSearchSkillsAvailableForBoostRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[BoostSearchSkillsAvailableForBoost200Response]:
-        """Search available skills for a boost
-
-        Returns a flattened, paginated list of skills matching the search query. Supports $regex and $in operators. Searches skills from frameworks attached to the boost or any of its ancestors. Requires boost admin.
-
-        :param boost_search_skills_available_for_boost_request: (required)
-        :type boost_search_skills_available_for_boost_request: BoostSearchSkillsAvailableForBoostRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_search_skills_available_for_boost_serialize(
-            boost_search_skills_available_for_boost_request=boost_search_skills_available_for_boost_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostSearchSkillsAvailableForBoost200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_search_skills_available_for_boost_without_preload_content(
-        self,
-        boost_search_skills_available_for_boost_request: BoostSearchSkillsAvailableForBoostRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Search available skills for a boost
-
-        Returns a flattened, paginated list of skills matching the search query. Supports $regex and $in operators. Searches skills from frameworks attached to the boost or any of its ancestors. Requires boost admin.
-
-        :param boost_search_skills_available_for_boost_request: (required)
-        :type boost_search_skills_available_for_boost_request: BoostSearchSkillsAvailableForBoostRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_search_skills_available_for_boost_serialize(
-            boost_search_skills_available_for_boost_request=boost_search_skills_available_for_boost_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostSearchSkillsAvailableForBoost200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_search_skills_available_for_boost_serialize(
-        self,
-        boost_search_skills_available_for_boost_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_search_skills_available_for_boost_request is not None:
-            _body_params = boost_search_skills_available_for_boost_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/skills/search',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_send_boost(
-        self,
-        profile_id: Optional[StrictStr],
-        boost_send_boost_request: BoostSendBoostRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> str:
-        """Send a Boost
-
-        This endpoint sends a boost to a profile
-
-        :param profile_id: (required)
-        :type profile_id: str
-        :param boost_send_boost_request: (required)
-        :type boost_send_boost_request: BoostSendBoostRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_send_boost_serialize(
-            profile_id=profile_id,
-            boost_send_boost_request=boost_send_boost_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "str",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_send_boost_with_http_info(
-        self,
-        profile_id: Optional[StrictStr],
-        boost_send_boost_request: BoostSendBoostRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[str]:
-        """Send a Boost
-
-        This endpoint sends a boost to a profile
-
-        :param profile_id: (required)
-        :type profile_id: str
-        :param boost_send_boost_request: (required)
-        :type boost_send_boost_request: BoostSendBoostRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_send_boost_serialize(
-            profile_id=profile_id,
-            boost_send_boost_request=boost_send_boost_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "str",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_send_boost_without_preload_content(
-        self,
-        profile_id: Optional[StrictStr],
-        boost_send_boost_request: BoostSendBoostRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Send a Boost
-
-        This endpoint sends a boost to a profile
-
-        :param profile_id: (required)
-        :type profile_id: str
-        :param boost_send_boost_request: (required)
-        :type boost_send_boost_request: BoostSendBoostRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_send_boost_serialize(
-            profile_id=profile_id,
-            boost_send_boost_request=boost_send_boost_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "str",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_send_boost_serialize(
-        self,
-        profile_id,
-        boost_send_boost_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if profile_id is not None:
-            _path_params['profileId'] = profile_id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_send_boost_request is not None:
-            _body_params = boost_send_boost_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/send/{profileId}',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_send_boost_via_signing_authority(
-        self,
-        profile_id: StrictStr,
-        boost_send_boost_via_signing_authority_request: BoostSendBoostViaSigningAuthorityRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> str:
-        """Send a boost to a profile using a signing authority
-
-        Issues a boost VC to a recipient profile using a specified signing authority and sends it via the network.
-
-        :param profile_id: (required)
-        :type profile_id: str
-        :param boost_send_boost_via_signing_authority_request: (required)
-        :type boost_send_boost_via_signing_authority_request: BoostSendBoostViaSigningAuthorityRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_send_boost_via_signing_authority_serialize(
-            profile_id=profile_id,
-            boost_send_boost_via_signing_authority_request=boost_send_boost_via_signing_authority_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "str",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_send_boost_via_signing_authority_with_http_info(
-        self,
-        profile_id: StrictStr,
-        boost_send_boost_via_signing_authority_request: BoostSendBoostViaSigningAuthorityRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[str]:
-        """Send a boost to a profile using a signing authority
-
-        Issues a boost VC to a recipient profile using a specified signing authority and sends it via the network.
-
-        :param profile_id: (required)
-        :type profile_id: str
-        :param boost_send_boost_via_signing_authority_request: (required)
-        :type boost_send_boost_via_signing_authority_request: BoostSendBoostViaSigningAuthorityRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_send_boost_via_signing_authority_serialize(
-            profile_id=profile_id,
-            boost_send_boost_via_signing_authority_request=boost_send_boost_via_signing_authority_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "str",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_send_boost_via_signing_authority_without_preload_content(
-        self,
-        profile_id: StrictStr,
-        boost_send_boost_via_signing_authority_request: BoostSendBoostViaSigningAuthorityRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Send a boost to a profile using a signing authority
-
-        Issues a boost VC to a recipient profile using a specified signing authority and sends it via the network.
-
-        :param profile_id: (required)
-        :type profile_id: str
-        :param boost_send_boost_via_signing_authority_request: (required)
-        :type boost_send_boost_via_signing_authority_request: BoostSendBoostViaSigningAuthorityRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_send_boost_via_signing_authority_serialize(
-            profile_id=profile_id,
-            boost_send_boost_via_signing_authority_request=boost_send_boost_via_signing_authority_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "str",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_send_boost_via_signing_authority_serialize(
-        self,
-        profile_id,
-        boost_send_boost_via_signing_authority_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if profile_id is not None:
-            _path_params['profileId'] = profile_id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_send_boost_via_signing_authority_request is not None:
-            _body_params = boost_send_boost_via_signing_authority_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/send/via-signing-authority/{profileId}',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_update_boost(
-        self,
-        boost_update_boost_request: BoostUpdateBoostRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> bool:
-        """Update a boost
-
-        This route updates a boost
-
-        :param boost_update_boost_request: (required)
-        :type boost_update_boost_request: BoostUpdateBoostRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_update_boost_serialize(
-            boost_update_boost_request=boost_update_boost_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_update_boost_with_http_info(
-        self,
-        boost_update_boost_request: BoostUpdateBoostRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[bool]:
-        """Update a boost
-
-        This route updates a boost
-
-        :param boost_update_boost_request: (required)
-        :type boost_update_boost_request: BoostUpdateBoostRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_update_boost_serialize(
-            boost_update_boost_request=boost_update_boost_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_update_boost_without_preload_content(
-        self,
-        boost_update_boost_request: BoostUpdateBoostRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Update a boost
-
-        This route updates a boost
-
-        :param boost_update_boost_request: (required)
-        :type boost_update_boost_request: BoostUpdateBoostRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_update_boost_serialize(
-            boost_update_boost_request=boost_update_boost_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_update_boost_serialize(
-        self,
-        boost_update_boost_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_update_boost_request is not None:
-            _body_params = boost_update_boost_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_update_boost_permissions(
-        self,
-        boost_update_boost_permissions_request: BoostUpdateBoostPermissionsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> bool:
-        """Update boost permissions
-
-        This endpoint updates permission metadata about a boost for the current user
-
-        :param boost_update_boost_permissions_request: (required)
-        :type boost_update_boost_permissions_request: BoostUpdateBoostPermissionsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_update_boost_permissions_serialize(
-            boost_update_boost_permissions_request=boost_update_boost_permissions_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_update_boost_permissions_with_http_info(
-        self,
-        boost_update_boost_permissions_request: BoostUpdateBoostPermissionsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[bool]:
-        """Update boost permissions
-
-        This endpoint updates permission metadata about a boost for the current user
-
-        :param boost_update_boost_permissions_request: (required)
-        :type boost_update_boost_permissions_request: BoostUpdateBoostPermissionsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_update_boost_permissions_serialize(
-            boost_update_boost_permissions_request=boost_update_boost_permissions_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_update_boost_permissions_without_preload_content(
-        self,
-        boost_update_boost_permissions_request: BoostUpdateBoostPermissionsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Update boost permissions
-
-        This endpoint updates permission metadata about a boost for the current user
-
-        :param boost_update_boost_permissions_request: (required)
-        :type boost_update_boost_permissions_request: BoostUpdateBoostPermissionsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_update_boost_permissions_serialize(
-            boost_update_boost_permissions_request=boost_update_boost_permissions_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_update_boost_permissions_serialize(
-        self,
-        boost_update_boost_permissions_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_update_boost_permissions_request is not None:
-            _body_params = boost_update_boost_permissions_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/permissions',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
-
-
-    @validate_call
-    def boost_update_other_boost_permissions(
-        self,
-        profile_id: StrictStr,
-        boost_update_other_boost_permissions_request: BoostUpdateOtherBoostPermissionsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> bool:
-        """Update other profile's boost permissions
-
-        This endpoint updates permission metadata about a boost for another user
-
-        :param profile_id: (required)
-        :type profile_id: str
-        :param boost_update_other_boost_permissions_request: (required)
-        :type boost_update_other_boost_permissions_request: BoostUpdateOtherBoostPermissionsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_update_other_boost_permissions_serialize(
-            profile_id=profile_id,
-            boost_update_other_boost_permissions_request=boost_update_other_boost_permissions_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_update_other_boost_permissions_with_http_info(
-        self,
-        profile_id: StrictStr,
-        boost_update_other_boost_permissions_request: BoostUpdateOtherBoostPermissionsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[bool]:
-        """Update other profile's boost permissions
-
-        This endpoint updates permission metadata about a boost for another user
-
-        :param profile_id: (required)
-        :type profile_id: str
-        :param boost_update_other_boost_permissions_request: (required)
-        :type boost_update_other_boost_permissions_request: BoostUpdateOtherBoostPermissionsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_update_other_boost_permissions_serialize(
-            profile_id=profile_id,
-            boost_update_other_boost_permissions_request=boost_update_other_boost_permissions_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def boost_update_other_boost_permissions_without_preload_content(
-        self,
-        profile_id: StrictStr,
-        boost_update_other_boost_permissions_request: BoostUpdateOtherBoostPermissionsRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Update other profile's boost permissions
-
-        This endpoint updates permission metadata about a boost for another user
-
-        :param profile_id: (required)
-        :type profile_id: str
-        :param boost_update_other_boost_permissions_request: (required)
-        :type boost_update_other_boost_permissions_request: BoostUpdateOtherBoostPermissionsRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_update_other_boost_permissions_serialize(
-            profile_id=profile_id,
-            boost_update_other_boost_permissions_request=boost_update_other_boost_permissions_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bool",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_update_other_boost_permissions_serialize(
-        self,
-        profile_id,
-        boost_update_other_boost_permissions_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if profile_id is not None:
-            _path_params['profileId'] = profile_id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_update_other_boost_permissions_request is not None:
-            _body_params = boost_update_other_boost_permissions_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/boost/permissions/{profileId}',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
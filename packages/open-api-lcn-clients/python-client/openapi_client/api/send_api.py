@@ -6,181 +6,80 @@
     API for interacting with LearnCloud Network
 
     The version of the OpenAPI document: 1.0.0
-    Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-    Do not edit the class manually.
 """  # noqa: E501
 
-import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
-from typing import Any, Dict, List, Optional, Tuple, Union
+from pydantic import Field, StrictFloat, StrictInt, StrictStr
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
 from typing_extensions import Annotated
 
 from openapi_client.models.boost_send200_response import BoostSend200Response
 from openapi_client.models.boost_send_request import BoostSendRequest
 
-from openapi_client.api_client import ApiClient, RequestSerialized
-from openapi_client.api_response import ApiResponse
-from openapi_client.rest import RESTResponseType
+from openapi_client.bulk import BulkCheckpoint, BulkResult, bulk_call
+from openapi_client.operations import Endpoint, GeneratedApi, Param
+from openapi_client.prepared import RequestTemplate
 
 
-class SendApi:
-    """NOTE: This class is auto generated by OpenAPI Generator
-    Ref: https://openapi-generator.tech
+class SendApi(GeneratedApi):
+    """Operations of the Send tag of the LearnCloud Network API.
 
-    Do not edit the class manually.
+    `GeneratedApi` builds the operation methods from `operations`; the rest
+    of the class is written by hand.
     """
 
-    def __init__(self, api_client=None) -> None:
-        if api_client is None:
-            api_client = ApiClient.get_default()
-        self.api_client = api_client
-
-
-    @validate_call
-    def boost_send(
-        self,
-        boost_send_request: BoostSendRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> BoostSend200Response:
-        """Send data to a recipient
-
-        Sends data to a recipient. For boosts: creates a boost if needed, auto-issues a credential from its template, and sends it. If a contractUri is provided and the recipient has consent with write permission for the boost category, the credential is sent through the contract; otherwise it is sent normally.
-
-        :param boost_send_request: (required)
-        :type boost_send_request: BoostSendRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_send_serialize(
-            boost_send_request=boost_send_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostSend200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def boost_send_with_http_info(
+    operations = (
+        Endpoint(
+            name='boost_send',
+            method='POST',
+            path='/send',
+            summary='Send data to a recipient',
+            description='Sends data to a recipient. For boosts: creates a boost if needed, auto-issues a credential from its template, and sends it. If a contractUri is provided and the recipient has consent with write permission for the boost category, the credential is sent through the contract; otherwise it is sent normally.',
+            params=(
+                Param('boost_send_request', BoostSendRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=BoostSend200Response,
+            response_types_map={
+                '200': "BoostSend200Response",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+    )
+
+
+    def bulk_send(
         self,
-        boost_send_request: BoostSendRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[BoostSend200Response]:
-        """Send data to a recipient
-
-        Sends data to a recipient. For boosts: creates a boost if needed, auto-issues a credential from its template, and sends it. If a contractUri is provided and the recipient has consent with write permission for the boost category, the credential is sent through the contract; otherwise it is sent normally.
-
-        :param boost_send_request: (required)
-        :type boost_send_request: BoostSendRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_send_serialize(
-            boost_send_request=boost_send_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
+        boost_send_requests: Iterable[BoostSendRequest],
+        *,
+        max_workers: Optional[int] = None,
+        max_retries: int = 5,
+        checkpoint: Optional[Union[str, BulkCheckpoint]] = None,
+        retry_read_errors: bool = False,
+    ) -> Iterator[BulkResult]:
+        """Sends data to many recipients, one `boost_send` call per request.
+
+        See `openapi_client.bulk.bulk_call`; `checkpoint` may also be the path
+        of a checkpoint file, and `max_workers` defaults to
+        `Configuration.connection_pool_maxsize`.
+        """
+        if isinstance(checkpoint, str):
+            checkpoint = BulkCheckpoint(checkpoint)
+        if max_workers is None:
+            max_workers = self.api_client.configuration.connection_pool_maxsize
+        return bulk_call(
+            self.boost_send,
+            boost_send_requests,
+            max_workers=max_workers,
+            max_retries=max_retries,
+            checkpoint=checkpoint,
+            retry_read_errors=retry_read_errors,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostSend200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
 
-
-    @validate_call
-    def boost_send_without_preload_content(
+    def prepare_boost_send(
         self,
         boost_send_request: BoostSendRequest,
         _request_timeout: Union[
@@ -195,129 +94,26 @@ class SendApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Send data to a recipient
-
-        Sends data to a recipient. For boosts: creates a boost if needed, auto-issues a credential from its template, and sends it. If a contractUri is provided and the recipient has consent with write permission for the boost category, the credential is sent through the contract; otherwise it is sent normally.
-
-        :param boost_send_request: (required)
-        :type boost_send_request: BoostSendRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._boost_send_serialize(
-            boost_send_request=boost_send_request,
+    ) -> RequestTemplate:
+        """Prepares `boost_send` for many recipients of the same request.
+
+        The request (template, templateUri, options, templateData, ...) is
+        validated and encoded once; `send(recipient)` on the result splices
+        the recipient into the encoded body, and `bulk_send(recipients)` fans
+        out like `bulk_send`. On an `AsyncApiClient` use `asend(recipient)`.
+
+        The `_request_*`, `_content_type`, `_headers` and `_host_index`
+        options are those of `boost_send`, applied to every send; see
+        `openapi_client.prepared.RequestTemplate`.
+        """
+        return RequestTemplate(
+            self,
+            'boost_send',
+            boost_send_request,
+            'recipient',
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
             _host_index=_host_index
         )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "BoostSend200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _boost_send_serialize(
-        self,
-        boost_send_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if boost_send_request is not None:
-            _body_params = boost_send_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/send',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
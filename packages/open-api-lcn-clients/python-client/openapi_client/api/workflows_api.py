@@ -6,350 +6,44 @@
     API for interacting with LearnCloud Network
 
     The version of the OpenAPI document: 1.0.0
-    Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-    Do not edit the class manually.
 """  # noqa: E501
 
-import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
-from typing import Any, Dict, List, Optional, Tuple, Union
-from typing_extensions import Annotated
-
 from pydantic import StrictStr
 from typing import Optional
+
 from openapi_client.models.workflows_participate_in_exchange200_response import WorkflowsParticipateInExchange200Response
 from openapi_client.models.workflows_participate_in_exchange_request import WorkflowsParticipateInExchangeRequest
 
-from openapi_client.api_client import ApiClient, RequestSerialized
-from openapi_client.api_response import ApiResponse
-from openapi_client.rest import RESTResponseType
+from openapi_client.operations import Endpoint, GeneratedApi, Param
 
 
-class WorkflowsApi:
-    """NOTE: This class is auto generated by OpenAPI Generator
-    Ref: https://openapi-generator.tech
+class WorkflowsApi(GeneratedApi):
+    """Operations of the Workflows tag of the LearnCloud Network API.
 
-    Do not edit the class manually.
+    `GeneratedApi` builds the operation methods from `operations`; the rest
+    of the class is written by hand.
     """
 
-    def __init__(self, api_client=None) -> None:
-        if api_client is None:
-            api_client = ApiClient.get_default()
-        self.api_client = api_client
-
-
-    @validate_call
-    def workflows_participate_in_exchange(
-        self,
-        local_workflow_id: Optional[StrictStr],
-        local_exchange_id: Optional[StrictStr],
-        workflows_participate_in_exchange_request: WorkflowsParticipateInExchangeRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> WorkflowsParticipateInExchange200Response:
-        """Participate in an Exchange
-
-        VC-API endpoint for participating in credential exchanges. Supports both exchange initiation and credential claiming.
-
-        :param local_workflow_id: (required)
-        :type local_workflow_id: str
-        :param local_exchange_id: (required)
-        :type local_exchange_id: str
-        :param workflows_participate_in_exchange_request: (required)
-        :type workflows_participate_in_exchange_request: WorkflowsParticipateInExchangeRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._workflows_participate_in_exchange_serialize(
-            local_workflow_id=local_workflow_id,
-            local_exchange_id=local_exchange_id,
-            workflows_participate_in_exchange_request=workflows_participate_in_exchange_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "WorkflowsParticipateInExchange200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-
-    @validate_call
-    def workflows_participate_in_exchange_with_http_info(
-        self,
-        local_workflow_id: Optional[StrictStr],
-        local_exchange_id: Optional[StrictStr],
-        workflows_participate_in_exchange_request: WorkflowsParticipateInExchangeRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[WorkflowsParticipateInExchange200Response]:
-        """Participate in an Exchange
-
-        VC-API endpoint for participating in credential exchanges. Supports both exchange initiation and credential claiming.
-
-        :param local_workflow_id: (required)
-        :type local_workflow_id: str
-        :param local_exchange_id: (required)
-        :type local_exchange_id: str
-        :param workflows_participate_in_exchange_request: (required)
-        :type workflows_participate_in_exchange_request: WorkflowsParticipateInExchangeRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._workflows_participate_in_exchange_serialize(
-            local_workflow_id=local_workflow_id,
-            local_exchange_id=local_exchange_id,
-            workflows_participate_in_exchange_request=workflows_participate_in_exchange_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "WorkflowsParticipateInExchange200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-
-    @validate_call
-    def workflows_participate_in_exchange_without_preload_content(
-        self,
-        local_workflow_id: Optional[StrictStr],
-        local_exchange_id: Optional[StrictStr],
-        workflows_participate_in_exchange_request: WorkflowsParticipateInExchangeRequest,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[
-                Annotated[StrictFloat, Field(gt=0)],
-                Annotated[StrictFloat, Field(gt=0)]
-            ]
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Participate in an Exchange
-
-        VC-API endpoint for participating in credential exchanges. Supports both exchange initiation and credential claiming.
-
-        :param local_workflow_id: (required)
-        :type local_workflow_id: str
-        :param local_exchange_id: (required)
-        :type local_exchange_id: str
-        :param workflows_participate_in_exchange_request: (required)
-        :type workflows_participate_in_exchange_request: WorkflowsParticipateInExchangeRequest
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """ # noqa: E501
-
-        _param = self._workflows_participate_in_exchange_serialize(
-            local_workflow_id=local_workflow_id,
-            local_exchange_id=local_exchange_id,
-            workflows_participate_in_exchange_request=workflows_participate_in_exchange_request,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "WorkflowsParticipateInExchange200Response",
-            '400': "ErrorBADREQUEST",
-            '401': "ErrorUNAUTHORIZED",
-            '403': "ErrorFORBIDDEN",
-            '500': "ErrorINTERNALSERVERERROR",
-        }
-        response_data = self.api_client.call_api(
-            *_param,
-            _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-
-    def _workflows_participate_in_exchange_serialize(
-        self,
-        local_workflow_id,
-        local_exchange_id,
-        workflows_participate_in_exchange_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if local_workflow_id is not None:
-            _path_params['localWorkflowId'] = local_workflow_id
-        if local_exchange_id is not None:
-            _path_params['localExchangeId'] = local_exchange_id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if workflows_participate_in_exchange_request is not None:
-            _body_params = workflows_participate_in_exchange_request
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json'
-                ]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = [
-            'Authorization'
-        ]
-
-        return self.api_client.param_serialize(
+    operations = (
+        Endpoint(
+            name='workflows_participate_in_exchange',
             method='POST',
-            resource_path='/workflows/{localWorkflowId}/exchanges/{localExchangeId}',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
-        )
-
-
+            path='/workflows/{localWorkflowId}/exchanges/{localExchangeId}',
+            summary='Participate in an Exchange',
+            description='VC-API endpoint for participating in credential exchanges. Supports both exchange initiation and credential claiming.',
+            params=(
+                Param('local_workflow_id', Optional[StrictStr], 'path', 'localWorkflowId'),
+                Param('local_exchange_id', Optional[StrictStr], 'path', 'localExchangeId'),
+                Param('workflows_participate_in_exchange_request', WorkflowsParticipateInExchangeRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=WorkflowsParticipateInExchange200Response,
+            response_types_map={
+                '200': "WorkflowsParticipateInExchange200Response",
+                '400': "ErrorBADREQUEST",
+                '401': "ErrorUNAUTHORIZED",
+                '403': "ErrorFORBIDDEN",
+                '500': "ErrorINTERNALSERVERERROR",
+            },
+        ),
+    )
@@ -6,9 +6,6 @@
     API for interacting with LearnCloud Network
 
     The version of the OpenAPI document: 1.0.0
-    Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-    Do not edit the class manually.
 """  # noqa: E501
 
 
@@ -16,21 +13,28 @@ import datetime
 from dateutil.parser import parse
 from enum import Enum
 import decimal
+import functools
 import json
 import mimetypes
 import os
 import re
 import tempfile
+import time
 import uuid
 
 from urllib.parse import quote
-from typing import Tuple, Optional, List, Dict, Union
-from pydantic import SecretStr
+from typing import Any, Iterator, Tuple, Optional, List, Dict, Union, get_args
+from pydantic import BaseModel, SecretStr, TypeAdapter, ValidationError
 
 from openapi_client.configuration import Configuration
 from openapi_client.api_response import ApiResponse, T as ApiResponseT
 import openapi_client.models
-from openapi_client import rest
+from openapi_client import encoding, instrumentation, pools, rest
+from openapi_client.cache import MUTATING_METHODS, replay_response, request_key
+from openapi_client.singleflight import COALESCED_METHODS
+from openapi_client.streaming import DEFAULT_CHUNK_SIZE, JSONArrayStream, stream_path
+from openapi_client.throttle import Throttle
+from openapi_client.tokens import Tokens
 from openapi_client.exceptions import (
     ApiValueError,
     ApiException,
@@ -43,6 +47,60 @@ from openapi_client.exceptions import (
 
 RequestSerialized = Tuple[str, str, Dict[str, str], Optional[str], List[str]]
 
+# steps yielded by `ApiClient._call_steps`, see `ApiClient._perform`
+_ACQUIRE = 'acquire'
+_REQUEST = 'request'
+_READ = 'read'
+_COALESCE = 'coalesce'
+
+JSON_MIME_RE = re.compile(r'^application/(json|[\w!#$&.+\-^_]+\+json)\s*(;|$)', re.IGNORECASE)
+
+
+def _plain_models(annotation, seen) -> bool:
+    """Checks that every model reachable from `annotation` is a plain model.
+
+    anyOf/oneOf models (those with `actual_instance`) pick their branch in
+    `from_dict`, so pydantic alone cannot validate them.
+    """
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        if annotation in seen:
+            return True
+        if 'actual_instance' in annotation.model_fields:
+            return False
+        seen.add(annotation)
+        return all(
+            _plain_models(field.annotation, seen)
+            for field in annotation.model_fields.values()
+        )
+    return all(_plain_models(arg, seen) for arg in get_args(annotation))
+
+
+def _resolve_model_type(klass: str):
+    """Maps a response type string to a typing annotation over model classes."""
+    if klass.startswith('List['):
+        sub_kls = _resolve_model_type(klass[len('List['):-1])
+        return None if sub_kls is None else List[sub_kls]
+    if klass.startswith('Dict['):
+        m = re.match(r'Dict\[([^,]*), (.*)]', klass)
+        sub_kls = _resolve_model_type(m.group(2)) if m else None
+        return None if sub_kls is None else Dict[str, sub_kls]
+    model = getattr(openapi_client.models, klass, None)
+    if isinstance(model, type) and issubclass(model, BaseModel):
+        return model
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def fast_type_adapter(klass: str) -> Optional[TypeAdapter]:
+    """Returns a compiled validator for a response type string, or None if
+    the type cannot be validated in a single pydantic pass.
+    """
+    annotation = _resolve_model_type(klass)
+    if annotation is None or not _plain_models(annotation, set()):
+        return None
+    return TypeAdapter(annotation)
+
+
 class ApiClient:
     """Generic API client for OpenAPI client library builds.
 
@@ -72,6 +130,7 @@ class ApiClient:
         'object': object,
     }
     _pool = None
+    _rest_client_class = rest.RESTClientObject
 
     def __init__(
         self,
@@ -85,7 +144,7 @@ class ApiClient:
             configuration = Configuration.get_default()
         self.configuration = configuration
 
-        self.rest_client = rest.RESTClientObject(configuration)
+        self.rest_client = self._rest_client_class(configuration)
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -93,12 +152,43 @@ class ApiClient:
         # Set default User-Agent.
         self.user_agent = 'OpenAPI-Generator/1.0.0/python'
         self.client_side_validation = configuration.client_side_validation
+        self.fast_deserialization = configuration.fast_deserialization
+        self.fast_serialization = configuration.fast_serialization
+        self.compact_json = configuration.compact_json
+        self._deserializers = {}
+        # opt-in GET response cache, see openapi_client.cache.ResponseCache
+        self.response_cache = None
+        # opt-in request coalescing, see openapi_client.singleflight.SingleFlight
+        self.single_flight = None
+        # opt-in cache of immutable storage_resolve bodies, see
+        # openapi_client.resolve_cache.ResolveCache
+        self.resolve_cache = None
+        # client-side rate limiting and adaptive concurrency, see
+        # openapi_client.throttle.Throttle
+        self.throttle = Throttle.from_configuration(configuration)
+        # start/end callbacks, see openapi_client.instrumentation.Hook
+        self.hooks = []
+        # per-tenant credentials, see openapi_client.tokens.Tokens
+        self.tokens = Tokens.from_configuration(configuration)
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        pass
+        self.close()
+
+    def close(self):
+        """Releases the connection pools of this client.
+
+        Pools shared with other clients (see
+        `Configuration.share_connection_pools`) are closed with the last of
+        them; a client that is garbage collected releases them as well.
+        """
+        self.rest_client.close()
+
+    def pool_stats(self) -> pools.PoolStats:
+        """Returns the connection counts of this client's pool manager."""
+        return self.rest_client.stats()
 
     @property
     def user_agent(self):
@@ -151,7 +241,9 @@ class ApiClient:
         files=None, auth_settings=None,
         collection_formats=None,
         _host=None,
-        _request_auth=None
+        _request_auth=None,
+        _operation_id=None,
+        _raw=False
     ) -> RequestSerialized:
 
         """Builds the HTTP request params needed by the request.
@@ -172,11 +264,17 @@ class ApiClient:
         :param _request_auth: set to override the auth_settings for an a single
                               request; this effectively ignores the authentication
                               in the spec for a single request.
+        :param _operation_id: operation being serialized, e.g. `boost_send`,
+                              as reported to `hooks`.
+        :param _raw: whether the response is handed over unread
+                     (`<operation>_without_preload_content`).
         :return: tuple of form (path, http_method, query_params, header_params,
             body, post_params, files)
         """
 
+        start = time.perf_counter() if self.hooks else None
         config = self.configuration
+        resource_template = resource_path
 
         # header parameters
         header_params = header_params or {}
@@ -227,7 +325,10 @@ class ApiClient:
 
         # body
         if body:
-            body = self.sanitize_for_serialization(body)
+            if self.fast_serialization and isinstance(body, BaseModel):
+                body = encoding.encode(body, compact=self.compact_json)
+            else:
+                body = self.sanitize_for_serialization(body)
 
         # request url
         if _host is None or self.configuration.ignore_operation_servers:
@@ -236,6 +337,13 @@ class ApiClient:
             # use server/host defined in path or operation instead
             url = _host + resource_path
 
+        if self.response_cache is not None:
+            self.response_cache.register(
+                url, resource_template, [v for _, v in path_params or ()]
+            )
+        if self.throttle is not None:
+            self.throttle.register(url, resource_template)
+
         # query parameters
         if query_params:
             query_params = self.sanitize_for_serialization(query_params)
@@ -245,6 +353,11 @@ class ApiClient:
             )
             url += "?" + url_query
 
+        if start is not None:
+            instrumentation.begin(
+                method, resource_template, url, start, _operation_id, _raw
+            )
+
         return method, url, header_params, body, post_params
 
 
@@ -269,9 +382,82 @@ class ApiClient:
         :return: RESTResponse
         """
 
+        return self._drive(self._call_steps(
+            method, url, header_params, body, post_params, _request_timeout
+        ))
+
+    def _drive(self, steps):
+        """Runs `steps` to completion, performing each step as it is yielded."""
+        result = error = None
+        while True:
+            try:
+                step = steps.send(result) if error is None else steps.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            try:
+                result, error = self._perform(*step), None
+            except BaseException as e:
+                result, error = None, e
+
+    def _perform(self, kind, *args):
+        """Performs one step of `_call_steps` with this client's transport."""
+        if kind is _REQUEST:
+            method, url, kwargs = args
+            return self.rest_client.request(method, url, **kwargs)
+        if kind is _READ:
+            return args[0].read()
+        if kind is _ACQUIRE:
+            throttle, url = args
+            return throttle.acquire(url)
+        flight, key, fetch = args
+        return flight.do(key, lambda: self._drive(fetch()))
+
+    def _replay(self, response, data):
+        """Wraps a stored or shared response in this client's response type."""
+        return rest.RESTResponse(response)
+
+    def _call_steps(self, method, url, header_params, body, post_params, _request_timeout):
+        """`call_api` as a generator of the transport steps it takes.
+
+        The cache, coalescing, throttling and retry policies are decided
+        here for both clients; the steps they yield (`_ACQUIRE` a throttle
+        permit, `_REQUEST`, `_READ` a body, `_COALESCE` a fetch) are carried
+        out by `_perform`, which `AsyncApiClient` overrides to await them.
+        """
+        if not self.hooks:
+            return (yield from self.__call(
+                method, url, header_params, body, post_params, _request_timeout
+            ))
+
+        # times `call_api` and hands the operation on to the response
+        operation = instrumentation.adopt(self.hooks, method, url, body)
+        operation.mark()
+        try:
+            response_data = yield from self.__call(
+                method, url, header_params, body, post_params, _request_timeout
+            )
+        except BaseException as e:
+            operation.lap('network')
+            instrumentation.finish(self.hooks, operation, e)
+            raise
+        operation.lap('network')
+        operation.status = response_data.status
+        response_data.operation = operation
+        if operation.raw:
+            instrumentation.finish(self.hooks, operation)
+        return response_data
+
+    def __call(self, method, url, header_params, body, post_params, _request_timeout):
+        cache = self.response_cache
+        flight = self.single_flight
+        if flight is not None and method in COALESCED_METHODS and not body and not post_params:
+            return (yield from self.__call_coalesced(flight, method, url, header_params, _request_timeout))
+        if cache is not None and method == 'GET' and not body and not post_params:
+            return (yield from self.__call_cached(cache, url, header_params, _request_timeout))
+
         try:
             # perform request and return response
-            response_data = self.rest_client.request(
+            response_data = yield from self.__request(
                 method, url,
                 headers=header_params,
                 body=body, post_params=post_params,
@@ -280,9 +466,84 @@ class ApiClient:
 
         except ApiException as e:
             raise e
+        finally:
+            if cache is not None and method in MUTATING_METHODS:
+                cache.invalidate(url, body)
 
         return response_data
 
+    def __request(self, method, url, **kwargs):
+        """Sends a request, once more with a fresh token after a 401."""
+        response_data = yield from self.__send(method, url, **kwargs)
+        if response_data.status == 401 and self.tokens is not None and not kwargs.get('post_params'):
+            headers = self.tokens.renewed(kwargs.get('headers'))
+            if headers is not None:
+                # returns the connection to the pool
+                yield _READ, response_data
+                kwargs['headers'] = headers
+                response_data = yield from self.__send(method, url, **kwargs)
+        return response_data
+
+    def __send(self, method, url, **kwargs):
+        """Sends a request through `throttle`, if any."""
+        throttle = self.throttle
+        if throttle is None:
+            return (yield _REQUEST, method, url, kwargs)
+        permit = yield _ACQUIRE, throttle, url
+        response_data = None
+        try:
+            response_data = yield _REQUEST, method, url, kwargs
+        finally:
+            permit.release(response_data)
+        return response_data
+
+    def __call_coalesced(self, flight, method, url, header_params, _request_timeout):
+        """Shares one response among identical concurrent requests.
+
+        The body is read once and replayed to every caller.
+        """
+        cache = self.response_cache
+
+        def fetch():
+            if cache is not None and method == 'GET':
+                response_data = yield from self.__call_cached(cache, url, header_params, _request_timeout)
+            else:
+                response_data = yield from self.__request(
+                    method, url,
+                    headers=header_params,
+                    _request_timeout=_request_timeout
+                )
+            data = yield _READ, response_data
+            return response_data.status, response_data.reason, response_data.headers, data
+
+        response = yield _COALESCE, flight, request_key(method, url, header_params), fetch
+        return self._replay(replay_response(*response), response[3])
+
+    def __call_cached(self, cache, url, header_params, _request_timeout):
+        """Serves a GET request through `response_cache`.
+
+        Stored bodies are replayed as an already read response, so the
+        transport is not involved at all on a fresh hit.
+        """
+        lookup = cache.lookup('GET', url, header_params)
+        if lookup.fresh:
+            return self._replay(cache.response(lookup.entry), lookup.entry.data)
+        response_data = yield from self.__request(
+            'GET', url,
+            headers=lookup.headers,
+            _request_timeout=_request_timeout
+        )
+        if response_data.status == 200 or (response_data.status == 304 and lookup.entry):
+            entry = cache.store(
+                lookup,
+                response_data.status,
+                response_data.reason,
+                response_data.headers,
+                (yield _READ, response_data),
+            )
+            response_data = self._replay(cache.response(entry), entry.data)
+        return response_data
+
     def response_deserialize(
         self,
         response_data: rest.RESTResponse,
@@ -297,6 +558,21 @@ class ApiClient:
         msg = "RESTResponse.read() must be called before passing it to response_deserialize()"
         assert response_data.data is not None, msg
 
+        operation = getattr(response_data, 'operation', None)
+        if operation is None:
+            return self.__response_deserialize(response_data, response_types_map, None)
+        operation.mark()
+        try:
+            return self.__response_deserialize(response_data, response_types_map, operation)
+        except BaseException as e:
+            instrumentation.finish(self.hooks, operation, e)
+            raise
+        finally:
+            instrumentation.finish(self.hooks, operation)
+
+    def __response_deserialize(self, response_data, response_types_map, operation):
+        """`response_deserialize`, timing each phase into `operation` if given."""
+
         response_type = response_types_map.get(str(response_data.status), None)
         if not response_type and isinstance(response_data.status, int) and 100 <= response_data.status <= 599:
             # if not found, look for '1XX', '2XX', etc.
@@ -316,8 +592,25 @@ class ApiClient:
                 if content_type is not None:
                     match = re.search(r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type)
                 encoding = match.group(1) if match else "utf-8"
-                response_text = response_data.data.decode(encoding)
-                return_data = self.deserialize(response_text, response_type, content_type)
+                if (
+                    self.fast_deserialization
+                    and 200 <= response_data.status <= 299
+                    and encoding.lower() in ('utf-8', 'utf8')
+                    and (content_type is None or JSON_MIME_RE.match(content_type))
+                ):
+                    return_data = self.__fast_deserialize(response_data.data, response_type)
+                    if operation is not None:
+                        operation.lap('deserialize')
+                if return_data is None:
+                    response_text = response_data.data.decode(encoding)
+                    if operation is None:
+                        return_data = self.deserialize(response_text, response_type, content_type)
+                    else:
+                        operation.lap('decode')
+                        data = self.__load(response_text, content_type)
+                        operation.lap('parse')
+                        return_data = self.__deserialize(data, response_type)
+                        operation.lap('deserialize')
         finally:
             if not 200 <= response_data.status <= 299:
                 raise ApiException.from_response(
@@ -333,6 +626,77 @@ class ApiClient:
             raw_data = response_data.data
         )
 
+    def stream_deserialize(
+        self,
+        response_data: rest.RESTResponse,
+        response_types_map: Optional[Dict[str, ApiResponseT]]=None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[Any]:
+        """Deserializes a list response one element at a time.
+
+        The body is read from the connection in `chunk_size` pieces and
+        decoded incrementally, so memory stays proportional to one element
+        instead of the whole list. Error responses are read and raised right
+        away, as by `response_deserialize`.
+
+        :param response_data: RESTResponse whose body has not been read.
+        :param response_types_map: dict of response types.
+        :param chunk_size: bytes read from the connection at a time.
+        :return: iterator over the deserialized elements.
+        """
+        if not 200 <= response_data.status <= 299:
+            response_data.read()
+            self.response_deserialize(response_data, response_types_map)
+        stream, deserialize = self._stream_decoder(response_data, response_types_map)
+        return self.__stream(response_data, stream, deserialize, chunk_size)
+
+    def _stream_decoder(self, response_data, response_types_map):
+        """Returns the JSONArrayStream and element deserializer of a list response."""
+        response_type = response_types_map.get(str(response_data.status), None)
+        if not response_type:
+            response_type = response_types_map.get(str(response_data.status)[0] + "XX", None)
+        path, item_type = stream_path(response_type)
+        deserialize = self.__deserializer(item_type)
+
+        def element(data):
+            # like the List deserializer, null elements are not converted
+            return None if data is None else deserialize(data)
+
+        return JSONArrayStream(path), element
+
+    def __stream(self, response_data, stream, deserialize, chunk_size):
+        response = response_data.response
+        operation = getattr(response_data, 'operation', None)
+        if response_data.data is not None:
+            chunks = [response_data.data]
+        else:
+            chunks = response.stream(chunk_size, decode_content=True)
+        complete = False
+        try:
+            for chunk in chunks:
+                if operation is not None:
+                    operation.bytes_in += len(chunk)
+                for element in stream.feed(chunk):
+                    yield deserialize(element)
+                if stream.done:
+                    break
+            for element in stream.close():
+                yield deserialize(element)
+            complete = True
+        except Exception as e:
+            if operation is not None:
+                instrumentation.finish(self.hooks, operation, e)
+            raise
+        finally:
+            # a partially read body leaves the connection unusable
+            if complete:
+                response.drain_conn()
+                response.release_conn()
+            else:
+                response.close()
+            if operation is not None:
+                instrumentation.finish(self.hooks, operation)
+
     def sanitize_for_serialization(self, obj):
         """Builds a JSON POST object.
 
@@ -405,13 +769,16 @@ class ApiClient:
         :return: deserialized object.
         """
 
-        # fetch data from response object
+        return self.__deserialize(self.__load(response_text, content_type), response_type)
+
+    def __load(self, response_text: str, content_type: Optional[str]):
+        """Parses a response body according to its content type."""
         if content_type is None:
             try:
                 data = json.loads(response_text)
             except ValueError:
                 data = response_text
-        elif re.match(r'^application/(json|[\w!#$&.+\-^_]+\+json)\s*(;|$)', content_type, re.IGNORECASE):
+        elif JSON_MIME_RE.match(content_type):
             if response_text == "":
                 data = ""
             else:
@@ -423,8 +790,7 @@ class ApiClient:
                 status=0,
                 reason="Unsupported content type: {0}".format(content_type)
             )
-
-        return self.__deserialize(data, response_type)
+        return data
 
     def __deserialize(self, data, klass):
         """Deserializes dict, list, str into an object.
@@ -437,41 +803,72 @@ class ApiClient:
         if data is None:
             return None
 
+        return self.__deserializer(klass)(data)
+
+    def __deserializer(self, klass):
+        """Returns the deserializer of a type, compiling it on first use.
+
+        Type strings such as `List[BoostGetBoosts200ResponseInner]` are parsed
+        and their classes looked up once per client, so list and dict
+        responses do not repeat the parsing for every element.
+
+        :param klass: class literal, or string of class name.
+        :return: callable taking the decoded (non-None) data.
+        """
+        try:
+            return self._deserializers[klass]
+        except KeyError:
+            pass
+
         if isinstance(klass, str):
             if klass.startswith('List['):
                 m = re.match(r'List\[(.*)]', klass)
                 assert m is not None, "Malformed List type definition"
-                sub_kls = m.group(1)
-                return [self.__deserialize(sub_data, sub_kls)
-                        for sub_data in data]
+                sub_deserializer = self.__deserializer(m.group(1))
+
+                def deserializer(data):
+                    return [None if sub_data is None else sub_deserializer(sub_data)
+                            for sub_data in data]
+
+                self._deserializers[klass] = deserializer
+                return deserializer
 
             if klass.startswith('Dict['):
                 m = re.match(r'Dict\[([^,]*), (.*)]', klass)
                 assert m is not None, "Malformed Dict type definition"
-                sub_kls = m.group(2)
-                return {k: self.__deserialize(v, sub_kls)
-                        for k, v in data.items()}
+                sub_deserializer = self.__deserializer(m.group(2))
+
+                def deserializer(data):
+                    return {k: None if v is None else sub_deserializer(v)
+                            for k, v in data.items()}
+
+                self._deserializers[klass] = deserializer
+                return deserializer
 
             # convert str to class
             if klass in self.NATIVE_TYPES_MAPPING:
-                klass = self.NATIVE_TYPES_MAPPING[klass]
+                resolved = self.NATIVE_TYPES_MAPPING[klass]
             else:
-                klass = getattr(openapi_client.models, klass)
-
-        if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
-        elif klass is object:
-            return self.__deserialize_object(data)
-        elif klass is datetime.date:
-            return self.__deserialize_date(data)
-        elif klass is datetime.datetime:
-            return self.__deserialize_datetime(data)
-        elif klass is decimal.Decimal:
-            return decimal.Decimal(data)
-        elif issubclass(klass, Enum):
-            return self.__deserialize_enum(data, klass)
+                resolved = getattr(openapi_client.models, klass)
         else:
-            return self.__deserialize_model(data, klass)
+            resolved = klass
+
+        if resolved in self.PRIMITIVE_TYPES:
+            deserializer = functools.partial(self.__deserialize_primitive, klass=resolved)
+        elif resolved is object:
+            deserializer = self.__deserialize_object
+        elif resolved is datetime.date:
+            deserializer = self.__deserialize_date
+        elif resolved is datetime.datetime:
+            deserializer = self.__deserialize_datetime
+        elif resolved is decimal.Decimal:
+            deserializer = decimal.Decimal
+        elif issubclass(resolved, Enum):
+            deserializer = functools.partial(self.__deserialize_enum, klass=resolved)
+        else:
+            deserializer = functools.partial(self.__deserialize_model, klass=resolved)
+        self._deserializers[klass] = deserializer
+        return deserializer
 
     def parameters_to_tuples(self, params, collection_formats):
         """Get parameters as list of tuples, formatting collections.
@@ -627,7 +1024,8 @@ class ApiClient:
         :body: A object representing the body of the HTTP request.
         The object type is the return value of sanitize_for_serialization().
         :param request_auth: if set, the provided settings will
-                             override the token in the configuration.
+                             override the token in the configuration
+                             and the token provider.
         """
         if not auth_settings:
             return
@@ -642,8 +1040,12 @@ class ApiClient:
                 request_auth
             )
         else:
+            if self.tokens is not None:
+                settings = self.tokens.auth_settings()
+            else:
+                settings = self.configuration.auth_settings()
             for auth in auth_settings:
-                auth_setting = self.configuration.auth_settings().get(auth)
+                auth_setting = settings.get(auth)
                 if auth_setting:
                     self._apply_auth_params(
                         headers,
@@ -793,6 +1195,21 @@ class ApiClient:
                 )
             )
 
+    def __fast_deserialize(self, data: bytes, klass: str):
+        """Validates a JSON response body in a single pydantic pass.
+
+        :param data: raw response body.
+        :param klass: response type string, e.g. `List[BoostGetBoosts200ResponseInner]`.
+        :return: deserialized object, or None if the regular path must be used.
+        """
+        adapter = fast_type_adapter(klass)
+        if adapter is None:
+            return None
+        try:
+            return adapter.validate_json(data)
+        except ValidationError:
+            return None
+
     def __deserialize_model(self, data, klass):
         """Deserializes list or dict to model.
 
@@ -0,0 +1,204 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import functools
+
+from openapi_client.api import (
+    ActivityApi,
+    AppStoreApi,
+    AppStoreAdminApi,
+    AuthGrantsApi,
+    BoostsApi,
+    ClaimHooksApi,
+    ContactMethodsApi,
+    ContractsApi,
+    CredentialsApi,
+    DIDMetadataApi,
+    IntegrationsApi,
+    PresentationsApi,
+    ProfileManagersApi,
+    ProfilesApi,
+    SendApi,
+    SkillsApi,
+    StorageApi,
+    UniversalInboxApi,
+    UtilitiesApi,
+    VCAPIApi,
+    WorkflowsApi,
+)
+from openapi_client import instrumentation
+from openapi_client.async_api_client import AsyncApiClient
+from openapi_client.pagination import aiter_records
+from openapi_client.prepared import iter_operations, send_request
+from openapi_client.streaming import DEFAULT_CHUNK_SIZE, astream_records
+
+
+class AsyncApi:
+    """Base class of the asyncio API classes.
+
+    Each operation of the wrapped generated API class is exposed as a
+    coroutine with the same name and signature. Arguments are validated and
+    serialized by the generated `_<operation>_serialize` method and the
+    response goes through `ApiClient.response_deserialize`, so the async and
+    sync clients behave identically apart from the transport.
+    """
+
+    sync_api_class = None
+
+    def __init__(self, api_client=None) -> None:
+        if api_client is None:
+            api_client = AsyncApiClient.get_default()
+        self.api_client = api_client
+        self._sync_api = self.sync_api_class(api_client)
+
+    async def _send(self, operation, args, kwargs):
+        prepared, response_data = send_request(self._sync_api, operation, *args, **kwargs)
+        return prepared, await response_data
+
+
+def _async_operation(operation, sync_method):
+
+    @functools.wraps(sync_method)
+    async def call(self, *args, **kwargs):
+        prepared, response_data = await self._send(operation, args, kwargs)
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=prepared.response_types_map,
+        ).data
+
+    return call
+
+
+def _async_operation_with_http_info(operation, sync_method):
+
+    @functools.wraps(sync_method)
+    async def call(self, *args, **kwargs):
+        prepared, response_data = await self._send(operation, args, kwargs)
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=prepared.response_types_map,
+        )
+
+    return call
+
+
+def _async_operation_without_preload_content(operation, sync_method):
+
+    @functools.wraps(sync_method)
+    async def call(self, *args, **kwargs):
+        _, response_data = await self._send(operation, args, kwargs)
+        if response_data.operation is not None:
+            instrumentation.finish(self.api_client.hooks, response_data.operation)
+        return response_data.response
+
+    return call
+
+
+def _async_iter_operation(operation, sync_iter_method):
+
+    @functools.wraps(sync_iter_method)
+    def call(self, *args, page_size=None, max_records=None, prefetch=True, **kwargs):
+        return aiter_records(
+            getattr(self, operation),
+            *args,
+            page_size=page_size,
+            max_records=max_records,
+            prefetch=prefetch,
+            **kwargs
+        )
+
+    call.__name__ = call.__qualname__ = 'aiter_' + operation
+    return call
+
+
+def _async_stream_operation(operation, sync_stream_method):
+
+    @functools.wraps(sync_stream_method)
+    def call(self, *args, chunk_size=DEFAULT_CHUNK_SIZE, **kwargs):
+        return astream_records(self, operation, *args, chunk_size=chunk_size, **kwargs)
+
+    call.__name__ = call.__qualname__ = 'astream_' + operation
+    return call
+
+
+def _async_prepare_operation(operation, sync_prepare_method):
+
+    @functools.wraps(sync_prepare_method)
+    def call(self, *args, **kwargs):
+        return getattr(self._sync_api, 'prepare_' + operation)(*args, **kwargs)
+
+    return call
+
+
+def async_api_class(sync_api_class):
+    """Builds the asyncio variant of a generated API class."""
+    namespace = {
+        'sync_api_class': sync_api_class,
+        '__doc__': 'asyncio variant of :class:`%s`.' % sync_api_class.__name__,
+        '__module__': __name__,
+    }
+    for operation in iter_operations(sync_api_class):
+        namespace[operation] = _async_operation(
+            operation,
+            getattr(sync_api_class, operation)
+        )
+        namespace[operation + '_with_http_info'] = _async_operation_with_http_info(
+            operation,
+            getattr(sync_api_class, operation + '_with_http_info')
+        )
+        namespace[operation + '_without_preload_content'] = _async_operation_without_preload_content(
+            operation,
+            getattr(sync_api_class, operation + '_without_preload_content')
+        )
+        # paginated operations get `aiter_<operation>` next to `iter_<operation>`
+        if hasattr(sync_api_class, 'iter_' + operation):
+            namespace['aiter_' + operation] = _async_iter_operation(
+                operation,
+                getattr(sync_api_class, 'iter_' + operation)
+            )
+        # list operations get `astream_<operation>` next to `stream_<operation>`
+        if hasattr(sync_api_class, 'stream_' + operation):
+            namespace['astream_' + operation] = _async_stream_operation(
+                operation,
+                getattr(sync_api_class, 'stream_' + operation)
+            )
+        # templated operations get `prepare_<operation>`, sent with `asend`
+        if hasattr(sync_api_class, 'prepare_' + operation):
+            namespace['prepare_' + operation] = _async_prepare_operation(
+                operation,
+                getattr(sync_api_class, 'prepare_' + operation)
+            )
+    return type('Async' + sync_api_class.__name__, (AsyncApi,), namespace)
+
+
+AsyncActivityApi = async_api_class(ActivityApi)
+AsyncAppStoreApi = async_api_class(AppStoreApi)
+AsyncAppStoreAdminApi = async_api_class(AppStoreAdminApi)
+AsyncAuthGrantsApi = async_api_class(AuthGrantsApi)
+AsyncBoostsApi = async_api_class(BoostsApi)
+AsyncClaimHooksApi = async_api_class(ClaimHooksApi)
+AsyncContactMethodsApi = async_api_class(ContactMethodsApi)
+AsyncContractsApi = async_api_class(ContractsApi)
+AsyncCredentialsApi = async_api_class(CredentialsApi)
+AsyncDIDMetadataApi = async_api_class(DIDMetadataApi)
+AsyncIntegrationsApi = async_api_class(IntegrationsApi)
+AsyncPresentationsApi = async_api_class(PresentationsApi)
+AsyncProfileManagersApi = async_api_class(ProfileManagersApi)
+AsyncProfilesApi = async_api_class(ProfilesApi)
+AsyncSendApi = async_api_class(SendApi)
+AsyncSkillsApi = async_api_class(SkillsApi)
+AsyncStorageApi = async_api_class(StorageApi)
+AsyncUniversalInboxApi = async_api_class(UniversalInboxApi)
+AsyncUtilitiesApi = async_api_class(UtilitiesApi)
+AsyncVCAPIApi = async_api_class(VCAPIApi)
+AsyncWorkflowsApi = async_api_class(WorkflowsApi)
@@ -0,0 +1,161 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+from typing import Any, AsyncIterator
+
+from openapi_client.api_client import _ACQUIRE, _READ, _REQUEST, ApiClient
+from openapi_client import async_rest, instrumentation
+from openapi_client.streaming import DEFAULT_CHUNK_SIZE
+
+
+class AsyncApiClient(ApiClient):
+    """asyncio flavour of :class:`ApiClient`.
+
+    Request serialization, response deserialization and the cache,
+    coalescing, throttling and retry policies of `call_api` are inherited
+    from `ApiClient` unchanged; only the transport is replaced by an aiohttp
+    session with its own connection pool, sized by
+    `Configuration.connection_pool_maxsize`, whose steps are awaited.
+
+    :param configuration: .Configuration object for this client
+    :param header_name: a header to pass when making calls to the API.
+    :param header_value: a header value to pass when making calls to
+        the API.
+    :param cookie: a cookie to include in the header when making calls
+        to the API
+    """
+
+    _default = None
+    _rest_client_class = async_rest.AsyncRESTClientObject
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # the aiohttp session can only be closed from the event loop
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        await self.rest_client.close()
+
+    @classmethod
+    def get_default(cls):
+        """Return new instance of AsyncApiClient.
+
+        :return: The AsyncApiClient object.
+        """
+        if cls._default is None:
+            cls._default = AsyncApiClient()
+        return cls._default
+
+    async def call_api(
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ) -> async_rest.AsyncRESTResponse:
+        """Makes the HTTP request (asynchronous)
+        :param method: Method to call.
+        :param url: Path to method endpoint.
+        :param header_params: Header parameters to be
+            placed in the request header.
+        :param body: Request body.
+        :param post_params dict: Request post form parameters,
+            for `application/x-www-form-urlencoded`, `multipart/form-data`.
+        :param _request_timeout: timeout setting for this request.
+        :return: AsyncRESTResponse
+        """
+
+        return await self._drive(self._call_steps(
+            method, url, header_params, body, post_params, _request_timeout
+        ))
+
+    async def _drive(self, steps):
+        """asyncio variant of :meth:`ApiClient._drive`."""
+        result = error = None
+        while True:
+            try:
+                step = steps.send(result) if error is None else steps.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            try:
+                result, error = await self._perform(*step), None
+            except BaseException as e:
+                result, error = None, e
+
+    async def _perform(self, kind, *args):
+        """Awaits one step of `_call_steps` with the aiohttp transport."""
+        if kind is _REQUEST:
+            method, url, kwargs = args
+            return await self.rest_client.request(method, url, **kwargs)
+        if kind is _READ:
+            return await args[0].read()
+        if kind is _ACQUIRE:
+            throttle, url = args
+            return await throttle.acquire_async(url)
+        flight, key, fetch = args
+        return await flight.do_async(key, lambda: self._drive(fetch()))
+
+    def _replay(self, response, data):
+        response_data = async_rest.AsyncRESTResponse(response)
+        response_data.data = data
+        return response_data
+
+    async def stream_deserialize(
+        self,
+        response_data: async_rest.AsyncRESTResponse,
+        response_types_map=None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[Any]:
+        """asyncio variant of :meth:`ApiClient.stream_deserialize`.
+
+        Error responses are raised on the first iteration.
+        """
+        if not 200 <= response_data.status <= 299:
+            await response_data.read()
+            self.response_deserialize(response_data, response_types_map)
+        stream, deserialize = self._stream_decoder(response_data, response_types_map)
+        operation = response_data.operation
+        response = response_data.response
+        try:
+            if response_data.data is not None:
+                chunks = _aiter([response_data.data])
+            else:
+                chunks = response.content.iter_chunked(chunk_size)
+            async for chunk in chunks:
+                if operation is not None:
+                    operation.bytes_in += len(chunk)
+                for element in stream.feed(chunk):
+                    yield deserialize(element)
+                if stream.done:
+                    break
+            for element in stream.close():
+                yield deserialize(element)
+        except Exception as e:
+            if operation is not None:
+                instrumentation.finish(self.hooks, operation, e)
+            raise
+        finally:
+            if response_data.data is None:
+                response.release()
+            if operation is not None:
+                instrumentation.finish(self.hooks, operation)
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
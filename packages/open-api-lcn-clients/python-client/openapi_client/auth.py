@@ -0,0 +1,356 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import base64
+import binascii
+import json
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, NamedTuple, Optional, Union
+
+from openapi_client.instrumentation import Histogram
+from openapi_client.tokens import TokenProvider
+
+logger = logging.getLogger('openapi_client')
+
+REFRESH_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Token(NamedTuple):
+    """A bearer token and the `time.time()` it expires at."""
+
+    value: str
+    expires_at: float
+
+
+def jwt_expiry(token: str) -> Optional[float]:
+    """Returns the `exp` claim of a JWT, without verifying it."""
+    parts = token.split('.')
+    if len(parts) != 3:
+        return None
+    payload = parts[1] + '=' * (-len(parts[1]) % 4)
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+    except (binascii.Error, ValueError):
+        return None
+    exp = claims.get('exp') if isinstance(claims, dict) else None
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+
+class ChallengePool:
+    """Challenges of one DID, fetched in batches ahead of their use.
+
+    Once fewer than `low_water` are left, a background fetch of `batch` more
+    is started; `take` only waits for the network when the pool ran dry.
+    At most one fetch is in flight.
+
+    :param fetch: called with an amount, returns that many challenges.
+    :param batch: challenges per fetch (the API hands out at most 100).
+    :param low_water: size below which the pool is refilled.
+    :param executor: runs the fetches; it must not be busy with tasks
+        waiting for challenges.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[int], List[str]],
+        batch: int = 95,
+        low_water: int = 10,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ) -> None:
+        self.fetch = fetch
+        self.batch = batch
+        self.low_water = low_water
+        self.fetched = 0
+        self._executor = executor or ThreadPoolExecutor(max_workers=1)
+        self._lock = threading.Lock()
+        self._challenges: List[str] = []
+        self._refill: Optional[Future] = None
+
+    def take(self) -> str:
+        """Returns an unused challenge."""
+        while True:
+            with self._lock:
+                if self._challenges:
+                    challenge = self._challenges.pop()
+                    if len(self._challenges) < self.low_water:
+                        self._start_refill()
+                    return challenge
+                refill = self._start_refill()
+            # raises the fetch's error, if any
+            refill.result()
+
+    def prefetch(self) -> None:
+        """Starts filling the pool, e.g. while the client is set up."""
+        with self._lock:
+            self._start_refill()
+
+    def _start_refill(self) -> Future:
+        # called with the lock held
+        if self._refill is None:
+            self._refill = self._executor.submit(self._run_refill)
+        return self._refill
+
+    def _run_refill(self) -> None:
+        try:
+            challenges = self.fetch(self.batch)
+            if not challenges:
+                raise ValueError('challenge refill returned no challenges')
+        except BaseException:
+            with self._lock:
+                self._refill = None
+            raise
+        with self._lock:
+            self._challenges.extend(challenges)
+            self.fetched += len(challenges)
+            self._refill = None
+
+    def __len__(self) -> int:
+        return len(self._challenges)
+
+
+class AuthStats(NamedTuple):
+    """Counters of an `AuthManager`.
+
+    :ivar tenants: tenants with a token.
+    :ivar refreshes: tokens signed.
+    :ivar background: of those, signed ahead of expiry off the request path.
+    :ivar blocking: requests that waited for a token to be signed.
+    :ivar failures: refreshes that raised.
+    :ivar rejected: tokens invalidated after a 401.
+    :ivar challenges: challenges fetched.
+    """
+
+    tenants: int
+    refreshes: int
+    background: int
+    blocking: int
+    failures: int
+    rejected: int
+    challenges: int
+
+
+class _State:
+
+    __slots__ = ('lock', 'token', 'refreshing', 'challenges')
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.token: Optional[Token] = None
+        self.refreshing = False
+        self.challenges: Optional[ChallengePool] = None
+
+
+class AuthManager(TokenProvider):
+    """Token provider that signs short-lived DID-auth tokens ahead of time.
+
+    `sign(tenant, challenge)` produces the bearer token of a tenant from an
+    LCN challenge (or, with `challenge` None, the token challenges are
+    requested with), e.g. by signing a DID-auth presentation with the
+    tenant's key. Challenges are fetched from `UtilitiesApi.
+    utilities_get_challenges` in batches per tenant and pooled. A token is
+    re-signed in the background once it is within `refresh_before` seconds
+    of expiring, so requests only wait for signing when a tenant has no
+    valid token at all; `ApiClient` retries a request that got a 401 once
+    with a fresh token (see `invalidate`).
+
+    Set it as `Configuration.token_provider`:
+
+        configuration.token_provider = AuthManager(sign, api_client=ApiClient(configuration))
+
+    :param sign: signs a token for a tenant and challenge; returns a JWT,
+        whose `exp` claim gives its expiry, or a `Token`.
+    :param api_client: client challenges are fetched with; without it
+        (and without `fetch_challenges`) tokens are signed with no challenge.
+    :param fetch_challenges: `(tenant, amount) -> challenges`, instead of
+        `utilities_get_challenges`.
+    :param refresh_before: seconds before expiry a token is re-signed.
+    :param lifetime: seconds a token lasts when its expiry is unknown.
+    :param batch: challenges fetched at once.
+    :param low_water: challenges left when another batch is fetched.
+    :param max_workers: threads signing tokens, and threads fetching
+        challenges.
+    :param refresh_seconds: histogram observing the seconds each refresh
+        took, labelled by `mode` (`background` or `blocking`); e.g. one
+        from `HistogramRegistry.histogram`.
+    """
+
+    def __init__(
+        self,
+        sign: Callable[[Optional[Hashable], Optional[str]], Union[str, Token]],
+        api_client: Any = None,
+        fetch_challenges: Optional[Callable[[Optional[Hashable], int], List[str]]] = None,
+        refresh_before: float = 30.0,
+        lifetime: float = 300.0,
+        batch: int = 95,
+        low_water: int = 10,
+        max_workers: int = 4,
+        refresh_seconds: Optional[Any] = None,
+    ) -> None:
+        self.sign = sign
+        if fetch_challenges is None and api_client is not None:
+            fetch_challenges = self._challenges_from(api_client)
+        self.fetch_challenges = fetch_challenges
+        self.refresh_before = refresh_before
+        self.lifetime = lifetime
+        self.batch = batch
+        self.low_water = low_water
+        if refresh_seconds is None:
+            refresh_seconds = Histogram(
+                'lcn_client_token_refresh_seconds', 'LCN token refresh duration', ('mode',), REFRESH_BUCKETS,
+            )
+        self.refresh_seconds = refresh_seconds
+        # separate pools, so refreshes waiting for challenges cannot starve
+        # the fetches they wait for
+        self._signer = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='openapi_client.auth')
+        self._fetcher = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='openapi_client.challenges')
+        self._lock = threading.Lock()
+        self._states: Dict[Optional[Hashable], _State] = {}
+        self._refreshes = self._background = self._blocking = self._failures = self._rejected = 0
+
+    def _challenges_from(self, api_client: Any) -> Callable[[Optional[Hashable], int], List[str]]:
+        from openapi_client.api.utilities_api import UtilitiesApi
+
+        api = UtilitiesApi(api_client)
+
+        def fetch(tenant: Optional[Hashable], amount: int) -> List[str]:
+            # the challenges are requested with a token signed without one
+            token = self._signed(tenant, None).value
+            return api.utilities_get_challenges(amount, _request_auth={
+                'type': 'bearer',
+                'in': 'header',
+                'key': 'Authorization',
+                'value': 'Bearer ' + token,
+            })
+        return fetch
+
+    def _state(self, tenant: Optional[Hashable]) -> _State:
+        state = self._states.get(tenant)
+        if state is None:
+            with self._lock:
+                state = self._states.setdefault(tenant, _State())
+        return state
+
+    def token(self, tenant: Optional[Hashable]) -> Optional[str]:
+        state = self._state(tenant)
+        current = state.token
+        if current is not None:
+            remaining = current.expires_at - time.time()
+            if remaining > self.refresh_before:
+                return current.value
+            if remaining > 0:
+                self._refresh_in_background(tenant, state)
+                return current.value
+        with state.lock:
+            current = state.token
+            if current is None or current.expires_at <= time.time():
+                self._count('_blocking')
+                current = self._refresh(tenant, state, 'blocking')
+        return current.value
+
+    def invalidate(self, tenant: Optional[Hashable], token: str) -> None:
+        """Drops `token` after the server rejected it, unless already replaced."""
+        state = self._state(tenant)
+        with state.lock:
+            if state.token is not None and state.token.value == token:
+                state.token = None
+                self._count('_rejected')
+
+    def prefetch(self, tenant: Optional[Hashable]) -> None:
+        """Starts fetching challenges for `tenant` in the background."""
+        challenges = self._challenge_pool(tenant, self._state(tenant))
+        if challenges is not None:
+            challenges.prefetch()
+
+    def stats(self) -> AuthStats:
+        """Returns the current counters."""
+        with self._lock:
+            states = list(self._states.values())
+        return AuthStats(
+            tenants=sum(1 for state in states if state.token is not None),
+            refreshes=self._refreshes,
+            background=self._background,
+            blocking=self._blocking,
+            failures=self._failures,
+            rejected=self._rejected,
+            challenges=sum(state.challenges.fetched for state in states if state.challenges is not None),
+        )
+
+    def close(self) -> None:
+        """Stops the background threads; tokens are signed inline afterwards."""
+        self._signer.shutdown(wait=True)
+        self._fetcher.shutdown(wait=True)
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _challenge_pool(self, tenant: Optional[Hashable], state: _State) -> Optional[ChallengePool]:
+        if self.fetch_challenges is None:
+            return None
+        if state.challenges is None:
+            with self._lock:
+                if state.challenges is None:
+                    fetch = self.fetch_challenges
+                    state.challenges = ChallengePool(
+                        lambda amount: fetch(tenant, amount), self.batch, self.low_water, self._fetcher,
+                    )
+        return state.challenges
+
+    def _signed(self, tenant: Optional[Hashable], challenge: Optional[str]) -> Token:
+        token = self.sign(tenant, challenge)
+        if isinstance(token, Token):
+            return token
+        expires_at = jwt_expiry(token)
+        if expires_at is None:
+            expires_at = time.time() + self.lifetime
+        return Token(token, expires_at)
+
+    def _refresh(self, tenant: Optional[Hashable], state: _State, mode: str) -> Token:
+        # called with state.lock held
+        start = time.perf_counter()
+        try:
+            challenges = self._challenge_pool(tenant, state)
+            token = self._signed(tenant, None if challenges is None else challenges.take())
+        except BaseException:
+            self._count('_failures')
+            raise
+        finally:
+            self.refresh_seconds.labels(mode=mode).observe(time.perf_counter() - start)
+        state.token = token
+        self._count('_refreshes')
+        return token
+
+    def _refresh_in_background(self, tenant: Optional[Hashable], state: _State) -> None:
+        with self._lock:
+            if state.refreshing:
+                return
+            state.refreshing = True
+        try:
+            self._signer.submit(self._background_refresh, tenant, state)
+        except RuntimeError:
+            # closed
+            state.refreshing = False
+
+    def _background_refresh(self, tenant: Optional[Hashable], state: _State) -> None:
+        try:
+            with state.lock:
+                current = state.token
+                if current is None or current.expires_at - time.time() <= self.refresh_before:
+                    self._refresh(tenant, state, 'background')
+                    self._count('_background')
+        except Exception as e:
+            # the next request past expiry retries in the foreground
+            logger.warning('token refresh failed: %s', e)
+        finally:
+            state.refreshing = False
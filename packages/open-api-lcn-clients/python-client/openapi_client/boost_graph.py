@@ -0,0 +1,217 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import contextvars
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from openapi_client.models.boost_get_boost_children_request import BoostGetBoostChildrenRequest
+from openapi_client.models.boost_get_boost_parents_request import BoostGetBoostParentsRequest
+from openapi_client.models.boost_get_paginated_boosts200_response_records_inner import BoostGetPaginatedBoosts200ResponseRecordsInner
+from openapi_client.pagination import iter_pages
+
+Boost = BoostGetPaginatedBoosts200ResponseRecordsInner
+
+
+class BoostGraph:
+    """Parent/child graph of the boosts related to a boost, loaded once.
+
+    The edges are read with `boost_get_boost_children` and
+    `boost_get_boost_parents`, one generation each, `max_workers` requests at
+    a time, starting from `uri`; every boost reached is expanded in turn,
+    until the whole connected graph is loaded or `max_nodes` boosts were
+    expanded. Each boost is expanded once, however many paths lead to it.
+    The multi-generation endpoints (`boost_get_familial_boosts` and the
+    `generations` of the children/parents requests) answer with a flat list
+    of boosts, without the edges between them, so they cannot save any of
+    these requests and are not used.
+
+    Boosts are cached by URI, and the adjacency lists answer `children`,
+    `parents`, `siblings` and the `count_*` methods without a request.
+
+    :param api: a `BoostsApi`.
+    :param uri: the boost to start from.
+    :param page_size: boosts requested per page.
+    :param max_workers: concurrent requests.
+    :param max_nodes: number of boosts whose edges are loaded; None loads
+        the whole graph.
+
+    :ivar nodes: boosts by URI, as returned by the API.
+    :ivar requests: page requests made.
+    :ivar complete: whether every boost reached had its edges loaded.
+    """
+
+    def __init__(
+        self,
+        api: Any,
+        uri: str,
+        page_size: Optional[int] = None,
+        max_workers: int = 4,
+        max_nodes: Optional[int] = None,
+    ) -> None:
+        self.api = api
+        self.uri = uri
+        self.page_size = page_size
+        self.max_workers = max_workers
+        self.max_nodes = max_nodes
+        self.nodes: Dict[str, Boost] = {}
+        self.requests = 0
+        self.complete = False
+        self._lock = threading.Lock()
+        # insertion-ordered sets of URIs
+        self._children: Dict[str, Dict[str, None]] = {}
+        self._parents: Dict[str, Dict[str, None]] = {}
+        self._expanded: Set[str] = set()
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._known())
+
+    def __contains__(self, uri: str) -> bool:
+        return uri in self.nodes or uri in self._children or uri in self._parents
+
+    def node(self, uri: str) -> Optional[Boost]:
+        """Returns a cached boost; None for `uri` when no request returned it."""
+        return self.nodes.get(uri)
+
+    def children(self, uri: str) -> List[str]:
+        """URIs of the child boosts of `uri`."""
+        return list(self._children.get(uri, ()))
+
+    def parents(self, uri: str) -> List[str]:
+        """URIs of the parent boosts of `uri`."""
+        return list(self._parents.get(uri, ()))
+
+    def siblings(self, uri: str) -> List[str]:
+        """URIs of the boosts sharing a parent with `uri`."""
+        siblings: Dict[str, None] = {}
+        for parent in self._parents.get(uri, ()):
+            siblings.update(self._children[parent])
+        siblings.pop(uri, None)
+        return list(siblings)
+
+    def descendants(self, uri: str, generations: Optional[int] = None) -> List[str]:
+        """URIs of the boosts below `uri`, nearest first."""
+        return self._reach(uri, self._children, generations)
+
+    def ancestors(self, uri: str, generations: Optional[int] = None) -> List[str]:
+        """URIs of the boosts above `uri`, nearest first."""
+        return self._reach(uri, self._parents, generations)
+
+    def count_children(self, uri: str, generations: int = 1) -> int:
+        """Like `boost_count_boost_children`, from the loaded graph."""
+        return len(self.descendants(uri, generations))
+
+    def count_parents(self, uri: str, generations: int = 1) -> int:
+        """Like `boost_count_boost_parents`, from the loaded graph."""
+        return len(self.ancestors(uri, generations))
+
+    def count_siblings(self, uri: str) -> int:
+        """Like `boost_count_boost_siblings`, from the loaded graph."""
+        return len(self.siblings(uri))
+
+    def count_familial(self, uri: str, parent_generations: int = 1, child_generations: int = 1) -> int:
+        """Like `boost_count_familial_boosts` (without extended family), from the loaded graph."""
+        family = dict.fromkeys(self.ancestors(uri, parent_generations))
+        family.update(dict.fromkeys(self.siblings(uri)))
+        family.update(dict.fromkeys(self.descendants(uri, child_generations)))
+        family.pop(uri, None)
+        return len(family)
+
+    def adjacency(self) -> Dict[str, List[str]]:
+        """Child URIs of every boost with children."""
+        return {uri: list(children) for uri, children in self._children.items() if children}
+
+    @property
+    def edges(self) -> int:
+        """Number of parent/child pairs."""
+        return sum(len(children) for children in self._children.values())
+
+    def _known(self) -> Set[str]:
+        return set(self.nodes) | set(self._children) | set(self._parents)
+
+    def _reach(self, uri: str, edges: Dict[str, Dict[str, None]], generations: Optional[int]) -> List[str]:
+        seen = {uri: None}
+        level = [uri]
+        depth = 0
+        while level and (generations is None or depth < generations):
+            following = []
+            for current in level:
+                for other in edges.get(current, ()):
+                    if other not in seen:
+                        seen[other] = None
+                        following.append(other)
+            level = following
+            depth += 1
+        del seen[uri]
+        return list(seen)
+
+    def _load(self) -> None:
+        pending: Dict[Future, Tuple[str, str]] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+
+            def expand(uri: str) -> None:
+                if uri in self._expanded:
+                    return
+                if self.max_nodes is not None and len(self._expanded) >= self.max_nodes:
+                    return
+                self._expanded.add(uri)
+                self._children.setdefault(uri, {})
+                self._parents.setdefault(uri, {})
+                children = BoostGetBoostChildrenRequest(uri=uri)
+                parents = BoostGetBoostParentsRequest(uri=uri)
+                for kind, operation, request in (
+                    ('children', self.api.boost_get_boost_children, children),
+                    ('parents', self.api.boost_get_boost_parents, parents),
+                ):
+                    future = executor.submit(contextvars.copy_context().run, self._fetch, operation, request)
+                    pending[future] = (kind, uri)
+
+            try:
+                expand(self.uri)
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        kind, uri = pending.pop(future)
+                        for record in future.result():
+                            if record.uri is None:
+                                continue
+                            self._add(record)
+                            if kind == 'children':
+                                self._link(uri, record.uri)
+                            else:
+                                self._link(record.uri, uri)
+                            expand(record.uri)
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+        self.complete = self._known() <= self._expanded
+
+    def _fetch(self, operation: Any, request: Any) -> List[Boost]:
+        records: List[Boost] = []
+        for page in iter_pages(operation, request, page_size=self.page_size, prefetch=False):
+            with self._lock:
+                self.requests += 1
+            records.extend(page.records)
+        return records
+
+    def _add(self, record: Boost) -> None:
+        # the graph is only modified from the loading thread
+        if record.uri is not None:
+            self.nodes.setdefault(record.uri, record)
+
+    def _link(self, parent: str, child: str) -> None:
+        self._children.setdefault(parent, {})[child] = None
+        self._children.setdefault(child, {})
+        self._parents.setdefault(child, {})[parent] = None
+        self._parents.setdefault(parent, {})
@@ -0,0 +1,234 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import contextvars
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional, Set
+
+import urllib3
+
+from openapi_client.exceptions import ApiException
+from openapi_client.throttle import parse_retry_after
+
+RETRYABLE_STATUSES = frozenset({429, 503})
+# connection failures, dropped connections and timeouts raised by urllib3
+# (MaxRetryError, ProtocolError, TimeoutError, ...) instead of a response
+TRANSPORT_ERRORS = (urllib3.exceptions.HTTPError,)
+# transport errors raised before the request was sent (NewConnectionError,
+# NameResolutionError and ConnectTimeoutError), safe to retry for any method
+CONNECT_ERRORS = (urllib3.exceptions.ConnectTimeoutError,)
+
+
+class BulkResult(NamedTuple):
+    """Outcome of one item of a bulk run.
+
+    :param index: position of the item in the input iterable.
+    :param request: the request object that was sent.
+    :param data: deserialized response, if the call succeeded.
+    :param error: the `ApiException` (or subclass) or transport error raised
+                  by the last attempt.
+    :param retries: number of retries after throttling responses and
+                    transport errors.
+    """
+
+    index: int
+    request: Any
+    data: Any = None
+    error: Optional[Exception] = None
+    retries: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def definitive(self) -> bool:
+        """Whether sending the request again cannot change the outcome.
+
+        True for successes and for 4xx responses other than 429; throttled,
+        5xx and transport failures may succeed on a later run.
+        """
+        if self.error is None:
+            return True
+        status = getattr(self.error, 'status', None)
+        return isinstance(status, int) and 400 <= status < 500 and status not in RETRYABLE_STATUSES
+
+
+class BulkCheckpoint:
+    """Records which items of a bulk run have been acknowledged.
+
+    The file holds the highest index below which every item is done plus the
+    indices acknowledged out of order beyond it, so a restarted run skips
+    exactly the items that already got a definitive response. Writes go
+    through a temporary file and `os.replace`, so a crash never leaves a
+    truncated checkpoint behind.
+
+    :param path: location of the checkpoint file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self.last_index = -1
+        self._done: Set[int] = set()
+        if os.path.exists(path):
+            with open(path) as f:
+                state = json.load(f)
+            self.last_index = state.get('last_index', -1)
+            self._done = set(state.get('done', []))
+
+    def is_done(self, index: int) -> bool:
+        return index <= self.last_index or index in self._done
+
+    def acknowledge(self, index: int) -> None:
+        with self._lock:
+            self._done.add(index)
+            while self.last_index + 1 in self._done:
+                self.last_index += 1
+                self._done.discard(self.last_index)
+            self._write()
+
+    def _write(self) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.checkpoint-')
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'last_index': self.last_index, 'done': sorted(self._done)}, f)
+        os.replace(tmp_path, self.path)
+
+
+def is_connect_error(error: BaseException) -> bool:
+    """Whether the transport error `error` means the request never reached the server.
+
+    urllib3 reports connect failures directly or, once its own retries are
+    spent, as the `reason` of a `MaxRetryError`.
+    """
+    if isinstance(error, urllib3.exceptions.MaxRetryError):
+        error = error.reason
+    return isinstance(error, CONNECT_ERRORS)
+
+
+def retry_after_seconds(exc: ApiException) -> Optional[float]:
+    """Parses the `Retry-After` header of a throttled response, if present."""
+    return parse_retry_after(exc.headers)
+
+
+class _Throttle:
+    """Pauses every worker of a bulk run while the server asks to back off."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def wait(self) -> None:
+        delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def back_off(self, seconds: float) -> None:
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+
+def bulk_call(
+    operation: Callable[[Any], Any],
+    requests: Iterable[Any],
+    max_workers: int = 8,
+    max_retries: int = 5,
+    backoff_factor: float = 0.5,
+    max_backoff: float = 60.0,
+    checkpoint: Optional[BulkCheckpoint] = None,
+    retry_read_errors: bool = False,
+) -> Iterator[BulkResult]:
+    """Calls `operation` once per request with bounded concurrency.
+
+    Results are yielded as they complete. Throttling responses (429/503) and
+    connection failures (`is_connect_error`) are retried up to `max_retries`
+    times; the delay comes from `Retry-After` when present, exponential
+    backoff otherwise, and it pauses every worker, not only the one that
+    failed. Other transport errors (read timeouts, dropped connections) are
+    only retried with `retry_read_errors`, as the server may already have
+    handled the request and a retried send could issue twice. Other
+    `ApiException`s are reported in the result and not retried; errors of
+    one item never abort the run. The input iterable is consumed lazily, at
+    most `2 * max_workers` items ahead of the results.
+
+    :param operation: bound API method taking a single request, e.g.
+                      `SendApi(...).boost_send`.
+    :param requests: iterable of request objects.
+    :param max_workers: number of requests in flight; keep this at or below
+                        `Configuration.connection_pool_maxsize`.
+    :param max_retries: retries per item after throttling responses and
+                        transport errors.
+    :param backoff_factor: base delay in seconds when `Retry-After` is absent.
+    :param max_backoff: upper bound for a single delay, in seconds.
+    :param checkpoint: skip items it already acknowledged and acknowledge
+                       each item whose result is `definitive`; failed items
+                       that may still succeed are sent again on a restart.
+    :param retry_read_errors: also retry transport errors raised after the
+                              request was sent; only safe for idempotent
+                              operations.
+    :return: Iterator of BulkResult.
+    """
+    throttle = _Throttle()
+
+    def run(index, request):
+        retries = 0
+        while True:
+            throttle.wait()
+            try:
+                return BulkResult(index, request, data=operation(request), retries=retries)
+            except ApiException as e:
+                if e.status not in RETRYABLE_STATUSES or retries >= max_retries:
+                    return BulkResult(index, request, error=e, retries=retries)
+                delay = retry_after_seconds(e)
+            except TRANSPORT_ERRORS as e:
+                if retries >= max_retries or not (retry_read_errors or is_connect_error(e)):
+                    return BulkResult(index, request, error=e, retries=retries)
+                delay = None
+            if delay is None:
+                delay = backoff_factor * (2 ** retries)
+            throttle.back_off(min(delay, max_backoff))
+            retries += 1
+
+    pending = set()
+    items = iter(enumerate(requests))
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        while True:
+            for index, request in items:
+                if checkpoint is not None and checkpoint.is_done(index):
+                    continue
+                pending.add(executor.submit(contextvars.copy_context().run, run, index, request))
+                if len(pending) >= 2 * max_workers:
+                    break
+            if not pending:
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            results = [future.result() for future in done]
+            if checkpoint is not None:
+                for result in results:
+                    if result.definitive:
+                        checkpoint.acknowledge(result.index)
+            yield from results
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+        # calls already on the wire when the caller stopped still count
+        if checkpoint is not None:
+            for future in pending:
+                if not future.cancelled() and future.exception() is None and future.result().definitive:
+                    checkpoint.acknowledge(future.result().index)
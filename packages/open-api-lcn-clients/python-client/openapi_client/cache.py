@@ -0,0 +1,470 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import urllib3
+
+MUTATING_METHODS = frozenset({'POST', 'PUT', 'PATCH', 'DELETE'})
+
+# recomputed for the decoded body when a cached response is replayed
+_HOP_HEADERS = frozenset({'content-encoding', 'content-length', 'transfer-encoding'})
+# headers a 304 response may update on the stored response
+_REVALIDATION_HEADERS = frozenset({'cache-control', 'date', 'etag', 'expires', 'last-modified'})
+
+
+class CacheEntry(NamedTuple):
+    """A stored GET response.
+
+    :param status: HTTP status of the stored response.
+    :param reason: HTTP reason phrase.
+    :param headers: response headers as (name, value) pairs.
+    :param data: decoded response body.
+    :param stored_at: wall-clock time the request that produced it was sent.
+    :param expires_at: wall-clock time after which it must be revalidated.
+    :param tags: resources the response describes, see `ResponseCache`.
+    """
+
+    status: int
+    reason: str
+    headers: Tuple[Tuple[str, str], ...]
+    data: bytes
+    stored_at: float
+    expires_at: float
+    tags: Tuple[str, ...] = ()
+
+    def header(self, name: str) -> Optional[str]:
+        name = name.lower()
+        for key, value in self.headers:
+            if key.lower() == name:
+                return value
+        return None
+
+
+class MemoryCache:
+    """In-process cache backend evicting the least recently used entry.
+
+    :param maxsize: maximum number of stored responses.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[str, CacheEntry]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskCache:
+    """Cache backend storing one file per response in a directory.
+
+    Entries survive restarts and can be shared by several processes. Reads
+    bump the file's modification time, and once the directory grows past
+    `max_bytes` the least recently used files are removed. Writes go through a
+    temporary file and `os.replace`, so readers never see a partial entry.
+
+    :param directory: where to store the entries; created if missing.
+    :param max_bytes: size the directory is trimmed back to.
+    """
+
+    SUFFIX = '.response'
+
+    def __init__(self, directory: str, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._size = sum(size for _, size, _ in self._files())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    def _files(self) -> Iterable[Tuple[str, int, float]]:
+        for item in os.scandir(self.directory):
+            if item.name.endswith(self.SUFFIX):
+                try:
+                    stat = item.stat()
+                except FileNotFoundError:
+                    continue
+                yield item.path, stat.st_size, stat.st_mtime
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                meta, _, data = f.read().partition(b'\n')
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        try:
+            meta = json.loads(meta)
+            return CacheEntry(
+                status=meta['status'],
+                reason=meta['reason'],
+                headers=tuple(tuple(h) for h in meta['headers']),
+                data=data,
+                stored_at=meta['stored_at'],
+                expires_at=meta['expires_at'],
+                tags=tuple(meta['tags']),
+            )
+        except (ValueError, KeyError, TypeError):
+            self.delete(key)
+            return None
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        meta = entry._asdict()
+        del meta['data']
+        content = json.dumps(meta).encode() + b'\n' + entry.data
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix='.entry-')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, self._path(key))
+        with self._lock:
+            self._size += len(content)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        files = sorted(self._files(), key=lambda f: f[2])
+        self._size = sum(size for _, size, _ in files)
+        for path, size, _ in files:
+            if self._size <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self._size -= size
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        for path, _, _ in list(self._files()):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        with self._lock:
+            self._size = 0
+
+
+class CacheLookup(NamedTuple):
+    """State of a GET request between `ResponseCache.lookup` and `store`.
+
+    :param key: cache key of the request.
+    :param entry: stored response, if any.
+    :param fresh: whether `entry` can be served without contacting the server.
+    :param headers: headers to send, with validators added when revalidating.
+    :param started: wall-clock time of the lookup.
+    :param tags: resources the request reads.
+    :param store: False when the request asked not to be stored.
+    """
+
+    key: str
+    entry: Optional[CacheEntry]
+    fresh: bool
+    headers: Dict[str, str]
+    started: float
+    tags: Tuple[str, ...]
+    store: bool = True
+
+
+def _cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    directives = {}
+    for part in (value or '').split(','):
+        name, _, argument = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
+
+
+def _is_identifier(name: str) -> bool:
+    return name.lower() in ('id', 'uri') or name.endswith(('Id', 'Uri', '_id', '_uri'))
+
+
+def _header(headers: Optional[Dict[str, str]], name: str) -> Optional[str]:
+    for key, value in (headers or {}).items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def request_key(method: str, url: str, headers: Optional[Dict[str, str]]) -> str:
+    """Identifies a request by method, URL and the credentials it carries."""
+    identity = '\0'.join([
+        method,
+        url,
+        _header(headers, 'authorization') or '',
+        _header(headers, 'cookie') or '',
+    ])
+    return hashlib.sha256(identity.encode()).hexdigest()
+
+
+def replay_response(status: int, reason: Optional[str], headers: Any, data: bytes) -> urllib3.HTTPResponse:
+    """Builds an unread urllib3 response serving an already read body.
+
+    :param headers: (name, value) pairs or a mapping; encoding and length
+        headers are recomputed for the decoded `data`.
+    """
+    if hasattr(headers, 'items'):
+        headers = headers.items()
+    headers = urllib3.HTTPHeaderDict([(k, v) for k, v in headers if k.lower() not in _HOP_HEADERS])
+    headers['Content-Length'] = str(len(data))
+    return urllib3.HTTPResponse(
+        body=io.BytesIO(data),
+        headers=headers,
+        status=status,
+        reason=reason,
+        preload_content=False,
+        decode_content=False,
+    )
+
+
+class ResponseCache:
+    """Opt-in cache for GET responses of an `ApiClient`.
+
+    Responses are keyed by URL and the `Authorization`/`Cookie` headers, so
+    clients acting as different profiles never see each other's data. A
+    response is fresh for its `Cache-Control: max-age`, or `ttl` seconds when
+    the server sends none; `no-store` responses are not stored and `no-cache`
+    ones are always revalidated. Stale responses carrying an `ETag` or
+    `Last-Modified` validator are revalidated with `If-None-Match` /
+    `If-Modified-Since`, and a `304 Not Modified` replays the stored body.
+    Callers can bypass the cache for one call by passing a
+    `Cache-Control: no-cache` (or `no-store`) header in `_headers`.
+
+    Every stored response is tagged with the resources it reads: its path
+    template plus its identifiers (path parameters and `id`/`uri`-like query
+    parameters). A POST, PUT, PATCH or DELETE made through the same client
+    invalidates the responses sharing an identifier with it, taken from its
+    path parameters, query and top-level body fields, e.g. `boost_update_boost`
+    (`POST /boost` with `{"uri": ...}`) drops the cached `boost_get_boost`
+    (`GET /boost?uri=...`) of that boost. A mutation without identifiers,
+    such as `profile_update_profile`, invalidates its own path instead.
+
+        api_client.response_cache = ResponseCache(MemoryCache(maxsize=512), ttl=30)
+
+    :param backend: `MemoryCache`, `DiskCache` or any object with the same
+        `get`/`set`/`delete` methods. Defaults to a `MemoryCache`.
+    :param ttl: freshness in seconds of responses without `max-age`.
+    :param max_invalidations: number of invalidated resources remembered;
+        when exceeded, everything stored before the oldest one forgotten is
+        treated as invalidated.
+    """
+
+    def __init__(
+        self,
+        backend: Any = None,
+        ttl: float = 60.0,
+        max_invalidations: int = 4096,
+    ) -> None:
+        self.backend = backend if backend is not None else MemoryCache()
+        self.ttl = ttl
+        self.max_invalidations = max_invalidations
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._lock = threading.Lock()
+        self._resources: 'OrderedDict[str, Tuple[str, Tuple[str, ...]]]' = OrderedDict()
+        self._invalidated: 'OrderedDict[str, float]' = OrderedDict()
+        self._invalidated_before = 0.0
+
+    def register(self, url: str, resource_path: str, path_values: Iterable[Any]) -> None:
+        """Records the path template and path parameters behind a URL.
+
+        Called by `ApiClient.param_serialize`, which still knows which parts
+        of the path are parameters.
+
+        :param url: request URL without its query string.
+        :param resource_path: path template, e.g. `/skills/{id}`.
+        :param path_values: values substituted into the template.
+        """
+        with self._lock:
+            self._resources[url] = (resource_path, tuple(str(v) for v in path_values))
+            self._resources.move_to_end(url)
+            while len(self._resources) > self.max_invalidations:
+                self._resources.popitem(last=False)
+
+    def tags(self, url: str, body: Any = None) -> Tuple[str, ...]:
+        """Returns the resources a request reads or writes.
+
+        :return: `path:<template>` followed by `id:<identifier>` tags.
+        """
+        base, _, query = url.partition('?')
+        with self._lock:
+            resource = self._resources.get(base)
+        if resource is None:
+            resource = (urlsplit(base).path, ())
+        template, identifiers = resource
+        identifiers = list(identifiers)
+        identifiers.extend(value for name, value in parse_qsl(query) if _is_identifier(name))
+        if isinstance(body, bytes):
+            # encoded by openapi_client.encoding
+            try:
+                body = json.loads(body)
+            except ValueError:
+                body = None
+        if isinstance(body, dict):
+            identifiers.extend(
+                str(value) for name, value in body.items()
+                if _is_identifier(name) and isinstance(value, (str, int))
+            )
+        return ('path:' + template,) + tuple(sorted({'id:' + i for i in identifiers}))
+
+    @staticmethod
+    def key(method: str, url: str, headers: Optional[Dict[str, str]]) -> str:
+        return request_key(method, url, headers)
+
+    def lookup(self, method: str, url: str, headers: Optional[Dict[str, str]]) -> CacheLookup:
+        """Finds the stored response for a GET request.
+
+        :return: a `CacheLookup`; when it is not fresh, send `headers` and
+            hand the response to `store`.
+        """
+        headers = dict(headers or {})
+        started = time.time()
+        key = self.key(method, url, headers)
+        tags = self.tags(url)
+        directives = _cache_control(_header(headers, 'cache-control'))
+        if 'no-store' in directives:
+            return CacheLookup(key, None, False, headers, started, tags, store=False)
+        entry = self.backend.get(key)
+        if entry is not None and self._is_invalidated(entry):
+            self.backend.delete(key)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return CacheLookup(key, None, False, headers, started, tags)
+        if started < entry.expires_at and 'no-cache' not in directives:
+            self.hits += 1
+            return CacheLookup(key, entry, True, headers, started, tags)
+        etag = entry.header('ETag')
+        last_modified = entry.header('Last-Modified')
+        if etag is None and last_modified is None:
+            self.misses += 1
+            return CacheLookup(key, None, False, headers, started, tags)
+        if etag is not None:
+            headers['If-None-Match'] = etag
+        if last_modified is not None:
+            headers['If-Modified-Since'] = last_modified
+        return CacheLookup(key, entry, False, headers, started, tags)
+
+    def store(
+        self,
+        lookup: CacheLookup,
+        status: int,
+        reason: Optional[str],
+        headers: Any,
+        data: bytes,
+    ) -> Optional[CacheEntry]:
+        """Stores the response to a request that was not served from cache.
+
+        :param lookup: result of `lookup` for the request.
+        :param status: 200 for a full response, 304 after revalidation.
+        :param headers: response headers (any mapping with `items()`).
+        :param data: response body; ignored for 304.
+        :return: the entry to serve, or None when there is nothing to serve
+            (a 304 for a request that was not conditional).
+        """
+        headers = tuple((k, v) for k, v in headers.items() if k.lower() not in _HOP_HEADERS)
+        if status == 304:
+            if lookup.entry is None:
+                return None
+            self.revalidations += 1
+            updated = {name.lower() for name, _ in headers if name.lower() in _REVALIDATION_HEADERS}
+            headers = tuple(
+                (k, v) for k, v in lookup.entry.headers if k.lower() not in updated
+            ) + tuple((k, v) for k, v in headers if k.lower() in updated)
+            status, reason, data = lookup.entry.status, lookup.entry.reason, lookup.entry.data
+        entry = CacheEntry(status, reason or '', headers, data, lookup.started, lookup.started, lookup.tags)
+        directives = _cache_control(entry.header('Cache-Control'))
+        ttl = self.ttl
+        try:
+            ttl = float(directives['max-age'])
+        except (KeyError, TypeError, ValueError):
+            pass
+        if 'no-cache' in directives:
+            ttl = 0
+        entry = entry._replace(expires_at=lookup.started + ttl)
+        validated = entry.header('ETag') is not None or entry.header('Last-Modified') is not None
+        if not lookup.store or 'no-store' in directives or (ttl <= 0 and not validated):
+            self.backend.delete(lookup.key)
+        elif not self._is_invalidated(entry):
+            self.backend.set(lookup.key, entry)
+        return entry
+
+    def invalidate(self, url: str, body: Any = None) -> None:
+        """Invalidates the responses describing the resources a mutation wrote.
+
+        :param url: URL of the mutating request.
+        :param body: its serialized body.
+        """
+        tags = self.tags(url, body)
+        identifiers = tags[1:] or tags[:1]
+        now = time.time()
+        with self._lock:
+            for tag in identifiers:
+                self._invalidated[tag] = now
+                self._invalidated.move_to_end(tag)
+            while len(self._invalidated) > self.max_invalidations:
+                _, invalidated_at = self._invalidated.popitem(last=False)
+                self._invalidated_before = max(self._invalidated_before, invalidated_at)
+
+    def _is_invalidated(self, entry: CacheEntry) -> bool:
+        with self._lock:
+            invalidated_at = max(
+                [self._invalidated_before] + [self._invalidated.get(t, 0.0) for t in entry.tags]
+            )
+        return entry.stored_at <= invalidated_at
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    @staticmethod
+    def response(entry: CacheEntry) -> urllib3.HTTPResponse:
+        """Replays a stored entry as a fresh, unread urllib3 response."""
+        return replay_response(entry.status, entry.reason, entry.headers, entry.data)
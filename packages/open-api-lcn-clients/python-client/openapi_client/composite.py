@@ -0,0 +1,124 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import functools
+import json
+import re
+from typing import Any, FrozenSet, NamedTuple, Optional, Tuple, get_args
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+_SCHEMA_FIELD_RE = re.compile(r'^(any|one)of_schema_(\d+)_validator$')
+
+
+class _Branch(NamedTuple):
+    field: str
+    model: Optional[type]
+    adapter: Optional[TypeAdapter]
+
+
+def _is_composite(model: type) -> bool:
+    return 'actual_instance' in model.model_fields
+
+
+@functools.lru_cache(maxsize=None)
+def _branches(cls: type) -> Tuple[_Branch, ...]:
+    """Returns the schemas of an anyOf/oneOf model in declaration order.
+
+    Model schemas are deserialized with their own `from_dict`; other schemas
+    (strings, lists, dicts) are validated against the annotation of their
+    `*_schema_<n>_validator` field, as the generated `from_json` does by
+    assigning to that field.
+    """
+    branches = []
+    for name, field in cls.model_fields.items():
+        m = _SCHEMA_FIELD_RE.match(name)
+        if m is None:
+            continue
+        model = None
+        for arg in get_args(field.annotation):
+            if isinstance(arg, type) and issubclass(arg, BaseModel):
+                model = arg
+        adapter = TypeAdapter(field.rebuild_annotation()) if model is None else None
+        branches.append((int(m.group(2)), _Branch(name, model, adapter)))
+    return tuple(branch for _, branch in sorted(branches))
+
+
+@functools.lru_cache(maxsize=None)
+def _required_keys(model: type) -> FrozenSet[str]:
+    """Returns the keys a schema requires to be present.
+
+    Nullable required fields count too: the generated `from_dict` fills them
+    with `None` when absent, which lets e.g. the JWE schema (all of whose
+    fields are nullable) accept any object at all.
+    """
+    return frozenset(
+        field.alias or name
+        for name, field in model.model_fields.items()
+        if field.is_required()
+    )
+
+
+def _may_match(model: type, obj: Any) -> bool:
+    """Cheap key inspection ruling out schemas that cannot match `obj`.
+
+    E.g. a JWE (`protected`, `ciphertext`, ...) lacks the `@context`, `type`
+    and `proof` keys a verifiable presentation requires, so the presentation
+    schema is skipped without being validated.
+    """
+    if not isinstance(obj, dict):
+        return True
+    if _is_composite(model):
+        return any(
+            branch.model is None or _may_match(branch.model, obj)
+            for branch in _branches(model)
+        )
+    return _required_keys(model).issubset(obj.keys())
+
+
+def resolve_composite(cls: type, obj: Any) -> Any:
+    """Deserializes a dict into an anyOf/oneOf model without JSON round-trips.
+
+    Schemas whose required keys are missing from `obj` are skipped, so keys
+    act as discriminators: `ciphertext`/`protected` select the JWE schema,
+    `@context`/`proof` a verifiable credential or presentation. The rest are
+    validated in declaration order directly from the dict; anyOf models take
+    the first schema that validates, oneOf models require exactly one. When
+    nothing (or, for oneOf, more than one schema) matches, the generated
+    `from_json` probing runs instead, so anything it accepted before is still
+    accepted and failures report the same error.
+
+    :param cls: anyOf/oneOf model class.
+    :param obj: decoded JSON data.
+    :return: instance of `cls` with `actual_instance` set.
+    """
+    one_of = 'one_of_schemas' in cls.model_fields
+    match = None
+    for branch in _branches(cls):
+        if branch.model is not None and not _may_match(branch.model, obj):
+            continue
+        try:
+            if branch.model is None:
+                value = branch.adapter.validate_python(obj)
+                values = {branch.field: value, 'actual_instance': value}
+            else:
+                values = {'actual_instance': branch.model.from_dict(obj)}
+        except (ValidationError, ValueError):
+            continue
+        if not one_of:
+            return cls.model_construct(**values)
+        if match is not None:
+            match = None
+            break
+        match = values
+    if match is not None:
+        return cls.model_construct(**match)
+    return cls.from_json(json.dumps(obj))
@@ -6,9 +6,6 @@
     API for interacting with LearnCloud Network
 
     The version of the OpenAPI document: 1.0.0
-    Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-    Do not edit the class manually.
 """  # noqa: E501
 
 
@@ -234,6 +231,12 @@ class Configuration:
         self.access_token = access_token
         """Access token
         """
+        self.token_provider = None
+        """Source of per-tenant access tokens used instead of `access_token`:
+           a `openapi_client.tokens.TokenProvider`, a callable or a mapping
+           taking the tenant set with `openapi_client.tokens.tenant`. Copies
+           of the configuration share it.
+        """
         self.logger = {}
         """Logging Settings
         """
@@ -291,6 +294,18 @@ class Configuration:
            requests to the same host, which is often the case here.
            cpu_count * 5 is used as default value to increase performance.
         """
+        self.connection_pool_block = False
+        """Wait for a free connection when all `connection_pool_maxsize`
+           connections to a host are in use, instead of opening one more that
+           is closed after the request.
+        """
+        self.share_connection_pools = False
+        """Share the urllib3 pool manager, and so the open connections, with
+           the other `ApiClient`s whose host, TLS, proxy, retry and pool
+           settings are the same and that share too, e.g. one client per
+           tenant token. Off by default: each client has its own pool
+           manager. See `openapi_client.pools`.
+        """
 
         self.proxy: Optional[str] = None
         """Proxy URL
@@ -304,8 +319,49 @@ class Configuration:
         self.retries = retries
         """Adding retries to override urllib3 default value 3
         """
+        self.rate_limit: Optional[float] = None
+        """Requests per second allowed per host by the client-side token
+           bucket; None disables rate limiting.
+        """
+        self.rate_limit_burst: Optional[float] = None
+        """Requests allowed back to back after an idle period; defaults to
+           one second worth of `rate_limit`.
+        """
+        self.adaptive_concurrency = False
+        """Limit concurrent requests per host and operation group, backing
+           off on 429/503 responses and rising latency and growing again
+           while responses are healthy. See `openapi_client.throttle`.
+        """
         # Enable client side validation
         self.client_side_validation = True
+        """Validate the arguments of API methods with pydantic `validate_call`.
+           When False, arguments are passed through as given, except request
+           bodies that are not already instances of their model class. Read
+           by `ApiClient` when it is created; `api_client.client_side_validation`
+           can be changed afterwards.
+        """
+        # Validate JSON responses in a single pydantic pass
+        self.fast_deserialization = False
+        """Validate 2xx JSON responses straight from the raw bytes with one
+           compiled pydantic validator per response type instead of going
+           through `json.loads` and the generated `from_dict` methods.
+           Response types involving anyOf/oneOf models always take the
+           regular path, as does any response the single pass rejects.
+           Unknown properties are not collected into `additional_properties`
+           in this mode, and fields absent from the response are not marked
+           as set (so `to_dict()` omits them rather than emitting null).
+        """
+        # Encode request bodies straight to JSON bytes
+        self.fast_serialization = False
+        """Encode request models to JSON bytes in one pass with
+           `openapi_client.encoding.encode` instead of building a dict with
+           `sanitize_for_serialization` and dumping it in `RESTClientObject`.
+        """
+        self.compact_json = True
+        """With `fast_serialization`, leave out the spaces after separators
+           and write non-ASCII characters as UTF-8. Set to False to send
+           bytes identical to the regular path.
+        """
 
         self.socket_options = None
         """Options to pass down to the underlying urllib3 socket
@@ -324,8 +380,9 @@ class Configuration:
         result = cls.__new__(cls)
         memo[id(self)] = result
         for k, v in self.__dict__.items():
-            if k not in ('logger', 'logger_file_handler'):
+            if k not in ('logger', 'logger_file_handler', 'token_provider'):
                 setattr(result, k, copy.deepcopy(v, memo))
+        result.token_provider = self.token_provider
         # shallow copy of loggers
         result.logger = copy.copy(self.logger)
         # use setters to configure loggers
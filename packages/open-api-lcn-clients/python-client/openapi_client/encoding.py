@@ -0,0 +1,184 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import datetime
+import decimal
+import functools
+import json
+import typing
+import uuid
+from enum import Enum
+from typing import Any, NamedTuple, Optional, Tuple
+
+from pydantic import BaseModel, SecretStr
+
+# field kinds whose generated `to_dict()` calls `to_dict()` of the value(s)
+_PLAIN, _MODEL, _LIST, _DICT = range(4)
+
+
+class _Field(NamedTuple):
+    name: str
+    alias: str
+    kind: int
+    # List/Dict fields whose items may be None; `to_dict()` drops falsy items
+    drop_falsy: bool
+
+
+class _Plan(NamedTuple):
+    fields: Tuple[_Field, ...]
+    # (alias, name) of nullable fields, written as null when explicitly set
+    nullable: Tuple[Tuple[str, str], ...]
+    additional_properties: bool
+    composite: bool
+
+
+def _unwrap(annotation: Any) -> Tuple[Any, bool]:
+    """Strips Annotated and Optional, telling whether None was allowed."""
+    optional = False
+    while True:
+        origin = typing.get_origin(annotation)
+        if origin is typing.Annotated:
+            annotation = typing.get_args(annotation)[0]
+        elif origin is typing.Union and type(None) in typing.get_args(annotation):
+            args = [a for a in typing.get_args(annotation) if a is not type(None)]
+            if len(args) != 1:
+                return annotation, True
+            annotation, optional = args[0], True
+        else:
+            return annotation, optional
+
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def _field_kind(annotation: Any) -> Tuple[int, bool]:
+    annotation, _ = _unwrap(annotation)
+    if _is_model(annotation):
+        return _MODEL, False
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is list and args:
+        item, optional = _unwrap(args[0])
+        if _is_model(item):
+            return _LIST, optional
+    if origin is dict and len(args) == 2:
+        item, optional = _unwrap(args[1])
+        if _is_model(item):
+            return _DICT, optional
+    return _PLAIN, False
+
+
+@functools.lru_cache(maxsize=None)
+def _plan(cls: type) -> _Plan:
+    """Works out what the generated `to_dict()` of a model class does.
+
+    Model, List[model] and Dict[str, model] fields are the ones `to_dict()`
+    re-walks with the nested `to_dict()`; the others keep pydantic's
+    `model_dump` output. Nullable fields are found by calling `to_dict()`
+    on an instance with every field explicitly set to None: only those come
+    back, as null, in the order `to_dict()` appends them.
+    """
+    if 'actual_instance' in cls.model_fields:
+        return _Plan((), (), False, True)
+    fields = []
+    for name, info in cls.model_fields.items():
+        if name == 'additional_properties':
+            continue
+        kind, drop_falsy = _field_kind(info.annotation)
+        fields.append(_Field(name, info.alias or name, kind, drop_falsy))
+    probe = cls.model_construct(**{name: None for name in cls.model_fields})
+    aliases = {field.alias: field.name for field in fields}
+    nullable = tuple((alias, aliases[alias]) for alias in probe.to_dict() if alias in aliases)
+    return _Plan(
+        tuple(fields), nullable, 'additional_properties' in cls.model_fields, False
+    )
+
+
+def _model_dict(obj: BaseModel) -> Any:
+    """The value `obj.to_dict()` would produce, one level deep.
+
+    Nested models are left in place for the encoder to hand back to
+    `_default`, so the tree is walked once, by the encoder.
+    """
+    plan = _plan(type(obj))
+    if plan.composite:
+        return obj.actual_instance
+    values = obj.__dict__
+    result = {}
+    for field in plan.fields:
+        value = values[field.name]
+        if value is None:
+            continue
+        if field.drop_falsy:
+            if field.kind == _LIST:
+                value = [item for item in value if item]
+            else:
+                value = {key: item for key, item in value.items() if item}
+        result[field.alias] = value
+    if plan.additional_properties and obj.additional_properties:
+        result.update(obj.additional_properties)
+    if plan.nullable:
+        fields_set = obj.model_fields_set
+        for alias, name in plan.nullable:
+            if values[name] is None and name in fields_set:
+                result[alias] = None
+    return result
+
+
+def _default(obj: Any) -> Any:
+    """Converts what `json` can't encode, like `sanitize_for_serialization`."""
+    if isinstance(obj, BaseModel) and hasattr(obj, 'to_dict'):
+        return _model_dict(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, SecretStr):
+        return obj.get_secret_value()
+    if isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    if isinstance(obj, (uuid.UUID, decimal.Decimal)):
+        return str(obj)
+    if hasattr(obj, 'to_dict') and callable(obj.to_dict):
+        return obj.to_dict()
+    try:
+        return obj.__dict__
+    except AttributeError:
+        raise TypeError(
+            'Object of type %s is not JSON serializable' % type(obj).__name__
+        ) from None
+
+
+_COMPACT = json.JSONEncoder(
+    ensure_ascii=False, check_circular=False, separators=(',', ':'), default=_default
+)
+_COMPATIBLE = json.JSONEncoder(check_circular=False, default=_default)
+
+
+def encode(obj: Any, compact: bool = True) -> bytes:
+    """Encodes a request body, typically a model, to UTF-8 JSON bytes.
+
+    Models are converted as their generated `to_dict()` would, but without
+    building the intermediate dicts of `to_dict()` and
+    `ApiClient.sanitize_for_serialization`: each model is visited once, and
+    strings, numbers and containers are written by the C encoder of `json`.
+    Model instances placed inside free-form (`Dict[str, Any]`) fields are
+    converted with their `to_dict()` too, where the regular path would use
+    pydantic's `model_dump`.
+
+    :param obj: model, or any value `sanitize_for_serialization` accepts.
+    :param compact: omit the spaces after `,` and `:` and write non-ASCII
+        characters as UTF-8 instead of `\\u` escapes. With False the output
+        is byte-for-byte what `RESTClientObject` sends for
+        `sanitize_for_serialization(obj)`.
+    :return: the JSON document.
+    """
+    encoder = _COMPACT if compact else _COMPATIBLE
+    return encoder.encode(obj).encode('utf-8')
@@ -0,0 +1,440 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import bisect
+import contextvars
+import json
+import logging
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger('openapi_client')
+
+# where the time of an operation goes, in order
+PHASES = ('serialize', 'network', 'read', 'decode', 'parse', 'deserialize')
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+# the operation serialized last in this thread or task, until it is sent
+_pending: contextvars.ContextVar[Optional['Operation']] = contextvars.ContextVar(
+    'openapi_client_operation', default=None
+)
+
+
+class Operation:
+    """Timing and size of one API call, as seen by hooks.
+
+    :ivar operation_id: generated method name, e.g. `boost_send`; None for
+        requests not made through a generated method, like `bulk_send`'s.
+    :ivar method: HTTP method.
+    :ivar path: path template, e.g. `/boost/send/{profileId}`; the URL path
+        when the template is unknown.
+    :ivar url: request URL.
+    :ivar status: response status, once received.
+    :ivar bytes_out: size of the request body. JSON bodies are measured by
+        encoding them once more; form bodies count as 0.
+    :ivar bytes_in: size of the response body, once read.
+    :ivar phases: seconds spent per phase, see `PHASES`.
+    :ivar error: exception the call ended with, if any.
+    :ivar started: `time.time()` when the operation started.
+    :ivar duration: seconds from start to end, once ended.
+    :ivar context: scratch space for hooks.
+    """
+
+    __slots__ = (
+        'operation_id', 'method', 'path', 'url', 'status', 'bytes_out', 'bytes_in',
+        'phases', 'error', 'started', 'duration', 'context', 'raw', '_start', '_mark',
+        '_ended',
+    )
+
+    def __init__(
+        self,
+        operation_id: Optional[str],
+        method: str,
+        path: str,
+        url: str,
+        start: Optional[float] = None,
+    ) -> None:
+        self.operation_id = operation_id
+        self.method = method
+        self.path = path
+        self.url = url
+        self.status: Optional[int] = None
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.phases: Dict[str, float] = {}
+        self.error: Optional[BaseException] = None
+        self._start = self._mark = time.perf_counter() if start is None else start
+        self.started = time.time() - (time.perf_counter() - self._start)
+        self.duration: Optional[float] = None
+        self.context: Dict[Any, Any] = {}
+        # ended as soon as the response arrives, for *_without_preload_content
+        self.raw = False
+        self._ended = False
+
+    def mark(self) -> None:
+        """Starts timing a phase."""
+        self._mark = time.perf_counter()
+
+    def lap(self, phase: str) -> None:
+        """Adds the time since the last `mark` or `lap` to `phase`."""
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self._mark
+        self._mark = now
+
+    def __repr__(self) -> str:
+        return '<Operation %s %s %s %s>' % (self.operation_id, self.method, self.path, self.status)
+
+
+class Hook:
+    """Base class for instrumentation hooks.
+
+    Hooks are appended to `ApiClient.hooks`. Both callbacks run on the
+    calling thread (or task), so they should be quick; exceptions they
+    raise are logged and otherwise ignored.
+    """
+
+    def on_start(self, operation: Operation) -> None:
+        """Called as the request is about to be sent."""
+
+    def on_end(self, operation: Operation) -> None:
+        """Called once the response is deserialized or the call failed."""
+
+
+def _notify(hooks: Sequence[Hook], callback: str, operation: Operation) -> None:
+    for hook in hooks:
+        try:
+            getattr(hook, callback)(operation)
+        except Exception:
+            logger.exception('%s.%s failed', type(hook).__name__, callback)
+
+
+def begin(
+    method: str,
+    path: str,
+    url: str,
+    start: float,
+    operation_id: Optional[str] = None,
+    raw: bool = False,
+) -> None:
+    """Records the operation serialized by `ApiClient.param_serialize`.
+
+    Hooks only hear of it once it is sent, as requests can be prepared and
+    never sent (see `openapi_client.prepared`).
+
+    :param operation_id: the operation, e.g. `boost_send`; None for
+        requests serialized outside of a generated API method.
+    :param raw: whether the response is handed over unread.
+    """
+    operation = Operation(operation_id, method, path, url, start)
+    operation.raw = raw
+    operation.lap('serialize')
+    _pending.set(operation)
+
+
+def detach(function: Callable[..., Any], *args: Any, **kwargs: Any) -> Tuple[Any, Optional[Operation]]:
+    """Calls `function` and returns its result and the operation it serialized.
+
+    The pending operation is left as it was, so a request that is only
+    prepared is not attributed to the next one sent.
+    """
+    token = _pending.set(None)
+    try:
+        result = function(*args, **kwargs)
+        return result, _pending.get()
+    finally:
+        _pending.reset(token)
+
+
+def resume(operation: Optional[Operation]) -> None:
+    """Makes an operation returned by `detach` the next one sent."""
+    _pending.set(operation)
+
+
+def adopt(hooks: Sequence[Hook], method: str, url: str, body: Any) -> Operation:
+    """Picks up the operation being sent by `ApiClient.call_api`.
+
+    Requests that were serialized elsewhere, e.g. on another thread, start
+    a new operation without an id.
+    """
+    operation = _pending.get()
+    if operation is not None and operation.method == method and operation.url == url:
+        _pending.set(None)
+    else:
+        operation = Operation(None, method, urlsplit(url).path, url)
+    operation.bytes_out = _body_size(body)
+    _notify(hooks, 'on_start', operation)
+    return operation
+
+
+def finish(hooks: Sequence[Hook], operation: Operation, error: Optional[BaseException] = None) -> None:
+    """Ends an operation, once."""
+    if operation._ended:
+        return
+    operation._ended = True
+    if error is not None:
+        operation.error = error
+    operation.duration = time.perf_counter() - operation._start
+    _notify(hooks, 'on_end', operation)
+
+
+def _body_size(body: Any) -> int:
+    if body is None:
+        return 0
+    if isinstance(body, bytes):
+        return len(body)
+    if isinstance(body, str):
+        return len(body.encode('utf-8'))
+    try:
+        # what RESTClientObject sends; ASCII, so characters are bytes
+        return len(json.dumps(body))
+    except (TypeError, ValueError):
+        return 0
+
+
+class Histogram:
+    """Cumulative histogram with labels, in the style of `prometheus_client`.
+
+    :param name: metric name.
+    :param documentation: help text.
+    :param labelnames: names of the labels.
+    :param buckets: upper bounds of the buckets; +Inf is added.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._series: Dict[Tuple[str, ...], '_Series'] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, **labels: Any) -> '_Series':
+        """Returns the series for a combination of label values."""
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        series = self._series.get(key)
+        if series is None:
+            with self._lock:
+                series = self._series.setdefault(key, _Series(self.buckets))
+        return series
+
+    def collect(self) -> List[Tuple[Dict[str, str], List[int], float, int]]:
+        """Snapshot of every series.
+
+        :return: (labels, cumulative bucket counts, sum, count) tuples.
+        """
+        with self._lock:
+            items = list(self._series.items())
+        return [(dict(zip(self.labelnames, key)),) + series.snapshot() for key, series in items]
+
+
+class _Series:
+
+    __slots__ = ('_buckets', '_counts', '_sum', '_lock')
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self._buckets = buckets
+        self._counts = [0] * len(buckets)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        i = bisect.bisect_left(self._buckets, value)
+        with self._lock:
+            self._counts[i] += 1
+            self._sum += value
+
+    def snapshot(self) -> Tuple[List[int], float, int]:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        cumulative = []
+        running = 0
+        for count in counts:
+            running += count
+            cumulative.append(running)
+        return cumulative, total, running
+
+
+class HistogramRegistry:
+    """Dependency-free registry of `Histogram`s.
+
+    Renders the Prometheus text exposition format with `exposition()`, e.g.
+    to serve from a `/metrics` endpoint.
+    """
+
+    def __init__(self) -> None:
+        self.histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Returns the histogram called `name`, creating it if needed."""
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram(name, documentation, labelnames, buckets)
+        return histogram
+
+    def exposition(self) -> str:
+        """Renders every histogram in the Prometheus text format."""
+        lines = []
+        for name, histogram in sorted(self.histograms.items()):
+            lines.append('# HELP %s %s' % (name, histogram.documentation))
+            lines.append('# TYPE %s histogram' % name)
+            for labels, counts, total, count in histogram.collect():
+                for bound, cumulative in zip(histogram.buckets, counts):
+                    le = '+Inf' if bound == math.inf else repr(float(bound))
+                    lines.append('%s_bucket{%s} %d' % (name, _labels(labels, le=le), cumulative))
+                lines.append('%s_sum{%s} %r' % (name, _labels(labels), total))
+                lines.append('%s_count{%s} %d' % (name, _labels(labels), count))
+        return '\n'.join(lines) + '\n'
+
+
+def _labels(labels: Dict[str, str], **extra: str) -> str:
+    labels = dict(labels, **extra)
+    return ','.join(
+        '%s="%s"' % (k, v.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for k, v in labels.items()
+    )
+
+
+class PrometheusClientRegistry:
+    """Creates `MetricsHook` histograms with `prometheus_client`.
+
+    Requires the `prometheus_client` package.
+
+    :param registry: `prometheus_client.CollectorRegistry` to register the
+        histograms with; the default registry if None.
+    """
+
+    def __init__(self, registry: Any = None) -> None:
+        import prometheus_client
+
+        self._prometheus_client = prometheus_client
+        self._registry = registry if registry is not None else prometheus_client.REGISTRY
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Any:
+        return self._prometheus_client.Histogram(
+            name, documentation, labelnames, buckets=buckets, registry=self._registry
+        )
+
+
+class MetricsHook(Hook):
+    """Records operations into histograms.
+
+    Works with `HistogramRegistry`, `PrometheusClientRegistry`, or any
+    registry whose `histogram(name, documentation, labelnames, buckets)`
+    returns an object with `labels(**labels).observe(value)`:
+
+    - `<namespace>_duration_seconds{operation, method, path, status}`
+    - `<namespace>_phase_seconds{operation, phase}`
+    - `<namespace>_request_bytes{operation}` and `<namespace>_response_bytes{operation}`
+
+    `status` is `error` for calls that failed without a response.
+
+    :param registry: where to create the histograms.
+    :param namespace: prefix of the metric names.
+    """
+
+    def __init__(self, registry: Any, namespace: str = 'lcn_client') -> None:
+        self.duration = registry.histogram(
+            namespace + '_duration_seconds', 'LCN API call duration',
+            ('operation', 'method', 'path', 'status'),
+        )
+        self.phase = registry.histogram(
+            namespace + '_phase_seconds', 'LCN API call duration per phase', ('operation', 'phase'),
+        )
+        self.request_bytes = registry.histogram(
+            namespace + '_request_bytes', 'LCN API request body size', ('operation',), SIZE_BUCKETS,
+        )
+        self.response_bytes = registry.histogram(
+            namespace + '_response_bytes', 'LCN API response body size', ('operation',), SIZE_BUCKETS,
+        )
+
+    def on_end(self, operation: Operation) -> None:
+        name = operation.operation_id or operation.path
+        status = 'error' if operation.status is None else operation.status
+        self.duration.labels(
+            operation=name, method=operation.method, path=operation.path, status=status,
+        ).observe(operation.duration)
+        for phase, seconds in operation.phases.items():
+            self.phase.labels(operation=name, phase=phase).observe(seconds)
+        self.request_bytes.labels(operation=name).observe(operation.bytes_out)
+        self.response_bytes.labels(operation=name).observe(operation.bytes_in)
+
+
+class TracingHook(Hook):
+    """Emits one span per operation through an OpenTelemetry-style tracer.
+
+    The tracer needs `start_span(name, attributes=..., start_time=...)`
+    returning a span with `set_attribute`, `record_exception` and
+    `end(end_time=...)`, as `opentelemetry.trace.Tracer` does. Spans are
+    named `<method> <path template>` and carry the HTTP semantic convention
+    attributes plus `lcn.operation` and `lcn.phase.<phase>` durations in
+    seconds.
+
+    :param tracer: e.g. `opentelemetry.trace.get_tracer("openapi_client")`.
+    """
+
+    def __init__(self, tracer: Any) -> None:
+        self.tracer = tracer
+
+    def on_start(self, operation: Operation) -> None:
+        attributes = {
+            'http.request.method': operation.method,
+            'url.template': operation.path,
+            'url.full': operation.url,
+        }
+        if operation.operation_id is not None:
+            attributes['lcn.operation'] = operation.operation_id
+        operation.context[self] = self.tracer.start_span(
+            '%s %s' % (operation.method, operation.path),
+            attributes=attributes,
+            start_time=int(operation.started * 1e9),
+        )
+
+    def on_end(self, operation: Operation) -> None:
+        span = operation.context.pop(self, None)
+        if span is None:
+            return
+        if operation.status is not None:
+            span.set_attribute('http.response.status_code', operation.status)
+        span.set_attribute('http.request.body.size', operation.bytes_out)
+        span.set_attribute('http.response.body.size', operation.bytes_in)
+        for phase, seconds in operation.phases.items():
+            span.set_attribute('lcn.phase.' + phase, seconds)
+        if operation.error is not None:
+            span.set_attribute('error.type', type(operation.error).__name__)
+            span.record_exception(operation.error)
+        span.end(end_time=int((operation.started + operation.duration) * 1e9))
@@ -0,0 +1,270 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import collections
+import contextvars
+import itertools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from openapi_client.models.activity_get_my_activities200_response_records_inner import ActivityGetMyActivities200ResponseRecordsInner
+from openapi_client.models.contracts_get_credentials_for_contract200_response_records_inner import ContractsGetCredentialsForContract200ResponseRecordsInner
+from openapi_client.models.credential_received_credentials200_response_inner import CredentialReceivedCredentials200ResponseInner
+from openapi_client.models.inbox_get_my_issued_credentials200_response_records_inner import InboxGetMyIssuedCredentials200ResponseRecordsInner
+
+BOOST = 'boost'
+CREDENTIAL = 'credential'
+PROFILE = 'profile'
+
+# record attribute -> kind of object it refers to, per record type
+REFERENCES: Dict[type, Dict[str, str]] = {
+    ActivityGetMyActivities200ResponseRecordsInner: {
+        'boost_uri': BOOST,
+        'credential_uri': CREDENTIAL,
+        'actor_profile_id': PROFILE,
+    },
+    CredentialReceivedCredentials200ResponseInner: {
+        'uri': CREDENTIAL,
+        'to': PROFILE,
+        'var_from': PROFILE,
+    },
+    InboxGetMyIssuedCredentials200ResponseRecordsInner: {
+        'boost_uri': BOOST,
+    },
+    ContractsGetCredentialsForContract200ResponseRecordsInner: {
+        'credential_uri': CREDENTIAL,
+        'boost_uri': BOOST,
+    },
+}
+# used for records of other types, where the attributes exist
+DEFAULT_REFERENCES: Dict[str, str] = {
+    'boost_uri': BOOST,
+    'credential_uri': CREDENTIAL,
+    'actor_profile_id': PROFILE,
+}
+
+
+class Resolved:
+    """A record with the objects its references resolved to.
+
+    `resolved['boost_uri']` is the boost the record's `boost_uri` refers
+    to; references that are unset, or whose lookup failed, are missing
+    (the error is in `errors`).
+
+    :ivar record: the record as returned by the API.
+    :ivar resolved: resolved objects by record attribute.
+    :ivar errors: exceptions of failed lookups by record attribute.
+    """
+
+    __slots__ = ('record', 'resolved', 'errors')
+
+    def __init__(self, record: Any, resolved: Dict[str, Any], errors: Dict[str, BaseException]) -> None:
+        self.record = record
+        self.resolved = resolved
+        self.errors = errors
+
+    def __getitem__(self, attribute: str) -> Any:
+        return self.resolved[attribute]
+
+    def get(self, attribute: str, default: Any = None) -> Any:
+        return self.resolved.get(attribute, default)
+
+    def __repr__(self) -> str:
+        return 'Resolved(%r, %r)' % (self.record, sorted(self.resolved))
+
+
+class _Cache:
+    """LRU of the objects of one kind, with the lookups in flight."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self.values: 'collections.OrderedDict[str, Any]' = collections.OrderedDict()
+        self.loading: Dict[str, Future] = {}
+
+    def put(self, key: str, value: Any) -> None:
+        # called with the loader's lock held
+        self.values[key] = value
+        self.values.move_to_end(key)
+        while len(self.values) > self.max_entries:
+            self.values.popitem(last=False)
+
+
+class ReferenceLoader:
+    """Resolves the references of page records in a few parallel batches.
+
+    Records of `activity_get_my_activities`, `credential_received_credentials`,
+    `inbox_get_my_issued_credentials` and `contracts_get_credentials_for_contract`
+    refer to boosts, stored credentials and profiles by URI or id. `resolve`
+    collects the references of a whole page, looks each distinct one up once
+    (`boost_get_boost`, `storage_resolve`, `profile_get_other_profile`),
+    `max_workers` at a time, and pairs the results with the records. Results
+    are cached per kind, so later pages only fetch what they add, and
+    concurrent `resolve` calls share the lookups in flight; failed lookups
+    are not cached.
+
+    Boosts and profiles can change, so a long-lived loader serves them as of
+    their first lookup until `clear` is called.
+
+    :param api_client: client the lookups are made with.
+    :param max_workers: concurrent lookups.
+    :param max_entries: objects cached per kind.
+    :param fetchers: lookup per kind (`boost`, `credential`, `profile`),
+        replacing the default API calls.
+
+    :ivar requests: lookups made, per kind.
+    :ivar hits: references served from the cache or a lookup in flight,
+        per kind.
+    """
+
+    def __init__(
+        self,
+        api_client: Any = None,
+        max_workers: int = 8,
+        max_entries: int = 10000,
+        fetchers: Optional[Mapping[str, Callable[[str], Any]]] = None,
+    ) -> None:
+        self.fetchers: Dict[str, Callable[[str], Any]] = {}
+        if api_client is not None:
+            self.fetchers.update(self._fetchers_from(api_client))
+        if fetchers:
+            self.fetchers.update(fetchers)
+        self.max_entries = max_entries
+        self.requests: 'collections.Counter[str]' = collections.Counter()
+        self.hits: 'collections.Counter[str]' = collections.Counter()
+        self._lock = threading.Lock()
+        self._caches: Dict[str, _Cache] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='openapi_client.loader')
+
+    @staticmethod
+    def _fetchers_from(api_client: Any) -> Dict[str, Callable[[str], Any]]:
+        from openapi_client.api.boosts_api import BoostsApi
+        from openapi_client.api.profiles_api import ProfilesApi
+        from openapi_client.api.storage_api import StorageApi
+
+        return {
+            BOOST: BoostsApi(api_client).boost_get_boost,
+            CREDENTIAL: StorageApi(api_client).storage_resolve,
+            PROFILE: ProfilesApi(api_client).profile_get_other_profile,
+        }
+
+    def __enter__(self) -> 'ReferenceLoader':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stops the lookup threads."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def clear(self, kind: Optional[str] = None) -> None:
+        """Forgets the cached objects of `kind`, or of every kind."""
+        with self._lock:
+            for name, cache in self._caches.items():
+                if kind is None or name == kind:
+                    cache.values.clear()
+
+    def references(self, record: Any) -> Dict[str, str]:
+        """Returns the attributes of `record` holding references, with their kind."""
+        references = REFERENCES.get(type(record))
+        if references is None:
+            references = {a: k for a, k in DEFAULT_REFERENCES.items() if hasattr(record, a)}
+        return {a: k for a, k in references.items() if k in self.fetchers}
+
+    def load(self, kind: str, key: str) -> Any:
+        """Returns one object, from the cache if possible."""
+        return self._futures(kind, [key])[key].result()
+
+    def resolve(self, records: Iterable[Any]) -> List[Resolved]:
+        """Resolves the references of `records`, e.g. one page.
+
+        Each distinct reference is looked up once, all of them concurrently.
+        """
+        records = list(records)
+        wanted: Dict[str, Dict[str, None]] = collections.defaultdict(dict)
+        plans: List[List[Tuple[str, str, str]]] = []
+        for record in records:
+            plan = []
+            for attribute, kind in self.references(record).items():
+                key = getattr(record, attribute)
+                if key is not None:
+                    wanted[kind][key] = None
+                    plan.append((attribute, kind, key))
+            plans.append(plan)
+
+        futures = {kind: self._futures(kind, list(keys)) for kind, keys in wanted.items()}
+        results = []
+        for record, plan in zip(records, plans):
+            resolved: Dict[str, Any] = {}
+            errors: Dict[str, BaseException] = {}
+            for attribute, kind, key in plan:
+                error = futures[kind][key].exception()
+                if error is None:
+                    resolved[attribute] = futures[kind][key].result()
+                else:
+                    errors[attribute] = error
+            results.append(Resolved(record, resolved, errors))
+        return results
+
+    def iter_resolved(self, records: Iterable[Any], batch_size: int = 100) -> Iterator[Resolved]:
+        """Resolves `records` in batches of `batch_size`, e.g. from an `iter_*` method."""
+        iterator = iter(records)
+        while True:
+            batch = list(itertools.islice(iterator, batch_size))
+            if not batch:
+                return
+            yield from self.resolve(batch)
+
+    def _futures(self, kind: str, keys: List[str]) -> Dict[str, Future]:
+        fetch = self.fetchers.get(kind)
+        if fetch is None:
+            raise KeyError('no fetcher for %r' % kind)
+        futures: Dict[str, Future] = {}
+        submit: List[Tuple[str, Future]] = []
+        with self._lock:
+            cache = self._caches.get(kind)
+            if cache is None:
+                cache = self._caches[kind] = _Cache(self.max_entries)
+            for key in keys:
+                if key in cache.values:
+                    cache.values.move_to_end(key)
+                    future: Future = Future()
+                    future.set_result(cache.values[key])
+                    self.hits[kind] += 1
+                elif key in cache.loading:
+                    future = cache.loading[key]
+                    self.hits[kind] += 1
+                else:
+                    future = cache.loading[key] = Future()
+                    submit.append((key, future))
+                    self.requests[kind] += 1
+                futures[key] = future
+        for key, future in submit:
+            try:
+                self._executor.submit(contextvars.copy_context().run, self._fetch, kind, cache, fetch, key, future)
+            except RuntimeError:
+                # closed: looked up inline
+                self._fetch(kind, cache, fetch, key, future)
+        return futures
+
+    def _fetch(self, kind: str, cache: _Cache, fetch: Callable[[str], Any], key: str, future: Future) -> None:
+        try:
+            value = fetch(key)
+        except BaseException as e:
+            with self._lock:
+                del cache.loading[key]
+            future.set_exception(e)
+            return
+        with self._lock:
+            del cache.loading[key]
+            cache.put(key, value)
+        future.set_result(value)
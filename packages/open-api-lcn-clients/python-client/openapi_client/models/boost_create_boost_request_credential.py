@@ -6,9 +6,6 @@
     API for interacting with LearnCloud Network
 
     The version of the OpenAPI document: 1.0.0
-    Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-    Do not edit the class manually.
 """  # noqa: E501
 
 
@@ -18,6 +15,7 @@ import json
 import pprint
 import re  # noqa: F401
 from pydantic import BaseModel, ConfigDict, Field, StrictStr, ValidationError, field_validator
+from openapi_client.composite import resolve_composite
 from typing import Optional
 from openapi_client.models.boost_create_boost_request_credential_any_of import BoostCreateBoostRequestCredentialAnyOf
 from openapi_client.models.boost_send_request_template_credential_any_of import BoostSendRequestTemplateCredentialAnyOf
@@ -81,7 +79,7 @@ class BoostCreateBoostRequestCredential(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: Dict[str, Any]) -> Self:
-        return cls.from_json(json.dumps(obj))
+        return resolve_composite(cls, obj)
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
@@ -6,9 +6,6 @@
     API for interacting with LearnCloud Network
 
     The version of the OpenAPI document: 1.0.0
-    Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-    Do not edit the class manually.
 """  # noqa: E501
 
 
@@ -16,6 +13,7 @@ from __future__ import annotations
 import json
 import pprint
 from pydantic import BaseModel, ConfigDict, Field, StrictStr, ValidationError, field_validator
+from openapi_client.composite import resolve_composite
 from typing import Any, List, Optional
 from openapi_client.models.contact_methods_verify_with_credential200_response_contact_method_one_of import ContactMethodsVerifyWithCredential200ResponseContactMethodOneOf
 from openapi_client.models.contact_methods_verify_with_credential200_response_contact_method_one_of1 import ContactMethodsVerifyWithCredential200ResponseContactMethodOneOf1
@@ -78,7 +76,7 @@ class ContactMethodsVerifyWithCredential200ResponseContactMethod(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: Union[str, Dict[str, Any]]) -> Self:
-        return cls.from_json(json.dumps(obj))
+        return resolve_composite(cls, obj)
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
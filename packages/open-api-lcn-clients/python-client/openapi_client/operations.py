@@ -0,0 +1,380 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import inspect
+import typing
+import warnings
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from pydantic import Field, StrictFloat, StrictInt, StrictStr
+from typing_extensions import Annotated
+
+from openapi_client.api_client import ApiClient, RequestSerialized
+from openapi_client.api_response import ApiResponse
+from openapi_client.rest import RESTResponseType
+from openapi_client.validation import validate_call
+
+
+class Param(NamedTuple):
+    """One argument of an operation.
+
+    :param name: argument name, e.g. `profile_id`.
+    :param annotation: argument type, as validated by `validate_call`.
+    :param location: `path`, `query` or `body`.
+    :param key: name of a path or query parameter on the wire, e.g. `profileId`.
+    :param required: whether the argument has no default (optional ones
+        default to None).
+    :param collection_format: how a list query parameter is sent, e.g. `multi`.
+    """
+
+    name: str
+    annotation: Any
+    location: str
+    key: Optional[str] = None
+    required: bool = True
+    collection_format: Optional[str] = None
+
+
+class Endpoint(NamedTuple):
+    """Descriptor of one generated operation.
+
+    `GeneratedApi` builds the `<name>`, `<name>_with_http_info`,
+    `<name>_without_preload_content` and `_<name>_serialize` methods from it.
+
+    :param name: operation name, e.g. `boost_send`.
+    :param method: HTTP method.
+    :param path: path template, e.g. `/boost/send/{profileId}`.
+    :param params: the arguments, in the order of the spec, which is the order
+        query parameters are sent in; the signatures list required ones first.
+    :param returns: type of the deserialized response.
+    :param response_types_map: response type per status code, as passed to
+        `ApiClient.response_deserialize`.
+    :param summary: first line of the docstrings.
+    :param description: paragraph following the summary.
+    :param deprecated: warn with a DeprecationWarning on every call.
+    :param content_types: request content types; empty without a body.
+    :param accept: response content types.
+    :param auth_settings: names of the auth settings the operation uses.
+    """
+
+    name: str
+    method: str
+    path: str
+    params: Tuple[Param, ...]
+    returns: Any
+    response_types_map: Dict[str, Optional[str]]
+    summary: str = ''
+    description: str = ''
+    deprecated: bool = False
+    content_types: Tuple[str, ...] = ()
+    accept: Tuple[str, ...] = ('application/json',)
+    auth_settings: Tuple[str, ...] = ('Authorization',)
+
+
+# the `_`-prefixed arguments every operation takes after its own
+_OPTIONS = (
+    inspect.Parameter(
+        '_request_timeout',
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        default=None,
+        annotation=Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ],
+    ),
+    inspect.Parameter(
+        '_request_auth',
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        default=None,
+        annotation=Optional[Dict[StrictStr, Any]],
+    ),
+    inspect.Parameter(
+        '_content_type',
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        default=None,
+        annotation=Optional[StrictStr],
+    ),
+    inspect.Parameter(
+        '_headers',
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        default=None,
+        annotation=Optional[Dict[StrictStr, Any]],
+    ),
+    inspect.Parameter(
+        '_host_index',
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        default=0,
+        annotation=Annotated[StrictInt, Field(ge=0, le=0)],
+    ),
+)
+_SELF = inspect.Parameter('self', inspect.Parameter.POSITIONAL_OR_KEYWORD)
+
+_OPTIONS_DOC = """\
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """
+
+
+def _doc_type(annotation: Any) -> str:
+    """The `:type` of an argument in the generated docstrings."""
+    while True:
+        origin = typing.get_origin(annotation)
+        if origin is Annotated:
+            annotation = typing.get_args(annotation)[0]
+        elif origin is Union:
+            args = [a for a in typing.get_args(annotation) if a is not type(None)]
+            # Union[StrictFloat, StrictInt] is a number
+            annotation = args[0]
+        else:
+            break
+    if origin is list:
+        return 'List[%s]' % _doc_type(typing.get_args(annotation)[0])
+    if origin is dict:
+        return 'object'
+    return annotation.__name__
+
+
+def _signature_order(params: Tuple[Param, ...]) -> List[Param]:
+    return sorted(params, key=lambda p: not p.required)
+
+
+def _docstring(endpoint: Endpoint) -> str:
+    summary = endpoint.summary
+    if endpoint.deprecated:
+        summary = '(Deprecated) ' + summary
+    lines = [summary, '']
+    if endpoint.description:
+        lines += ['        ' + endpoint.description, '']
+    for param in _signature_order(endpoint.params):
+        lines.append('        :param %s:%s' % (param.name, ' (required)' if param.required else ''))
+        lines.append('        :type %s: %s' % (param.name, _doc_type(param.annotation)))
+    return '\n'.join(lines) + '\n' + _OPTIONS_DOC
+
+
+def _binder(parameters: List[inspect.Parameter]) -> Callable[[str, tuple, dict], Dict[str, Any]]:
+    """Maps the `(args, kwargs)` of a call to a dict of every argument's value."""
+    names = tuple(p.name for p in parameters)
+    positions = {name: position for position, name in enumerate(names)}
+    defaults = {p.name: p.default for p in parameters if p.default is not p.empty}
+    required = [p.name for p in parameters if p.default is p.empty]
+
+    def bind(function_name, args, kwargs):
+        if len(args) > len(names):
+            raise TypeError('%s() takes %d positional arguments but %d were given' % (
+                function_name, len(names) + 1, len(args) + 1,
+            ))
+        values = dict(defaults)
+        values.update(zip(names, args))
+        for name, value in kwargs.items():
+            position = positions.get(name)
+            if position is None:
+                raise TypeError('%s() got an unexpected keyword argument %r' % (function_name, name))
+            if position < len(args):
+                raise TypeError('%s() got multiple values for argument %r' % (function_name, name))
+            values[name] = value
+        if len(values) < len(names):
+            missing = [name for name in required if name not in values]
+            raise TypeError('%s() missing required arguments: %s' % (
+                function_name, ', '.join(repr(name) for name in missing),
+            ))
+        return values
+
+    return bind
+
+
+def _operation_methods(cls: type, endpoint: Endpoint) -> Dict[str, Callable]:
+    """The four methods of `endpoint`, as the generator would write them."""
+    name = endpoint.name
+    serialize_name = '_%s_serialize' % name
+    parameters = [
+        inspect.Parameter(
+            p.name,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            default=inspect.Parameter.empty if p.required else None,
+            annotation=p.annotation,
+        )
+        for p in _signature_order(endpoint.params)
+    ] + list(_OPTIONS)
+    # `_<name>_serialize` takes every argument but `_request_timeout`, none optional
+    serialize_parameters = [
+        inspect.Parameter(p.name, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        for p in parameters if p.name != '_request_timeout'
+    ]
+    bind = _binder(parameters)
+    bind_serialize = _binder(serialize_parameters)
+    response_types_map = endpoint.response_types_map
+    collection_formats = {
+        p.key: p.collection_format for p in endpoint.params if p.collection_format
+    }
+    deprecated = endpoint.deprecated
+    deprecation = '%s %s is deprecated.' % (endpoint.method, endpoint.path)
+
+    def serialize_values(self, values, raw=False):
+        # `raw`: the response is handed over unread, as reported to the hooks
+        path_params: Dict[str, str] = {}
+        query_params: List[Tuple[str, str]] = []
+        header_params: Dict[str, Optional[str]] = values['_headers'] or {}
+        body_params = None
+
+        for param in endpoint.params:
+            value = values[param.name]
+            if value is None:
+                continue
+            if param.location == 'path':
+                path_params[param.key] = value
+            elif param.location == 'query':
+                query_params.append((param.key, value))
+            else:
+                body_params = value
+
+        # set the HTTP header `Accept`
+        if 'Accept' not in header_params:
+            header_params['Accept'] = self.api_client.select_header_accept(
+                list(endpoint.accept)
+            )
+
+        # set the HTTP header `Content-Type`
+        if endpoint.content_types:
+            if values['_content_type']:
+                header_params['Content-Type'] = values['_content_type']
+            else:
+                default_content_type = self.api_client.select_header_content_type(
+                    list(endpoint.content_types)
+                )
+                if default_content_type is not None:
+                    header_params['Content-Type'] = default_content_type
+
+        return self.api_client.param_serialize(
+            method=endpoint.method,
+            resource_path=endpoint.path,
+            path_params=path_params,
+            query_params=query_params,
+            header_params=header_params,
+            body=body_params,
+            post_params=[],
+            files={},
+            auth_settings=list(endpoint.auth_settings),
+            collection_formats=collection_formats,
+            _host=None,
+            _request_auth=values['_request_auth'],
+            _operation_id=name,
+            _raw=raw
+        )
+
+    def serialize(self, *args, **kwargs):
+        return serialize_values(self, bind_serialize(serialize_name, args, kwargs))
+
+    def operation(self, *args, **kwargs):
+        values = bind(name, args, kwargs)
+        if deprecated:
+            warnings.warn(deprecation, DeprecationWarning)
+        response_data = self.api_client.call_api(
+            *serialize_values(self, values),
+            _request_timeout=values['_request_timeout']
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=response_types_map,
+        ).data
+
+    def with_http_info(self, *args, **kwargs):
+        values = bind(name + '_with_http_info', args, kwargs)
+        if deprecated:
+            warnings.warn(deprecation, DeprecationWarning)
+        response_data = self.api_client.call_api(
+            *serialize_values(self, values),
+            _request_timeout=values['_request_timeout']
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=response_types_map,
+        )
+
+    def without_preload_content(self, *args, **kwargs):
+        values = bind(name + '_without_preload_content', args, kwargs)
+        if deprecated:
+            warnings.warn(deprecation, DeprecationWarning)
+        response_data = self.api_client.call_api(
+            *serialize_values(self, values, raw=True),
+            _request_timeout=values['_request_timeout']
+        )
+        return response_data.response
+
+    doc = _docstring(endpoint)
+    methods = {}
+    for method_name, function, returns in (
+        (name, operation, endpoint.returns),
+        (name + '_with_http_info', with_http_info, ApiResponse[endpoint.returns]),
+        (name + '_without_preload_content', without_preload_content, RESTResponseType),
+        (serialize_name, serialize, RequestSerialized),
+    ):
+        function.__name__ = method_name
+        function.__qualname__ = '%s.%s' % (cls.__qualname__, method_name)
+        function.__module__ = cls.__module__
+        if method_name == serialize_name:
+            function.__signature__ = inspect.Signature([_SELF] + serialize_parameters, return_annotation=returns)
+            methods[method_name] = function
+            continue
+        function.__doc__ = doc
+        function.__signature__ = inspect.Signature([_SELF] + parameters, return_annotation=returns)
+        function.__annotations__ = {p.name: p.annotation for p in parameters}
+        function.__annotations__['return'] = returns
+        methods[method_name] = validate_call(function)
+    return methods
+
+
+class GeneratedApi:
+    """Base class of the generated API classes.
+
+    Subclasses list their operations in `operations`; every `Endpoint` there
+    becomes the methods `<name>`, `<name>_with_http_info`,
+    `<name>_without_preload_content` and `_<name>_serialize`, with the
+    signatures and docstrings the generator would have written out. Methods
+    defined on the subclass itself are left alone.
+    """
+
+    operations: Tuple[Endpoint, ...] = ()
+
+    def __init__(self, api_client=None) -> None:
+        if api_client is None:
+            api_client = ApiClient.get_default()
+        self.api_client = api_client
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        for endpoint in cls.__dict__.get('operations', ()):
+            for method_name, method in _operation_methods(cls, endpoint).items():
+                if method_name not in cls.__dict__:
+                    setattr(cls, method_name, method)
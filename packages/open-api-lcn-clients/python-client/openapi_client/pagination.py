@@ -0,0 +1,249 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import asyncio
+import contextvars
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Iterator, Optional, Tuple, get_args
+
+from pydantic import BaseModel
+
+from openapi_client.exceptions import ApiValueError
+
+
+def _cursor_model(annotation):
+    """Returns the request body model carrying `cursor`, if any."""
+    for candidate in (annotation,) + get_args(annotation):
+        if (
+            isinstance(candidate, type)
+            and issubclass(candidate, BaseModel)
+            and 'cursor' in candidate.model_fields
+        ):
+            return candidate
+    return None
+
+
+class _PageRequest:
+    """Builds the arguments of successive page requests for an operation.
+
+    The cursor is either a query parameter of the operation (`cursor`) or a
+    field of its request body model, e.g. `BoostGetPaginatedBoostsRequest`.
+    """
+
+    def __init__(self, operation: Callable, args, kwargs, page_size_param: Optional[str]) -> None:
+        self.operation = operation
+        self.bound = inspect.signature(operation).bind(*args, **kwargs)
+        self.page_size_param = page_size_param or 'limit'
+        self.body_param = None
+        parameters = self.bound.signature.parameters
+        if 'cursor' in parameters:
+            # skill trees page their roots with `roots_limit`
+            if page_size_param is None and 'limit' not in parameters and 'roots_limit' in parameters:
+                self.page_size_param = 'roots_limit'
+        else:
+            for name, parameter in parameters.items():
+                model = _cursor_model(parameter.annotation)
+                if model is not None:
+                    self.body_param = name
+                    # optional request bodies are paged from their defaults
+                    value = self.bound.arguments.get(name)
+                    if value is None:
+                        self.bound.arguments[name] = model()
+                    elif not isinstance(value, BaseModel):
+                        self.bound.arguments[name] = model.model_validate(value)
+                    break
+            else:
+                raise ApiValueError(
+                    "%s does not take a cursor" % getattr(operation, '__name__', operation)
+                )
+
+    def arguments(self, cursor: Optional[str], page_size: Optional[int]) -> Tuple[tuple, dict]:
+        arguments = dict(self.bound.arguments)
+        if self.body_param is None:
+            arguments['cursor'] = cursor
+            if page_size is not None:
+                arguments[self.page_size_param] = page_size
+        else:
+            update = {'cursor': cursor}
+            if page_size is not None:
+                update[self.page_size_param] = page_size
+            arguments[self.body_param] = arguments[self.body_param].model_copy(update=update)
+        bound = inspect.BoundArguments(self.bound.signature, arguments)
+        return bound.args, bound.kwargs
+
+
+def _has_next(page) -> bool:
+    return bool(page.has_more and page.cursor)
+
+
+def iter_pages(
+    operation: Callable,
+    *args,
+    page_size: Optional[int] = None,
+    page_size_param: Optional[str] = None,
+    prefetch: bool = True,
+    **kwargs
+) -> Iterator[Any]:
+    """Yields the pages of a `{cursor, hasMore, records}` operation.
+
+    :param operation: bound API method, e.g. `BoostsApi(...).boost_get_paginated_boosts`.
+    :param page_size: records requested per page; the server default if None.
+    :param page_size_param: name of the page size parameter or body field;
+                            `limit` (or `roots_limit` for skill trees) if None.
+    :param prefetch: request the next page in a background thread while the
+                     current one is being consumed.
+    """
+    request = _PageRequest(operation, args, kwargs, page_size_param)
+
+    def fetch(cursor):
+        page_args, page_kwargs = request.arguments(cursor, page_size)
+        return operation(*page_args, **page_kwargs)
+
+    if not prefetch:
+        page = fetch(None)
+        while True:
+            yield page
+            if not _has_next(page):
+                return
+            page = fetch(page.cursor)
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        page = fetch(None)
+        while True:
+            following = executor.submit(
+                contextvars.copy_context().run, fetch, page.cursor
+            ) if _has_next(page) else None
+            yield page
+            if following is None:
+                return
+            page = following.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_records(
+    operation: Callable,
+    *args,
+    page_size: Optional[int] = None,
+    max_records: Optional[int] = None,
+    page_size_param: Optional[str] = None,
+    prefetch: bool = True,
+    **kwargs
+) -> Iterator[Any]:
+    """Yields the records of a `{cursor, hasMore, records}` operation lazily.
+
+    Only the current page (and, with `prefetch`, the next one) is held in
+    memory, so arbitrarily long result sets can be streamed.
+
+    :param operation: bound API method, e.g. `BoostsApi(...).boost_get_paginated_boosts`.
+    :param page_size: records requested per page; the server default if None.
+    :param max_records: stop after this many records.
+    :param page_size_param: name of the page size parameter or body field;
+                            `limit` (or `roots_limit` for skill trees) if None.
+    :param prefetch: request the next page in a background thread while the
+                     current one is being consumed.
+    """
+    if max_records is not None and max_records <= 0:
+        return
+    if max_records is not None and page_size is not None:
+        page_size = min(page_size, max_records)
+    count = 0
+    pages = iter_pages(
+        operation,
+        *args,
+        page_size=page_size,
+        page_size_param=page_size_param,
+        prefetch=prefetch,
+        **kwargs
+    )
+    try:
+        for page in pages:
+            for record in page.records:
+                yield record
+                count += 1
+                if max_records is not None and count >= max_records:
+                    return
+    finally:
+        pages.close()
+
+
+async def aiter_pages(
+    operation: Callable,
+    *args,
+    page_size: Optional[int] = None,
+    page_size_param: Optional[str] = None,
+    prefetch: bool = True,
+    **kwargs
+) -> AsyncIterator[Any]:
+    """asyncio variant of :func:`iter_pages` for the `Async*Api` classes."""
+    request = _PageRequest(operation, args, kwargs, page_size_param)
+
+    async def fetch(cursor):
+        page_args, page_kwargs = request.arguments(cursor, page_size)
+        return await operation(*page_args, **page_kwargs)
+
+    page = await fetch(None)
+    following = None
+    try:
+        while True:
+            if _has_next(page):
+                following = fetch(page.cursor)
+                if prefetch:
+                    following = asyncio.ensure_future(following)
+            else:
+                following = None
+            yield page
+            if following is None:
+                return
+            page = await following
+            following = None
+    finally:
+        if following is not None:
+            if asyncio.isfuture(following):
+                following.cancel()
+            else:
+                following.close()
+
+
+async def aiter_records(
+    operation: Callable,
+    *args,
+    page_size: Optional[int] = None,
+    max_records: Optional[int] = None,
+    page_size_param: Optional[str] = None,
+    prefetch: bool = True,
+    **kwargs
+) -> AsyncIterator[Any]:
+    """asyncio variant of :func:`iter_records` for the `Async*Api` classes."""
+    if max_records is not None and max_records <= 0:
+        return
+    if max_records is not None and page_size is not None:
+        page_size = min(page_size, max_records)
+    count = 0
+    pages = aiter_pages(
+        operation,
+        *args,
+        page_size=page_size,
+        page_size_param=page_size_param,
+        prefetch=prefetch,
+        **kwargs
+    )
+    try:
+        async for page in pages:
+            for record in page.records:
+                yield record
+                count += 1
+                if max_records is not None and count >= max_records:
+                    return
+    finally:
+        await pages.aclose()
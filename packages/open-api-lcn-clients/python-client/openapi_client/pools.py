@@ -0,0 +1,273 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import inspect
+import os
+import threading
+from typing import Any, Callable, Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+import urllib3
+
+# bumped in forked children, whose inherited connections belong to the parent
+_fork_generation = 0
+
+
+class PoolStats(NamedTuple):
+    """Connection counts of one urllib3 pool manager.
+
+    :ivar host: `Configuration.host` of the clients using the manager.
+    :ivar clients: RESTClientObjects (one per ApiClient) using the manager.
+    :ivar pools: per-host connection pools held by the manager.
+    :ivar idle: open connections waiting in the pools.
+    :ivar in_use: connections currently serving a request.
+    :ivar opened: connections established so far.
+    :ivar reused: requests sent over an already open connection.
+    :ivar waited: requests that had to wait for a connection, as the pool
+        was full (`Configuration.connection_pool_block`).
+    :ivar discarded: connections closed on release as the pool was full.
+    """
+
+    host: Optional[str]
+    clients: int
+    pools: int
+    idle: int
+    in_use: int
+    opened: int
+    reused: int
+    waited: int
+    discarded: int
+
+    @property
+    def open(self) -> int:
+        """Connections currently open."""
+        return self.idle + self.in_use
+
+
+class _Counters:
+
+    __slots__ = ('lock', 'in_use', 'opened', 'reused', 'waited', 'discarded')
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.in_use = 0
+        self.opened = 0
+        self.reused = 0
+        self.waited = 0
+        self.discarded = 0
+
+
+def _counting_supported() -> bool:
+    """Whether the urllib3 in use has the internals `_CountingPool` overrides."""
+    if not urllib3.__version__.startswith('2.'):
+        return False
+    pool_class = urllib3.HTTPConnectionPool
+    try:
+        get_conn = list(inspect.signature(pool_class._get_conn).parameters)
+        put_conn = list(inspect.signature(pool_class._put_conn).parameters)
+    except (AttributeError, TypeError, ValueError):
+        return False
+    return get_conn == ['self', 'timeout'] and put_conn == ['self', 'conn']
+
+
+# `_CountingPool` overrides `_get_conn` and `_put_conn`, which are private to
+# urllib3: urllib3 has no public hook for a connection leaving or returning
+# to a pool. They are unchanged across the urllib3 2.x releases `setup.py`
+# allows, which test_pools checks; with any other urllib3 the pools are left
+# alone and the counters of `PoolStats` stay at zero.
+COUNTING_SUPPORTED = _counting_supported()
+
+
+class _CountingPool:
+    """Mixin for urllib3 connection pools keeping a manager's `_Counters`."""
+
+    counters: _Counters
+
+    def _get_conn(self, timeout=None):
+        pool = self.pool
+        waited = self.block and pool is not None and pool.empty()
+        conn = super()._get_conn(timeout)
+        counters = self.counters
+        with counters.lock:
+            counters.in_use += 1
+            if waited:
+                counters.waited += 1
+            if getattr(conn, 'is_connected', False):
+                counters.reused += 1
+            else:
+                counters.opened += 1
+        return conn
+
+    def _put_conn(self, conn) -> None:
+        pool = self.pool
+        discarded = conn is not None and pool is not None and pool.full()
+        super()._put_conn(conn)
+        counters = self.counters
+        with counters.lock:
+            counters.in_use -= 1
+            if discarded:
+                counters.discarded += 1
+
+
+def count_connections(manager: urllib3.PoolManager) -> _Counters:
+    """Makes the pools `manager` creates from now on update its counters.
+
+    Does nothing but attach the counters unless `COUNTING_SUPPORTED`.
+    """
+    counters = _Counters()
+    manager.counters = counters
+    if not COUNTING_SUPPORTED:
+        return counters
+    manager.pool_classes_by_scheme = {
+        scheme: type(pool_class.__name__, (_CountingPool, pool_class), {'counters': counters})
+        for scheme, pool_class in manager.pool_classes_by_scheme.items()
+    }
+    return counters
+
+
+def pool_stats(manager: urllib3.PoolManager, host: Optional[str] = None, clients: int = 1) -> PoolStats:
+    """Returns the current `PoolStats` of a pool manager."""
+    counters = getattr(manager, 'counters', None) or _Counters()
+    pools = idle = 0
+    for key in manager.pools.keys():
+        pool = manager.pools.get(key)
+        if pool is None or pool.pool is None:
+            continue
+        pools += 1
+        # the LifoQueue of the pool; None stands for a connection not opened yet
+        idle += sum(1 for conn in list(pool.pool.queue) if getattr(conn, 'is_connected', False))
+    with counters.lock:
+        return PoolStats(
+            host=host,
+            clients=clients,
+            pools=pools,
+            idle=idle,
+            in_use=counters.in_use,
+            opened=counters.opened,
+            reused=counters.reused,
+            waited=counters.waited,
+            discarded=counters.discarded,
+        )
+
+
+def _hashable(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((k, _hashable(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(v) for v in value)
+    return value
+
+
+def pool_key(host: Optional[str], pool_args: Dict[str, Any]) -> Tuple[Hashable, ...]:
+    """Key of the pool manager shared by clients with these settings.
+
+    `pool_args` are the urllib3 pool manager arguments, which hold the TLS,
+    proxy, retry and pool size settings; credentials are not part of it, so
+    clients with different tokens share connections.
+    """
+    return (host, _hashable(pool_args))
+
+
+class _Entry:
+
+    __slots__ = ('manager', 'host', 'clients')
+
+    def __init__(self, manager: urllib3.PoolManager, host: Optional[str]) -> None:
+        self.manager = manager
+        self.host = host
+        self.clients = 0
+
+
+class PoolRegistry:
+    """Pool managers shared between the ApiClients with the same settings.
+
+    Each `acquire` of a key is matched by a `release`; the manager is
+    cleared, closing its idle connections, when its last client releases
+    it. In a forked child the registry starts out empty, as the inherited
+    connections are the parent's.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[Hashable, ...], _Entry] = {}
+        self._generation = _fork_generation
+
+    def _check_fork(self) -> None:
+        if self._generation != _fork_generation:
+            # the lock may have been held by another thread of the parent
+            self._lock = threading.Lock()
+            self._entries = {}
+            self._generation = _fork_generation
+
+    def acquire(
+        self,
+        key: Tuple[Hashable, ...],
+        factory: Callable[[], urllib3.PoolManager],
+        host: Optional[str] = None,
+    ) -> urllib3.PoolManager:
+        """Returns the manager for `key`, creating it with `factory`."""
+        self._check_fork()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                manager = factory()
+                count_connections(manager)
+                entry = self._entries[key] = _Entry(manager, host)
+            entry.clients += 1
+            return entry.manager
+
+    def release(self, key: Tuple[Hashable, ...], generation: int) -> None:
+        """Releases one `acquire` of `key` made in fork `generation`."""
+        if generation != _fork_generation:
+            return
+        self._check_fork()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry.clients -= 1
+            if entry.clients > 0:
+                return
+            del self._entries[key]
+        entry.manager.clear()
+
+    def clients(self, key: Tuple[Hashable, ...]) -> int:
+        """Number of unreleased `acquire`s of `key`."""
+        self._check_fork()
+        entry = self._entries.get(key)
+        return 0 if entry is None else entry.clients
+
+    def stats(self) -> List[PoolStats]:
+        """Returns the `PoolStats` of every shared manager."""
+        self._check_fork()
+        with self._lock:
+            entries = list(self._entries.values())
+        return [pool_stats(e.manager, e.host, e.clients) for e in entries]
+
+    def __len__(self) -> int:
+        self._check_fork()
+        return len(self._entries)
+
+
+shared_pools = PoolRegistry()
+
+
+def fork_generation() -> int:
+    """Number of forks between the main process and this one."""
+    return _fork_generation
+
+
+def _after_fork_in_child() -> None:
+    global _fork_generation
+    _fork_generation += 1
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
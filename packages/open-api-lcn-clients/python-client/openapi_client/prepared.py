@@ -0,0 +1,279 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import inspect
+import uuid
+from json.encoder import encode_basestring, encode_basestring_ascii
+from typing import Any, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+from openapi_client import instrumentation
+from openapi_client.api_client import RequestSerialized
+from openapi_client.bulk import BulkCheckpoint, BulkResult, bulk_call
+from openapi_client.encoding import encode
+
+
+class PreparedRequest(NamedTuple):
+    """A fully serialized request for a generated operation.
+
+    Holds exactly what the generated `<operation>_with_http_info` method would
+    hand to `ApiClient.call_api`, plus the `_response_types_map` it would pass
+    to `ApiClient.response_deserialize`.
+    """
+
+    method: str
+    url: str
+    header_params: Dict[str, str]
+    body: Any
+    post_params: Any
+    request_timeout: Any = None
+    response_types_map: Optional[Dict[str, Optional[str]]] = None
+
+    @property
+    def params(self) -> RequestSerialized:
+        """Positional arguments for `ApiClient.call_api`."""
+        return (
+            self.method,
+            self.url,
+            self.header_params,
+            self.body,
+            self.post_params,
+        )
+
+
+class _RecordedCall:
+    """Stands in for a `RESTResponse` while an operation is being prepared."""
+
+    def __init__(self, prepared: PreparedRequest) -> None:
+        self.prepared = prepared
+        self.response = None
+        self.data = b""
+
+    def read(self):
+        return self.data
+
+
+class _RequestRecorder:
+    """ApiClient proxy that records requests instead of sending them.
+
+    Everything except the transport is delegated to the wrapped client, so
+    headers, auth and host selection match a real call exactly.
+    """
+
+    def __init__(self, api_client) -> None:
+        self._api_client = api_client
+
+    def __getattr__(self, name):
+        return getattr(self._api_client, name)
+
+    def call_api(
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ) -> _RecordedCall:
+        return _RecordedCall(PreparedRequest(
+            method=method,
+            url=url,
+            header_params=header_params,
+            body=body,
+            post_params=post_params,
+            request_timeout=_request_timeout,
+        ))
+
+    def response_deserialize(
+        self,
+        response_data: _RecordedCall,
+        response_types_map: Optional[Dict[str, Optional[str]]]=None
+    ) -> PreparedRequest:
+        return response_data.prepared._replace(
+            response_types_map=response_types_map
+        )
+
+
+def prepare_request(api, operation: str, *args, **kwargs) -> PreparedRequest:
+    """Serializes a call to `operation` on `api` without sending it.
+
+    Argument validation, `_<operation>_serialize` and the response types map
+    are the generated ones, so the result is what the operation would send.
+    Hooks are not told of it; use `send_request` to send it as `operation`.
+
+    :param api: instance of a generated API class, e.g. `BoostsApi`.
+    :param operation: operation name, e.g. `boost_get_boost`.
+    :return: PreparedRequest
+    """
+    return _record(api, operation, args, kwargs)[0]
+
+
+def send_request(api, operation: str, *args, **kwargs) -> Tuple[PreparedRequest, Any]:
+    """Prepares a call to `operation` and sends it with `ApiClient.call_api`.
+
+    :param api: instance of a generated API class, e.g. `BoostsApi`.
+    :param operation: operation name, e.g. `boost_get_boost`.
+    :return: the PreparedRequest and the unread response (awaitable with an
+        `AsyncApiClient`).
+    """
+    prepared, recorded = _record(api, operation, args, kwargs)
+    instrumentation.resume(recorded)
+    return prepared, api.api_client.call_api(
+        *prepared.params,
+        _request_timeout=prepared.request_timeout
+    )
+
+
+def _record(api, operation, args, kwargs):
+    recorder = type(api)(_RequestRecorder(api.api_client))
+    return instrumentation.detach(getattr(recorder, operation + '_with_http_info'), *args, **kwargs)
+
+
+def iter_operations(api_cls) -> Iterator[str]:
+    """Yields the operation names defined on a generated API class."""
+    for name in sorted(vars(api_cls)):
+        if name.startswith('_') or name.endswith(('_with_http_info', '_without_preload_content')):
+            continue
+        if hasattr(api_cls, '_%s_serialize' % name):
+            yield name
+
+
+
+class RequestTemplate:
+    """A request sent many times with a single string field of its body changed.
+
+    The arguments are validated and the body is encoded once, with a
+    placeholder in `field`; each send only validates the new value and
+    splices it into the encoded body. Headers, auth and the URL are still
+    built per send by the generated `_<operation>_serialize` method (without
+    a body), so token changes, hooks, caching and throttling apply as usual.
+
+    :param api: instance of a generated API class, e.g. `SendApi`.
+    :param operation: operation name, e.g. `boost_send`; its only parameter
+        apart from the `_`-prefixed ones must be the request body.
+    :param request: the request model; its value of `field` is ignored.
+    :param field: name of the string field that changes between sends.
+    """
+
+    def __init__(
+        self,
+        api,
+        operation: str,
+        request: BaseModel,
+        field: str,
+        **kwargs: Any
+    ) -> None:
+        self.api = api
+        self.operation = operation
+        self.field = field
+        # validates the request and the `_request_*` arguments
+        prepared = prepare_request(api, operation, request, **kwargs)
+        self.request_timeout = prepared.request_timeout
+        self.response_types_map = prepared.response_types_map
+        self._serialize = getattr(api, '_%s_serialize' % operation)
+        body_params = [
+            name for name in inspect.signature(self._serialize).parameters
+            if not name.startswith('_')
+        ]
+        if len(body_params) != 1:
+            raise ValueError('%s takes parameters besides its request body' % operation)
+        self._serialize_kwargs = {
+            body_params[0]: None,
+            '_request_auth': kwargs.get('_request_auth'),
+            '_content_type': kwargs.get('_content_type'),
+            '_headers': kwargs.get('_headers'),
+            '_host_index': kwargs.get('_host_index', 0),
+        }
+
+        self._model_class = type(request)
+        placeholder = '\x00' + uuid.uuid4().hex
+        if not isinstance(self._validate(placeholder), str):
+            raise ValueError('%s is not a string field' % field)
+        compact = getattr(api.api_client, 'compact_json', True)
+        self._escape = encode_basestring if compact else encode_basestring_ascii
+        body = encode(request.model_copy(update={field: placeholder}), compact=compact)
+        parts = body.split(self._escape(placeholder).encode('utf-8'))
+        if len(parts) != 2:
+            raise ValueError('%s does not appear once in the encoded request' % field)
+        self._prefix, self._suffix = parts
+
+    def _validate(self, value: Any) -> Any:
+        # field type and validators, as assigning to the field of a request
+        instance = self._model_class.model_construct()
+        self._model_class.__pydantic_validator__.validate_assignment(instance, self.field, value)
+        return instance.__dict__[self.field]
+
+    def body(self, value: str) -> bytes:
+        """Returns the encoded request body with `field` set to `value`."""
+        value = self._validate(value)
+        return self._prefix + self._escape(value).encode('utf-8') + self._suffix
+
+    def _params(self, value: str) -> RequestSerialized:
+        body = self.body(value)
+        kwargs = self._serialize_kwargs
+        if kwargs['_headers']:
+            kwargs = dict(kwargs, _headers=dict(kwargs['_headers']))
+        method, url, header_params, _, post_params = self._serialize(**kwargs)
+        return method, url, header_params, body, post_params
+
+    def send(self, value: str) -> Any:
+        """Sends the request with `field` set to `value`.
+
+        :return: the deserialized response, as the operation returns it.
+        """
+        response_data = self.api.api_client.call_api(
+            *self._params(value),
+            _request_timeout=self.request_timeout
+        )
+        response_data.read()
+        return self.api.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=self.response_types_map,
+        ).data
+
+    async def asend(self, value: str) -> Any:
+        """`send` for templates prepared on an `AsyncApiClient`."""
+        response_data = await self.api.api_client.call_api(
+            *self._params(value),
+            _request_timeout=self.request_timeout
+        )
+        await response_data.read()
+        return self.api.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=self.response_types_map,
+        ).data
+
+    def bulk_send(
+        self,
+        values: Iterable[str],
+        *,
+        max_workers: Optional[int] = None,
+        max_retries: int = 5,
+        checkpoint: Optional[Union[str, BulkCheckpoint]] = None,
+        retry_read_errors: bool = False,
+    ) -> Iterator[BulkResult]:
+        """Sends the request once per value, concurrently; see `bulk_call`.
+
+        :return: Returns an iterator of BulkResult, one per value.
+        """
+        if isinstance(checkpoint, str):
+            checkpoint = BulkCheckpoint(checkpoint)
+        if max_workers is None:
+            max_workers = self.api.api_client.configuration.connection_pool_maxsize
+        return bulk_call(
+            self.send,
+            values,
+            max_workers=max_workers,
+            max_retries=max_retries,
+            checkpoint=checkpoint,
+            retry_read_errors=retry_read_errors,
+        )
@@ -0,0 +1,326 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from openapi_client.models.storage_resolve200_response import StorageResolve200Response
+from openapi_client.prepared import send_request
+
+# credentials and presentations cannot be changed once stored; boosts,
+# contracts, terms, frameworks and skills can
+IMMUTABLE_URI_RE = re.compile(r':(credential|presentation):[^:]+$')
+
+# record header of a segment: magic, key length, data length
+_HEADER = struct.Struct('>4sII')
+_MAGIC = b'LCRC'
+
+
+def is_immutable(uri: str) -> bool:
+    """Whether `uri` names a stored credential or presentation."""
+    return IMMUTABLE_URI_RE.search(uri) is not None
+
+
+class StoredItem:
+    """The body `storage_resolve` returned for a URI, parsed on first use.
+
+    :ivar uri: the resolved URI.
+    :ivar raw: the JSON body as received (or as stored).
+    """
+
+    __slots__ = ('uri', 'raw', '_json', '_value')
+
+    def __init__(self, uri: str, raw: bytes) -> None:
+        self.uri = uri
+        self.raw = raw
+        self._json: Any = None
+        self._value: Optional[StorageResolve200Response] = None
+
+    def json(self) -> Any:
+        """The body as plain JSON values, without model validation."""
+        if self._json is None:
+            self._json = json.loads(self.raw)
+        return self._json
+
+    @property
+    def value(self) -> StorageResolve200Response:
+        """The body as the model `storage_resolve` returns."""
+        if self._value is None:
+            self._value = StorageResolve200Response.from_dict(self.json())
+        return self._value
+
+    def __repr__(self) -> str:
+        return 'StoredItem(%r, %d bytes)' % (self.uri, len(self.raw))
+
+
+class SegmentStore:
+    """Append-only segment files of cached bodies, read through mmap.
+
+    Bodies are appended to the current segment until it reaches
+    `segment_bytes`, then a new one is started; once the segments take more
+    than `max_bytes`, the oldest one is deleted with the bodies it holds.
+    The index is rebuilt from the segments when the store is opened, and a
+    record cut short by a crash is dropped. A directory is meant for one
+    process at a time.
+
+    :param directory: where the segments are kept; created if missing.
+    :param segment_bytes: size at which a segment is closed.
+    :param max_bytes: size the segments are trimmed back to.
+    """
+
+    SUFFIX = '.segment'
+
+    def __init__(self, directory: str, segment_bytes: int = 64 * 1024 * 1024, max_bytes: int = 1024 * 1024 * 1024) -> None:
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # key -> (segment, offset of the data, data length)
+        self._index: Dict[str, Tuple[int, int, int]] = {}
+        self._sizes: 'OrderedDict[int, int]' = OrderedDict()
+        self._maps: Dict[int, mmap.mmap] = {}
+        os.makedirs(directory, exist_ok=True)
+        for segment in sorted(self._segments()):
+            self._sizes[segment] = self._scan(segment)
+        if not self._sizes:
+            self._sizes[0] = 0
+        self._active = next(reversed(self._sizes))
+        self._file = open(self._path(self._active), 'ab')
+
+    def _path(self, segment: int) -> str:
+        return os.path.join(self.directory, '%08d%s' % (segment, self.SUFFIX))
+
+    def _segments(self) -> List[int]:
+        segments = []
+        for name in os.listdir(self.directory):
+            if name.endswith(self.SUFFIX) and name[:-len(self.SUFFIX)].isdigit():
+                segments.append(int(name[:-len(self.SUFFIX)]))
+        return segments
+
+    def _scan(self, segment: int) -> int:
+        # indexes the records of a segment; returns its valid length
+        path = self._path(segment)
+        with open(path, 'rb') as f:
+            content = f.read()
+        offset = 0
+        while offset + _HEADER.size <= len(content):
+            magic, key_length, data_length = _HEADER.unpack_from(content, offset)
+            start = offset + _HEADER.size
+            end = start + key_length + data_length
+            if magic != _MAGIC or end > len(content):
+                break
+            key = content[start:start + key_length].decode('utf-8')
+            self._index[key] = (segment, start + key_length, data_length)
+            offset = end
+        if offset < len(content):
+            with open(path, 'r+b') as f:
+                f.truncate(offset)
+        return offset
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    @property
+    def size(self) -> int:
+        """Bytes held by the segments."""
+        return sum(self._sizes.values())
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            location = self._index.get(key)
+            if location is None:
+                return None
+            segment, offset, length = location
+            mapped = self._maps.get(segment)
+            if mapped is None or len(mapped) < offset + length:
+                # the current segment has grown since it was mapped
+                if mapped is not None:
+                    mapped.close()
+                with open(self._path(segment), 'rb') as f:
+                    mapped = self._maps[segment] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return mapped[offset:offset + length]
+
+    def put(self, key: str, data: bytes) -> None:
+        encoded = key.encode('utf-8')
+        record = _HEADER.pack(_MAGIC, len(encoded), len(data)) + encoded + data
+        with self._lock:
+            if self._sizes[self._active] and self._sizes[self._active] + len(record) > self.segment_bytes:
+                self._file.close()
+                self._active += 1
+                self._sizes[self._active] = 0
+                self._file = open(self._path(self._active), 'ab')
+            offset = self._sizes[self._active]
+            self._file.write(record)
+            # visible to the mmap reads before the lock is released
+            self._file.flush()
+            self._sizes[self._active] = offset + len(record)
+            self._index[key] = (self._active, offset + _HEADER.size + len(encoded), len(data))
+            while self.size > self.max_bytes and len(self._sizes) > 1:
+                self._drop(next(iter(self._sizes)))
+
+    def _drop(self, segment: int) -> None:
+        # called with the lock held
+        del self._sizes[segment]
+        mapped = self._maps.pop(segment, None)
+        if mapped is not None:
+            mapped.close()
+        for key in [k for k, location in self._index.items() if location[0] == segment]:
+            del self._index[key]
+        try:
+            os.remove(self._path(segment))
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        with self._lock:
+            for segment in list(self._sizes):
+                if segment != self._active:
+                    self._drop(segment)
+            mapped = self._maps.pop(self._active, None)
+            if mapped is not None:
+                mapped.close()
+            self._file.truncate(0)
+            self._sizes[self._active] = 0
+            self._index.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            for mapped in self._maps.values():
+                mapped.close()
+            self._maps.clear()
+            self._file.close()
+
+
+class ResolveCache:
+    """Cache of `storage_resolve` bodies by URI, for URIs that never change.
+
+    Bodies are kept as received, in a memory LRU of up to `max_bytes` and,
+    with `directory`, in a `SegmentStore` that survives restarts; a body
+    found on disk is moved back into memory. Only URIs `cacheable` accepts
+    are stored, by default those of stored credentials and presentations.
+
+        api_client.resolve_cache = ResolveCache(directory='/var/cache/lcn-resolve')
+
+    `StorageApi.cached_storage_resolve` then answers from the cache without
+    a request, and `StorageApi.cached_storage_store(..., seed=True)` adds
+    what it stores.
+
+    :param max_bytes: size of the bodies kept in memory.
+    :param directory: where to keep the on-disk segments; None keeps
+        bodies in memory only.
+    :param segment_bytes: size of a disk segment.
+    :param max_disk_bytes: size the disk segments are trimmed back to.
+    :param cacheable: decides which URIs are cached.
+
+    :ivar hits: lookups answered from memory.
+    :ivar disk_hits: lookups answered from disk.
+    :ivar misses: lookups that found nothing.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        directory: Optional[str] = None,
+        segment_bytes: int = 64 * 1024 * 1024,
+        max_disk_bytes: int = 1024 * 1024 * 1024,
+        cacheable: Callable[[str], bool] = is_immutable,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.cacheable = cacheable
+        self.disk = SegmentStore(directory, segment_bytes, max_disk_bytes) if directory is not None else None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[str, bytes]' = OrderedDict()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, uri: str) -> bool:
+        return uri in self._entries or (self.disk is not None and uri in self.disk)
+
+    def get(self, uri: str) -> Optional[bytes]:
+        """Returns the cached body of `uri`, if any."""
+        with self._lock:
+            data = self._entries.get(uri)
+            if data is not None:
+                self._entries.move_to_end(uri)
+                self.hits += 1
+                return data
+        data = self.disk.get(uri) if self.disk is not None else None
+        with self._lock:
+            if data is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(uri, data)
+        return data
+
+    def put(self, uri: str, data: bytes) -> bool:
+        """Caches the body of `uri`; returns False if `uri` is not cacheable."""
+        if not self.cacheable(uri):
+            return False
+        with self._lock:
+            if uri in self._entries:
+                return True
+            self._remember(uri, data)
+        if self.disk is not None and uri not in self.disk:
+            self.disk.put(uri, data)
+        return True
+
+    def _remember(self, uri: str, data: bytes) -> None:
+        # called with the lock held
+        previous = self._entries.pop(uri, None)
+        if previous is not None:
+            self._size -= len(previous)
+        if len(data) > self.max_bytes:
+            return
+        self._entries[uri] = data
+        self._size += len(data)
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+        if self.disk is not None:
+            self.disk.clear()
+
+    def close(self) -> None:
+        """Closes the disk segments."""
+        if self.disk is not None:
+            self.disk.close()
+
+
+def resolve_raw(api: Any, uri: str, **kwargs: Any) -> bytes:
+    """Calls `storage_resolve` and returns its body without deserializing it.
+
+    Error responses are raised as by `storage_resolve`.
+
+    :param api: a `StorageApi`.
+    """
+    prepared, response_data = send_request(api, 'storage_resolve', uri, **kwargs)
+    response_data.read()
+    response_types_map = dict(prepared.response_types_map, **{'200': 'bytearray'})
+    return api.api_client.response_deserialize(response_data, response_types_map).data
@@ -6,9 +6,6 @@
     API for interacting with LearnCloud Network
 
     The version of the OpenAPI document: 1.0.0
-    Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-    Do not edit the class manually.
 """  # noqa: E501
 
 
@@ -16,9 +13,11 @@ import io
 import json
 import re
 import ssl
+import weakref
 
 import urllib3
 
+from openapi_client import pools
 from openapi_client.exceptions import ApiException, ApiValueError
 
 SUPPORTED_SOCKS_PROXIES = {"socks5", "socks5h", "socks4", "socks4a"}
@@ -42,10 +41,18 @@ class RESTResponse(io.IOBase):
         self.status = resp.status
         self.reason = resp.reason
         self.data = None
+        # set by ApiClient.call_api while instrumentation hooks are registered
+        self.operation = None
 
     def read(self):
         if self.data is None:
+            operation = self.operation
+            if operation is not None:
+                operation.mark()
             self.data = self.response.data
+            if operation is not None:
+                operation.lap('read')
+                operation.bytes_in = len(self.data)
         return self.data
 
     @property
@@ -62,6 +69,11 @@ class RESTResponse(io.IOBase):
         return self.response.headers.get(name, default)
 
 
+# urllib3.Retry objects are immutable, so clients can share this one (and
+# its pool manager)
+_THROTTLED_RETRIES = urllib3.Retry(respect_retry_after_header=False)
+
+
 class RESTClientObject:
 
     def __init__(self, configuration) -> None:
@@ -90,6 +102,10 @@ class RESTClientObject:
 
         if configuration.retries is not None:
             pool_args['retries'] = configuration.retries
+        elif configuration.adaptive_concurrency:
+            # hand 429/503 responses back to ApiClient.throttle instead of
+            # retrying them behind its back
+            pool_args['retries'] = _THROTTLED_RETRIES
 
         if configuration.tls_server_name:
             pool_args['server_hostname'] = configuration.tls_server_name
@@ -101,21 +117,68 @@ class RESTClientObject:
         if configuration.connection_pool_maxsize is not None:
             pool_args['maxsize'] = configuration.connection_pool_maxsize
 
-        # https pool manager
-        self.pool_manager: urllib3.PoolManager
+        if configuration.connection_pool_block:
+            pool_args['block'] = True
 
         if configuration.proxy:
+            pool_args["proxy_url"] = configuration.proxy
             if is_socks_proxy_url(configuration.proxy):
-                from urllib3.contrib.socks import SOCKSProxyManager
-                pool_args["proxy_url"] = configuration.proxy
                 pool_args["headers"] = configuration.proxy_headers
-                self.pool_manager = SOCKSProxyManager(**pool_args)
             else:
-                pool_args["proxy_url"] = configuration.proxy
                 pool_args["proxy_headers"] = configuration.proxy_headers
-                self.pool_manager = urllib3.ProxyManager(**pool_args)
+
+        self._pool_args = pool_args
+        self._host = configuration.host
+        # share the pool manager with the other clients of the same settings,
+        # see openapi_client.pools
+        self._shared = configuration.share_connection_pools
+        self._key = pools.pool_key(self._host, pool_args)
+        self._release = None
+        self._connect()
+
+    def _new_pool_manager(self) -> urllib3.PoolManager:
+        pool_args = dict(self._pool_args)
+        proxy = pool_args.get("proxy_url")
+        if proxy and is_socks_proxy_url(proxy):
+            from urllib3.contrib.socks import SOCKSProxyManager
+            return SOCKSProxyManager(**pool_args)
+        elif proxy:
+            return urllib3.ProxyManager(**pool_args)
+        else:
+            return urllib3.PoolManager(**pool_args)
+
+    def _connect(self) -> None:
+        # https pool manager
+        self.pool_manager: urllib3.PoolManager
+
+        if self._release is not None:
+            self._release.detach()
+        self._generation = pools.fork_generation()
+        if self._shared:
+            self.pool_manager = pools.shared_pools.acquire(
+                self._key, self._new_pool_manager, self._host
+            )
+            self._release = weakref.finalize(
+                self, pools.shared_pools.release, self._key, self._generation
+            )
         else:
-            self.pool_manager = urllib3.PoolManager(**pool_args)
+            self.pool_manager = self._new_pool_manager()
+            pools.count_connections(self.pool_manager)
+            self._release = weakref.finalize(self, self.pool_manager.clear)
+
+    def close(self) -> None:
+        """Releases the pool manager.
+
+        A shared pool manager is cleared once its last client is closed;
+        requests made after `close` open a new one.
+        """
+        if self._release is not None:
+            self._release()
+
+    def stats(self) -> pools.PoolStats:
+        """Returns the connection counts of this client's pool manager."""
+        clients = pools.shared_pools.clients(self._key) if self._shared else 1
+        return pools.pool_stats(self.pool_manager, self._host, clients)
 
     def request(
         self,
@@ -140,6 +203,10 @@ class RESTClientObject:
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
         """
+        if self._generation != pools.fork_generation() or not self._release.alive:
+            # forked, or closed: the connections to use are not ours anymore
+            self._connect()
+
         method = method.upper()
         assert method in [
             'GET',
@@ -183,7 +250,10 @@ class RESTClientObject:
                     or re.search('json', content_type, re.IGNORECASE)
                 ):
                     request_body = None
-                    if body is not None:
+                    if isinstance(body, bytes):
+                        # already encoded, e.g. by openapi_client.encoding
+                        request_body = body
+                    elif body is not None:
                         request_body = json.dumps(body)
                     r = self.pool_manager.request(
                         method,
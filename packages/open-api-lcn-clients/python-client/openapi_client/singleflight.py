@@ -0,0 +1,104 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+COALESCED_METHODS = frozenset({'GET', 'HEAD'})
+
+
+class _Call:
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Collapses concurrent identical requests into one.
+
+    The first caller for a key runs the request; callers arriving with the
+    same key while it is in flight wait for it and receive the same result
+    (or exception) instead of sending a request of their own. Nothing is
+    remembered once the request completes, so unlike `ResponseCache` this
+    never serves data older than the request it waited for.
+
+    `ApiClient` and `AsyncApiClient` key GET and HEAD requests by method, URL
+    and `Authorization`/`Cookie` headers:
+
+        api_client.single_flight = SingleFlight()
+
+    :ivar requests: number of calls made through `do`/`do_async`.
+    :ivar collapsed: number of those served by another caller's request.
+    """
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.collapsed = 0
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Tuple[Hashable, int], 'asyncio.Future[Any]'] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Runs `fn` unless a call with the same key is in flight.
+
+        :param key: identity of the request.
+        :param fn: performs the request; its result is shared by all callers
+            and must not be consumed destructively by any of them.
+        :return: the result of the in-flight call.
+        """
+        with self._lock:
+            self.requests += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.collapsed += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """asyncio flavour of `do`.
+
+        The request runs in its own task, so cancelling the caller that
+        started it does not cancel it for the others waiting on it.
+        """
+        loop = asyncio.get_running_loop()
+        task_key = (key, id(loop))
+        with self._lock:
+            self.requests += 1
+            task = self._tasks.get(task_key)
+            if task is None:
+                task = self._tasks[task_key] = loop.create_task(fn())
+                task.add_done_callback(lambda _: self._forget(task_key))
+            else:
+                self.collapsed += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, task_key: Tuple[Hashable, int]) -> None:
+        with self._lock:
+            del self._tasks[task_key]
@@ -0,0 +1,293 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import contextvars
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from openapi_client.models.schema0 import Schema0
+from openapi_client.models.schema1 import Schema1
+from openapi_client.models.skill_frameworks_replace_skills_request import SkillFrameworksReplaceSkillsRequest
+from openapi_client.models.skills_create_many_request import SkillsCreateManyRequest
+from openapi_client.models.skills_update_request import SkillsUpdateRequest
+
+# fields compared between the local and the remote skills
+SYNC_FIELDS = ('statement', 'description', 'code', 'icon', 'type', 'status')
+# fields the server defaults; only compared when set locally
+DEFAULTED_FIELDS = ('type', 'status')
+
+
+def content_hash(skill: Union[Schema0, Schema1], fields: Sequence[str] = SYNC_FIELDS) -> str:
+    """Hash of the content of a skill (not its id, children or position)."""
+    values = [getattr(skill, field) for field in fields]
+    return hashlib.sha1(json.dumps(values).encode('utf-8')).hexdigest()
+
+
+def _fields(skill: Schema0) -> Tuple[str, ...]:
+    return tuple(f for f in SYNC_FIELDS if f not in DEFAULTED_FIELDS or getattr(skill, f) is not None)
+
+
+def _size(skill: Schema0) -> int:
+    return 1 + sum(_size(child) for child in skill.children or ())
+
+
+class SkillCreate(NamedTuple):
+    """New skills under an existing parent (None for a root)."""
+
+    parent_id: Optional[str]
+    skill: Schema0
+
+
+class SkillUpdate(NamedTuple):
+    """Changed fields of an existing skill."""
+
+    id: str
+    changes: Dict[str, Any]
+
+
+class SkillMove(NamedTuple):
+    """An existing skill that has another parent locally."""
+
+    id: str
+    remote_parent_id: Optional[str]
+    local_parent_id: Optional[str]
+
+
+class SyncPlan(NamedTuple):
+    """Changes that bring a framework's skills in line with a local tree.
+
+    :ivar creates: new subtrees, by the existing skill they go under.
+    :ivar updates: existing skills whose content differs.
+    :ivar deletes: remote skills missing locally; only the topmost of a
+        missing subtree is listed, and deleted with its descendants.
+    :ivar moves: skills with another parent locally. `skills_update` cannot
+        move skills, so a plan with moves is applied with
+        `skill_frameworks_replace_skills`.
+    :ivar unchanged: skills already in sync.
+    """
+
+    creates: List[SkillCreate]
+    updates: List[SkillUpdate]
+    deletes: List[str]
+    moves: List[SkillMove]
+    unchanged: int
+
+    @property
+    def created(self) -> int:
+        """Number of skills the creates add."""
+        return sum(_size(create.skill) for create in self.creates)
+
+    def __bool__(self) -> bool:
+        return bool(self.creates or self.updates or self.deletes or self.moves)
+
+    def summary(self) -> str:
+        """One line per kind of change, for review before `apply`."""
+        lines = [
+            'create %d skills in %d subtrees' % (self.created, len(self.creates)),
+            'update %d skills' % len(self.updates),
+            'delete %d subtrees' % len(self.deletes),
+            'move %d skills' % len(self.moves),
+            'unchanged %d skills' % self.unchanged,
+        ]
+        if self.moves:
+            lines.append('moves are applied by replacing the whole framework')
+        return '\n'.join(lines)
+
+
+class SyncResult(NamedTuple):
+    """Outcome of `SkillSync.apply`.
+
+    :ivar requests: API calls made.
+    :ivar replaced: whether the framework was replaced as a whole.
+    """
+
+    created: int
+    updated: int
+    deleted: int
+    requests: int
+    replaced: bool
+
+
+def plan_sync(remote: Iterable[Schema1], local: Iterable[Schema0]) -> SyncPlan:
+    """Diffs a remote skill tree against a local one.
+
+    Local skills are matched to remote ones by `id`, or else by `code`;
+    unmatched ones are created. `description`, `code` and `icon` are synced
+    as given (None clears them), `type` and `status` only where set locally.
+
+    :param remote: roots of the remote tree, e.g. from `skills_get_full_skill_tree`.
+    :param local: roots of the wanted tree.
+    """
+    by_id: Dict[str, Schema1] = {}
+    by_code: Dict[str, Schema1] = {}
+    remote_parent: Dict[str, Optional[str]] = {}
+    stack: List[Tuple[Schema1, Optional[str]]] = [(skill, None) for skill in remote]
+    while stack:
+        skill, parent_id = stack.pop()
+        by_id[skill.id] = skill
+        if skill.code is not None:
+            by_code.setdefault(skill.code, skill)
+        remote_parent[skill.id] = parent_id
+        stack.extend((child, skill.id) for child in skill.children)
+
+    creates: List[SkillCreate] = []
+    updates: List[SkillUpdate] = []
+    moves: List[SkillMove] = []
+    matched: Dict[str, None] = {}
+    unchanged = 0
+
+    def visit(skill: Schema0, parent_id: Optional[str], created: bool) -> Optional[Schema0]:
+        # returns the skill (with only its new descendants) when it is new
+        nonlocal unchanged
+        match = by_id.get(skill.id) if skill.id is not None else None
+        if match is None and skill.id is None and skill.code is not None:
+            match = by_code.get(skill.code)
+        if match is not None and match.id in matched:
+            match = None
+        if match is not None and created:
+            # an existing skill under a new one
+            matched[match.id] = None
+            moves.append(SkillMove(match.id, remote_parent[match.id], parent_id))
+        if match is None or created:
+            children = [visit(child, skill.id, True) for child in skill.children or ()]
+            return skill.model_copy(update={'children': children or None})
+        matched[match.id] = None
+        if remote_parent[match.id] != parent_id:
+            moves.append(SkillMove(match.id, remote_parent[match.id], parent_id))
+        fields = _fields(skill)
+        if content_hash(skill, fields) != content_hash(match, fields):
+            changes = {f: getattr(skill, f) for f in fields if getattr(skill, f) != getattr(match, f)}
+            updates.append(SkillUpdate(match.id, changes))
+        else:
+            unchanged += 1
+        for child in skill.children or ():
+            new = visit(child, match.id, False)
+            if new is not None:
+                creates.append(SkillCreate(match.id, new))
+        return None
+
+    for root in local:
+        new = visit(root, None, False)
+        if new is not None:
+            creates.append(SkillCreate(None, new))
+
+    deletes = [
+        skill_id for skill_id in by_id
+        if skill_id not in matched
+        and (remote_parent[skill_id] is None or remote_parent[skill_id] in matched)
+    ]
+    return SyncPlan(creates, updates, deletes, moves, unchanged)
+
+
+class SkillSync:
+    """Brings a framework's skills in line with a local tree in few requests.
+
+    `plan` fetches the remote tree with `skills_get_full_skill_tree` and
+    diffs it with `plan_sync`; `apply` then deletes, updates and creates
+    only what changed, `max_workers` requests at a time. New skills are
+    sent with `skills_create_many` in requests of up to `chunk_size`
+    skills, parents before their children.
+
+    :param api: a `SkillsApi`.
+    :param framework_id: the framework, which the caller must manage.
+    :param chunk_size: skills per `skills_create_many` request.
+    :param max_workers: concurrent requests.
+    """
+
+    def __init__(self, api: Any, framework_id: str, chunk_size: int = 100, max_workers: int = 4) -> None:
+        self.api = api
+        self.framework_id = framework_id
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+
+    def plan(self, local: Iterable[Schema0]) -> SyncPlan:
+        """Returns the changes `apply` would make."""
+        remote = self.api.skills_get_full_skill_tree(self.framework_id).skills
+        return plan_sync(remote, local)
+
+    def sync(self, local: Sequence[Schema0], dry_run: bool = False) -> Tuple[SyncPlan, Optional[SyncResult]]:
+        """Plans and, unless `dry_run`, applies the changes."""
+        plan = self.plan(local)
+        return plan, None if dry_run else self.apply(plan, local)
+
+    def apply(self, plan: SyncPlan, local: Optional[Sequence[Schema0]] = None) -> SyncResult:
+        """Makes the changes of `plan`.
+
+        :param local: the local tree the plan was made from; needed when
+            the plan has moves.
+        """
+        if plan.moves:
+            if local is None:
+                raise ValueError('a plan with moves needs the local tree to replace the framework with')
+            self.api.skill_frameworks_replace_skills(
+                self.framework_id, SkillFrameworksReplaceSkillsRequest(skills=list(local)),
+            )
+            return SyncResult(plan.created, len(plan.updates), len(plan.deletes), 1, True)
+
+        requests = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+
+            def run(calls: List[Callable[[], Any]]) -> List[Any]:
+                nonlocal requests
+                requests += len(calls)
+                futures = [executor.submit(contextvars.copy_context().run, call) for call in calls]
+                return [future.result() for future in futures]
+
+            run([self._delete(skill_id) for skill_id in plan.deletes])
+            run([self._update(update) for update in plan.updates])
+            # parents before children: subtrees too big for one request are
+            # created a level at a time
+            pending = [(create.parent_id, create.skill) for create in plan.creates]
+            while pending:
+                chunks, split = self._chunks(pending)
+                results = run([self._create(parent_id, skills) for parent_id, skills in chunks])
+                pending = []
+                for index, children in split:
+                    parent = chunks[index][1][0]
+                    parent_id = parent.id if parent.id is not None else results[index][0].id
+                    pending.extend((parent_id, child) for child in children)
+        return SyncResult(plan.created, len(plan.updates), len(plan.deletes), requests, False)
+
+    def _chunks(
+        self, pending: List[Tuple[Optional[str], Schema0]]
+    ) -> Tuple[List[Tuple[Optional[str], List[Schema0]]], List[Tuple[int, List[Schema0]]]]:
+        # packs subtrees with the same parent into requests of at most
+        # `chunk_size` skills; bigger subtrees are sent without their
+        # children, which follow once their parent exists
+        chunks: List[Tuple[Optional[str], List[Schema0]]] = []
+        split: List[Tuple[int, List[Schema0]]] = []
+        open_chunks: Dict[Optional[str], Tuple[int, int]] = {}
+        for parent_id, skill in pending:
+            size = _size(skill)
+            if size > self.chunk_size:
+                split.append((len(chunks), list(skill.children or ())))
+                chunks.append((parent_id, [skill.model_copy(update={'children': None})]))
+                continue
+            index, used = open_chunks.get(parent_id, (-1, self.chunk_size))
+            if used + size > self.chunk_size:
+                index, used = len(chunks), 0
+                chunks.append((parent_id, []))
+            chunks[index][1].append(skill)
+            open_chunks[parent_id] = (index, used + size)
+        return chunks, split
+
+    def _delete(self, skill_id: str) -> Callable[[], Any]:
+        return lambda: self.api.skills_delete(skill_id, self.framework_id, strategy='recursive')
+
+    def _update(self, update: SkillUpdate) -> Callable[[], Any]:
+        request = SkillsUpdateRequest(frameworkId=self.framework_id, **update.changes)
+        return lambda: self.api.skills_update(update.id, request)
+
+    def _create(self, parent_id: Optional[str], skills: List[Schema0]) -> Callable[[], Any]:
+        request = SkillsCreateManyRequest(frameworkId=self.framework_id, skills=skills, parentId=parent_id)
+        return lambda: self.api.skills_create_many(request)
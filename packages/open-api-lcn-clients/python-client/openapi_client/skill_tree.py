@@ -0,0 +1,303 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from openapi_client.models.schema1 import Schema1
+from openapi_client.pagination import iter_records
+
+
+class SkillNode:
+    """A skill of a `SkillTree`.
+
+    :ivar skill: the skill as returned by the API, with `children` emptied;
+        the loaded children are `SkillNode.children`.
+    :ivar parent_id: id of the parent skill; None for roots.
+    """
+
+    __slots__ = ('skill', 'parent_id', '_tree', '_children', '_cursor', '_complete')
+
+    def __init__(self, tree: 'SkillTree', skill: Schema1, parent_id: Optional[str]) -> None:
+        self.skill = skill
+        self.parent_id = parent_id
+        self._tree = tree
+        self._children: List['SkillNode'] = []
+        # where to continue loading children from, once `_children` is a
+        # first page
+        self._cursor: Optional[str] = None
+        self._complete = not skill.has_children
+
+    @property
+    def id(self) -> str:
+        return self.skill.id
+
+    @property
+    def has_children(self) -> bool:
+        return self.skill.has_children
+
+    @property
+    def loaded(self) -> bool:
+        """Whether all children are loaded."""
+        return self._complete
+
+    @property
+    def children(self) -> List['SkillNode']:
+        """The child skills, fetched on first access."""
+        return self._tree.expand(self)
+
+    @property
+    def parent(self) -> Optional['SkillNode']:
+        return None if self.parent_id is None else self._tree.get(self.parent_id)
+
+    def __repr__(self) -> str:
+        return 'SkillNode(%r, %r)' % (self.id, self.skill.statement)
+
+
+class SkillTree:
+    """Skill tree of a framework that loads levels as they are visited.
+
+    The roots (with the first page of their children) are fetched with
+    `skills_get_framework_skill_tree` when the tree is built; the children
+    of any other skill are fetched with `skills_get_skill_children_tree` the
+    first time `SkillNode.children` is read, and with `prefetch` the
+    children of those children are requested in background threads
+    meanwhile. Loaded skills are indexed by id with their parent, so `path`
+    answers like `skills_get_skill_path` without a request.
+
+    With `max_nodes`, the children of the least recently expanded skills
+    are dropped (and fetched again when visited) once more skills than that
+    are loaded; roots are kept.
+
+    :param api: a `SkillsApi`.
+    :param framework_id: the framework.
+    :param roots_limit: roots requested per page.
+    :param children_limit: children requested per page.
+    :param prefetch: load the next level in the background.
+    :param max_nodes: number of loaded skills above which cold subtrees
+        are evicted; None keeps everything.
+    :param max_workers: threads prefetching children.
+
+    :ivar requests: children and path requests made since the roots were
+        loaded.
+    :ivar evicted: skills dropped to stay under `max_nodes`.
+    """
+
+    def __init__(
+        self,
+        api: Any,
+        framework_id: str,
+        roots_limit: Optional[int] = None,
+        children_limit: Optional[int] = None,
+        prefetch: bool = True,
+        max_nodes: Optional[int] = None,
+        max_workers: int = 4,
+    ) -> None:
+        self.api = api
+        self.framework_id = framework_id
+        self.children_limit = children_limit
+        self.prefetch = prefetch
+        self.max_nodes = max_nodes
+        self.requests = 0
+        self.evicted = 0
+        self._lock = threading.RLock()
+        self._nodes: Dict[str, SkillNode] = {}
+        # skills with loaded children, least recently expanded first
+        self._expanded: 'OrderedDict[str, None]' = OrderedDict()
+        self._loading: Dict[str, Future] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers) if prefetch else None
+
+        self.roots: List[SkillNode] = []
+        records = iter_records(
+            api.skills_get_framework_skill_tree,
+            framework_id,
+            page_size=roots_limit,
+            prefetch=False,
+            children_limit=children_limit,
+        )
+        with self._lock:
+            for record in records:
+                self.roots.append(self._add(record, None))
+
+    def __enter__(self) -> 'SkillTree':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stops prefetching."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, skill_id: str) -> bool:
+        return skill_id in self._nodes
+
+    def get(self, skill_id: str) -> Optional[SkillNode]:
+        """Returns a loaded skill, without fetching anything."""
+        return self._nodes.get(skill_id)
+
+    def node(self, skill_id: str) -> SkillNode:
+        """Returns a skill, loading the levels above it if needed.
+
+        :raises KeyError: if the skill's path does not lead to one of the
+            roots.
+        """
+        node = self._nodes.get(skill_id)
+        if node is not None:
+            return node
+        path = self.api.skills_get_skill_path(skill_id, self.framework_id).path
+        self._count()
+        ids = [skill.id for skill in reversed(path)]
+        if not ids or ids[-1] != skill_id or ids[0] not in self._nodes:
+            raise KeyError(skill_id)
+        node = self._nodes[ids[0]]
+        for child_id in ids[1:]:
+            for child in self.expand(node):
+                if child.id == child_id:
+                    node = child
+                    break
+            else:
+                raise KeyError(child_id)
+        return node
+
+    def path(self, skill_id: str) -> List[SkillNode]:
+        """Returns the skill and its ancestors, up to its root.
+
+        The order is the one of `skills_get_skill_path`: the skill first.
+        """
+        node: Optional[SkillNode] = self.node(skill_id)
+        path = []
+        with self._lock:
+            while node is not None:
+                path.append(node)
+                node = self._nodes.get(node.parent_id) if node.parent_id is not None else None
+        return path
+
+    def walk(self) -> Iterator[SkillNode]:
+        """Yields every skill depth-first, loading the whole tree."""
+        stack = list(reversed(self.roots))
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(self.expand(node)))
+
+    def expand(self, node: SkillNode) -> List[SkillNode]:
+        """Returns the children of `node`, loading them if needed."""
+        return self._load(node, self.prefetch)
+
+    def _add(self, skill: Schema1, parent_id: Optional[str]) -> SkillNode:
+        # called with the lock held
+        embedded = skill.children
+        skill.children = []
+        node = SkillNode(self, skill, parent_id)
+        self._nodes[node.id] = node
+        if embedded:
+            node._children = [self._add(child, node.id) for child in embedded]
+            node._cursor = skill.children_cursor
+            node._complete = skill.children_cursor is None
+            self._expanded[node.id] = None
+        return node
+
+    def _load(self, node: SkillNode, prefetch: bool) -> List[SkillNode]:
+        with self._lock:
+            if node._complete:
+                if node.id in self._expanded:
+                    self._expanded.move_to_end(node.id)
+                return node._children
+            future = self._loading.get(node.id)
+            owner = future is None
+            if owner:
+                future = self._loading[node.id] = Future()
+            cursor = node._cursor
+        if not owner:
+            return future.result()
+        try:
+            records = self._fetch_children(node.id, cursor)
+            with self._lock:
+                if self._nodes.get(node.id) is node:
+                    node._children.extend(self._add(record, node.id) for record in records)
+                    node._cursor = None
+                    node._complete = True
+                    self._expanded[node.id] = None
+                    self._expanded.move_to_end(node.id)
+                    self._evict(node)
+                    children = node._children
+                else:
+                    # evicted meanwhile: the caller still gets the children
+                    children = [SkillNode(self, record, node.id) for record in records]
+                del self._loading[node.id]
+        except BaseException as e:
+            with self._lock:
+                del self._loading[node.id]
+            future.set_exception(e)
+            raise
+        future.set_result(children)
+        if prefetch and self._executor is not None:
+            for child in children:
+                if not child._complete:
+                    try:
+                        self._executor.submit(self._load, child, False)
+                    except RuntimeError:
+                        # closed
+                        break
+        return children
+
+    def _fetch_children(self, skill_id: str, cursor: Optional[str]) -> List[Schema1]:
+        records: List[Schema1] = []
+        while True:
+            page = self.api.skills_get_skill_children_tree(
+                skill_id, self.framework_id, limit=self.children_limit, cursor=cursor,
+            )
+            self._count()
+            records.extend(page.records)
+            if not (page.has_more and page.cursor):
+                return records
+            cursor = page.cursor
+
+    def _count(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def _evict(self, keep: SkillNode) -> None:
+        # called with the lock held
+        if self.max_nodes is None:
+            return
+        protected: Set[str] = set()
+        node: Optional[SkillNode] = keep
+        while node is not None:
+            protected.add(node.id)
+            node = self._nodes.get(node.parent_id) if node.parent_id is not None else None
+        for skill_id in list(self._expanded):
+            if len(self._nodes) <= self.max_nodes:
+                return
+            if skill_id in protected or skill_id not in self._expanded:
+                continue
+            self._collapse(self._nodes[skill_id])
+
+    def _collapse(self, node: SkillNode) -> None:
+        # called with the lock held; forgets the descendants of `node`
+        stack = list(node._children)
+        while stack:
+            child = stack.pop()
+            stack.extend(child._children)
+            del self._nodes[child.id]
+            self._expanded.pop(child.id, None)
+            self.evicted += 1
+        node._children = []
+        node._cursor = None
+        node._complete = not node.has_children
+        self._expanded.pop(node.id, None)
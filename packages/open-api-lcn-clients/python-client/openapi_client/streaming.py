@@ -0,0 +1,230 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import codecs
+import functools
+import json
+import re
+from typing import Any, AsyncIterator, Iterator, Sequence, Tuple, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+from openapi_client.exceptions import ApiValueError
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE_RE = re.compile(r'[ \t\n\r]*')
+_DECODER = json.JSONDecoder()
+# yielded by the parser when it has consumed everything fed so far
+_NEED_DATA = object()
+
+
+class JSONArrayStream:
+    """Incremental decoder for the elements of a JSON array.
+
+    Bytes are pushed with `feed` as they arrive, which yields the elements
+    they complete one at a time, so only the undecoded tail of the body and
+    the current element are held in memory. With `path`, the array is
+    looked up under those keys of enclosing objects, e.g. `('skills',)` for
+    `{"skills": [...]}`; anything after the array is ignored.
+
+        stream = JSONArrayStream()
+        for chunk in chunks:
+            for element in stream.feed(chunk):
+                ...
+        for element in stream.close():
+            ...
+
+    :param path: keys leading from the document root to the array.
+    """
+
+    def __init__(self, path: Sequence[str] = ()) -> None:
+        self._text = codecs.getincrementaldecoder('utf-8')()
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+        self._parser = self._parse(tuple(path))
+        next(self._parser)
+
+    @property
+    def done(self) -> bool:
+        """Whether the closing bracket of the array has been seen."""
+        return self._parser is None
+
+    def feed(self, chunk: bytes) -> Iterator[Any]:
+        """Adds bytes to the stream.
+
+        The returned iterator must be exhausted before feeding more.
+
+        :return: iterator over the elements completed by `chunk`.
+        """
+        self._buf += self._text.decode(chunk)
+        return self._run()
+
+    def close(self) -> Iterator[Any]:
+        """Marks the end of the body.
+
+        :return: iterator over the remaining elements.
+        :raise json.JSONDecodeError: while iterating, if the array is
+            truncated or malformed.
+        """
+        self._buf += self._text.decode(b'', final=True)
+        self._eof = True
+        return self._run()
+
+    def _run(self) -> Iterator[Any]:
+        while self._parser is not None:
+            try:
+                element = self._parser.send(None)
+            except StopIteration:
+                self._parser = None
+                return
+            if element is _NEED_DATA:
+                return
+            yield element
+
+    def _more(self):
+        """Suspends the parser until more data is fed."""
+        if self._eof:
+            raise json.JSONDecodeError('Unexpected end of data', self._buf, len(self._buf))
+        # drop the consumed text before the next chunk is appended
+        self._buf = self._buf[self._pos:]
+        self._pos = 0
+        yield _NEED_DATA
+
+    def _peek(self):
+        while True:
+            self._pos = _WHITESPACE_RE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            yield from self._more()
+
+    def _expect(self, chars: str):
+        char = yield from self._peek()
+        if char not in chars:
+            raise json.JSONDecodeError(
+                'Expecting %s' % ' or '.join(repr(c) for c in chars), self._buf, self._pos
+            )
+        self._pos += 1
+        return char
+
+    def _value(self):
+        yield from self._peek()
+        # retry only once the buffered tail has doubled, so an element split
+        # over many chunks is decoded in linear time
+        need = 0
+        while True:
+            if self._eof or len(self._buf) - self._pos >= need:
+                try:
+                    value, end = _DECODER.raw_decode(self._buf, self._pos)
+                except json.JSONDecodeError:
+                    if self._eof:
+                        raise
+                else:
+                    # a number at the end of the buffer may continue
+                    if end < len(self._buf) or self._eof or type(value) not in (int, float):
+                        self._pos = end
+                        return value
+                need = 2 * (len(self._buf) - self._pos)
+            yield from self._more()
+
+    def _parse(self, path: Tuple[str, ...]):
+        yield _NEED_DATA
+        for key in path:
+            yield from self._expect('{')
+            while True:
+                if (yield from self._peek()) != '"':
+                    raise json.JSONDecodeError('Missing key %r' % key, self._buf, self._pos)
+                name = yield from self._value()
+                yield from self._expect(':')
+                if name == key:
+                    break
+                yield from self._value()
+                yield from self._expect(',')
+        yield from self._expect('[')
+        if (yield from self._peek()) == ']':
+            return
+        while True:
+            yield (yield from self._value())
+            if (yield from self._expect(',]')) == ']':
+                return
+
+
+def _type_name(annotation: Any) -> str:
+    """Renders a field annotation as a response type string."""
+    if get_origin(annotation) is Union:
+        annotation = next(a for a in get_args(annotation) if a is not type(None))
+    if get_origin(annotation) is list:
+        return 'List[%s]' % _type_name(get_args(annotation)[0])
+    if isinstance(annotation, type) and (
+        issubclass(annotation, BaseModel) or annotation in (str, int, float, bool)
+    ):
+        return annotation.__name__
+    return 'object'
+
+
+@functools.lru_cache(maxsize=None)
+def stream_path(response_type: str) -> Tuple[Tuple[str, ...], str]:
+    """Locates the array to stream in a response type.
+
+    `List[X]` responses stream their elements. Object responses stream the
+    elements of their only list property, e.g. `SkillsGetFullSkillTree200Response`
+    streams `skills`.
+
+    :return: (keys leading to the array, element type).
+    """
+    import openapi_client.models
+
+    path: Tuple[str, ...] = ()
+    while not response_type.startswith('List['):
+        model = getattr(openapi_client.models, response_type, None)
+        lists = [] if model is None else [
+            (field.alias or name, _type_name(field.annotation))
+            for name, field in model.model_fields.items()
+            if _type_name(field.annotation).startswith('List[')
+        ]
+        if len(lists) != 1:
+            raise ApiValueError('%s is not a list response' % response_type)
+        key, response_type = lists[0]
+        path += (key,)
+    return path, response_type[len('List['):-1]
+
+
+def stream_records(api, operation: str, *args, chunk_size: int = DEFAULT_CHUNK_SIZE, **kwargs) -> Iterator[Any]:
+    """Calls a list operation and yields its elements as they are received.
+
+    The request is sent and error responses raised immediately; the body is
+    then decoded incrementally while iterating.
+
+    :param api: instance of a generated API class, e.g. `CredentialsApi`.
+    :param operation: operation name, e.g. `credential_received_credentials`.
+    :param chunk_size: bytes read from the connection at a time.
+    """
+    # prepared imports api_client, which imports this module
+    from openapi_client.prepared import send_request
+
+    prepared, response_data = send_request(api, operation, *args, **kwargs)
+    return api.api_client.stream_deserialize(
+        response_data, prepared.response_types_map, chunk_size=chunk_size
+    )
+
+
+async def astream_records(api, operation: str, *args, chunk_size: int = DEFAULT_CHUNK_SIZE, **kwargs) -> AsyncIterator[Any]:
+    """asyncio variant of :func:`stream_records` for the `Async*Api` classes."""
+    prepared, response_data = await api._send(operation, args, kwargs)
+    elements = api.api_client.stream_deserialize(
+        response_data, prepared.response_types_map, chunk_size=chunk_size
+    )
+    try:
+        async for element in elements:
+            yield element
+    finally:
+        await elements.aclose()
@@ -0,0 +1,412 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import asyncio
+import collections
+import email.utils
+import threading
+import time
+from typing import Any, Deque, Dict, Iterable, NamedTuple, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+# operations the server rate limits separately from the rest of its API
+DEFAULT_GROUPS = ('/send', '/inbox/issue', '/boost/recipients/paginated')
+THROTTLED_STATUSES = frozenset({429, 503})
+
+
+def parse_retry_after(headers: Any) -> Optional[float]:
+    """Parses a `Retry-After` header into seconds from now, if present."""
+    if not headers:
+        return None
+    value = headers.get('Retry-After')
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class TokenBucket:
+    """Token bucket allowing `rate` requests per second on average.
+
+    Up to `burst` requests go out back to back after an idle period. Tokens
+    are reserved in arrival order, so callers are released at an even pace
+    instead of all retrying at once when the bucket refills.
+
+    :param rate: tokens added per second.
+    :param burst: bucket capacity; defaults to one second worth of tokens.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        self.rate = float(rate)
+        self.burst = max(1.0, self.rate if burst is None else float(burst))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Takes a token.
+
+        :return: seconds to wait before the token may be used.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class AdaptiveLimit:
+    """Concurrency limit adjusted by additive increase, multiplicative decrease.
+
+    The limit grows by one per window of `limit` successful requests while
+    it is saturated, and is multiplied by `backoff` when the server answers
+    429/503, or by `latency_backoff` when recent responses take more than
+    `latency_tolerance` times the baseline latency on average. Only requests
+    started after the last decrease can decrease it again, so a burst of
+    throttled responses from one window counts once.
+
+    Callers over the limit queue in arrival order, from threads (`acquire`)
+    or asyncio tasks (`acquire_async`).
+
+    :param initial: starting limit.
+    :param min_limit: lower bound of the limit.
+    :param max_limit: upper bound of the limit.
+    :param backoff: factor applied on 429/503.
+    :param latency_tolerance: latency, relative to the baseline, above
+        which the limit is decreased; None ignores latency.
+    :param latency_backoff: factor applied on slow responses.
+    """
+
+    def __init__(
+        self,
+        initial: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        backoff: float = 0.5,
+        latency_tolerance: Optional[float] = 2.0,
+        latency_backoff: float = 0.9,
+    ) -> None:
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = float(min(max(initial, min_limit), max_limit))
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.latency_backoff = latency_backoff
+        self.in_flight = 0
+        self.throttled = 0
+        self.resume_at = 0.0
+        self._baseline: Optional[float] = None
+        self._smoothed = 0.0
+        self._decreased_at = 0.0
+        self._waiters: Deque[Union[threading.Event, 'asyncio.Future[None]']] = collections.deque()
+        self._lock = threading.Lock()
+
+    @property
+    def queued(self) -> int:
+        """Number of callers waiting for a slot."""
+        return len(self._waiters)
+
+    def _try_acquire(self) -> bool:
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            return True
+        return False
+
+    def acquire(self) -> None:
+        """Blocks until a slot is free."""
+        with self._lock:
+            if self._try_acquire():
+                return
+            waiter = threading.Event()
+            self._waiters.append(waiter)
+        waiter.wait()
+
+    async def acquire_async(self) -> None:
+        """Waits for a free slot without blocking the event loop."""
+        with self._lock:
+            if self._try_acquire():
+                return
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # the slot was handed over as the caller was cancelled
+                self._release_slot()
+            else:
+                with self._lock:
+                    if waiter in self._waiters:
+                        self._waiters.remove(waiter)
+            raise
+
+    def release(self, started: float, status: Optional[int] = None, retry_after: Optional[float] = None) -> None:
+        """Frees a slot and adapts the limit to the response.
+
+        :param started: `time.monotonic()` when the request was sent.
+        :param status: response status; None if the request failed.
+        :param retry_after: seconds the server asked to wait, if any.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if status in THROTTLED_STATUSES:
+                self.throttled += 1
+                self._decrease(started, now, self.backoff)
+                if retry_after:
+                    self.resume_at = max(self.resume_at, now + retry_after)
+            elif status is not None and status < 500:
+                self._observe(started, now)
+        self._release_slot()
+
+    def _observe(self, started: float, now: float) -> None:
+        latency = now - started
+        if self._baseline is None:
+            self._baseline = self._smoothed = latency
+        # the baseline follows the fastest responses and drifts up slowly,
+        # so it tracks a server whose normal latency changes
+        self._smoothed += (latency - self._smoothed) * 0.2
+        self._baseline = min(latency, self._baseline + (self._smoothed - self._baseline) * 0.01)
+        if self.latency_tolerance is not None and self._smoothed > self._baseline * self.latency_tolerance:
+            self._decrease(started, now, self.latency_backoff)
+        elif self.in_flight >= int(self.limit):
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+    def _decrease(self, started: float, now: float, factor: float) -> None:
+        if started > self._decreased_at:
+            self.limit = max(self.min_limit, self.limit * factor)
+            self._decreased_at = now
+
+    def _release_slot(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            while self._waiters and self.in_flight < int(self.limit):
+                self.in_flight += 1
+                waiter = self._waiters.popleft()
+                if isinstance(waiter, threading.Event):
+                    waiter.set()
+                else:
+                    waiter.get_loop().call_soon_threadsafe(self._grant, waiter)
+
+    def _grant(self, waiter: 'asyncio.Future[None]') -> None:
+        if waiter.done():
+            # cancelled while the slot was on its way
+            self._release_slot()
+        else:
+            waiter.set_result(None)
+
+
+class ThrottleStats(NamedTuple):
+    """Snapshot of one concurrency limit of a `Throttle`.
+
+    `limit` is 0 when concurrency is not limited.
+    """
+    limit: int
+    in_flight: int
+    queued: int
+    throttled: int
+
+
+class Permit:
+    """A request slot handed out by `Throttle`; release it with the response."""
+
+    __slots__ = ('_limit', '_started')
+
+    def __init__(self, limit: Optional[AdaptiveLimit]) -> None:
+        self._limit = limit
+        self._started = time.monotonic()
+
+    def release(self, response_data: Any = None) -> None:
+        """Releases the slot.
+
+        :param response_data: the response received, or None if the request
+            failed.
+        """
+        if self._limit is None:
+            return
+        if response_data is None:
+            self._limit.release(self._started)
+        else:
+            self._limit.release(
+                self._started,
+                response_data.status,
+                parse_retry_after(response_data.headers),
+            )
+
+
+class Throttle:
+    """Client-wide request governor.
+
+    Combines a token bucket per host, limiting the request rate, with an
+    `AdaptiveLimit` per host and operation group, limiting concurrency. A
+    group is a path prefix of the operation templates, e.g. `/send`; requests
+    outside every group share their host's default limit. After a 429/503
+    with `Retry-After`, new requests of that group wait it out.
+
+    `ApiClient` creates one from `Configuration.rate_limit`,
+    `Configuration.rate_limit_burst` and `Configuration.adaptive_concurrency`,
+    or one can be assigned directly:
+
+        api_client.throttle = Throttle(rate=50, groups=['/send'], max_limit=32)
+
+    :param rate: requests per second per host; None for no rate limit.
+    :param burst: token bucket capacity, see `TokenBucket`.
+    :param adaptive: whether to limit concurrency with `AdaptiveLimit`.
+    :param groups: path template prefixes limited separately.
+    :param limit_options: keyword arguments for each `AdaptiveLimit`.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        adaptive: bool = True,
+        groups: Iterable[str] = DEFAULT_GROUPS,
+        max_templates: int = 4096,
+        **limit_options: Any,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.adaptive = adaptive
+        # longest prefix first, so nested groups win
+        self.groups = tuple(sorted(groups, key=len, reverse=True))
+        self.max_templates = max_templates
+        self.limit_options = limit_options
+        self._limits: Dict[Tuple[str, str], AdaptiveLimit] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._queued: Dict[Tuple[str, str], int] = collections.Counter()
+        self._templates: 'collections.OrderedDict[str, str]' = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_configuration(cls, configuration: Any) -> Optional['Throttle']:
+        """Builds the throttle a `Configuration` asks for, if any."""
+        if configuration.rate_limit is None and not configuration.adaptive_concurrency:
+            return None
+        return cls(
+            rate=configuration.rate_limit,
+            burst=configuration.rate_limit_burst,
+            adaptive=configuration.adaptive_concurrency,
+        )
+
+    def register(self, url: str, resource_path: str) -> None:
+        """Records the path template behind a URL.
+
+        Called by `ApiClient.param_serialize`, so operations are grouped by
+        their template regardless of the host's base path.
+
+        :param url: request URL without its query string.
+        :param resource_path: path template, e.g. `/send`.
+        """
+        with self._lock:
+            self._templates[url] = resource_path
+            self._templates.move_to_end(url)
+            while len(self._templates) > self.max_templates:
+                self._templates.popitem(last=False)
+
+    def group(self, url: str) -> Tuple[str, str]:
+        """Returns the (host, group) a request is limited under."""
+        base = url.partition('?')[0]
+        parts = urlsplit(base)
+        with self._lock:
+            path = self._templates.get(base, parts.path)
+        for prefix in self.groups:
+            if path == prefix or path.startswith(prefix + '/'):
+                return parts.netloc, prefix
+        return parts.netloc, ''
+
+    def _acquire(self, url: str) -> Tuple[Tuple[str, str], Optional[AdaptiveLimit], Optional[TokenBucket]]:
+        key = self.group(url)
+        with self._lock:
+            limit = self._limits.get(key)
+            if limit is None and self.adaptive:
+                limit = self._limits[key] = AdaptiveLimit(**self.limit_options)
+            bucket = self._buckets.get(key[0])
+            if bucket is None and self.rate is not None:
+                bucket = self._buckets[key[0]] = TokenBucket(self.rate, self.burst)
+            self._queued[key] += 1
+        return key, limit, bucket
+
+    def _delay(self, limit: Optional[AdaptiveLimit], bucket: Optional[TokenBucket]) -> float:
+        delay = bucket.reserve() if bucket is not None else 0.0
+        if limit is not None:
+            delay = max(delay, limit.resume_at - time.monotonic())
+        return delay
+
+    def _dequeue(self, key: Tuple[str, str]) -> None:
+        with self._lock:
+            self._queued[key] -= 1
+
+    def acquire(self, url: str) -> Permit:
+        """Blocks until the request may be sent.
+
+        :param url: request URL.
+        :return: the slot, to be released once the response arrives.
+        """
+        key, limit, bucket = self._acquire(url)
+        try:
+            if limit is not None:
+                limit.acquire()
+            try:
+                delay = self._delay(limit, bucket)
+                if delay > 0:
+                    time.sleep(delay)
+            except BaseException:
+                if limit is not None:
+                    limit.release(time.monotonic())
+                raise
+        finally:
+            self._dequeue(key)
+        return Permit(limit)
+
+    async def acquire_async(self, url: str) -> Permit:
+        """asyncio flavour of `acquire`."""
+        key, limit, bucket = self._acquire(url)
+        try:
+            if limit is not None:
+                await limit.acquire_async()
+            try:
+                delay = self._delay(limit, bucket)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            except BaseException:
+                if limit is not None:
+                    limit.release(time.monotonic())
+                raise
+        finally:
+            self._dequeue(key)
+        return Permit(limit)
+
+    def stats(self) -> Dict[Tuple[str, str], ThrottleStats]:
+        """Current limit, requests in flight and queue depth per (host, group).
+
+        Queued requests include those waiting for a rate limit token.
+        """
+        with self._lock:
+            keys = set(self._limits) | {k for k, n in self._queued.items() if n}
+            return {
+                key: ThrottleStats(
+                    int(self._limits[key].limit) if key in self._limits else 0,
+                    self._limits[key].in_flight if key in self._limits else 0,
+                    self._queued[key],
+                    self._limits[key].throttled if key in self._limits else 0,
+                )
+                for key in keys
+            }
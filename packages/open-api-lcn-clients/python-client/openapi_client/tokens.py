@@ -0,0 +1,160 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import contextlib
+import contextvars
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterator, Mapping, Optional, Tuple, Union
+
+from openapi_client.configuration import AuthSettings
+
+# the tenant whose credentials requests in this thread or task are sent with
+_tenant: contextvars.ContextVar[Optional[Hashable]] = contextvars.ContextVar(
+    'openapi_client_tenant', default=None
+)
+
+
+class TokenProvider:
+    """Base class for objects handing out a bearer token per tenant.
+
+    `token` is called for every request, from whichever thread or task
+    sends it, so it should answer from memory (refreshing tokens in the
+    background) and be thread-safe.
+    """
+
+    def token(self, tenant: Optional[Hashable]) -> Optional[str]:
+        """Returns the access token of `tenant`, or None to send the
+        request without credentials. `tenant` is None outside of a
+        `tenant` block.
+        """
+        raise NotImplementedError
+
+
+TokenSource = Union[TokenProvider, Callable[[Optional[Hashable]], Optional[str]], Mapping[Any, str]]
+
+
+@contextlib.contextmanager
+def tenant(key: Optional[Hashable]) -> Iterator[None]:
+    """Sends the requests made in the block with the credentials of `key`.
+
+    The tenant is held in a context variable, so concurrent threads and
+    asyncio tasks each see their own, and `bulk_*`/`iter_*` methods carry
+    it to their worker threads.
+    """
+    reset = _tenant.set(key)
+    try:
+        yield
+    finally:
+        _tenant.reset(reset)
+
+
+def current_tenant() -> Optional[Hashable]:
+    """Returns the tenant of the enclosing `tenant` block, if any."""
+    return _tenant.get()
+
+
+class Tokens:
+    """Auth settings of an ApiClient built per request from a token provider.
+
+    `ApiClient.update_params_for_auth` asks for the settings of the current
+    tenant instead of `Configuration.auth_settings()`. The settings of each
+    tenant are kept until the provider hands out a different token, so a
+    request costs a provider lookup and a string comparison; once
+    `max_tenants` tenants are cached the oldest are forgotten.
+
+    :param provider: a `TokenProvider`, a callable taking the tenant, or a
+        mapping of tenant to token.
+    :param max_tenants: number of tenants whose settings are cached.
+    """
+
+    def __init__(self, provider: TokenSource, max_tenants: int = 10000) -> None:
+        if isinstance(provider, TokenProvider):
+            self._token = provider.token
+        elif isinstance(provider, Mapping):
+            self._token = provider.get
+        elif callable(provider):
+            self._token = provider
+        else:
+            raise TypeError('token provider must be a TokenProvider, a callable or a mapping')
+        self.provider = provider
+        self.max_tenants = max_tenants
+        self._lock = threading.Lock()
+        self._settings: Dict[Optional[Hashable], Tuple[str, AuthSettings]] = {}
+
+    @classmethod
+    def from_configuration(cls, configuration: Any) -> Optional['Tokens']:
+        """Builds the tokens a `Configuration` asks for, if any."""
+        if configuration.token_provider is None:
+            return None
+        return cls(configuration.token_provider)
+
+    def auth_settings(self, tenant: Optional[Hashable] = None) -> AuthSettings:
+        """Returns the auth settings of `tenant`, by default the current one.
+
+        The returned dict is shared between requests and must not be
+        modified.
+        """
+        if tenant is None:
+            tenant = _tenant.get()
+        token = self._token(tenant)
+        if token is None:
+            return {}
+        cached = self._settings.get(tenant)
+        if cached is not None and cached[0] == token:
+            return cached[1]
+        settings: AuthSettings = {
+            'Authorization': {
+                'type': 'bearer',
+                'in': 'header',
+                'key': 'Authorization',
+                'value': 'Bearer ' + token
+            }
+        }
+        with self._lock:
+            self._settings[tenant] = (token, settings)
+            while len(self._settings) > self.max_tenants:
+                del self._settings[next(iter(self._settings))]
+        return settings
+
+    def renewed(self, headers: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+        """Returns the headers to retry a request that got a 401 with.
+
+        Only requests sent with the provider's current token of the current
+        tenant are retried, and only if the provider has an `invalidate`
+        method (like `openapi_client.auth.AuthManager`) and hands out a
+        different token once the rejected one is invalidated.
+
+        :param headers: headers the request was sent with.
+        :return: a copy with the new `Authorization` header, or None.
+        """
+        invalidate = getattr(self.provider, 'invalidate', None)
+        if invalidate is None or not headers:
+            return None
+        tenant = _tenant.get()
+        sent = headers.get('Authorization')
+        cached = self._settings.get(tenant)
+        if sent is None or cached is None or cached[1]['Authorization']['value'] != sent:
+            return None
+        invalidate(tenant, cached[0])
+        setting = self.auth_settings(tenant).get('Authorization')
+        if setting is None or setting['value'] == sent:
+            return None
+        retry = dict(headers)
+        retry['Authorization'] = setting['value']
+        return retry
+
+    def forget(self, tenant: Optional[Hashable]) -> None:
+        """Drops the cached settings of `tenant`, e.g. once it is gone."""
+        with self._lock:
+            self._settings.pop(tenant, None)
+
+    def __len__(self) -> int:
+        return len(self._settings)
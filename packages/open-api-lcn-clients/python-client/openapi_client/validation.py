@@ -0,0 +1,77 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import functools
+import inspect
+import typing
+from typing import Any, Callable, Tuple, TypeVar
+
+import pydantic
+from pydantic import BaseModel
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+def _model_class(annotation: Any) -> Any:
+    """The model class of a `Model` or `Optional[Model]` annotation, else None."""
+    if typing.get_origin(annotation) is typing.Union:
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        if len(args) != 1:
+            return None
+        annotation = args[0]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    return None
+
+
+def _model_parameters(function: Callable[..., Any]) -> Tuple[Tuple[int, str, type], ...]:
+    """(position after self, name, model class) of the model parameters."""
+    hints = typing.get_type_hints(function)
+    found = []
+    for position, name in enumerate(list(inspect.signature(function).parameters)[1:]):
+        model = _model_class(hints.get(name))
+        if model is not None:
+            found.append((position, name, model))
+    return tuple(found)
+
+
+def validate_call(function: F) -> F:
+    """`pydantic.validate_call` for the methods of the generated API classes.
+
+    Arguments are validated unless `client_side_validation` is off on the
+    API class's `api_client` (see `Configuration.client_side_validation`).
+    Even then, request bodies that are not already instances of their model
+    class go through validation, so a dict is still checked and converted.
+    The pydantic validator is built on the first validated call, as building
+    one for each of the ~700 generated methods at import took over a second.
+    """
+    validated = None
+    model_parameters = None
+
+    @functools.wraps(function)
+    def call(self, *args, **kwargs):
+        nonlocal validated, model_parameters
+        if not self.api_client.client_side_validation:
+            if model_parameters is None:
+                # resolved on first use, once every model module is importable
+                model_parameters = _model_parameters(function)
+            for position, name, model in model_parameters:
+                value = args[position] if position < len(args) else kwargs.get(name)
+                if value is not None and not isinstance(value, model):
+                    break
+            else:
+                return function(self, *args, **kwargs)
+        if validated is None:
+            validated = pydantic.validate_call(function)
+        return validated(self, *args, **kwargs)
+
+    call.raw_function = function
+    return call
@@ -6,9 +6,6 @@
     API for interacting with LearnCloud Network
 
     The version of the OpenAPI document: 1.0.0
-    Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-    Do not edit the class manually.
 """  # noqa: E501
 
 
@@ -29,6 +26,9 @@ REQUIRES = [
     "pydantic >= 2",
     "typing-extensions >= 4.7.1",
 ]
+EXTRAS_REQUIRE = {
+    "async": ["aiohttp >= 3.8.4"],
+}
 
 setup(
     name=NAME,
@@ -39,6 +39,7 @@ setup(
     url="",
     keywords=["OpenAPI", "OpenAPI-Generator", "LearnCloud Network API"],
     install_requires=REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
     packages=find_packages(exclude=["test", "tests"]),
     include_package_data=True,
     long_description_content_type='text/markdown',
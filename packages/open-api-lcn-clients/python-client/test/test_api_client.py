@@ -0,0 +1,134 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import datetime
+import json
+import unittest
+
+import urllib3
+
+from openapi_client.api_client import ApiClient, fast_type_adapter
+from openapi_client.configuration import Configuration
+from openapi_client.models.boost_get_paginated_boost_recipients200_response import BoostGetPaginatedBoostRecipients200Response
+from openapi_client.models.storage_resolve200_response import StorageResolve200Response
+from openapi_client.rest import RESTResponse
+
+
+def _response(payload, status=200, content_type='application/json; charset=utf-8'):
+    resp = RESTResponse(urllib3.HTTPResponse(
+        body=json.dumps(payload).encode(),
+        status=status,
+        headers={'content-type': content_type},
+        preload_content=True,
+    ))
+    resp.read()
+    return resp
+
+
+def _recipients(records):
+    return {
+        'cursor': None,
+        'hasMore': False,
+        'records': [
+            {
+                'to': {
+                    'profileId': 'profile-%d' % i,
+                    'displayName': 'Profile %d' % i,
+                    'shortBio': '',
+                    'bio': '',
+                    'did': 'did:web:profile-%d' % i,
+                    'display': {'backgroundColor': '#fff'},
+                },
+                'from': 'issuer',
+                'uri': 'lc:network:credential:%d' % i,
+            }
+            for i in range(records)
+        ],
+    }
+
+
+class TestApiClient(unittest.TestCase):
+    """ApiClient unit test stubs"""
+
+    def setUp(self) -> None:
+        self.regular = ApiClient(Configuration())
+        configuration = Configuration()
+        configuration.fast_deserialization = True
+        self.fast = ApiClient(configuration)
+
+    def deserialize(self, api_client, payload, response_type, **kwargs):
+        return api_client.response_deserialize(_response(payload, **kwargs), {'200': response_type}).data
+
+    def test_fast_deserialization_matches_regular_path(self) -> None:
+        payload = _recipients(3)
+        regular = self.deserialize(self.regular, payload, 'BoostGetPaginatedBoostRecipients200Response')
+        fast = self.deserialize(self.fast, payload, 'BoostGetPaginatedBoostRecipients200Response')
+        self.assertIsInstance(fast, BoostGetPaginatedBoostRecipients200Response)
+        self.assertEqual(fast.records, regular.records)
+        records = self.deserialize(
+            self.fast, payload['records'], 'List[BoostGetPaginatedBoostRecipients200ResponseRecordsInner]'
+        )
+        self.assertEqual([r.var_from for r in records], ['issuer'] * 3)
+        self.assertEqual(records[1].to.display.background_color, '#fff')
+
+    def test_fast_deserialization_falls_back(self) -> None:
+        # `from_dict` fills missing nullable fields with None, the single pass rejects them
+        activity = {
+            'id': '1',
+            'activityId': 'activity-1',
+            'eventType': 'CREATED',
+            'actorProfileId': 'issuer',
+            'recipientType': 'profile',
+            'source': 'send',
+        }
+        record = self.deserialize(self.fast, activity, 'ActivityGetMyActivities200ResponseRecordsInner')
+        self.assertIsNone(record.timestamp)
+        self.assertIsNone(record.recipient_identifier)
+        # invalid payloads still raise
+        payload = _recipients(1)
+        del payload['records'][0]['from']
+        with self.assertRaises(ValueError):
+            self.deserialize(self.fast, payload, 'BoostGetPaginatedBoostRecipients200Response')
+        # non-JSON content types go through the regular path
+        self.assertEqual(self.deserialize(self.fast, 'plain', 'str', content_type='text/plain'), '"plain"')
+
+    def test_deserializer_cache(self) -> None:
+        records = self.regular.deserialize(
+            json.dumps([{'uri': 'lc:network:boost:1', 'name': 'Boost'}, None]),
+            'List[BoostGetBoosts200ResponseInner]',
+            'application/json',
+        )
+        self.assertEqual(records[0].name, 'Boost')
+        self.assertIsNone(records[1])
+        self.assertEqual(
+            self.regular.deserialize('{"a": "2024-01-02", "b": null}', 'Dict[str, date]', 'application/json'),
+            {'a': datetime.date(2024, 1, 2), 'b': None},
+        )
+        self.assertEqual(self.regular.deserialize('"1.5"', 'float', 'application/json'), 1.5)
+        self.assertIn('List[BoostGetBoosts200ResponseInner]', self.regular._deserializers)
+        self.assertIn('BoostGetBoosts200ResponseInner', self.regular._deserializers)
+        self.assertIn('Dict[str, date]', self.regular._deserializers)
+
+    def test_fast_type_adapter_eligibility(self) -> None:
+        self.assertIsNotNone(fast_type_adapter('BoostGetPaginatedBoostRecipients200Response'))
+        self.assertIsNotNone(fast_type_adapter('Dict[str, BoostGetPaginatedBoostRecipients200Response]'))
+        self.assertIsNone(fast_type_adapter('StorageResolve200Response'))
+        self.assertIsNone(fast_type_adapter('List[str]'))
+        self.assertIs(
+            fast_type_adapter('StorageResolve200Response'),
+            fast_type_adapter('StorageResolve200Response'),
+        )
+        payload = {'@context': ['https://www.w3.org/2018/credentials/v1'], 'type': ['VerifiablePresentation']}
+        self.assertIsInstance(self.deserialize(self.fast, payload, 'StorageResolve200Response'), StorageResolve200Response)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import asyncio
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from openapi_client.api.boosts_api import BoostsApi
+from openapi_client.api.send_api import SendApi
+from openapi_client.api_client import ApiClient
+from openapi_client.async_api import AsyncBoostsApi, AsyncSendApi
+from openapi_client.async_api_client import AsyncApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.exceptions import NotFoundException
+from openapi_client.models.boost_send_request import BoostSendRequest
+
+BOOST = {
+    "uri": "lc:network:boost:1",
+    "name": "Badge",
+    "boost": {
+        "@context": ["https://www.w3.org/2018/credentials/v1"],
+        "type": ["VerifiableCredential"],
+        "issuer": "did:web:issuer",
+        "credentialSubject": {"id": "did:web:subject"},
+    },
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.server.requests.append(("GET", self.path, None))
+        if self.path.startswith("/boost?uri=lc"):
+            self._reply(200, BOOST)
+        else:
+            self._reply(404, {"message": "not found"})
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append(("POST", self.path, body))
+        self._reply(200, {
+            "type": "boost",
+            "credentialUri": "lc:network:credential:" + body["recipient"],
+            "uri": "lc:network:boost:1",
+            "activityId": "activity",
+        })
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestAsyncApi(unittest.IsolatedAsyncioTestCase):
+    """AsyncApiClient and async API class tests"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.server.requests = []
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        self.server.requests.clear()
+        self.configuration = Configuration(
+            host="http://127.0.0.1:%d" % self.server.server_port,
+            access_token="token",
+        )
+
+    async def test_matches_sync_client(self) -> None:
+        sync_boost = BoostsApi(ApiClient(self.configuration)).boost_get_boost("lc:network:boost:1")
+        async with AsyncApiClient(self.configuration) as api_client:
+            async_boost = await AsyncBoostsApi(api_client).boost_get_boost("lc:network:boost:1")
+        self.assertEqual(async_boost, sync_boost)
+        self.assertEqual(self.server.requests[0], self.server.requests[1])
+
+    async def test_with_http_info(self) -> None:
+        async with AsyncApiClient(self.configuration) as api_client:
+            response = await AsyncBoostsApi(api_client).boost_get_boost_with_http_info("lc:network:boost:1")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data.name, "Badge")
+
+    async def test_concurrent_sends(self) -> None:
+        async with AsyncApiClient(self.configuration) as api_client:
+            api = AsyncSendApi(api_client)
+            results = await asyncio.gather(*[
+                api.boost_send(BoostSendRequest(type="boost", recipient="p%d" % i, templateUri="lc:network:boost:1"))
+                for i in range(50)
+            ])
+        self.assertEqual(len(self.server.requests), 50)
+        self.assertEqual(
+            sorted(r.credential_uri for r in results),
+            sorted("lc:network:credential:p%d" % i for i in range(50))
+        )
+
+    async def test_error_status_raises(self) -> None:
+        async with AsyncApiClient(self.configuration) as api_client:
+            with self.assertRaises(NotFoundException):
+                await AsyncBoostsApi(api_client).boost_get_boost("missing")
+
+    def test_operations_mirror_sync_class(self) -> None:
+        for name in ("boost_send", "boost_send_with_http_info", "boost_send_without_preload_content"):
+            self.assertTrue(asyncio.iscoroutinefunction(getattr(AsyncSendApi, name)))
+        self.assertFalse(hasattr(AsyncSendApi, "_boost_send_serialize"))
+        self.assertIs(AsyncSendApi.sync_api_class, SendApi)
+
+    def test_client_has_sync_client_attributes(self) -> None:
+        sync_client = ApiClient(self.configuration)
+        async_client = AsyncApiClient(self.configuration)
+        self.assertEqual(set(vars(async_client)), set(vars(sync_client)))
+        self.assertIsNone(async_client.resolve_cache)
+        sync_client.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
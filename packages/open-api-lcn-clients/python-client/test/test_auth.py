@@ -0,0 +1,178 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import base64
+import itertools
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from openapi_client.api.send_api import SendApi
+from openapi_client.api_client import ApiClient
+from openapi_client.auth import AuthManager, ChallengePool, Token, jwt_expiry
+from openapi_client.configuration import Configuration
+from openapi_client.exceptions import UnauthorizedException
+from openapi_client.models.boost_send_request import BoostSendRequest
+from openapi_client.tokens import tenant
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        amount = int(parse_qs(url.query)["amount"][0])
+        with self.server.lock:
+            self.server.challenge_auth.append(self.headers["Authorization"])
+            challenges = ["c%d" % next(self.server.counter) for _ in range(amount)]
+        self._reply(200, challenges)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        authorization = self.headers["Authorization"]
+        with self.server.lock:
+            self.server.sent.append(authorization)
+        if authorization in self.server.revoked:
+            self._reply(401, {"message": "expired", "code": "UNAUTHORIZED"})
+        else:
+            self._reply(200, {"type": "boost", "credentialUri": "c", "uri": "lc:network:boost:1", "activityId": "a"})
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _jwt(claims):
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=").decode()
+    return "e30." + payload + ".sig"
+
+
+def _send_request():
+    return BoostSendRequest(type="boost", recipient="p", templateUri="lc:network:boost:1")
+
+
+class TestAuth(unittest.TestCase):
+    """AuthManager and 401 retry tests"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.server.lock = threading.Lock()
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        self.server.counter = itertools.count()
+        self.server.challenge_auth = []
+        self.server.sent = []
+        self.server.revoked = set()
+        self.signed = []
+        self.lifetime = 600.0
+
+    def sign(self, tenant, challenge):
+        self.signed.append((tenant, challenge))
+        return Token("%s:%s:%d" % (tenant, challenge, len(self.signed)), time.time() + self.lifetime)
+
+    def test_jwt_expiry(self) -> None:
+        self.assertEqual(jwt_expiry(_jwt({"exp": 1700000000})), 1700000000.0)
+        self.assertIsNone(jwt_expiry(_jwt({"sub": "did:web:a"})))
+        self.assertIsNone(jwt_expiry("not-a-jwt"))
+        self.assertIsNone(jwt_expiry("a.!!.c"))
+        manager = AuthManager(lambda tenant, challenge: _jwt({"exp": time.time() + 3600}))
+        self.assertEqual(manager.token("a"), manager.token("a"))
+        self.assertEqual(manager.stats().refreshes, 1)
+        manager.close()
+
+    def test_challenge_pool(self) -> None:
+        batches = []
+
+        def fetch(amount):
+            batches.append(amount)
+            return ["c%d-%d" % (len(batches), i) for i in range(amount)]
+
+        pool = ChallengePool(fetch, batch=4, low_water=2)
+        self.assertEqual(pool.take(), "c1-3")
+        self.assertEqual([pool.take(), pool.take()], ["c1-2", "c1-1"])
+        # dropped below the low water mark: refilled in the background
+        for _ in range(50):
+            if len(pool) == 5:
+                break
+            time.sleep(0.01)
+        self.assertEqual((batches, pool.fetched, len(pool)), ([4, 4], 8, 5))
+        failing = ChallengePool(lambda amount: [])
+        with self.assertRaises(ValueError):
+            failing.take()
+
+    def test_refresh_ahead(self) -> None:
+        manager = AuthManager(self.sign, fetch_challenges=lambda tenant, amount: ["x"] * amount, refresh_before=5.0)
+        self.lifetime = 2.0
+        first = manager.token("a")
+        # within `refresh_before` of expiring: the current token is still
+        # handed out while another is signed in the background
+        self.assertEqual(manager.token("a"), first)
+        for _ in range(100):
+            if manager.stats().background:
+                break
+            time.sleep(0.01)
+        self.lifetime = 600.0
+        stats = manager.stats()
+        self.assertEqual((stats.blocking, stats.background, stats.refreshes), (1, 1, 2))
+        self.assertNotEqual(manager.token("a"), first)
+        self.assertEqual(self.signed[0], ("a", "x"))
+        modes = {labels["mode"]: count for labels, _, _, count in manager.refresh_seconds.collect()}
+        self.assertEqual(modes, {"blocking": 1, "background": 1})
+        manager.close()
+
+    def test_retry_on_401(self) -> None:
+        configuration = Configuration(host="http://127.0.0.1:%d" % self.server.server_port)
+        api_client = ApiClient(configuration)
+        manager = AuthManager(self.sign, api_client=api_client, batch=3, low_water=1)
+        configuration.token_provider = manager
+        api_client = ApiClient(configuration)
+        api = SendApi(api_client)
+        with tenant("did:web:a"):
+            api.boost_send(_send_request())
+            self.server.revoked.add(self.server.sent[-1])
+            api.boost_send(_send_request())
+        first, rejected, retried = self.server.sent
+        self.assertEqual(first, rejected)
+        self.assertNotEqual(retried, first)
+        # challenges are fetched with a token signed without a challenge
+        self.assertEqual(self.server.challenge_auth[0], "Bearer did:web:a:None:1")
+        self.assertEqual(first, "Bearer did:web:a:c2:2")
+        stats = manager.stats()
+        self.assertEqual((stats.rejected, stats.tenants, stats.challenges >= 3), (1, 1, True))
+
+        # requests not sent with the provider's token are not retried
+        request_auth = {"type": "bearer", "in": "header", "key": "Authorization", "value": first}
+        with tenant("did:web:a"):
+            with self.assertRaises(UnauthorizedException):
+                api.boost_send(_send_request(), _request_auth=request_auth)
+        self.assertEqual(len(self.server.sent), 4)
+        manager.close()
+        api_client.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import collections
+import threading
+import time
+import unittest
+from typing import Dict, List
+
+from openapi_client.boost_graph import BoostGraph
+from openapi_client.models.boost_get_boost_children_request import BoostGetBoostChildrenRequest
+from openapi_client.models.boost_get_boost_parents_request import BoostGetBoostParentsRequest
+from openapi_client.models.boost_get_familial_boosts_request import BoostGetFamilialBoostsRequest
+from openapi_client.models.boost_get_paginated_boosts200_response import BoostGetPaginatedBoosts200Response
+
+# parent -> children; `d` has two parents and `f` is four generations below `a`
+EDGES = {
+    "p1": ["a"],
+    "p2": ["a", "s"],
+    "a": ["b", "c"],
+    "b": ["d"],
+    "c": ["d"],
+    "d": ["e"],
+    "e": ["f"],
+}
+
+
+def _sorted(adjacency: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    # edges found from either end arrive in any order
+    return {uri: sorted(children) for uri, children in adjacency.items()}
+
+
+class _FakeBoostsApi:
+    """In-memory boost hierarchy answering the boost graph endpoints."""
+
+    def __init__(self, edges: Dict[str, List[str]]) -> None:
+        self.children = collections.defaultdict(list)
+        self.parents = collections.defaultdict(list)
+        for parent, children in edges.items():
+            for child in children:
+                self.children[parent].append(child)
+                self.parents[child].append(parent)
+        self.lock = threading.Lock()
+        self.calls = collections.Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _page(self, kind, request, uris):
+        with self.lock:
+            self.calls[(kind, request.uri)] += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.005)
+        with self.lock:
+            self.in_flight -= 1
+        start = int(request.cursor or 0)
+        end = start + int(request.limit)
+        return BoostGetPaginatedBoosts200Response.from_dict({
+            "hasMore": end < len(uris),
+            "cursor": str(end) if end < len(uris) else None,
+            "records": [{"uri": uri, "name": uri.upper()} for uri in uris[start:end]],
+        })
+
+    def _reach(self, uri, edges, generations):
+        seen, level = [], [uri]
+        for _ in range(generations):
+            level = [other for current in level for other in edges[current] if other not in seen]
+            seen.extend(dict.fromkeys(level))
+        return seen
+
+    def boost_get_familial_boosts(self, request: BoostGetFamilialBoostsRequest):
+        parents = self._reach(request.uri, self.parents, int(request.parent_generations.actual_instance))
+        children = self._reach(request.uri, self.children, int(request.child_generations.actual_instance))
+        siblings = [s for p in self.parents[request.uri] for s in self.children[p] if s != request.uri]
+        return self._page("familial", request, list(dict.fromkeys(parents + siblings + children)))
+
+    def boost_get_boost_children(self, request: BoostGetBoostChildrenRequest):
+        return self._page("children", request, self.children[request.uri])
+
+    def boost_get_boost_parents(self, request: BoostGetBoostParentsRequest):
+        return self._page("parents", request, self.parents[request.uri])
+
+
+class TestBoostGraph(unittest.TestCase):
+    """BoostGraph unit test stubs"""
+
+    def test_loads_the_connected_graph_once_per_boost(self) -> None:
+        api = _FakeBoostsApi(EDGES)
+        graph = BoostGraph(api, "a", max_workers=3)
+
+        self.assertTrue(graph.complete)
+        self.assertEqual(sorted(graph.nodes), ["a", "b", "c", "d", "e", "f", "p1", "p2", "s"])
+        self.assertEqual(graph.node("d").name, "D")
+        self.assertEqual(len(graph), 9)
+        self.assertEqual(graph.edges, 9)
+        self.assertEqual(_sorted(graph.adjacency()), EDGES)
+        # every boost is expanded once, though `d` is reached twice
+        for uri in graph.nodes:
+            self.assertEqual(api.calls[("children", uri)], 1)
+            self.assertEqual(api.calls[("parents", uri)], 1)
+        self.assertLessEqual(api.max_in_flight, 3)
+        self.assertEqual(graph.requests, 2 * 9)
+
+    def test_requests_match_the_per_boost_walk(self) -> None:
+        api = _FakeBoostsApi(EDGES)
+        graph = BoostGraph(api, "a", page_size=2)
+
+        # the pages of the children and parents of each boost, and nothing else
+        def pages(uris: List[str]) -> int:
+            return max(1, -(-len(uris) // 2))
+
+        walk = sum(pages(api.children[uri]) + pages(api.parents[uri]) for uri in graph.nodes)
+        self.assertEqual(graph.requests, walk)
+        self.assertEqual(sum(api.calls.values()), walk)
+        self.assertEqual({kind for kind, _ in api.calls}, {"children", "parents"})
+
+    def test_queries_answer_from_the_graph(self) -> None:
+        api = _FakeBoostsApi(EDGES)
+        graph = BoostGraph(api, "a")
+        calls = sum(api.calls.values())
+
+        self.assertEqual(sorted(graph.parents("a")), ["p1", "p2"])
+        self.assertEqual(sorted(graph.children("a")), ["b", "c"])
+        self.assertEqual(graph.siblings("a"), ["s"])
+        self.assertEqual(graph.siblings("b"), ["c"])
+        self.assertEqual(sorted(graph.descendants("a")), ["b", "c", "d", "e", "f"])
+        self.assertEqual(graph.ancestors("f", 2), ["e", "d"])
+        self.assertEqual(graph.count_children("a"), 2)
+        self.assertEqual(graph.count_children("a", 2), 3)
+        self.assertEqual(graph.count_parents("d"), 2)
+        self.assertEqual(graph.count_siblings("a"), 1)
+        self.assertEqual(graph.count_familial("a"), 5)
+        self.assertEqual(sum(api.calls.values()), calls)
+
+    def test_pages(self) -> None:
+        api = _FakeBoostsApi(EDGES)
+        graph = BoostGraph(api, "a", page_size=1)
+
+        self.assertEqual(_sorted(graph.adjacency()), EDGES)
+        # one page per record, plus an empty one for boosts without any
+        self.assertEqual(graph.requests, sum(api.calls.values()))
+        self.assertEqual(api.calls[("children", "a")], 2)
+        self.assertEqual(api.calls[("parents", "p1")], 1)
+
+    def test_max_nodes(self) -> None:
+        api = _FakeBoostsApi(EDGES)
+        graph = BoostGraph(api, "a", max_nodes=2, max_workers=1)
+
+        self.assertFalse(graph.complete)
+        expanded = {uri for kind, uri in api.calls if kind == "children"}
+        self.assertEqual(len(expanded), 2)
+        self.assertIn("a", expanded)
+        self.assertEqual(sorted(graph.children("a")), ["b", "c"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,198 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import json
+import os
+import tempfile
+import threading
+import unittest
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import urllib3
+
+from openapi_client.api.send_api import SendApi
+from openapi_client.api.universal_inbox_api import UniversalInboxApi
+from openapi_client.api_client import ApiClient
+from openapi_client.bulk import TRANSPORT_ERRORS, BulkCheckpoint, bulk_call, is_connect_error, retry_after_seconds
+from openapi_client.configuration import Configuration
+from openapi_client.exceptions import ApiException, BadRequestException
+from openapi_client.models.boost_send_request import BoostSendRequest
+from openapi_client.models.inbox_issue_request import InboxIssueRequest
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def _reply(self, status, payload, headers=()):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        recipient = body["recipient"]
+        if isinstance(recipient, dict):
+            recipient = recipient["value"]
+        with self.server.lock:
+            self.server.calls[recipient] += 1
+            attempt = self.server.calls[recipient]
+        if recipient.startswith("dropped") and attempt == 1 or recipient.startswith("down"):
+            # no response at all: the client sees the connection drop
+            self.close_connection = True
+        elif recipient.startswith("failing") and attempt == 1:
+            self._reply(500, {"message": "try again"})
+        elif recipient.startswith("throttled") and attempt == 1:
+            self._reply(429, {"message": "slow down"}, [("Retry-After", "0")])
+        elif recipient.startswith("bad"):
+            self._reply(400, {"message": "bad recipient"})
+        elif self.path == "/inbox/issue":
+            self._reply(200, {"issuanceId": recipient, "status": "PENDING", "recipient": {"type": "email", "value": recipient}})
+        else:
+            self._reply(200, {"type": "boost", "credentialUri": "lc:network:credential:" + recipient, "uri": "lc:network:boost:1", "activityId": "a"})
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _send_request(recipient):
+    return BoostSendRequest(type="boost", recipient=recipient, templateUri="lc:network:boost:1")
+
+
+class TestBulk(unittest.TestCase):
+    """bulk_send/bulk_issue tests"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.server.lock = threading.Lock()
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        self.server.calls = Counter()
+        configuration = Configuration(host="http://127.0.0.1:%d" % self.server.server_port)
+        self.api_client = ApiClient(configuration)
+
+    def test_bulk_send(self) -> None:
+        recipients = ["p%d" % i for i in range(20)] + ["throttled", "bad"]
+        results = {r.request.recipient: r for r in SendApi(self.api_client).bulk_send(
+            (_send_request(p) for p in recipients), max_workers=4
+        )}
+        self.assertEqual(set(results), set(recipients))
+        self.assertEqual(results["p3"].data.credential_uri, "lc:network:credential:p3")
+        self.assertTrue(results["throttled"].ok)
+        self.assertEqual(results["throttled"].retries, 1)
+        self.assertIsInstance(results["bad"].error, BadRequestException)
+        self.assertEqual(self.server.calls["bad"], 1)
+        self.assertEqual(sorted(r.index for r in results.values()), list(range(len(recipients))))
+
+    def test_read_errors_are_not_retried_by_default(self) -> None:
+        results = {r.request.recipient: r for r in bulk_call(
+            SendApi(self.api_client).boost_send,
+            [_send_request(p) for p in ["p0", "dropped"]],
+            max_workers=2, max_retries=2, backoff_factor=0.01,
+        )}
+        self.assertTrue(results["p0"].ok)
+        self.assertIsInstance(results["dropped"].error, TRANSPORT_ERRORS)
+        self.assertFalse(is_connect_error(results["dropped"].error))
+        self.assertEqual(results["dropped"].retries, 0)
+        self.assertEqual(self.server.calls["dropped"], 1)
+
+    def test_retry_read_errors(self) -> None:
+        recipients = ["p%d" % i for i in range(5)] + ["dropped", "down"]
+        results = {r.request.recipient: r for r in bulk_call(
+            SendApi(self.api_client).boost_send,
+            (_send_request(p) for p in recipients),
+            max_workers=2, max_retries=2, backoff_factor=0.01, retry_read_errors=True,
+        )}
+        self.assertEqual(set(results), set(recipients))
+        self.assertTrue(results["dropped"].ok)
+        self.assertEqual(results["dropped"].retries, 1)
+        self.assertIsInstance(results["down"].error, TRANSPORT_ERRORS)
+        self.assertEqual(results["down"].retries, 2)
+        self.assertEqual(self.server.calls["down"], 3)
+        self.assertTrue(all(results["p%d" % i].ok for i in range(5)))
+
+    def test_connect_errors_are_retried(self) -> None:
+        attempts = Counter()
+        refused = urllib3.exceptions.NewConnectionError(None, "Connection refused")
+
+        def operation(request):
+            attempts[request] += 1
+            if attempts[request] == 1:
+                if request == "wrapped":
+                    raise urllib3.exceptions.MaxRetryError(None, "/send", refused)
+                raise urllib3.exceptions.ConnectTimeoutError("timed out connecting")
+            return request
+
+        results = list(bulk_call(operation, ["wrapped", "timeout"], max_retries=2, backoff_factor=0.01))
+        self.assertTrue(all(r.ok and r.retries == 1 for r in results))
+        self.assertTrue(is_connect_error(urllib3.exceptions.MaxRetryError(None, "/send", refused)))
+        self.assertFalse(is_connect_error(urllib3.exceptions.MaxRetryError(None, "/send", urllib3.exceptions.ProtocolError())))
+
+    def test_bulk_issue(self) -> None:
+        requests = [InboxIssueRequest.from_dict({"recipient": {"type": "email", "value": "u%d@example.com" % i}}) for i in range(5)]
+        results = list(UniversalInboxApi(self.api_client).bulk_issue(requests, max_workers=2))
+        self.assertTrue(all(r.ok for r in results))
+        self.assertEqual(sorted(r.data.issuance_id for r in results), sorted("u%d@example.com" % i for i in range(5)))
+
+    def test_checkpoint_resume(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "run.json")
+            api = SendApi(self.api_client)
+            results = api.bulk_send([_send_request("p%d" % i) for i in range(30)], max_workers=3, checkpoint=path)
+            consumed = [next(results) for _ in range(10)]
+            results.close()
+            checkpoint = BulkCheckpoint(path)
+            self.assertTrue(all(checkpoint.is_done(r.index) for r in consumed))
+
+            list(api.bulk_send([_send_request("p%d" % i) for i in range(30)], max_workers=3, checkpoint=path))
+            self.assertEqual(set(self.server.calls), {"p%d" % i for i in range(30)})
+            self.assertEqual(set(self.server.calls.values()), {1})
+            self.assertEqual(BulkCheckpoint(path).last_index, 29)
+
+    def test_checkpoint_resends_failed_items(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "run.json")
+            api = SendApi(self.api_client)
+            recipients = ["p0", "failing", "bad", "p1"]
+            first = {r.request.recipient: r for r in api.bulk_send([_send_request(p) for p in recipients], checkpoint=path)}
+            self.assertFalse(first["failing"].ok)
+            self.assertFalse(first["failing"].definitive)
+            self.assertTrue(first["bad"].definitive)
+            self.assertFalse(BulkCheckpoint(path).is_done(1))
+
+            second = list(api.bulk_send([_send_request(p) for p in recipients], checkpoint=path))
+            self.assertEqual([r.request.recipient for r in second], ["failing"])
+            self.assertTrue(second[0].ok)
+            self.assertEqual(self.server.calls, Counter({"p0": 1, "failing": 2, "bad": 1, "p1": 1}))
+            self.assertEqual(BulkCheckpoint(path).last_index, 3)
+
+    def test_retry_after_seconds(self) -> None:
+        self.assertIsNone(retry_after_seconds(ApiException(status=429)))
+        exc = ApiException(status=429)
+        exc.headers = {"Retry-After": "2"}
+        self.assertEqual(retry_after_seconds(exc), 2.0)
+        exc.headers = {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        self.assertEqual(retry_after_seconds(exc), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
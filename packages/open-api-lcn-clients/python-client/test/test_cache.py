@@ -0,0 +1,199 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from openapi_client.api.boosts_api import BoostsApi
+from openapi_client.api_client import ApiClient
+from openapi_client.async_api import AsyncBoostsApi
+from openapi_client.async_api_client import AsyncApiClient
+from openapi_client.cache import CacheEntry, DiskCache, MemoryCache, ResponseCache
+from openapi_client.configuration import Configuration
+from openapi_client.models.boost_update_boost_request import BoostUpdateBoostRequest
+
+CREDENTIAL = {
+    "@context": ["https://www.w3.org/2018/credentials/v1"],
+    "type": ["VerifiableCredential"],
+    "issuer": "did:web:issuer",
+    "credentialSubject": {"id": "did:web:subject"},
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def _reply(self, status, payload=None, headers=()):
+        body = b"" if payload is None else json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        uri = parse_qs(urlsplit(self.path).query)["uri"][0]
+        server = self.server
+        with server.lock:
+            name = server.names.get(uri, "Badge")
+            etag = '"%d"' % server.versions[uri]
+            conditional = self.headers.get("If-None-Match") == etag
+            server.calls[(uri, 304 if conditional else 200)] += 1
+        headers = [("ETag", etag), ("Cache-Control", server.cache_control)]
+        if conditional:
+            self._reply(304, headers=headers)
+        else:
+            self._reply(200, {"uri": uri, "name": name, "boost": CREDENTIAL}, headers)
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.server.lock:
+            self.server.names[body["uri"]] = body["updates"]["name"]
+            self.server.versions[body["uri"]] += 1
+        self._reply(200, True)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _entry(data=b"{}", tags=()):
+    now = time.time()
+    return CacheEntry(200, "OK", (("Content-Type", "application/json"),), data, now, now + 60, tags)
+
+
+class TestCache(unittest.TestCase):
+    """ResponseCache tests"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.server.lock = threading.Lock()
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        self.server.calls = Counter()
+        self.server.names = {}
+        self.server.versions = Counter()
+        self.server.cache_control = "max-age=60"
+        self.configuration = Configuration(host="http://127.0.0.1:%d" % self.server.server_port)
+        self.api_client = ApiClient(self.configuration)
+        self.api_client.response_cache = ResponseCache()
+        self.api = BoostsApi(self.api_client)
+
+    def test_fresh_hit(self) -> None:
+        first = self.api.boost_get_boost("lc:network:boost:1")
+        second = self.api.boost_get_boost("lc:network:boost:1")
+        self.assertEqual(first, second)
+        self.assertEqual(self.server.calls, Counter({("lc:network:boost:1", 200): 1}))
+        self.assertEqual(self.api_client.response_cache.hits, 1)
+        raw = self.api.boost_get_boost_without_preload_content("lc:network:boost:1")
+        self.assertEqual(json.loads(raw.read())["name"], "Badge")
+
+    def test_revalidation(self) -> None:
+        self.server.cache_control = "no-cache"
+        for _ in range(3):
+            self.assertEqual(self.api.boost_get_boost("lc:network:boost:1").name, "Badge")
+        self.assertEqual(self.server.calls, Counter({("lc:network:boost:1", 200): 1, ("lc:network:boost:1", 304): 2}))
+        self.assertEqual(self.api_client.response_cache.revalidations, 2)
+
+    def test_no_store(self) -> None:
+        self.server.cache_control = "no-store"
+        self.api.boost_get_boost("lc:network:boost:1")
+        self.api.boost_get_boost("lc:network:boost:1")
+        self.assertEqual(self.server.calls[("lc:network:boost:1", 200)], 2)
+        self.api.boost_get_boost("lc:network:boost:1", _headers={"Cache-Control": "no-store"})
+        self.assertEqual(self.server.calls[("lc:network:boost:1", 200)], 3)
+
+    def test_mutation_invalidates_resource(self) -> None:
+        self.api.boost_get_boost("lc:network:boost:1")
+        self.api.boost_get_boost("lc:network:boost:2")
+        self.api.boost_update_boost(BoostUpdateBoostRequest.from_dict(
+            {"uri": "lc:network:boost:1", "updates": {"name": "Renamed"}}
+        ))
+        self.assertEqual(self.api.boost_get_boost("lc:network:boost:1").name, "Renamed")
+        self.api.boost_get_boost("lc:network:boost:2")
+        self.assertEqual(self.server.calls[("lc:network:boost:1", 200)], 2)
+        self.assertEqual(self.server.calls[("lc:network:boost:2", 200)], 1)
+
+    def test_keyed_by_auth(self) -> None:
+        self.api.boost_get_boost("lc:network:boost:1", _headers={"Authorization": "Bearer a"})
+        self.api.boost_get_boost("lc:network:boost:1", _headers={"Authorization": "Bearer b"})
+        self.api.boost_get_boost("lc:network:boost:1", _headers={"Authorization": "Bearer a"})
+        self.assertEqual(self.server.calls[("lc:network:boost:1", 200)], 2)
+
+    def test_disk_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            self.api_client.response_cache = ResponseCache(DiskCache(directory))
+            self.api.boost_get_boost("lc:network:boost:1")
+            other = ApiClient(self.configuration)
+            other.response_cache = ResponseCache(DiskCache(directory))
+            self.assertEqual(BoostsApi(other).boost_get_boost("lc:network:boost:1").name, "Badge")
+            self.assertEqual(self.server.calls[("lc:network:boost:1", 200)], 1)
+
+            small = DiskCache(os.path.join(directory, "small"), max_bytes=1000)
+            for i in range(5):
+                small.set("key%d" % i, _entry(b"x" * 300))
+                os.utime(small._path("key%d" % i), (i, i))
+            self.assertIsNone(small.get("key0"))
+            self.assertEqual(small.get("key4").data, b"x" * 300)
+
+    def test_memory_cache_lru(self) -> None:
+        cache = MemoryCache(maxsize=2)
+        cache.set("a", _entry())
+        cache.set("b", _entry())
+        cache.get("a")
+        cache.set("c", _entry())
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(len(cache), 2)
+
+    def test_forgotten_invalidations(self) -> None:
+        cache = ResponseCache(max_invalidations=2)
+        url = "http://localhost/boost?uri=1"
+        cache.backend.set(cache.key("GET", url, {}), _entry(tags=("path:/boost", "id:1")))
+        self.assertTrue(cache.lookup("GET", url, {}).fresh)
+        for i in range(2, 5):
+            cache.invalidate("http://localhost/boost?uri=%d" % i)
+        self.assertIsNone(cache.lookup("GET", url, {}).entry)
+
+    def test_async_client(self) -> None:
+        async def run():
+            async with AsyncApiClient(self.configuration) as api_client:
+                api_client.response_cache = ResponseCache()
+                api = AsyncBoostsApi(api_client)
+                await api.boost_get_boost("lc:network:boost:1")
+                cached = await api.boost_get_boost("lc:network:boost:1")
+                await api.boost_update_boost(BoostUpdateBoostRequest.from_dict(
+                    {"uri": "lc:network:boost:1", "updates": {"name": "Renamed"}}
+                ))
+                return cached, await api.boost_get_boost("lc:network:boost:1")
+
+        cached, updated = asyncio.run(run())
+        self.assertEqual((cached.name, updated.name), ("Badge", "Renamed"))
+        self.assertEqual(self.server.calls[("lc:network:boost:1", 200)], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import json
+import unittest
+
+from openapi_client.models.boost_send_request_template_credential_any_of_context_inner import BoostSendRequestTemplateCredentialAnyOfContextInner
+from openapi_client.models.inbox_issue_request_recipient import InboxIssueRequestRecipient
+from openapi_client.models.inbox_issue_request_recipient_one_of import InboxIssueRequestRecipientOneOf
+from openapi_client.models.inbox_issue_request_recipient_one_of1 import InboxIssueRequestRecipientOneOf1
+from openapi_client.models.storage_resolve200_response import StorageResolve200Response
+from openapi_client.models.storage_resolve200_response_any_of_any_of1 import StorageResolve200ResponseAnyOfAnyOf1
+from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of1 import StorageResolve200ResponseAnyOfAnyOfAnyOf1
+from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of1 import StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOf1
+from openapi_client.models.storage_resolve200_response_any_of_any_of_any_of_any_of_any_of import StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOf
+
+PROOF = {
+    "type": "Ed25519Signature2020",
+    "created": "2024-01-01T00:00:00Z",
+    "proofPurpose": "assertionMethod",
+    "verificationMethod": "did:web:issuer#key-1",
+}
+CREDENTIAL = {
+    "@context": ["https://www.w3.org/2018/credentials/v1", {"name": "https://schema.org/name"}],
+    "type": ["VerifiableCredential"],
+    "issuer": "did:web:issuer",
+    "credentialSubject": {"id": "did:web:subject"},
+}
+PRESENTATION = {
+    "@context": ["https://www.w3.org/2018/credentials/v1"],
+    "type": ["VerifiablePresentation"],
+    "verifiableCredential": dict(CREDENTIAL, proof=PROOF),
+    "proof": PROOF,
+}
+JWE = {
+    "protected": "eyJlbmMiOiJYQzIwUCJ9",
+    "iv": "iv",
+    "ciphertext": "ciphertext",
+    "tag": "tag",
+}
+CONTRACT = {
+    "read": {"credentials": {"categories": {"Achievement": {"required": False}}}, "personal": {"name": {"required": True}}},
+    "write": {"credentials": {"categories": {"Achievement": {"required": False}}}, "personal": {}},
+}
+
+
+def _leaf(instance):
+    while hasattr(instance, "actual_instance"):
+        instance = instance.actual_instance
+    return instance
+
+
+class TestComposite(unittest.TestCase):
+    """anyOf/oneOf resolution tests"""
+
+    def test_storage_resolve_branches(self) -> None:
+        cases = [
+            (CREDENTIAL, StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOfAnyOf),
+            (PRESENTATION, StorageResolve200ResponseAnyOfAnyOfAnyOfAnyOf1),
+            (JWE, StorageResolve200ResponseAnyOfAnyOfAnyOf1),
+            (CONTRACT, StorageResolve200ResponseAnyOfAnyOf1),
+        ]
+        for payload, leaf_class in cases:
+            resolved = StorageResolve200Response.from_dict(payload)
+            self.assertIsInstance(_leaf(resolved), leaf_class)
+            self.assertEqual(resolved.to_dict(), _leaf(resolved).to_dict())
+
+    def test_matches_generated_probing(self) -> None:
+        for payload in (CREDENTIAL, PRESENTATION, JWE):
+            resolved = StorageResolve200Response.from_dict(payload)
+            probed = StorageResolve200Response.from_json(json.dumps(payload))
+            self.assertIs(type(_leaf(resolved)), type(_leaf(probed)))
+            self.assertEqual(resolved.to_json(), probed.to_json())
+
+    def test_primitive_branches(self) -> None:
+        context = [BoostSendRequestTemplateCredentialAnyOfContextInner.from_dict(c) for c in CREDENTIAL["@context"]]
+        self.assertEqual(context[0].actual_instance, "https://www.w3.org/2018/credentials/v1")
+        self.assertEqual(context[0].anyof_schema_1_validator, "https://www.w3.org/2018/credentials/v1")
+        self.assertEqual(context[1].actual_instance, {"name": "https://schema.org/name"})
+
+    def test_one_of(self) -> None:
+        email = InboxIssueRequestRecipient.from_dict({"type": "email", "value": "user@example.com"})
+        phone = InboxIssueRequestRecipient.from_dict({"type": "phone", "value": "+15555550100"})
+        self.assertIsInstance(email.actual_instance, InboxIssueRequestRecipientOneOf)
+        self.assertIsInstance(phone.actual_instance, InboxIssueRequestRecipientOneOf1)
+        with self.assertRaisesRegex(ValueError, "No match found"):
+            InboxIssueRequestRecipient.from_dict({"type": "fax", "value": "1"})
+
+    def test_no_match(self) -> None:
+        with self.assertRaisesRegex(ValueError, "No match found"):
+            BoostSendRequestTemplateCredentialAnyOfContextInner.from_dict(1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import datetime
+import json
+import threading
+import unittest
+from enum import Enum
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from openapi_client.api.send_api import SendApi
+from openapi_client.api_client import ApiClient
+from openapi_client.cache import MemoryCache, ResponseCache
+from openapi_client.configuration import Configuration
+from openapi_client.encoding import encode
+from openapi_client.models.boost_create_boost_request import BoostCreateBoostRequest
+from openapi_client.models.boost_send_request import BoostSendRequest
+from openapi_client.models.skills_create_many_request import SkillsCreateManyRequest
+
+CREDENTIAL = {
+    "@context": ["https://www.w3.org/2018/credentials/v1", {"name": "https://schema.org/name"}],
+    "type": ["VerifiableCredential", "OpenBadgeCredential"],
+    "issuer": {"id": "did:web:issuer", "name": "Issuer é中"},
+    "credentialSubject": {
+        "id": "did:web:subject",
+        "achievement": {"name": "Café", "score": 9.5, "tags": [None, 1, True]},
+        "note": None,
+    },
+    "evidence": [{"id": "urn:evidence:%d" % i, "type": ["Evidence"]} for i in range(3)],
+    "name": None,
+    "x-extra": {"nested": [1, 2, 3]},
+}
+
+
+class Color(Enum):
+    RED = "red"
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def do_POST(self):
+        self.server.bodies.append(self.rfile.read(int(self.headers["Content-Length"])))
+        body = json.dumps({
+            "type": "boost",
+            "uri": "lc:network:boost:1",
+            "credentialUri": "lc:network:credential:1",
+            "activityId": "activity-1",
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestEncoding(unittest.TestCase):
+    """Request body encoder tests"""
+
+    def setUp(self) -> None:
+        self.api_client = ApiClient()
+
+    def reference(self, obj, **kwargs) -> bytes:
+        return json.dumps(self.api_client.sanitize_for_serialization(obj), **kwargs).encode("utf-8")
+
+    def assertEncodes(self, obj) -> None:
+        self.assertEqual(encode(obj, compact=False), self.reference(obj))
+        self.assertEqual(
+            encode(obj),
+            self.reference(obj, separators=(",", ":"), ensure_ascii=False),
+        )
+
+    def test_nested_models(self) -> None:
+        request = BoostCreateBoostRequest.from_dict({
+            "name": "Badge",
+            "meta": {"a": None, "b": [1, 2.5, None]},
+            "credential": CREDENTIAL,
+            "skills": [{"frameworkId": "framework-1", "id": "skill-1"}],
+        })
+        self.assertEncodes(request)
+        decoded = json.loads(encode(request))
+        # nullable fields set to None are kept, other None fields dropped and
+        # additional properties flattened
+        self.assertIsNone(decoded["credential"]["issuer"]["parentOrg"])
+        self.assertNotIn("name", decoded["credential"])
+        self.assertEqual(decoded["credential"]["x-extra"], {"nested": [1, 2, 3]})
+        self.assertEqual(decoded["credential"]["credentialSubject"]["note"], None)
+
+    def test_nullable_fields(self) -> None:
+        request = SkillsCreateManyRequest.from_dict({
+            "frameworkId": None,
+            "skills": [{"statement": "Skill", "code": "S1"}] * 3,
+        })
+        self.assertEncodes(request)
+        self.assertTrue(encode(request).endswith(b'],"frameworkId":null,"parentId":null}'))
+        # unset optional fields are left out
+        request = BoostSendRequest(type="boost", recipient="profile-1")
+        self.assertEqual(encode(request), b'{"type":"boost","recipient":"profile-1"}')
+
+    def test_composite_models(self) -> None:
+        request = BoostSendRequest.from_dict({
+            "type": "boost",
+            "recipient": "profile-1",
+            "contractUri": None,
+            "template": {"name": "Badge", "credential": CREDENTIAL},
+            "templateData": {"when": "now"},
+        })
+        self.assertEncodes(request)
+
+    def test_other_values(self) -> None:
+        value = {
+            "date": datetime.date(2024, 1, 2),
+            "when": datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+            "color": Color.RED,
+            "items": (1, "two"),
+            "text": "über \"quoted\"\n",
+        }
+        self.assertEncodes(value)
+        with self.assertRaises(TypeError):
+            encode({"values": {1, 2}})
+
+    def test_param_serialize(self) -> None:
+        request = BoostSendRequest(type="boost", recipient="profile-é")
+        configuration = Configuration()
+        configuration.fast_serialization = True
+        api_client = ApiClient(configuration)
+        body = api_client.param_serialize("POST", "/send", body=request)[3]
+        self.assertEqual(body, '{"type":"boost","recipient":"profile-é"}'.encode("utf-8"))
+        configuration.compact_json = False
+        body = ApiClient(configuration).param_serialize("POST", "/send", body=request)[3]
+        self.assertEqual(body, self.reference(request))
+        # plain dict bodies keep the regular path
+        body = api_client.param_serialize("POST", "/send", body={"a": 1})[3]
+        self.assertEqual(body, {"a": 1})
+
+    def test_send(self) -> None:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        server.bodies = []
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        request = BoostSendRequest(type="boost", recipient="profile-1", templateUri="lc:network:boost:1")
+        for fast in (False, True):
+            configuration = Configuration(host="http://127.0.0.1:%d" % server.server_port)
+            configuration.fast_serialization = fast
+            configuration.compact_json = False
+            with ApiClient(configuration) as api_client:
+                api_client.response_cache = ResponseCache(MemoryCache())
+                response = SendApi(api_client).boost_send(request)
+                self.assertEqual(response.uri, "lc:network:boost:1")
+                self.assertEqual(
+                    api_client.response_cache.tags(
+                        "http://127.0.0.1:%d/send" % server.server_port,
+                        api_client.param_serialize("POST", "/send", body=request)[3],
+                    ),
+                    ("path:/send", "id:lc:network:boost:1"),
+                )
+        self.assertEqual(server.bodies[0], server.bodies[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
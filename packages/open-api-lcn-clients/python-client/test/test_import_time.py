@@ -0,0 +1,107 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import os
+import subprocess
+import sys
+import unittest
+
+import openapi_client
+import openapi_client.api
+import openapi_client.models
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(args):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [PACKAGE_DIR, env.get("PYTHONPATH")]))
+    return subprocess.run(
+        [sys.executable] + args,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def importtime(statement):
+    """Runs `statement` under `python -X importtime`.
+
+    :return: dict of imported module name to cumulative import time in us.
+    """
+    modules = {}
+    for line in _run(["-X", "importtime", "-c", statement]).stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def loaded_modules(statement):
+    """Returns the `openapi_client` modules loaded after running `statement`.
+
+    `-X importtime` does not report modules loaded through
+    `importlib.import_module`, which is how the lazy exports are resolved.
+    """
+    script = statement + "; import sys; print('\\n'.join(m for m in sys.modules if m.startswith('openapi_client')))"
+    return set(_run(["-c", script]).stdout.split())
+
+
+class TestImportTime(unittest.TestCase):
+    """Lazy import tests"""
+
+    def test_import_package_is_lazy(self) -> None:
+        modules = importtime("import openapi_client")
+        loaded = [m for m in modules if m.startswith(("openapi_client.models.", "openapi_client.api."))]
+        self.assertEqual(loaded, [])
+        self.assertEqual(loaded_modules("import openapi_client"), {"openapi_client"})
+        # eager imports built every pydantic model and took seconds
+        self.assertLess(modules["openapi_client"], 1000000)
+
+    def test_import_one_api(self) -> None:
+        modules = loaded_modules("from openapi_client import BoostsApi, ApiClient, Configuration")
+        self.assertIn("openapi_client.api.boosts_api", modules)
+        self.assertNotIn("openapi_client.api.send_api", modules)
+        models = [m for m in modules if m.startswith("openapi_client.models.")]
+        self.assertLess(len(models), len(openapi_client.models._LAZY_IMPORTS) // 2)
+
+    def test_exports_resolve(self) -> None:
+        for name in openapi_client.__all__:
+            self.assertEqual(getattr(openapi_client, name).__name__, name)
+        for package in (openapi_client.api, openapi_client.models):
+            for name in package._LAZY_IMPORTS:
+                self.assertIs(getattr(package, name), getattr(openapi_client, name))
+        self.assertTrue(set(openapi_client.__all__) <= set(dir(openapi_client)))
+        self.assertIs(openapi_client.rest, sys.modules["openapi_client.rest"])
+        with self.assertRaises(AttributeError):
+            openapi_client.NoSuchModel
+
+    def test_every_module_imports_in_a_clean_interpreter(self) -> None:
+        # isolated mode ignores PYTHONPATH, so no sitecustomize can patch
+        # over a module that fails to import
+        script = "\n".join([
+            "import importlib, pkgutil, sys",
+            "sys.path.insert(0, %r)" % PACKAGE_DIR,
+            "import openapi_client",
+            "for module in pkgutil.walk_packages(openapi_client.__path__, 'openapi_client.'):",
+            "    importlib.import_module(module.name)",
+            "for name in openapi_client.__all__:",
+            "    getattr(openapi_client, name)",
+        ])
+        result = subprocess.run([sys.executable, "-I", "-c", script], capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
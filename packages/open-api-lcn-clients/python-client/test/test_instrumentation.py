@@ -0,0 +1,249 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import asyncio
+import json
+import socket
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from openapi_client.api.boosts_api import BoostsApi
+from openapi_client.api_client import ApiClient
+from openapi_client.async_api import AsyncBoostsApi
+from openapi_client.async_api_client import AsyncApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.exceptions import NotFoundException
+from openapi_client.instrumentation import Hook, HistogramRegistry, MetricsHook, TracingHook
+from openapi_client.models.boost_get_boosts_request import BoostGetBoostsRequest
+from openapi_client.prepared import prepare_request, send_request
+
+BOOST_URI = "lc:network:boost:1"
+BOOST = json.dumps({
+    "uri": BOOST_URI,
+    "name": "Badge",
+    "boost": {
+        "@context": ["https://www.w3.org/2018/credentials/v1"],
+        "type": ["VerifiableCredential"],
+        "issuer": "did:web:issuer",
+        "credentialSubject": {"id": "did:web:subject"},
+    },
+}).encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def _reply(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.startswith("/boost?"):
+            self._reply(200, BOOST)
+        else:
+            self._reply(404, b'{"message": "not found"}')
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self._reply(200, b"3")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Recorder(Hook):
+
+    def __init__(self):
+        self.events = []
+
+    def on_start(self, operation):
+        self.events.append(("start", operation))
+
+    def on_end(self, operation):
+        self.events.append(("end", operation))
+
+
+class _Span:
+
+    def __init__(self, name, attributes, start_time):
+        self.name = name
+        self.attributes = dict(attributes)
+        self.start_time = start_time
+        self.end_time = None
+        self.exceptions = []
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def record_exception(self, exception):
+        self.exceptions.append(exception)
+
+    def end(self, end_time=None):
+        self.end_time = end_time
+
+
+class _Tracer:
+
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, name, attributes=None, start_time=None):
+        span = _Span(name, attributes or {}, start_time)
+        self.spans.append(span)
+        return span
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Operation hook tests"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        self.configuration = Configuration(host="http://127.0.0.1:%d" % self.server.server_port)
+        self.api_client = ApiClient(self.configuration)
+        self.recorder = _Recorder()
+        self.api_client.hooks.append(self.recorder)
+        self.api = BoostsApi(self.api_client)
+
+    def test_phases(self) -> None:
+        self.assertEqual(self.api.boost_get_boost(BOOST_URI).name, "Badge")
+        [(start, operation), (end, ended)] = self.recorder.events
+        self.assertEqual((start, end), ("start", "end"))
+        self.assertIs(operation, ended)
+        self.assertEqual(operation.operation_id, "boost_get_boost")
+        self.assertEqual((operation.method, operation.path, operation.status), ("GET", "/boost", 200))
+        self.assertEqual((operation.bytes_out, operation.bytes_in), (0, len(BOOST)))
+        self.assertEqual(
+            list(operation.phases),
+            ["serialize", "network", "read", "decode", "parse", "deserialize"],
+        )
+        self.assertGreaterEqual(operation.duration, sum(operation.phases.values()))
+        self.assertIsNone(operation.error)
+
+    def test_request_body(self) -> None:
+        self.assertEqual(self.api.boost_count_boosts(BoostGetBoostsRequest()), 3)
+        operation = self.recorder.events[-1][1]
+        self.assertEqual((operation.operation_id, operation.path), ("boost_count_boosts", "/boost/count"))
+        self.assertEqual((operation.bytes_out, operation.bytes_in), (2, 1))
+
+    def test_error_status(self) -> None:
+        with self.assertRaises(NotFoundException):
+            self.api.boost_get_boost_recipient_count_with_http_info(BOOST_URI)
+        operation = self.recorder.events[-1][1]
+        self.assertEqual(operation.status, 404)
+        self.assertIsInstance(operation.error, NotFoundException)
+
+    def test_connection_error(self) -> None:
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+        configuration = Configuration(host="http://127.0.0.1:%d" % port, retries=0)
+        api_client = ApiClient(configuration)
+        api_client.hooks.append(self.recorder)
+        with self.assertRaises(Exception):
+            BoostsApi(api_client).boost_get_boost(BOOST_URI)
+        [_, (end, operation)] = self.recorder.events
+        self.assertEqual((end, operation.status), ("end", None))
+        self.assertIsNotNone(operation.error)
+        self.assertEqual(list(operation.phases), ["serialize", "network"])
+
+    def test_without_preload_content(self) -> None:
+        response = self.api.boost_get_boost_without_preload_content(BOOST_URI)
+        self.assertEqual([e for e, _ in self.recorder.events], ["start", "end"])
+        self.assertEqual(self.recorder.events[-1][1].operation_id, "boost_get_boost")
+        self.assertEqual(response.data, BOOST)
+
+    def test_prepared_request(self) -> None:
+        prepared = prepare_request(self.api, "boost_get_boost", BOOST_URI)
+        self.assertEqual(self.recorder.events, [])
+        # a request sent by hand is not taken for the one only prepared
+        self.api_client.call_api(*prepared.params).read()
+        self.assertEqual(self.recorder.events[-1][0], "start")
+        self.assertIsNone(self.recorder.events[-1][1].operation_id)
+        self.assertEqual(self.api.boost_count_boosts(BoostGetBoostsRequest()), 3)
+        self.assertEqual(self.recorder.events[-1][1].operation_id, "boost_count_boosts")
+
+        self.recorder.events.clear()
+        prepared, response_data = send_request(self.api, "boost_get_boost", BOOST_URI)
+        response_data.read()
+        self.api_client.response_deserialize(response_data, prepared.response_types_map)
+        self.assertEqual([e for e, _ in self.recorder.events], ["start", "end"])
+        self.assertEqual(self.recorder.events[-1][1].operation_id, "boost_get_boost")
+
+    def test_hook_failure_is_ignored(self) -> None:
+        class Broken(Hook):
+            def on_end(self, operation):
+                raise RuntimeError("broken hook")
+
+        self.api_client.hooks.insert(0, Broken())
+        with self.assertLogs("openapi_client", "ERROR"):
+            self.assertEqual(self.api.boost_get_boost(BOOST_URI).name, "Badge")
+        self.assertEqual(len(self.recorder.events), 2)
+
+    def test_metrics_hook(self) -> None:
+        registry = HistogramRegistry()
+        self.api_client.hooks.append(MetricsHook(registry))
+        self.api.boost_get_boost(BOOST_URI)
+        self.api.boost_get_boost(BOOST_URI)
+        text = registry.exposition()
+        self.assertIn(
+            'lcn_client_duration_seconds_count{operation="boost_get_boost",method="GET",path="/boost",status="200"} 2',
+            text,
+        )
+        self.assertIn('lcn_client_duration_seconds_bucket{operation="boost_get_boost",method="GET",path="/boost",status="200",le="+Inf"} 2', text)
+        self.assertIn('lcn_client_phase_seconds_count{operation="boost_get_boost",phase="parse"} 2', text)
+        self.assertIn('lcn_client_response_bytes_bucket{operation="boost_get_boost",le="1024.0"} 2', text)
+        self.assertIn("# TYPE lcn_client_request_bytes histogram", text)
+
+    def test_tracing_hook(self) -> None:
+        tracer = _Tracer()
+        self.api_client.hooks.append(TracingHook(tracer))
+        self.api.boost_get_boost(BOOST_URI)
+        with self.assertRaises(NotFoundException):
+            self.api.boost_get_boost_recipient_count(BOOST_URI)
+        ok, failed = tracer.spans
+        self.assertEqual(ok.name, "GET /boost")
+        self.assertEqual(ok.attributes["lcn.operation"], "boost_get_boost")
+        self.assertEqual(ok.attributes["http.response.status_code"], 200)
+        self.assertEqual(ok.attributes["http.response.body.size"], len(BOOST))
+        self.assertIn("lcn.phase.network", ok.attributes)
+        self.assertLessEqual(ok.start_time, ok.end_time)
+        self.assertEqual(failed.attributes["error.type"], "NotFoundException")
+        self.assertEqual(len(failed.exceptions), 1)
+
+    def test_async_client(self) -> None:
+        async def run():
+            async with AsyncApiClient(self.configuration) as api_client:
+                api_client.hooks.append(self.recorder)
+                api = AsyncBoostsApi(api_client)
+                await asyncio.gather(*[api.boost_get_boost(BOOST_URI) for _ in range(3)])
+
+        asyncio.run(run())
+        ended = [o for e, o in self.recorder.events if e == "end"]
+        self.assertEqual(len(ended), 3)
+        self.assertEqual({o.operation_id for o in ended}, {"boost_get_boost"})
+        self.assertEqual({o.bytes_in for o in ended}, {len(BOOST)})
+        self.assertIn("read", ended[0].phases)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import collections
+import threading
+import unittest
+
+from openapi_client.api_client import ApiClient
+from openapi_client.exceptions import NotFoundException
+from openapi_client.loader import BOOST, CREDENTIAL, PROFILE, ReferenceLoader
+from openapi_client.models.activity_get_my_activities200_response_records_inner import ActivityGetMyActivities200ResponseRecordsInner
+from openapi_client.models.contracts_get_credentials_for_contract200_response_records_inner import ContractsGetCredentialsForContract200ResponseRecordsInner
+
+
+def _activity(index, boost_uri, credential_uri, actor):
+    return ActivityGetMyActivities200ResponseRecordsInner.from_dict({
+        "id": "id-%d" % index,
+        "activityId": "activity-%d" % index,
+        "eventType": "CREATED",
+        "timestamp": "2024-01-01T00:00:00Z",
+        "actorProfileId": actor,
+        "recipientType": "profile",
+        "recipientIdentifier": "someone",
+        "boostUri": boost_uri,
+        "credentialUri": credential_uri,
+        "source": "send",
+    })
+
+
+class _Fetchers:
+    """Lookups recording their calls, by kind."""
+
+    def __init__(self, fail=(), barrier=None):
+        self.lock = threading.Lock()
+        self.calls = collections.Counter()
+        self.fail = set(fail)
+        self.barrier = barrier
+
+    def __call__(self, kind):
+        def fetch(key):
+            with self.lock:
+                self.calls[(kind, key)] += 1
+            if self.barrier is not None:
+                self.barrier.wait()
+            if key in self.fail:
+                raise NotFoundException(status=404, reason="Not Found")
+            return "%s:%s" % (kind, key)
+        return fetch
+
+    def mapping(self):
+        return {kind: self(kind) for kind in (BOOST, CREDENTIAL, PROFILE)}
+
+
+class TestReferenceLoader(unittest.TestCase):
+    """ReferenceLoader unit test stubs"""
+
+    def test_resolves_each_reference_once(self) -> None:
+        fetchers = _Fetchers()
+        page = [_activity(i, "boost-%d" % (i % 2), "cred-%d" % i, "alice" if i < 3 else None) for i in range(5)]
+        with ReferenceLoader(fetchers=fetchers.mapping()) as loader:
+            resolved = loader.resolve(page)
+
+        self.assertEqual([r.record for r in resolved], page)
+        self.assertEqual(resolved[3]["boost_uri"], "boost:boost-1")
+        self.assertEqual(resolved[3]["credential_uri"], "credential:cred-3")
+        self.assertEqual(resolved[0]["actor_profile_id"], "profile:alice")
+        self.assertNotIn("actor_profile_id", resolved[4].resolved)
+        self.assertEqual(set(fetchers.calls.values()), {1})
+        self.assertEqual(loader.requests, {BOOST: 2, CREDENTIAL: 5, PROFILE: 1})
+
+    def test_caches_across_pages(self) -> None:
+        fetchers = _Fetchers()
+        with ReferenceLoader(fetchers=fetchers.mapping(), max_entries=2) as loader:
+            loader.resolve([_activity(0, "b1", "c1", "alice")])
+            resolved = loader.resolve([
+                ContractsGetCredentialsForContract200ResponseRecordsInner.from_dict({
+                    "credentialUri": "c2", "termsUri": "t", "contractUri": "k", "boostUri": "b1", "date": "d",
+                }),
+            ])
+            self.assertEqual(resolved[0].resolved, {"credential_uri": "credential:c2", "boost_uri": "boost:b1"})
+            self.assertEqual(fetchers.calls[(BOOST, "b1")], 1)
+            self.assertEqual(loader.hits[BOOST], 1)
+
+            loader.clear(BOOST)
+            self.assertEqual(loader.load(BOOST, "b1"), "boost:b1")
+            self.assertEqual(fetchers.calls[(BOOST, "b1")], 2)
+
+    def test_kinds_are_fetched_concurrently(self) -> None:
+        # each lookup waits for the other two, which only returns if they overlap
+        fetchers = _Fetchers(barrier=threading.Barrier(3, timeout=5))
+        with ReferenceLoader(fetchers=fetchers.mapping(), max_workers=3) as loader:
+            resolved = loader.resolve([_activity(0, "b1", "c1", "alice")])
+
+        self.assertEqual(resolved[0].errors, {})
+        self.assertEqual(len(resolved[0].resolved), 3)
+
+    def test_failed_lookups(self) -> None:
+        fetchers = _Fetchers(fail={"missing"})
+        page = [_activity(0, "b1", "missing", None), _activity(1, "b1", "c1", None)]
+        with ReferenceLoader(fetchers=fetchers.mapping()) as loader:
+            resolved = loader.resolve(page)
+            self.assertIsInstance(resolved[0].errors["credential_uri"], NotFoundException)
+            self.assertEqual(resolved[0]["boost_uri"], "boost:b1")
+            self.assertEqual(resolved[1].errors, {})
+
+            # failures are not cached
+            loader.resolve(page[:1])
+            self.assertEqual(fetchers.calls[(CREDENTIAL, "missing")], 2)
+
+    def test_iter_resolved_and_default_fetchers(self) -> None:
+        fetchers = _Fetchers()
+        records = (_activity(i, "b%d" % i, None, None) for i in range(5))
+        with ReferenceLoader(ApiClient(), fetchers={BOOST: fetchers(BOOST)}) as loader:
+            self.assertEqual(set(loader.fetchers), {BOOST, CREDENTIAL, PROFILE})
+            resolved = list(loader.iter_resolved(records, batch_size=2))
+
+        self.assertEqual([r["boost_uri"] for r in resolved], ["boost:b%d" % i for i in range(5)])
+
+
+if __name__ == '__main__':
+    unittest.main()
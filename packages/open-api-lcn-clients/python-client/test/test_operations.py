@@ -0,0 +1,157 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import inspect
+import typing
+import unittest
+import warnings
+from typing import List, Optional
+
+from pydantic import StrictStr, ValidationError
+
+from openapi_client.api.boosts_api import BoostsApi
+from openapi_client.api_client import ApiClient
+from openapi_client.api_response import ApiResponse
+from openapi_client.configuration import Configuration
+from openapi_client.models.boost_send_request import BoostSendRequest
+from openapi_client.operations import Endpoint, GeneratedApi, Param
+from openapi_client.prepared import iter_operations, prepare_request
+
+
+class _ExampleApi(GeneratedApi):
+
+    operations = (
+        Endpoint(
+            name='example_get',
+            method='GET',
+            path='/example/{exampleId}',
+            summary='Get an example',
+            description='Fetches one example.',
+            deprecated=True,
+            params=(
+                Param('example_id', StrictStr, 'path', 'exampleId'),
+                Param('tags', Optional[List[StrictStr]], 'query', 'tags', required=False, collection_format='multi'),
+                Param('uri', StrictStr, 'query', 'uri'),
+            ),
+            returns=List[StrictStr],
+            response_types_map={'200': "List[str]"},
+        ),
+        Endpoint(
+            name='example_send',
+            method='POST',
+            path='/example/send',
+            summary='Send an example',
+            params=(
+                Param('boost_send_request', BoostSendRequest, 'body'),
+            ),
+            content_types=('application/json',),
+            returns=object,
+            response_types_map={'200': "object"},
+        ),
+    )
+
+    def example_send(self, request):
+        return 'overridden'
+
+
+class TestOperations(unittest.TestCase):
+    """GeneratedApi / Endpoint tests"""
+
+    def setUp(self) -> None:
+        self.api = _ExampleApi(ApiClient(Configuration(host="http://localhost")))
+
+    def test_methods(self) -> None:
+        self.assertEqual(list(iter_operations(_ExampleApi)), ['example_get', 'example_send'])
+        self.assertEqual(self.api.example_send(None), 'overridden')
+        for name in ('example_send_with_http_info', 'example_send_without_preload_content', '_example_send_serialize'):
+            self.assertTrue(hasattr(_ExampleApi, name))
+
+    def test_signature(self) -> None:
+        method = _ExampleApi.example_get
+        self.assertEqual(method.__name__, 'example_get')
+        self.assertEqual(method.__qualname__, '_ExampleApi.example_get')
+        parameters = inspect.signature(method).parameters
+        # required arguments first, then the `_` options
+        self.assertEqual(list(parameters)[:5], ['self', 'example_id', 'uri', 'tags', '_request_timeout'])
+        self.assertIs(parameters['uri'].default, inspect.Parameter.empty)
+        self.assertIsNone(parameters['tags'].default)
+        self.assertEqual(parameters['_host_index'].default, 0)
+        self.assertEqual(typing.get_type_hints(method)['return'], List[str])
+        self.assertIs(
+            inspect.signature(_ExampleApi.example_get_with_http_info).return_annotation,
+            ApiResponse[List[StrictStr]],
+        )
+        self.assertEqual(
+            list(inspect.signature(_ExampleApi._example_get_serialize).parameters),
+            ['self', 'example_id', 'uri', 'tags', '_request_auth', '_content_type', '_headers', '_host_index'],
+        )
+
+    def test_docstring(self) -> None:
+        doc = _ExampleApi.example_get.__doc__
+        self.assertTrue(doc.startswith(
+            "(Deprecated) Get an example\n\n"
+            "        Fetches one example.\n\n"
+            "        :param example_id: (required)\n"
+            "        :type example_id: str\n"
+            "        :param uri: (required)\n"
+            "        :type uri: str\n"
+            "        :param tags:\n"
+            "        :type tags: List[str]\n"
+            "        :param _request_timeout:"
+        ))
+        self.assertIs(_ExampleApi.example_get_with_http_info.__doc__, doc)
+
+    def test_serialize(self) -> None:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            prepared = prepare_request(self.api, 'example_get', 'e/1', 'lc:1', tags=['a', 'b'])
+        self.assertEqual(
+            prepared.url,
+            'http://localhost/example/e%2F1?tags=a&tags=b&uri=lc%3A1',
+        )
+        self.assertEqual(prepared.response_types_map, {'200': "List[str]"})
+        self.assertEqual(
+            [str(w.message) for w in caught],
+            ['GET /example/{exampleId} is deprecated.'],
+        )
+        request = BoostSendRequest(type='boost', recipient='profile-1')
+        prepared = prepare_request(self.api, 'example_send', request)
+        self.assertEqual(prepared.method, 'POST')
+        self.assertEqual(prepared.header_params['Content-Type'], 'application/json')
+        self.assertEqual(prepared.body, {'type': 'boost', 'recipient': 'profile-1'})
+
+    def test_arguments(self) -> None:
+        self.api.api_client.client_side_validation = False
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            with self.assertRaisesRegex(TypeError, "missing required arguments: 'uri'"):
+                self.api.example_get('e')
+            with self.assertRaisesRegex(TypeError, "unexpected keyword argument 'limit'"):
+                self.api.example_get('e', 'u', limit=1)
+            with self.assertRaisesRegex(TypeError, "multiple values for argument 'uri'"):
+                self.api.example_get('e', 'u', uri='u')
+            with self.assertRaisesRegex(TypeError, "takes 9 positional arguments"):
+                self.api.example_get(*range(9))
+            self.api.api_client.client_side_validation = True
+            with self.assertRaises(ValidationError):
+                self.api.example_get('e', 42)
+
+    def test_generated_classes(self) -> None:
+        self.assertTrue(issubclass(BoostsApi, GeneratedApi))
+        names = [endpoint.name for endpoint in BoostsApi.operations]
+        self.assertEqual(sorted(names), list(iter_operations(BoostsApi)))
+        method = BoostsApi.boost_get_boost
+        self.assertEqual(method.__module__, 'openapi_client.api.boosts_api')
+        self.assertIn(':param uri: (required)', method.__doc__)
+
+
+if __name__ == '__main__':
+    unittest.main()
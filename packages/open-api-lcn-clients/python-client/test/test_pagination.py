@@ -0,0 +1,142 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from openapi_client.api.activity_api import ActivityApi
+from openapi_client.api.boosts_api import BoostsApi
+from openapi_client.api_client import ApiClient
+from openapi_client.async_api import AsyncActivityApi, AsyncBoostsApi
+from openapi_client.async_api_client import AsyncApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.models.boost_get_paginated_boosts_request import BoostGetPaginatedBoostsRequest
+from openapi_client.pagination import iter_pages
+
+TOTAL = 23
+
+
+def _page(cursor, limit, record):
+    start = int(cursor or 0)
+    end = min(start + limit, TOTAL)
+    return {
+        "cursor": str(end) if end < TOTAL else None,
+        "hasMore": end < TOTAL,
+        "records": [record(i) for i in range(start, end)],
+    }
+
+
+def _boost(i):
+    return {"uri": "lc:network:boost:%d" % i, "name": "Boost %d" % i}
+
+
+def _activity(i):
+    return {
+        "id": str(i),
+        "activityId": "activity-%d" % i,
+        "eventType": "CREATED",
+        "timestamp": None,
+        "actorProfileId": "issuer",
+        "recipientType": "profile",
+        "recipientIdentifier": "recipient-%d" % i,
+        "source": "send",
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def _reply(self, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        self.server.requests.append(query)
+        self._reply(_page(query.get("cursor"), int(query.get("limit", 10)), _activity))
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append(body)
+        self._reply(_page(body.get("cursor"), int(body["limit"]), _boost))
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestPagination(unittest.IsolatedAsyncioTestCase):
+    """iter_*/aiter_* cursor pagination tests"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.server.requests = []
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        self.server.requests.clear()
+        self.configuration = Configuration(host="http://127.0.0.1:%d" % self.server.server_port)
+
+    def test_iter_body_cursor(self) -> None:
+        api = BoostsApi(ApiClient(self.configuration))
+        request = BoostGetPaginatedBoostsRequest(limit=5, query=None)
+        uris = [r.uri for r in api.iter_boost_get_paginated_boosts(request)]
+        self.assertEqual(uris, ["lc:network:boost:%d" % i for i in range(TOTAL)])
+        self.assertEqual([r.get("cursor") for r in self.server.requests], [None, "5", "10", "15", "20"])
+        # the caller's request model is left untouched
+        self.assertIsNone(request.cursor)
+
+    def test_iter_query_cursor_without_prefetch(self) -> None:
+        api = ActivityApi(ApiClient(self.configuration))
+        ids = [r.id for r in api.iter_activity_get_my_activities(page_size=10, prefetch=False, event_type="CREATED")]
+        self.assertEqual(ids, [str(i) for i in range(TOTAL)])
+        self.assertEqual([r.get("cursor") for r in self.server.requests], [None, "10", "20"])
+        self.assertTrue(all(r["eventType"] == "CREATED" for r in self.server.requests))
+
+    def test_max_records_stops_early(self) -> None:
+        api = BoostsApi(ApiClient(self.configuration))
+        records = list(api.iter_boost_get_paginated_boosts(
+            BoostGetPaginatedBoostsRequest(), page_size=4, max_records=6, prefetch=False
+        ))
+        self.assertEqual(len(records), 6)
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_iter_pages(self) -> None:
+        api = BoostsApi(ApiClient(self.configuration))
+        pages = list(iter_pages(api.boost_get_paginated_boosts, BoostGetPaginatedBoostsRequest(), page_size=10))
+        self.assertEqual([len(p.records) for p in pages], [10, 10, 3])
+
+    async def test_aiter(self) -> None:
+        async with AsyncApiClient(self.configuration) as api_client:
+            boosts = [r.uri async for r in AsyncBoostsApi(api_client).aiter_boost_get_paginated_boosts(
+                BoostGetPaginatedBoostsRequest(), page_size=7
+            )]
+            activities = [r.id async for r in AsyncActivityApi(api_client).aiter_activity_get_my_activities(
+                page_size=20, max_records=21
+            )]
+        self.assertEqual(boosts, ["lc:network:boost:%d" % i for i in range(TOTAL)])
+        self.assertEqual(activities, [str(i) for i in range(21)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,179 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import gc
+import os
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from openapi_client import pools
+from openapi_client.api_client import ApiClient
+from openapi_client.configuration import Configuration
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        time.sleep(0.02)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestPools(unittest.TestCase):
+    """Shared connection pool tests"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.host = "http://127.0.0.1:%d" % cls.server.server_address[1]
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def configuration(self, **settings) -> Configuration:
+        configuration = Configuration(host=self.host, access_token=settings.pop("access_token", None))
+        settings.setdefault("share_connection_pools", True)
+        for name, value in settings.items():
+            setattr(configuration, name, value)
+        return configuration
+
+    def get(self, api_client: ApiClient) -> None:
+        response = api_client.rest_client.request("GET", self.host + "/boost")
+        response.read()
+
+    def test_shared_between_clients(self) -> None:
+        with ApiClient(self.configuration(access_token="a")) as first, \
+                ApiClient(self.configuration(access_token="b")) as second:
+            self.assertIs(first.rest_client.pool_manager, second.rest_client.pool_manager)
+            self.get(first)
+            self.get(second)
+            stats = first.pool_stats()
+            self.assertEqual((stats.clients, stats.opened, stats.reused, stats.open), (2, 1, 1, 1))
+            self.assertEqual(stats.host, self.host)
+            self.assertIn(stats, pools.shared_pools.stats())
+
+    def test_not_shared_by_default(self) -> None:
+        self.assertFalse(Configuration().share_connection_pools)
+        with ApiClient(Configuration(host=self.host)) as first, \
+                ApiClient(Configuration(host=self.host)) as second:
+            self.assertIsNot(first.rest_client.pool_manager, second.rest_client.pool_manager)
+            self.get(first)
+            self.assertEqual((first.pool_stats().clients, first.pool_stats().opened), (1, 1))
+            self.assertNotIn(first.pool_stats(), pools.shared_pools.stats())
+
+    def test_urllib3_internals(self) -> None:
+        # the urllib3 allowed by setup.py keeps the private methods the
+        # counters override; a release that changes them fails here
+        self.assertTrue(pools.COUNTING_SUPPORTED)
+        with ApiClient(self.configuration()) as api_client:
+            with ThreadPoolExecutor(4) as executor:
+                list(executor.map(lambda _: self.get(api_client), range(8)))
+            stats = api_client.pool_stats()
+            manager = api_client.rest_client.pool_manager
+            connection_pools = [manager.pools.get(key) for key in manager.pools.keys()]
+            # urllib3's own public counters agree
+            self.assertEqual(stats.opened, sum(p.num_connections for p in connection_pools))
+            self.assertEqual(stats.opened + stats.reused, sum(p.num_requests for p in connection_pools))
+            self.assertEqual(stats.in_use, 0)
+
+    def test_separate_settings(self) -> None:
+        with ApiClient(self.configuration()) as first, \
+                ApiClient(self.configuration(verify_ssl=False)) as second, \
+                ApiClient(self.configuration(share_connection_pools=False)) as third:
+            managers = {id(c.rest_client.pool_manager) for c in (first, second, third)}
+            self.assertEqual(len(managers), 3)
+            self.get(third)
+            self.assertEqual(third.pool_stats().clients, 1)
+            self.assertEqual(third.pool_stats().opened, 1)
+
+    def test_close(self) -> None:
+        first = ApiClient(self.configuration(connection_pool_maxsize=3))
+        with ApiClient(self.configuration(connection_pool_maxsize=3)) as second:
+            self.get(second)
+            self.assertEqual(second.pool_stats().clients, 2)
+        key = first.rest_client._key
+        manager = first.rest_client.pool_manager
+        self.assertEqual(pools.shared_pools.clients(key), 1)
+        self.assertEqual(len(manager.pools), 1)
+        first.close()
+        self.assertEqual(pools.shared_pools.clients(key), 0)
+        self.assertEqual(len(manager.pools), 0)
+        # a closed client reconnects on its next request
+        self.get(first)
+        self.assertIsNot(first.rest_client.pool_manager, manager)
+        self.assertEqual(pools.shared_pools.clients(key), 1)
+        del first
+        gc.collect()
+        self.assertEqual(pools.shared_pools.clients(key), 0)
+
+    def test_waited(self) -> None:
+        with ApiClient(self.configuration(connection_pool_maxsize=1, connection_pool_block=True)) as api_client:
+            with ThreadPoolExecutor(4) as executor:
+                list(executor.map(lambda _: self.get(api_client), range(8)))
+            stats = api_client.pool_stats()
+            self.assertEqual(stats.opened, 1)
+            self.assertEqual(stats.reused, 7)
+            self.assertGreater(stats.waited, 0)
+            self.assertEqual((stats.in_use, stats.open), (0, 1))
+
+    def test_fork(self) -> None:
+        with ApiClient(self.configuration()) as api_client:
+            self.get(api_client)
+            manager = api_client.rest_client.pool_manager
+            generation = pools._fork_generation
+            try:
+                pools._after_fork_in_child()
+                self.assertEqual(len(pools.shared_pools), 0)
+                self.get(api_client)
+                self.assertIsNot(api_client.rest_client.pool_manager, manager)
+                self.assertEqual(api_client.pool_stats().opened, 1)
+            finally:
+                api_client.close()
+                pools._fork_generation = generation
+                pools.shared_pools._check_fork()
+
+    @unittest.skipUnless(hasattr(os, "fork"), "needs os.fork")
+    def test_real_fork(self) -> None:
+        with ApiClient(self.configuration()) as api_client:
+            self.get(api_client)
+            manager = api_client.rest_client.pool_manager
+            pid = os.fork()
+            if pid == 0:
+                try:
+                    self.get(api_client)
+                    fresh = api_client.rest_client.pool_manager is not manager
+                    os._exit(0 if fresh and api_client.pool_stats().opened == 1 else 1)
+                except BaseException:
+                    os._exit(2)
+            _, status = os.waitpid(pid, 0)
+            self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+            # the parent's connection is untouched
+            self.get(api_client)
+            self.assertIs(api_client.rest_client.pool_manager, manager)
+            self.assertEqual(api_client.pool_stats().opened, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
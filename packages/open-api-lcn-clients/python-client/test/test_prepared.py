@@ -0,0 +1,165 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import asyncio
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from pydantic import ValidationError
+
+from openapi_client.api.send_api import SendApi
+from openapi_client.api_client import ApiClient
+from openapi_client.async_api import AsyncSendApi
+from openapi_client.async_api_client import AsyncApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.encoding import encode
+from openapi_client.instrumentation import Hook
+from openapi_client.models.boost_send_request import BoostSendRequest
+from openapi_client.prepared import RequestTemplate
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        with self.server.lock:
+            self.server.requests.append((self.headers["Authorization"], body))
+        recipient = json.loads(body)["recipient"]
+        payload = json.dumps({
+            "type": "boost",
+            "credentialUri": "lc:network:credential:" + recipient,
+            "uri": "lc:network:boost:1",
+            "activityId": "activity-1",
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Recorder(Hook):
+
+    def __init__(self):
+        self.operations = []
+
+    def on_end(self, operation):
+        self.operations.append(operation)
+
+
+def _send_request(recipient="placeholder"):
+    return BoostSendRequest.from_dict({
+        "type": "boost",
+        "recipient": recipient,
+        "templateUri": "lc:network:boost:1",
+        "options": {"skipNotification": True},
+        "templateData": {"course": "Café", "score": 9.5},
+    })
+
+
+class TestRequestTemplate(unittest.TestCase):
+    """RequestTemplate / SendApi.prepare_boost_send tests"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.server.lock = threading.Lock()
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        self.server.requests = []
+        self.configuration = Configuration(
+            host="http://127.0.0.1:%d" % self.server.server_port,
+            access_token="token-1",
+        )
+        self.api_client = ApiClient(self.configuration)
+        self.api = SendApi(self.api_client)
+
+    def test_body_matches_encoded_request(self) -> None:
+        template = self.api.prepare_boost_send(_send_request())
+        for recipient in ("profile-1", "ünïcode \"quoted\"  ", "+15555550100"):
+            self.assertEqual(template.body(recipient), encode(_send_request(recipient)))
+        self.configuration.compact_json = False
+        template = SendApi(ApiClient(self.configuration)).prepare_boost_send(_send_request())
+        self.assertEqual(
+            template.body("ünïcode"),
+            json.dumps(self.api_client.sanitize_for_serialization(_send_request("ünïcode"))).encode(),
+        )
+
+    def test_send(self) -> None:
+        recorder = _Recorder()
+        self.api_client.hooks.append(recorder)
+        template = self.api.prepare_boost_send(_send_request())
+        response = template.send("profile-1")
+        self.assertEqual(response.credential_uri, "lc:network:credential:profile-1")
+        # auth is resolved per send
+        self.configuration.access_token = "token-2"
+        template.send("profile-2")
+        self.assertEqual(
+            self.server.requests,
+            [
+                ("Bearer token-1", encode(_send_request("profile-1"))),
+                ("Bearer token-2", encode(_send_request("profile-2"))),
+            ],
+        )
+        self.assertEqual([o.operation_id for o in recorder.operations], ["boost_send"] * 2)
+
+    def test_validation(self) -> None:
+        template = self.api.prepare_boost_send(_send_request())
+        with self.assertRaises(ValidationError):
+            template.send(42)
+        with self.assertRaises(ValidationError):
+            self.api.prepare_boost_send(_send_request(), _host_index=3)
+        with self.assertRaises(ValueError):
+            RequestTemplate(self.api, "boost_send", _send_request(), "type")
+        self.assertEqual(self.server.requests, [])
+
+    def test_headers_are_not_shared(self) -> None:
+        headers = {"X-Campaign": "spring"}
+        template = self.api.prepare_boost_send(_send_request(), _headers=headers)
+        template.send("profile-1")
+        self.assertEqual(headers, {"X-Campaign": "spring"})
+
+    def test_bulk_send(self) -> None:
+        template = self.api.prepare_boost_send(_send_request())
+        recipients = ["profile-%d" % i for i in range(20)]
+        results = list(template.bulk_send(recipients, max_workers=4))
+        self.assertTrue(all(r.ok for r in results))
+        self.assertEqual(
+            sorted(r.data.credential_uri for r in results),
+            sorted("lc:network:credential:" + r for r in recipients),
+        )
+
+    def test_async(self) -> None:
+        async def run():
+            async with AsyncApiClient(self.configuration) as api_client:
+                template = AsyncSendApi(api_client).prepare_boost_send(_send_request())
+                return await asyncio.gather(*[template.asend("profile-%d" % i) for i in range(3)])
+
+        responses = asyncio.run(run())
+        self.assertEqual(
+            [r.credential_uri for r in responses],
+            ["lc:network:credential:profile-%d" % i for i in range(3)],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,199 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from openapi_client.api.storage_api import StorageApi
+from openapi_client.api_client import ApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.exceptions import NotFoundException
+from openapi_client.models.storage_resolve200_response import StorageResolve200Response
+from openapi_client.models.storage_store_request import StorageStoreRequest
+from openapi_client.resolve_cache import ResolveCache, SegmentStore, StoredItem, is_immutable
+
+CREDENTIAL_URI = "lc:network:network.learncard.com/trpc:credential:abc"
+BOOST_URI = "lc:network:network.learncard.com/trpc:boost:abc"
+STORED_URI = "lc:network:localhost:3000/trpc:credential:stored"
+
+VC = {
+    "@context": ["https://www.w3.org/2018/credentials/v1"],
+    "type": ["VerifiableCredential"],
+    "issuer": "did:example:issuer",
+    "credentialSubject": {"id": "did:example:subject"},
+    "issuanceDate": "2024-01-01T00:00:00Z",
+    "proof": {
+        "type": "Ed25519Signature2020",
+        "created": "2024-01-01T00:00:00Z",
+        "proofPurpose": "assertionMethod",
+        "verificationMethod": "did:example:issuer#key-1",
+    },
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        uri = parse_qs(urlsplit(self.path).query)["uri"][0]
+        with self.server.lock:
+            self.server.resolves.append(uri)
+        if uri.endswith(":missing"):
+            self.respond(404, {"message": "not found", "code": "NOT_FOUND"})
+        else:
+            self.respond(200, VC)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.respond(200, STORED_URI)
+
+    def respond(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestResolveCache(unittest.TestCase):
+    """ResolveCache unit test stubs"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.server.lock = threading.Lock()
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        self.server.resolves = []
+        self.directory = tempfile.mkdtemp()
+        configuration = Configuration(host="http://127.0.0.1:%d" % self.server.server_port)
+        self.api_client = ApiClient(configuration)
+        self.api = StorageApi(self.api_client)
+
+    def tearDown(self) -> None:
+        self.api_client.close()
+        shutil.rmtree(self.directory)
+
+    def test_is_immutable(self) -> None:
+        self.assertTrue(is_immutable(CREDENTIAL_URI))
+        self.assertTrue(is_immutable("lc:network:localhost%3A3000/trpc:presentation:1"))
+        self.assertFalse(is_immutable(BOOST_URI))
+        self.assertFalse(is_immutable("lc:network:network.learncard.com/trpc:skill:fw:sk"))
+
+    def test_resolve_is_served_from_cache(self) -> None:
+        self.api_client.resolve_cache = cache = ResolveCache()
+
+        first = self.api.cached_storage_resolve(CREDENTIAL_URI)
+        second = self.api.cached_storage_resolve(CREDENTIAL_URI)
+        self.api.cached_storage_resolve(BOOST_URI)
+        self.api.cached_storage_resolve(BOOST_URI)
+
+        self.assertEqual(self.server.resolves, [CREDENTIAL_URI, BOOST_URI, BOOST_URI])
+        self.assertIsInstance(second, StoredItem)
+        self.assertEqual(second.raw, first.raw)
+        self.assertEqual(second.json(), VC)
+        self.assertIsInstance(second.value, StorageResolve200Response)
+        self.assertEqual(second.value.to_dict(), self.api.storage_resolve(CREDENTIAL_URI).to_dict())
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+        self.assertNotIn(BOOST_URI, cache)
+
+    def test_errors_are_raised_and_not_cached(self) -> None:
+        self.api_client.resolve_cache = cache = ResolveCache()
+        uri = "lc:network:network.learncard.com/trpc:credential:missing"
+
+        for _ in range(2):
+            with self.assertRaises(NotFoundException):
+                self.api.cached_storage_resolve(uri)
+        self.assertEqual(len(self.server.resolves), 2)
+        self.assertEqual(len(cache), 0)
+
+    def test_store_does_not_seed_by_default(self) -> None:
+        self.api_client.resolve_cache = ResolveCache()
+        sent = dict(VC, issuer="did:example:sent")
+
+        uri = self.api.cached_storage_store(StorageStoreRequest.from_dict({"item": sent}))
+        item = self.api.cached_storage_resolve(uri)
+
+        self.assertEqual(uri, STORED_URI)
+        self.assertEqual(self.server.resolves, [STORED_URI])
+        self.assertEqual(item.json(), VC)
+
+    def test_store_seeds(self) -> None:
+        self.api_client.resolve_cache = ResolveCache(directory=self.directory)
+
+        uri = self.api.cached_storage_store(StorageStoreRequest.from_dict({"item": VC}), seed=True)
+        item = self.api.cached_storage_resolve(uri)
+
+        self.assertEqual(uri, STORED_URI)
+        self.assertEqual(self.server.resolves, [])
+        self.assertEqual(item.json(), VC)
+
+    def test_memory_lru_and_disk(self) -> None:
+        cache = ResolveCache(max_bytes=10, directory=self.directory)
+        cache.put(CREDENTIAL_URI + "1", b"123456")
+        cache.put(CREDENTIAL_URI + "2", b"abcdef")
+        self.assertEqual(len(cache), 1)
+        self.assertFalse(cache.put(BOOST_URI, b"{}"))
+
+        self.assertEqual(cache.get(CREDENTIAL_URI + "1"), b"123456")
+        self.assertEqual((cache.hits, cache.disk_hits), (0, 1))
+        self.assertEqual(cache.get(CREDENTIAL_URI + "1"), b"123456")
+        self.assertEqual(cache.hits, 1)
+        self.assertIsNone(cache.get(CREDENTIAL_URI + "3"))
+        cache.close()
+
+        reopened = ResolveCache(directory=self.directory)
+        self.assertEqual(reopened.get(CREDENTIAL_URI + "2"), b"abcdef")
+        self.assertEqual(reopened.disk_hits, 1)
+        reopened.close()
+
+    def test_segments(self) -> None:
+        store = SegmentStore(self.directory, segment_bytes=100, max_bytes=250)
+        for i in range(10):
+            store.put("key-%d" % i, b"x" * 40 + b"%d" % i)
+        self.assertLessEqual(store.size, 250)
+        self.assertIsNone(store.get("key-0"))
+        self.assertEqual(store.get("key-9"), b"x" * 40 + b"9")
+        kept = len(store)
+        store.close()
+
+        # a record cut short is dropped when the store is opened again
+        segments = sorted(os.listdir(self.directory))
+        with open(os.path.join(self.directory, segments[-1]), "ab") as f:
+            f.write(b"LCRC\x00\x00\x00\x05\x00\x00\x00\x10key-x")
+        store = SegmentStore(self.directory, segment_bytes=100, max_bytes=250)
+        self.assertEqual(len(store), kept)
+        self.assertEqual(store.get("key-9"), b"x" * 40 + b"9")
+        store.put("key-10", b"after")
+        self.assertEqual(store.get("key-10"), b"after")
+        store.clear()
+        self.assertEqual(len(store), 0)
+        self.assertIsNone(store.get("key-9"))
+        store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
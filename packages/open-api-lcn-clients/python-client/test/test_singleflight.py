@@ -0,0 +1,149 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from openapi_client.api.boosts_api import BoostsApi
+from openapi_client.api_client import ApiClient
+from openapi_client.async_api import AsyncBoostsApi
+from openapi_client.async_api_client import AsyncApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.singleflight import SingleFlight
+
+BOOST = {
+    "uri": "lc:network:boost:1",
+    "name": "Badge",
+    "boost": {
+        "@context": ["https://www.w3.org/2018/credentials/v1"],
+        "type": ["VerifiableCredential"],
+        "issuer": "did:web:issuer",
+        "credentialSubject": {"id": "did:web:subject"},
+    },
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.calls[self.headers.get("Authorization")] += 1
+        self.server.release.wait(5)
+        body = json.dumps(BOOST).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _wait_for(condition):
+    deadline = time.monotonic() + 5
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Request coalescing tests"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.server.lock = threading.Lock()
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        self.server.calls = Counter()
+        self.server.release = threading.Event()
+        self.configuration = Configuration(host="http://127.0.0.1:%d" % self.server.server_port)
+        self.flight = SingleFlight()
+
+    def test_threads_share_one_request(self) -> None:
+        api_client = ApiClient(self.configuration)
+        api_client.single_flight = self.flight
+        api = BoostsApi(api_client)
+        with ThreadPoolExecutor(8) as executor:
+            futures = [executor.submit(api.boost_get_boost, "lc:network:boost:1") for _ in range(8)]
+            _wait_for(lambda: self.flight.requests == 8)
+            self.server.release.set()
+            boosts = [f.result() for f in futures]
+        self.assertEqual(sum(self.server.calls.values()), 1)
+        self.assertEqual(self.flight.collapsed, 7)
+        self.assertEqual({b.name for b in boosts}, {"Badge"})
+        self.assertEqual(len({id(b) for b in boosts}), 8)
+
+    def test_keyed_by_auth(self) -> None:
+        api_client = ApiClient(self.configuration)
+        api_client.single_flight = self.flight
+        api = BoostsApi(api_client)
+        with ThreadPoolExecutor(4) as executor:
+            futures = [
+                executor.submit(api.boost_get_boost, "lc:network:boost:1", _headers={"Authorization": token})
+                for token in ("Bearer a", "Bearer b", "Bearer a", "Bearer b")
+            ]
+            _wait_for(lambda: self.flight.requests == 4)
+            self.server.release.set()
+            for f in futures:
+                f.result()
+        self.assertEqual(self.server.calls, Counter({"Bearer a": 1, "Bearer b": 1}))
+
+    def test_error_is_shared(self) -> None:
+        started = threading.Event()
+
+        def fail():
+            started.set()
+            self.server.release.wait(5)
+            raise ValueError("boom")
+
+        with ThreadPoolExecutor(3) as executor:
+            leader = executor.submit(self.flight.do, "key", fail)
+            started.wait(5)
+            followers = [executor.submit(self.flight.do, "key", fail) for _ in range(2)]
+            _wait_for(lambda: self.flight.requests == 3)
+            self.server.release.set()
+            for f in [leader] + followers:
+                self.assertRaisesRegex(ValueError, "boom", f.result)
+        self.assertEqual(self.flight.collapsed, 2)
+        self.assertEqual(self.flight.do("key", lambda: 1), 1)
+
+    def test_async_client(self) -> None:
+        async def run():
+            async with AsyncApiClient(self.configuration) as api_client:
+                api_client.single_flight = self.flight
+                api = AsyncBoostsApi(api_client)
+                calls = asyncio.gather(*[api.boost_get_boost("lc:network:boost:1") for _ in range(5)])
+                while self.flight.requests < 5:
+                    await asyncio.sleep(0.01)
+                self.server.release.set()
+                return await calls
+
+        boosts = asyncio.run(run())
+        self.assertEqual([b.name for b in boosts], ["Badge"] * 5)
+        self.assertEqual(sum(self.server.calls.values()), 1)
+        self.assertEqual(self.flight.collapsed, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
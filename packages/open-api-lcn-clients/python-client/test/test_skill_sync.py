@@ -0,0 +1,200 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import threading
+import unittest
+from typing import Dict, List, Optional
+
+from openapi_client.api.skills_api import SkillsApi
+from openapi_client.api_client import ApiClient
+from openapi_client.models.schema0 import Schema0
+from openapi_client.models.schema1 import Schema1
+from openapi_client.models.skill_frameworks_replace_skills200_response import SkillFrameworksReplaceSkills200Response
+from openapi_client.models.skills_create200_response import SkillsCreate200Response
+from openapi_client.models.skills_delete200_response import SkillsDelete200Response
+from openapi_client.models.skills_get_full_skill_tree200_response import SkillsGetFullSkillTree200Response
+from openapi_client.skill_sync import SkillSync, SyncPlan, content_hash, plan_sync
+
+
+class _FakeSkillsApi:
+    """In-memory framework answering the calls SkillSync makes."""
+
+    def __init__(self, roots: List[Schema0]) -> None:
+        self.lock = threading.Lock()
+        self.calls: List[tuple] = []
+        self.skills: Dict[str, dict] = {}
+        self.parents: Dict[str, Optional[str]] = {}
+        self.next_id = 0
+        for root in roots:
+            self._insert(root, None)
+        self.calls.clear()
+
+    def _insert(self, skill: Schema0, parent_id: Optional[str]) -> SkillsCreate200Response:
+        with self.lock:
+            if skill.id is None:
+                self.next_id += 1
+                skill_id = "gen-%d" % self.next_id
+            else:
+                skill_id = skill.id
+            self.skills[skill_id] = {
+                "id": skill_id, "statement": skill.statement, "description": skill.description,
+                "code": skill.code, "icon": skill.icon, "type": skill.type or "skill",
+                "status": skill.status or "active",
+            }
+            self.parents[skill_id] = parent_id
+        for child in skill.children or ():
+            self._insert(child, skill_id)
+        return SkillsCreate200Response.from_dict(self.skills[skill_id])
+
+    def _tree(self, parent_id: Optional[str]) -> List[Schema1]:
+        return [
+            Schema1.from_dict(dict(skill, children=[c.to_dict() for c in self._tree(skill_id)], hasChildren=False))
+            for skill_id, skill in self.skills.items() if self.parents[skill_id] == parent_id
+        ]
+
+    def tree(self) -> List[Schema0]:
+        """The framework as local definitions, for comparison."""
+        return [Schema0.from_dict(skill.to_dict()) for skill in self._tree(None)]
+
+    def skills_get_full_skill_tree(self, framework_id):
+        self.calls.append(("tree",))
+        return SkillsGetFullSkillTree200Response(skills=self._tree(None))
+
+    def skills_create_many(self, request):
+        with self.lock:
+            self.calls.append(("create", request.parent_id, [s.statement for s in request.skills]))
+        return [self._insert(skill, request.parent_id) for skill in request.skills]
+
+    def skills_update(self, skill_id, request):
+        with self.lock:
+            self.calls.append(("update", skill_id))
+            changes = request.model_dump(exclude={"framework_id"}, exclude_unset=True)
+            self.skills[skill_id].update(changes)
+
+    def skills_delete(self, skill_id, framework_id, strategy=None):
+        with self.lock:
+            self.calls.append(("delete", skill_id, strategy))
+            doomed = [skill_id]
+            while doomed:
+                current = doomed.pop()
+                doomed.extend(s for s, p in self.parents.items() if p == current)
+                del self.skills[current], self.parents[current]
+        return SkillsDelete200Response(success=True, deletedCount=1)
+
+    def skill_frameworks_replace_skills(self, framework_id, request):
+        self.calls.append(("replace", len(request.skills)))
+        self.skills.clear()
+        self.parents.clear()
+        for root in request.skills:
+            self._insert(root, None)
+        return SkillFrameworksReplaceSkills200Response(created=0, updated=0, deleted=0, unchanged=0, total=0)
+
+
+def _skill(skill_id, statement=None, children=(), **fields):
+    return Schema0(id=skill_id, statement=statement or "Skill " + str(skill_id), children=list(children) or None, **fields)
+
+
+def _framework(roots=3, children=10, grandchildren=5):
+    return [
+        _skill("r%d" % r, children=[
+            _skill("r%d.%d" % (r, c), code="C%d.%d" % (r, c), children=[
+                _skill("r%d.%d.%d" % (r, c, g)) for g in range(grandchildren)
+            ]) for c in range(children)
+        ]) for r in range(roots)
+    ]
+
+
+class TestSkillSync(unittest.TestCase):
+    """plan_sync / SkillSync tests"""
+
+    def test_in_sync(self) -> None:
+        api = _FakeSkillsApi(_framework())
+        plan = SkillSync(api, "f").plan(_framework())
+        self.assertFalse(plan)
+        self.assertEqual(plan.unchanged, 3 + 30 + 150)
+        self.assertEqual(SkillSync(api, "f").apply(plan).requests, 0)
+
+    def test_minimal_changes(self) -> None:
+        api = _FakeSkillsApi(_framework())
+        local = _framework()
+        local[0].children[1].statement = "Renamed"
+        local[0].children[2].description = "Described"
+        del local[1].children[3]
+        local[2].children[0].children.append(_skill(None, "New leaf", code="N1"))
+        local.append(_skill("r3", children=[_skill("r3.0")]))
+        sync = SkillSync(api, "f")
+        plan = sync.plan(local)
+        self.assertEqual(
+            sorted(plan.updates),
+            [("r0.1", {"statement": "Renamed"}), ("r0.2", {"description": "Described"})],
+        )
+        self.assertEqual(plan.deletes, ["r1.3"])
+        self.assertEqual([(c.parent_id, c.skill.statement) for c in plan.creates], [("r2.0", "New leaf"), (None, "Skill r3")])
+        self.assertEqual((plan.created, plan.moves), (3, []))
+        self.assertIn("delete 1 subtrees", plan.summary())
+
+        result = sync.apply(plan)
+        self.assertEqual((result.created, result.updated, result.deleted, result.requests), (3, 2, 1, 5))
+        self.assertFalse(result.replaced)
+        self.assertEqual(api.calls[1], ("delete", "r1.3", "recursive"))
+        self.assertFalse(sync.plan(local))
+
+    def test_match_by_code(self) -> None:
+        api = _FakeSkillsApi(_framework(1, 2, 0))
+        local = _framework(1, 2, 0)
+        for child in local[0].children:
+            child.id = None
+        local[0].children[0].icon = "star"
+        plan = plan_sync(api._tree(None), local)
+        self.assertEqual(plan.updates, [("r0.0", {"icon": "star"})])
+        self.assertEqual((plan.creates, plan.deletes), ([], []))
+
+    def test_chunked_creates(self) -> None:
+        api = _FakeSkillsApi([_skill("top")])
+        local = [_skill("top", children=_framework(4, 6, 3))]
+        sync = SkillSync(api, "f", chunk_size=10, max_workers=3)
+        plan = sync.plan(local)
+        self.assertEqual(plan.created, 4 * (1 + 6 + 18))
+        sync.apply(plan)
+        creates = [call for call in api.calls if call[0] == "create"]
+        # each 25-skill subtree is too big: its root goes first, then its
+        # 4-skill children, two per request
+        self.assertTrue(all(len(statements) * 4 <= 10 or len(statements) == 1 for _, _, statements in creates))
+        self.assertEqual(len(creates), 4 + 4 * 3)
+        self.assertEqual(
+            [content_hash(s, ("statement", "code")) for s in api.tree()[0].children[0].children[0].children],
+            [content_hash(s, ("statement", "code")) for s in local[0].children[0].children[0].children],
+        )
+        self.assertFalse(sync.plan(local))
+
+    def test_moves_replace(self) -> None:
+        api = _FakeSkillsApi(_framework(2, 2, 1))
+        local = _framework(2, 2, 1)
+        local[1].children.append(local[0].children.pop())
+        sync = SkillSync(api, "f")
+        plan = sync.plan(local)
+        self.assertEqual([(m.id, m.remote_parent_id, m.local_parent_id) for m in plan.moves], [("r0.1", "r0", "r1")])
+        with self.assertRaises(ValueError):
+            sync.apply(plan)
+        result = sync.apply(plan, local)
+        self.assertTrue(result.replaced)
+        self.assertEqual(api.calls[-1], ("replace", 2))
+        self.assertFalse(sync.plan(local))
+
+    def test_skills_api(self) -> None:
+        sync = SkillsApi(ApiClient()).skill_sync("f", chunk_size=50)
+        self.assertIsInstance(sync, SkillSync)
+        self.assertEqual((sync.framework_id, sync.chunk_size), ("f", 50))
+        self.assertIsInstance(plan_sync([], []), SyncPlan)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,178 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import json
+import threading
+import unittest
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from openapi_client.api.skills_api import SkillsApi
+from openapi_client.api_client import ApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.skill_tree import SkillTree
+
+FANOUT = 3
+DEPTH = 4
+
+
+def _children_ids(skill_id):
+    if skill_id.count(".") >= DEPTH - 1:
+        return []
+    return ["%s.%d" % (skill_id, i) for i in range(FANOUT)]
+
+
+def _skill(skill_id, children=(), cursor=None):
+    return {
+        "id": skill_id,
+        "statement": "Skill " + skill_id,
+        "type": "skill",
+        "status": "active",
+        "frameworkId": "f",
+        "children": list(children),
+        "hasChildren": bool(_children_ids(skill_id)),
+        "childrenCursor": cursor,
+    }
+
+
+def _page(ids, cursor, limit):
+    start = int(cursor or 0)
+    end = start + limit
+    return ids[start:end], (str(end) if end < len(ids) else None)
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        parts = url.path.strip("/").split("/")
+        with self.server.lock:
+            self.server.calls[url.path] += 1
+        if url.path == "/skills/frameworks/f/tree":
+            roots, cursor = _page(["r%d" % i for i in range(3)], query.get("cursor"), int(query.get("rootsLimit", 2)))
+            records = []
+            for root in roots:
+                children, children_cursor = _page(_children_ids(root), None, int(query.get("childrenLimit", 2)))
+                records.append(_skill(root, [_skill(c) for c in children], children_cursor))
+            payload = {"hasMore": cursor is not None, "cursor": cursor, "records": records}
+        elif parts[-1] == "children":
+            children, cursor = _page(_children_ids(parts[1]), query.get("cursor"), int(query.get("limit", 2)))
+            payload = {"hasMore": cursor is not None, "cursor": cursor, "records": [_skill(c) for c in children]}
+        else:
+            skill_id = parts[1]
+            ids = [skill_id]
+            while "." in ids[-1]:
+                ids.append(ids[-1].rsplit(".", 1)[0])
+            payload = {"path": [_skill(i) for i in ids]}
+            for skill in payload["path"]:
+                del skill["children"], skill["hasChildren"], skill["childrenCursor"]
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestSkillTree(unittest.TestCase):
+    """SkillTree tests"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.server.lock = threading.Lock()
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        self.server.calls = Counter()
+        configuration = Configuration(host="http://127.0.0.1:%d" % self.server.server_port)
+        self.api_client = ApiClient(configuration)
+        self.api = SkillsApi(self.api_client)
+
+    def tearDown(self) -> None:
+        self.api_client.close()
+
+    def test_roots(self) -> None:
+        with self.api.skill_tree("f", roots_limit=2, prefetch=False) as tree:
+            self.assertIsInstance(tree, SkillTree)
+            self.assertEqual([root.id for root in tree.roots], ["r0", "r1", "r2"])
+            self.assertEqual(self.server.calls["/skills/frameworks/f/tree"], 2)
+            root = tree.roots[0]
+            # the first page of children came with the root
+            self.assertEqual(len(tree), 9)
+            self.assertFalse(root.loaded)
+            self.assertEqual([child.id for child in root.children], ["r0.0", "r0.1", "r0.2"])
+            self.assertEqual(tree.requests, 1)
+            self.assertEqual(root.children[1].parent, root)
+            self.assertEqual(root.skill.children, [])
+
+    def test_lazy_children(self) -> None:
+        with SkillTree(self.api, "f", prefetch=False) as tree:
+            child = tree.roots[0].children[0]
+            self.assertEqual(tree.requests, 1)
+            grandchildren = child.children
+            self.assertEqual([c.id for c in grandchildren], ["r0.0.0", "r0.0.1", "r0.0.2"])
+            # two pages of two
+            self.assertEqual(self.server.calls["/skills/r0.0/children"], 2)
+            self.assertIs(child.children, grandchildren)
+            self.assertEqual(tree.requests, 3)
+            self.assertEqual(sum(1 for _ in tree.walk()), 3 * (1 + 3 + 9 + 27))
+
+    def test_prefetch(self) -> None:
+        with SkillTree(self.api, "f", children_limit=10) as tree:
+            child = tree.roots[0].children[0]
+            child.children
+        # the children of r0.0's children were requested in the background
+        for i in range(FANOUT):
+            self.assertEqual(self.server.calls["/skills/r0.0.%d/children" % i], 1)
+            self.assertTrue(tree.get("r0.0.%d" % i).loaded)
+
+    def test_path(self) -> None:
+        with SkillTree(self.api, "f", prefetch=False) as tree:
+            path = tree.path("r1.2.0.1")
+            self.assertEqual([node.id for node in path], ["r1.2.0.1", "r1.2.0", "r1.2", "r1"])
+            self.assertEqual(self.server.calls["/skills/r1.2.0.1/path"], 1)
+            requests = tree.requests
+            self.assertEqual([node.id for node in tree.path("r1.2.0.0")], ["r1.2.0.0", "r1.2.0", "r1.2", "r1"])
+            self.assertEqual(tree.requests, requests)
+
+    def test_eviction(self) -> None:
+        with SkillTree(self.api, "f", children_limit=10, prefetch=False, max_nodes=20) as tree:
+            self.assertEqual(len(tree), 12)
+            for root in tree.roots:
+                for child in root.children:
+                    child.children
+                    self.assertLessEqual(len(tree), 20)
+            self.assertGreater(tree.evicted, 0)
+            self.assertIn("r2.2.0", tree)
+            # the least recently expanded subtrees went first; roots stay
+            self.assertNotIn("r0.0", tree)
+            self.assertFalse(tree.roots[0].loaded)
+            self.assertEqual(len(tree.roots), 3)
+            # evicted subtrees are fetched again when visited
+            self.assertEqual([node.id for node in tree.path("r0.0.1")], ["r0.0.1", "r0.0", "r0"])
+            self.assertEqual(self.server.calls["/skills/r0/children"], 1)
+            self.assertEqual(self.server.calls["/skills/r0.0/children"], 2)
+            self.assertLessEqual(len(tree), 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
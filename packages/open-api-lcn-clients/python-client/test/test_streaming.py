@@ -0,0 +1,190 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import asyncio
+import json
+import threading
+import tracemalloc
+import unittest
+import warnings
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from openapi_client.api.boosts_api import BoostsApi
+from openapi_client.api.skills_api import SkillsApi
+from openapi_client.api.utilities_api import UtilitiesApi
+from openapi_client.api_client import ApiClient
+from openapi_client.async_api import AsyncBoostsApi, AsyncUtilitiesApi
+from openapi_client.async_api_client import AsyncApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.exceptions import NotFoundException
+from openapi_client.streaming import JSONArrayStream, stream_path
+
+RECORDS = 5000
+BOOST_URI = "lc:network:boost:1"
+RECIPIENTS = json.dumps([
+    {
+        "to": {
+            "profileId": "profile-%d" % i,
+            "displayName": "Café ✓ %d" % i,
+            "shortBio": "",
+            "bio": "",
+            "did": "did:web:profile-%d" % i,
+        },
+        "from": "did:web:issuer",
+        "received": "2024-01-01T00:00:00Z",
+        "uri": "lc:network:credential:%d" % i,
+    }
+    for i in range(RECORDS)
+]).encode()
+SKILL = {"id": "s1", "statement": "Skill", "type": "skill", "status": "active", "children": [], "hasChildren": False}
+SKILL_TREE = json.dumps({"skills": [SKILL, dict(SKILL, id="s2")]}).encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def _reply(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.startswith("/boost/recipients?"):
+            self._reply(200, RECIPIENTS)
+        elif self.path == "/skills/frameworks/f1/tree/full":
+            self._reply(200, SKILL_TREE)
+        elif self.path == "/challenges":
+            self._reply(200, b"[1, null, 2]")
+        else:
+            self._reply(404, json.dumps({"message": "not found"}).encode())
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _feed(stream, data, size):
+    elements = []
+    for i in range(0, len(data), size):
+        elements.extend(stream.feed(data[i:i + size]))
+    return elements + list(stream.close())
+
+
+class TestStreaming(unittest.TestCase):
+    """Streaming list deserialization tests"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        self.configuration = Configuration(host="http://127.0.0.1:%d" % self.server.server_port)
+        self.api_client = ApiClient(self.configuration)
+        # GET /boost/recipients is deprecated but still the largest plain list
+        catcher = warnings.catch_warnings()
+        catcher.__enter__()
+        self.addCleanup(catcher.__exit__, None, None, None)
+        warnings.simplefilter("ignore", DeprecationWarning)
+
+    def test_array_stream(self) -> None:
+        document = [1, -2.5e3, "a,]bé", {"k": [1, {"x": None}]}, [], True, None, 12345678901234567890]
+        data = json.dumps(document).encode()
+        for size in (1, 2, 3, 7, len(data)):
+            self.assertEqual(_feed(JSONArrayStream(), data, size), document)
+        self.assertEqual(_feed(JSONArrayStream(), b" [ ] ", 1), [])
+
+    def test_array_stream_path(self) -> None:
+        data = json.dumps({"cursor": "c", "meta": {"skills": 1}, "skills": [{"id": 1}, {"id": 2}], "after": 1}).encode()
+        self.assertEqual(_feed(JSONArrayStream(("skills",)), data, 5), [{"id": 1}, {"id": 2}])
+        with self.assertRaises(json.JSONDecodeError):
+            _feed(JSONArrayStream(("records",)), data, 5)
+
+    def test_array_stream_errors(self) -> None:
+        for data in (b'[1, 2', b'[1 2]', b'{"a": 1}', b'[1, 2'):
+            with self.assertRaises(json.JSONDecodeError):
+                _feed(JSONArrayStream(), data, 2)
+
+    def test_stream_path(self) -> None:
+        self.assertEqual(stream_path("List[str]"), ((), "str"))
+        self.assertEqual(stream_path("SkillsGetFullSkillTree200Response"), (("skills",), "Schema1"))
+
+    def test_stream_list(self) -> None:
+        api = BoostsApi(self.api_client)
+        streamed = list(api.stream_boost_get_boost_recipients(BOOST_URI, limit=10, chunk_size=4096))
+        self.assertEqual(len(streamed), RECORDS)
+        self.assertEqual(streamed[:50], api.boost_get_boost_recipients(BOOST_URI)[:50])
+        self.assertEqual(streamed[-1].to.display_name, "Café ✓ %d" % (RECORDS - 1))
+
+    def test_stream_memory(self) -> None:
+        api = BoostsApi(self.api_client)
+        list(api.stream_boost_get_boost_recipients(BOOST_URI))
+        tracemalloc.start()
+        try:
+            count = 0
+            for _ in api.stream_boost_get_boost_recipients(BOOST_URI, chunk_size=8192):
+                count += 1
+            _, streamed_peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            api.boost_get_boost_recipients(BOOST_URI)
+            _, loaded_peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(count, RECORDS)
+        # bounded by the chunk size, not by the number of records
+        self.assertLess(streamed_peak, len(RECIPIENTS) // 8)
+        self.assertLess(streamed_peak * 50, loaded_peak)
+
+    def test_stream_nested_list(self) -> None:
+        skills = list(SkillsApi(self.api_client).stream_skills_get_full_skill_tree("f1"))
+        self.assertEqual([s.id for s in skills], ["s1", "s2"])
+
+    def test_stream_null_elements(self) -> None:
+        api = UtilitiesApi(self.api_client)
+        streamed = list(api.stream_utilities_get_challenges())
+        self.assertEqual(streamed, ["1", None, "2"])
+        self.assertEqual(streamed, api.utilities_get_challenges())
+
+        async def run():
+            async with AsyncApiClient(self.configuration) as api_client:
+                return [c async for c in AsyncUtilitiesApi(api_client).astream_utilities_get_challenges()]
+
+        self.assertEqual(asyncio.run(run()), streamed)
+
+    def test_stream_error(self) -> None:
+        with self.assertRaises(NotFoundException):
+            SkillsApi(self.api_client).stream_skills_get_full_skill_tree("missing")
+
+    def test_early_exit(self) -> None:
+        api = BoostsApi(self.api_client)
+        elements = api.stream_boost_get_boost_recipients(BOOST_URI)
+        self.assertEqual(next(elements).uri, "lc:network:credential:0")
+        elements.close()
+        self.assertEqual(len(api.boost_get_boost_recipients(BOOST_URI)), RECORDS)
+
+    def test_async_stream(self) -> None:
+        async def run():
+            async with AsyncApiClient(self.configuration) as api_client:
+                api = AsyncBoostsApi(api_client)
+                return [c.uri async for c in api.astream_boost_get_boost_recipients(BOOST_URI, chunk_size=4096)]
+
+        uris = asyncio.run(run())
+        self.assertEqual(len(uris), RECORDS)
+        self.assertEqual(uris[-1], "lc:network:credential:%d" % (RECORDS - 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
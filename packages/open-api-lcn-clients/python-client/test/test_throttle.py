@@ -0,0 +1,218 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from openapi_client.api.boosts_api import BoostsApi
+from openapi_client.api_client import ApiClient
+from openapi_client.async_api import AsyncBoostsApi
+from openapi_client.async_api_client import AsyncApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.exceptions import ApiException
+from openapi_client.throttle import AdaptiveLimit, Throttle, TokenBucket
+
+BOOST_URI = "lc:network:boost:1"
+BOOST = {
+    "uri": BOOST_URI,
+    "name": "Badge",
+    "boost": {
+        "@context": ["https://www.w3.org/2018/credentials/v1"],
+        "type": ["VerifiableCredential"],
+        "issuer": "did:web:issuer",
+        "credentialSubject": {"id": "did:web:subject"},
+    },
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+            throttle = server.throttle_next > 0
+            server.throttle_next -= throttle
+        time.sleep(0.02)
+        with server.lock:
+            server.active -= 1
+        if throttle:
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            body = b'{"message": "slow down"}'
+        else:
+            self.send_response(200)
+            body = json.dumps(BOOST).encode()
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestThrottle(unittest.TestCase):
+    """Rate limiting and adaptive concurrency tests"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.server.lock = threading.Lock()
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        self.server.active = self.server.peak = self.server.throttle_next = 0
+        self.configuration = Configuration(host="http://127.0.0.1:%d" % self.server.server_port)
+
+    def test_token_bucket(self) -> None:
+        bucket = TokenBucket(100, burst=2)
+        delays = [bucket.reserve() for _ in range(4)]
+        self.assertEqual(delays[:2], [0.0, 0.0])
+        self.assertAlmostEqual(delays[2], 0.01, delta=0.005)
+        self.assertAlmostEqual(delays[3], 0.02, delta=0.005)
+
+    def test_aimd(self) -> None:
+        limit = AdaptiveLimit(initial=4, latency_tolerance=None)
+        started = time.monotonic()
+        for _ in range(4):
+            limit.acquire()
+        limit.release(started, 429)
+        self.assertEqual(limit.limit, 2)
+        # started before the decrease, so part of the same window
+        limit.release(started, 429)
+        self.assertEqual(limit.limit, 2)
+        self.assertEqual(limit.throttled, 2)
+        # grows only while saturated
+        limit.release(started, 200)
+        self.assertEqual(limit.limit, 2.5)
+        limit.release(started, 200)
+        self.assertEqual(limit.limit, 2.5)
+        self.assertEqual(limit.in_flight, 0)
+
+    def test_queue(self) -> None:
+        limit = AdaptiveLimit(initial=1)
+        limit.acquire()
+        acquired = threading.Event()
+        waiter = threading.Thread(target=lambda: (limit.acquire(), acquired.set()))
+        waiter.start()
+        time.sleep(0.05)
+        self.assertFalse(acquired.is_set())
+        self.assertEqual(limit.queued, 1)
+        limit.release(time.monotonic())
+        self.assertTrue(acquired.wait(5))
+        self.assertEqual((limit.in_flight, limit.queued), (1, 0))
+        waiter.join()
+
+    def test_async_cancel(self) -> None:
+        limit = AdaptiveLimit(initial=1)
+
+        async def run():
+            await limit.acquire_async()
+            waiter = asyncio.ensure_future(limit.acquire_async())
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await waiter
+            limit.release(time.monotonic())
+            await asyncio.wait_for(limit.acquire_async(), 1)
+
+        asyncio.run(run())
+        self.assertEqual((limit.in_flight, limit.queued), (1, 0))
+
+    def test_groups(self) -> None:
+        throttle = Throttle(groups=["/send", "/boost/recipients/paginated"])
+        throttle.register("https://a.example/api/send", "/send")
+        throttle.register("https://a.example/api/boost/recipients/paginated", "/boost/recipients/paginated")
+        self.assertEqual(throttle.group("https://a.example/api/send"), ("a.example", "/send"))
+        self.assertEqual(
+            throttle.group("https://a.example/api/boost/recipients/paginated?limit=5"),
+            ("a.example", "/boost/recipients/paginated"),
+        )
+        self.assertEqual(throttle.group("https://a.example/api/boost/send/p1"), ("a.example", ""))
+        self.assertEqual(throttle.group("https://b.example/send"), ("b.example", "/send"))
+
+    def test_from_configuration(self) -> None:
+        self.assertIsNone(ApiClient(self.configuration).throttle)
+        self.configuration.rate_limit = 20
+        throttle = ApiClient(self.configuration).throttle
+        self.assertEqual((throttle.rate, throttle.adaptive), (20, False))
+
+    def test_concurrency_limit(self) -> None:
+        api_client = ApiClient(self.configuration)
+        api_client.throttle = Throttle(groups=["/boost"], initial=3, max_limit=3, latency_tolerance=None)
+        api = BoostsApi(api_client)
+        with ThreadPoolExecutor(12) as executor:
+            list(executor.map(lambda _: api.boost_get_boost(BOOST_URI), range(24)))
+        self.assertEqual(self.server.peak, 3)
+        [(key, stats)] = api_client.throttle.stats().items()
+        self.assertEqual(key, ("127.0.0.1:%d" % self.server.server_port, "/boost"))
+        self.assertEqual(stats, (3, 0, 0, 0))
+
+    def test_backs_off_on_429(self) -> None:
+        self.server.throttle_next = 4
+        self.configuration.adaptive_concurrency = True
+        api_client = ApiClient(self.configuration)
+        api_client.throttle = Throttle(initial=8, latency_tolerance=None)
+        api = BoostsApi(api_client)
+
+        def call(_):
+            try:
+                return api.boost_get_boost(BOOST_URI).name
+            except ApiException as e:
+                return e.status
+
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(call, range(8)))
+        self.assertEqual(results.count(429), 4)
+        [stats] = api_client.throttle.stats().values()
+        self.assertEqual(stats.throttled, 4)
+        self.assertEqual(stats.limit, 4)
+
+    def test_rate_limit(self) -> None:
+        self.configuration.rate_limit = 50
+        self.configuration.rate_limit_burst = 1
+        api = BoostsApi(ApiClient(self.configuration))
+        start = time.monotonic()
+        for _ in range(6):
+            api.boost_get_boost(BOOST_URI)
+        # one token every 20ms after the first
+        self.assertGreaterEqual(time.monotonic() - start, 0.1)
+
+    def test_async_client(self) -> None:
+        self.configuration.adaptive_concurrency = True
+
+        async def run():
+            async with AsyncApiClient(self.configuration) as api_client:
+                api_client.throttle = Throttle(initial=2, latency_tolerance=None)
+                api = AsyncBoostsApi(api_client)
+                boosts = await asyncio.gather(*[api.boost_get_boost(BOOST_URI) for _ in range(10)])
+                return boosts, api_client.throttle.stats()
+
+        boosts, stats = asyncio.run(run())
+        self.assertEqual({b.name for b in boosts}, {"Badge"})
+        self.assertLessEqual(self.server.peak, 3)
+        self.assertEqual([s.in_flight for s in stats.values()], [0])
+
+
+if __name__ == '__main__':
+    unittest.main()
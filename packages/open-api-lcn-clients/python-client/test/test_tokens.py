@@ -0,0 +1,151 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import copy
+import json
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from openapi_client.api.send_api import SendApi
+from openapi_client.api_client import ApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.models.boost_send_request import BoostSendRequest
+from openapi_client.prepared import prepare_request
+from openapi_client.tokens import TokenProvider, Tokens, current_tenant, tenant
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.server.lock:
+            self.server.seen.append((request["recipient"], self.headers.get("Authorization")))
+        body = json.dumps({"type": "boost", "credentialUri": "c", "uri": "lc:network:boost:1", "activityId": "a"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Provider(TokenProvider):
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def token(self, tenant):
+        self.calls += 1
+        return None if tenant is None else "token-%s" % tenant
+
+
+def _send_request(recipient):
+    return BoostSendRequest(type="boost", recipient=recipient, templateUri="lc:network:boost:1")
+
+
+class TestTokens(unittest.TestCase):
+    """Token provider tests"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.server.lock = threading.Lock()
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        self.server.seen = []
+        self.provider = _Provider()
+        self.configuration = Configuration(
+            host="http://127.0.0.1:%d" % self.server.server_port, access_token="default",
+        )
+        self.configuration.token_provider = self.provider
+        self.configuration.connection_pool_maxsize = 8
+        self.api_client = ApiClient(self.configuration)
+        self.api = SendApi(self.api_client)
+
+    def tearDown(self) -> None:
+        self.api_client.close()
+
+    def authorization(self, **kwargs):
+        prepared = prepare_request(self.api, "boost_send", _send_request("p"), **kwargs)
+        return prepared.header_params.get("Authorization")
+
+    def test_tenant(self) -> None:
+        self.assertIsNone(self.authorization())
+        with tenant("a"):
+            self.assertEqual(current_tenant(), "a")
+            self.assertEqual(self.authorization(), "Bearer token-a")
+            with tenant("b"):
+                self.assertEqual(self.authorization(), "Bearer token-b")
+            self.assertEqual(self.authorization(), "Bearer token-a")
+            # _request_auth still overrides the provider
+            request_auth = {"type": "bearer", "in": "header", "key": "Authorization", "value": "Bearer x"}
+            self.assertEqual(self.authorization(_request_auth=request_auth), "Bearer x")
+        self.assertIsNone(current_tenant())
+
+    def test_cached(self) -> None:
+        tokens = {"a": "1"}
+        cache = Tokens(tokens, max_tenants=2)
+        first = cache.auth_settings("a")
+        self.assertIs(cache.auth_settings("a"), first)
+        tokens["a"] = "2"
+        self.assertEqual(cache.auth_settings("a")["Authorization"]["value"], "Bearer 2")
+        self.assertEqual(cache.auth_settings("b"), {})
+        for key in ("b", "c", "d"):
+            tokens[key] = key
+            cache.auth_settings(key)
+        self.assertEqual(len(cache), 2)
+        cache.forget("d")
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(Tokens(lambda key: "t").auth_settings()["Authorization"]["value"], "Bearer t")
+        with self.assertRaises(TypeError):
+            Tokens(42)
+
+    def test_concurrent_tenants(self) -> None:
+        def send(index):
+            key = "t%d" % (index % 10)
+            with tenant(key):
+                self.api.boost_send(_send_request("%s-%d" % (key, index)))
+
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(send, range(200)))
+        self.assertEqual(len(self.server.seen), 200)
+        for recipient, authorization in self.server.seen:
+            self.assertEqual(authorization, "Bearer token-" + recipient.split("-")[0])
+        self.assertEqual(len(self.api_client.tokens), 10)
+        self.assertEqual(self.api_client.pool_stats().clients, 1)
+
+    def test_bulk(self) -> None:
+        with tenant("bulk"):
+            results = list(self.api.bulk_send([_send_request("p%d" % i) for i in range(10)], max_workers=3))
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual({a for _, a in self.server.seen}, {"Bearer token-bulk"})
+
+    def test_configuration(self) -> None:
+        self.assertIs(copy.deepcopy(self.configuration).token_provider, self.provider)
+        configuration = Configuration(access_token="default")
+        self.assertIsNone(ApiClient(configuration).tokens)
+        api = SendApi(ApiClient(configuration))
+        prepared = prepare_request(api, "boost_send", _send_request("p"))
+        self.assertEqual(prepared.header_params["Authorization"], "Bearer default")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+# coding: utf-8
+
+"""
+    LearnCloud Network API
+
+    API for interacting with LearnCloud Network
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import unittest
+
+from pydantic import ValidationError
+
+from openapi_client.api.boosts_api import BoostsApi
+from openapi_client.api.send_api import SendApi
+from openapi_client.api_client import ApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.models.boost_send_request import BoostSendRequest
+from openapi_client.prepared import prepare_request
+
+
+class TestValidation(unittest.TestCase):
+    """client_side_validation / validate_call tests"""
+
+    def setUp(self) -> None:
+        self.configuration = Configuration(host="http://localhost")
+        self.configuration.client_side_validation = False
+        self.api_client = ApiClient(self.configuration)
+        self.request = BoostSendRequest(type="boost", recipient="profile-1")
+
+    def test_validated_by_default(self) -> None:
+        api = BoostsApi(ApiClient(Configuration(host="http://localhost")))
+        with self.assertRaises(ValidationError):
+            prepare_request(api, "boost_get_boost", 42)
+        with self.assertRaises(ValidationError):
+            prepare_request(api, "boost_get_boost", "lc:network:boost:1", _host_index=1)
+
+    def test_unchecked_arguments(self) -> None:
+        api = BoostsApi(self.api_client)
+        prepared = prepare_request(api, "boost_get_boost", "lc:network:boost:1")
+        self.assertEqual(prepared.url, "http://localhost/boost?uri=lc%3Anetwork%3Aboost%3A1")
+        # arguments are passed through as given
+        prepared = prepare_request(api, "boost_get_boost", 42, _host_index=1)
+        self.assertEqual(prepared.url, "http://localhost/boost?uri=42")
+
+    def test_same_request_either_way(self) -> None:
+        unchecked = prepare_request(SendApi(self.api_client), "boost_send", self.request)
+        checked = prepare_request(
+            SendApi(ApiClient(Configuration(host="http://localhost"))), "boost_send", self.request
+        )
+        self.assertEqual(unchecked, checked)
+
+    def test_bodies_still_validated(self) -> None:
+        api = SendApi(self.api_client)
+        prepared = prepare_request(api, "boost_send", {"type": "boost", "recipient": "profile-1"})
+        self.assertEqual(prepared.body, {"type": "boost", "recipient": "profile-1"})
+        with self.assertRaises(ValidationError):
+            prepare_request(api, "boost_send", {"type": "boost"})
+        with self.assertRaises(ValidationError):
+            prepare_request(api, "boost_send", boost_send_request={"recipient": "profile-1"})
+
+    def test_toggle_on_client(self) -> None:
+        api = BoostsApi(self.api_client)
+        prepare_request(api, "boost_get_boost", "lc:network:boost:1", _host_index=1)
+        self.api_client.client_side_validation = True
+        with self.assertRaises(ValidationError):
+            prepare_request(api, "boost_get_boost", "lc:network:boost:1", _host_index=1)
+
+
+if __name__ == '__main__':
+    unittest.main()